@@ -43,7 +43,7 @@ class AgentInterface(ABC):
         pass
 
     @abstractmethod
-    def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
+    async def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
         """
         Load the agent's working memory from chat history
 
@@ -1,3 +1,4 @@
+import time
 from typing import (
     AsyncIterator,
     List,
@@ -14,7 +15,7 @@ from ..output_types import SentenceOutput, DisplayText
 from ..stateless_llm.stateless_llm_interface import StatelessLLMInterface
 from ..stateless_llm.claude_llm import AsyncLLM as ClaudeAsyncLLM
 from ..stateless_llm.openai_compatible_llm import AsyncLLM as OpenAICompatibleAsyncLLM
-from ...chat_history_manager import get_history
+from ...chat_history_manager import async_get_history
 from ...config_manager import TTSPreprocessorConfig
 from ..input_types import BatchInput
 from prompts import prompt_loader
@@ -181,9 +182,9 @@ class BasicMemoryAgent(BaseAgent):
                 self._current_session_id
             )
 
-    def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
+    async def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
         """Load memory from chat history."""
-        messages = get_history(conf_uid, history_uid)
+        messages = await async_get_history(conf_uid, history_uid)
 
         converted = []
         for msg in messages:
@@ -653,7 +654,8 @@ class BasicMemoryAgent(BaseAgent):
                 if complete_response:
                     self._add_message(complete_response, "assistant")
 
-            # Trigger memory extraction after turn completes
+            # Queue the turn for memory extraction; LLM extraction runs in
+            # the memory service's background worker
             if self._memory_service and user_text:
                 last_msg = self._working_memory.last_message
                 assistant_text = (
@@ -683,9 +685,39 @@ class BasicMemoryAgent(BaseAgent):
     ) -> AsyncIterator[Union[SentenceOutput, Dict[str, Any]]]:
         """Run chat pipeline."""
         chat_func_decorated = self._chat_function_factory()
+        started = time.perf_counter()
+        first_output = True
         async for output in chat_func_decorated(input_data):
+            if first_output:
+                first_output = False
+                logger.info(
+                    "First agent output after "
+                    f"{(time.perf_counter() - started) * 1000.0:.1f}ms"
+                )
             yield output
 
+    def prefetch_context(self, input_data: BatchInput) -> None:
+        """Start memory retrieval for the next turn as soon as its input is known.
+
+        Called with the turn's input (e.g. right after ASR) before ``chat()``.
+        The user message is built from ``_to_text_prompt`` as in ``chat()``,
+        so the memory context build there finds and reuses the running
+        retrieval.
+        """
+        if self._memory_service is None:
+            return
+        text_prompt = self._to_text_prompt(input_data)
+        if not text_prompt:
+            return
+        messages = self._working_memory.to_chat_messages()
+        messages.append(
+            {"role": "user", "content": [{"type": "text", "text": text_prompt}]}
+        )
+        try:
+            self._memory_service.prefetch_context(messages)
+        except Exception as e:
+            logger.debug(f"Memory prefetch skipped: {e}")
+
     async def start_session(
         self,
         entity_id: str | None = None,
@@ -702,15 +734,21 @@ class BasicMemoryAgent(BaseAgent):
         return session_id
 
     async def end_session(self) -> None:
-        """End the current memory session, flushing any buffered extraction."""
+        """End the current memory session.
+
+        Consolidation, including the flush of buffered extraction turns, is
+        deferred to the memory service's background scheduler so the next
+        turn does not wait for it.
+        """
         if self._memory_service is None:
             return
-        # Flush any remaining buffered turns
-        await self._memory_service.flush_extraction()
         session_id = getattr(self, "_current_session_id", None)
         if session_id:
-            await self._memory_service.end_session(session_id)
+            await self._memory_service.end_session(session_id, defer=True)
             self._current_session_id = None
+        else:
+            # Flush any remaining buffered turns
+            await self._memory_service.flush_extraction()
 
     def update_stream_context(
         self,
@@ -9,7 +9,7 @@ from pathlib import Path
 from .agent_interface import AgentInterface
 from ..output_types import AudioOutput, Actions, DisplayText
 from ..input_types import BatchInput
-from ...chat_history_manager import get_metadata, update_metadate
+from ...chat_history_manager import async_get_metadata, async_update_metadate
 
 
 class HumeAIAgent(AgentInterface):
@@ -87,7 +87,7 @@ class HumeAIAgent(AgentInterface):
                 new_chat_group_id = data.get("chat_group_id")
 
                 if not resume_chat_group_id and self._current_history_uid:
-                    update_metadate(
+                    await async_update_metadate(
                         self._current_conf_uid,
                         self._current_history_uid,
                         {"resume_id": new_chat_group_id, "agent_type": self.AGENT_TYPE},
@@ -119,7 +119,7 @@ class HumeAIAgent(AgentInterface):
         if not self._connected or not self._ws or self._ws.closed:
             await self.connect(self._chat_group_id)
 
-    def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
+    async def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
         """
         Set chat group ID based on history
 
@@ -130,7 +130,7 @@ class HumeAIAgent(AgentInterface):
         self._current_conf_uid = conf_uid
         self._current_history_uid = history_uid
 
-        metadata = get_metadata(conf_uid, history_uid)
+        metadata = await async_get_metadata(conf_uid, history_uid)
 
         agent_type = metadata.get("agent_type")
         if agent_type and agent_type != self.AGENT_TYPE:
@@ -50,7 +50,7 @@ class LettaAgent(AgentInterface):
             )
         )
 
-    def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
+    async def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
         # The Letta Server automatically stores historical messages, so this part is not needed
         pass
 
@@ -103,6 +103,6 @@ class BaseAgent(AgentInterface):
         pass
 
     @abstractmethod
-    def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
+    async def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
         """Implemented by subclasses."""
         pass
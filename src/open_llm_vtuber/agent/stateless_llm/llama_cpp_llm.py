@@ -3,17 +3,24 @@ This class provides a stateless interface to llama.cpp for language generation.
 """
 
 import asyncio
+import concurrent.futures
+import threading
 from typing import AsyncIterator, List, Dict, Any
-from llama_cpp import Llama
+from llama_cpp import Llama, LlamaRAMCache
 from loguru import logger
 
 from .stateless_llm_interface import StatelessLLMInterface
 
+# Marks the end of a generation in the token queue
+_DONE = object()
+
 
 class LLM(StatelessLLMInterface):
     def __init__(
         self,
         model_path: str,
+        prompt_cache_size: int = 0,
+        max_buffered_tokens: int = 64,
         **kwargs,
     ):
         """
@@ -21,15 +28,30 @@ class LLM(StatelessLLMInterface):
 
         Parameters:
         - model_path (str): Path to the GGUF model file
+        - prompt_cache_size (int, optional): Bytes of RAM for the KV state cache
+          that lets turns sharing a prompt prefix (e.g. the same system prompt)
+          skip re-evaluating it. 0 disables the cache. Defaults to 0.
+        - max_buffered_tokens (int, optional): Tokens the generation thread may
+          run ahead of the consumer before it pauses. Defaults to 64.
         - **kwargs: Additional arguments passed to Llama constructor
         """
         logger.info(f"Initializing llama cpp with model path: {model_path}")
         self.model_path = model_path
+        self.max_buffered_tokens = max(1, max_buffered_tokens)
+        # llama.cpp contexts are not thread-safe; one generation at a time,
+        # on a thread of our own so its failures can be logged even after
+        # the event loop has closed
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="llama-cpp"
+        )
         try:
             self.llm = Llama(model_path=model_path, **kwargs)
         except Exception as e:
             logger.critical(f"Failed to initialize Llama model: {e}")
             raise
+        if prompt_cache_size > 0:
+            self.llm.set_cache(LlamaRAMCache(capacity_bytes=prompt_cache_size))
+            logger.info(f"Llama prompt cache enabled ({prompt_cache_size} bytes)")
 
     async def chat_completion(
         self, messages: List[Dict[str, Any]], system: str = None
@@ -37,6 +59,11 @@ class LLM(StatelessLLMInterface):
         """
         Generates a chat completion using llama.cpp asynchronously.
 
+        Generation runs in a producer thread that hands tokens over through a
+        bounded queue, so the event loop is never blocked. When the consumer
+        stops (e.g. the conversation task is cancelled on interrupt), the
+        thread stops llama.cpp before the next token.
+
         Parameters:
         - messages (List[Dict[str, Any]]): The list of messages to send to the model.
         - system (str, optional): System prompt to use for this completion.
@@ -46,31 +73,85 @@ class LLM(StatelessLLMInterface):
         """
         logger.debug(f"Generating completion for messages: {messages}")
 
+        # Add system prompt if provided
+        messages_with_system = messages
+        if system:
+            messages_with_system = [
+                {"role": "system", "content": system},
+                *messages,
+            ]
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_buffered_tokens)
+        stop = threading.Event()
+        # Errors in the thread are handed over through the queue as well;
+        # anything that cannot be handed over is logged by the callback
+        producer = self._executor.submit(
+            self._generate, messages_with_system, queue, loop, stop
+        )
+        producer.add_done_callback(self._log_producer_error)
+
         try:
-            # Add system prompt if provided
-            messages_with_system = messages
-            if system:
-                messages_with_system = [
-                    {"role": "system", "content": system},
-                    *messages,
-                ]
-
-            # Create chat completion in a separate thread to avoid blocking
-            chat_completion = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.llm.create_chat_completion(
-                    messages=messages_with_system,
-                    stream=True,
-                ),
-            )
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    logger.error(f"Error in chat completion: {item}")
+                    raise item
+                yield item
+        finally:
+            # Reached on completion, error, or cancellation by an interrupt
+            stop.set()
+
+    @staticmethod
+    def _log_producer_error(producer: concurrent.futures.Future) -> None:
+        if not producer.cancelled() and producer.exception() is not None:
+            logger.error(f"llama.cpp generation thread failed: {producer.exception()}")
 
-            # Process chunks
-            for chunk in chat_completion:
+    def _generate(
+        self,
+        messages: List[Dict[str, Any]],
+        queue: asyncio.Queue,
+        loop: asyncio.AbstractEventLoop,
+        stop: threading.Event,
+    ) -> None:
+        """Producer thread: run llama.cpp and push tokens until done or stopped."""
+
+        def put(item) -> bool:
+            if stop.is_set():
+                return False
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            # Wait for queue space, but give up once the consumer has left
+            while True:
+                try:
+                    future.result(timeout=0.1)
+                    return True
+                except concurrent.futures.TimeoutError:
+                    if stop.is_set():
+                        future.cancel()
+                        return False
+
+        if stop.is_set():
+            return
+        completion = None
+        try:
+            completion = self.llm.create_chat_completion(
+                messages=messages,
+                stream=True,
+            )
+            for chunk in completion:
+                if stop.is_set():
+                    logger.debug("llama.cpp generation interrupted.")
+                    return
                 if chunk.get("choices") and chunk["choices"][0].get("delta"):
                     content = chunk["choices"][0]["delta"].get("content", "")
-                    if content:
-                        yield content
-
+                    if content and not put(content):
+                        return
+            put(_DONE)
         except Exception as e:
-            logger.error(f"Error in chat completion: {e}")
-            raise
+            put(e)
+        finally:
+            if completion is not None:
+                # Stops llama.cpp from evaluating further tokens
+                completion.close()
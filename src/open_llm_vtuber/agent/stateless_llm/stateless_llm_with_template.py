@@ -4,7 +4,7 @@ compatible endpoints for language generation where the language model is not
 trained using a ChatML format.
 """
 
-import requests
+import httpx
 import json
 from jinja2 import Template
 from loguru import logger
@@ -114,16 +114,39 @@ class AsyncLLMWithTemplate(StatelessLLMInterface):
         self.prompt_headers = {
             "Authorization": llm_api_key or "Bearer your_api_key_here"
         }
+        self._client: httpx.AsyncClient | None = None
         logger.info(
             f"Initialized AsyncLLM with the parameters: {self.completion_url} ({template})"
         )
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Keep-alive connection pool shared by all completions of this instance."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self.prompt_headers,
+                # Tokens may be far apart while the server evaluates the prompt
+                timeout=httpx.Timeout(30.0, read=None),
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def chat_completion(
         self, messages: List[Dict[str, Any]], system: str = None
     ) -> AsyncIterator[str]:
         """
         Generates a chat completion using the OpenAI API asynchronously.
 
+        The response is read and parsed incrementally without blocking the
+        event loop. Closing the generator (e.g. on interrupt) closes the HTTP
+        response, so the server stops generating.
+
         Parameters:
         - messages (List[Dict[str, Any]]): The list of messages to send to the API.
         - system (str, optional): System prompt to use for this completion.
@@ -138,7 +161,6 @@ class AsyncLLMWithTemplate(StatelessLLMInterface):
         """
         logger.debug(f"Messages: {messages}")
         bos_token = "<|begin_of_text|>"
-        stream = None
         try:
             # If system prompt is provided, add it to the messages
             messages_with_system: List[Dict[str, Any]] = messages
@@ -157,37 +179,37 @@ class AsyncLLMWithTemplate(StatelessLLMInterface):
                 "temperature": self.temperature,
                 "prompt": prompt,
             }
-            with requests.post(
-                self.completion_url, headers=self.prompt_headers, json=data, stream=True
+            async with self.client.stream(
+                "POST", self.completion_url, json=data
             ) as response:
-                for line in response.iter_lines():
-                    if line:
-                        line = self._clean_raw_bytes(line)
-                        next_token = self._process_line(line)
-                        if next_token:
-                            if next_token == self.eot_token:
-                                break
-                            yield next_token
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    event = self._parse_sse_line(line)
+                    if event is None:
+                        continue
+                    next_token = self._process_line(event)
+                    if next_token:
+                        if next_token == self.eot_token:
+                            break
+                        yield next_token
         except Exception as e:
             logger.error(f"LLM API WITH TEMPLATE: Error occurred: {e}")
-            logger.info(f"Base URL: {self.base_url}")
+            logger.info(f"Base URL: {self.completion_url}")
             logger.info(f"Model: {self.model}")
             logger.info(f"Messages: {messages}")
             logger.info(f"temperature: {self.temperature}")
             yield "Error calling the chat endpoint: Error occurred while generating response. See the logs for details."
-        finally:
-            # make sure the stream is properly closed
-            # so when interrupted, no more tokens will being generated.
-            if stream:
-                logger.debug("Chat completion finished.")
-                await stream.close()
-                logger.debug("Stream closed.")
-
-    def _clean_raw_bytes(self, line):
-        line = line.decode("utf-8")
-        line = line.removeprefix("data: ")
-        line = json.loads(line)
-        return line
+        # No finally block needed: leaving the async with closes the response
+
+    def _parse_sse_line(self, line: str) -> Dict[str, Any] | None:
+        """Decode one server-sent event line; None for blanks, comments and [DONE]."""
+        line = line.strip()
+        if not line or line.startswith(":"):
+            return None
+        line = line.removeprefix("data:").strip()
+        if line == "[DONE]":
+            return None
+        return json.loads(line)
 
     def _process_line(self, line):
         if not (("stop" in line) and (line["stop"])):
@@ -66,6 +66,7 @@ class LLMFactory:
 
             return LlamaLLM(
                 model_path=kwargs.get("model_path"),
+                prompt_cache_size=kwargs.get("prompt_cache_size") or 0,
             )
         elif llm_provider == "claude_llm":
             return ClaudeLLM(
@@ -1,11 +1,47 @@
+"""Chat history storage.
+
+Each history is an append-only JSON Lines file,
+``chat_history/<conf_uid>/<history_uid>.jsonl``: a metadata record followed
+by one record per message. Storing a message appends a single line instead
+of rewriting the whole history.
+
+A per-conf index (``_index.json``) keeps the message count, latest message
+and file size of every history, so listing histories does not read them.
+An index entry whose size does not match its file is rebuilt from the file.
+
+All file operations run on a single writer thread. ``store_message``
+returns without waiting for its write; the other functions wait for their
+result, which also orders them after every earlier write. Their
+``async_`` variants await the same writer-thread future instead of blocking
+the event loop and are the ones to call from coroutines. Legacy
+``<history_uid>.json`` files are converted the first time their conf
+directory is used.
+"""
+
+import asyncio
 import os
 import re
 import json
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Literal, List, TypedDict, Optional
+from typing import Callable, Literal, List, TypedDict, Optional, TypeVar
 from loguru import logger
 
+HISTORY_ROOT = "chat_history"
+HISTORY_SUFFIX = ".jsonl"
+LEGACY_SUFFIX = ".json"
+INDEX_FILENAME = "_index.json"
+
+T = TypeVar("T")
+
+# Pending writes are still completed at interpreter exit
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat-history")
+
+# conf_dir -> {history_uid: {"size", "count", "latest_message"}}; writer thread only
+_indexes: dict[str, dict[str, dict]] = {}
+_migrated_dirs: set[str] = set()
+
 
 class HistoryMessage(TypedDict):
     role: Literal["human", "ai"]
@@ -44,8 +80,9 @@ def _ensure_conf_dir(conf_uid: str) -> str:
         raise ValueError("conf_uid cannot be empty")
 
     safe_conf_uid = _sanitize_path_component(conf_uid)
-    base_dir = os.path.join("chat_history", safe_conf_uid)
+    base_dir = os.path.join(HISTORY_ROOT, safe_conf_uid)
     os.makedirs(base_dir, exist_ok=True)
+    _migrate_legacy_files(base_dir)
     return base_dir
 
 
@@ -53,41 +90,233 @@ def _get_safe_history_path(conf_uid: str, history_uid: str) -> str:
     """Get sanitized path for history file"""
     safe_conf_uid = _sanitize_path_component(conf_uid)
     safe_history_uid = _sanitize_path_component(history_uid)
-    base_dir = os.path.join("chat_history", safe_conf_uid)
-    full_path = os.path.normpath(os.path.join(base_dir, f"{safe_history_uid}.json"))
+    base_dir = os.path.join(HISTORY_ROOT, safe_conf_uid)
+    full_path = os.path.normpath(
+        os.path.join(base_dir, f"{safe_history_uid}{HISTORY_SUFFIX}")
+    )
     if not full_path.startswith(base_dir):
         raise ValueError("Invalid path: Path traversal detected")
     return full_path
 
 
-def create_new_history(conf_uid: str) -> str:
-    """Create a new history file with a unique ID and return the history_uid"""
+def _run(fn: Callable[..., T], *args) -> T:
+    """Run a file operation on the writer thread and wait for its result."""
+    return _writer.submit(fn, *args).result()
+
+
+def _resolved(value: T) -> Future[T]:
+    """Return a future that already holds `value`."""
+    future: Future[T] = Future()
+    future.set_result(value)
+    return future
+
+
+def _log_write_error(future) -> None:
+    if future.exception() is not None:
+        logger.error(f"Failed to write chat history: {future.exception()}")
+
+
+# ---------------------------------------------------------------------------
+# Record files (writer thread only)
+# ---------------------------------------------------------------------------
+
+
+def _read_records(filepath: str) -> List[dict]:
+    records = []
+    with open(filepath, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # e.g. a line cut short by a crash mid-append
+                logger.warning(f"Skipping corrupt line {line_no} in {filepath}")
+    return records
+
+
+def _write_records(filepath: str, records: List[dict]) -> None:
+    """Atomically replace a history file."""
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, filepath)
+
+
+def _append_record(filepath: str, record: dict) -> int:
+    """Append one record and return the new file size."""
+    with open(filepath, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return f.tell()
+
+
+def _merge_metadata(records: List[dict]) -> dict:
+    metadata = {}
+    for record in records:
+        if record.get("role") == "metadata":
+            metadata.update(record)
+    return metadata
+
+
+def _migrate_legacy_files(conf_dir: str) -> None:
+    """Convert ``<history_uid>.json`` arrays to JSON Lines, once per directory."""
+    if conf_dir in _migrated_dirs or not os.path.isdir(conf_dir):
+        return
+    _migrated_dirs.add(conf_dir)
+    for filename in os.listdir(conf_dir):
+        if not filename.endswith(LEGACY_SUFFIX) or filename == INDEX_FILENAME:
+            continue
+        legacy_path = os.path.join(conf_dir, filename)
+        history_path = legacy_path[: -len(LEGACY_SUFFIX)] + HISTORY_SUFFIX
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+            _write_records(history_path, records)
+            os.remove(legacy_path)
+            logger.info(f"Migrated chat history {filename} to JSON Lines")
+        except Exception as e:
+            logger.error(f"Failed to migrate history file {filename}: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Index (writer thread only)
+# ---------------------------------------------------------------------------
+
+
+def _scan_entry(filepath: str) -> dict:
+    messages = [r for r in _read_records(filepath) if r.get("role") != "metadata"]
+    return {
+        "size": os.path.getsize(filepath),
+        "count": len(messages),
+        "latest_message": messages[-1] if messages else None,
+    }
+
+
+def _save_index(conf_dir: str) -> None:
+    index_path = os.path.join(conf_dir, INDEX_FILENAME)
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(_indexes[conf_dir], f, ensure_ascii=False)
+    os.replace(tmp_path, index_path)
+
+
+def _load_index(conf_dir: str) -> dict[str, dict]:
+    """Return the index of a conf directory, rebuilding stale entries."""
+    index = _indexes.get(conf_dir)
+    if index is None:
+        index = {}
+        index_path = os.path.join(conf_dir, INDEX_FILENAME)
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+            except Exception as e:
+                logger.warning(f"Rebuilding unreadable history index: {e}")
+                index = {}
+        _indexes[conf_dir] = index
+
+    changed = False
+    present = set()
+    for filename in os.listdir(conf_dir):
+        if not filename.endswith(HISTORY_SUFFIX):
+            continue
+        history_uid = filename[: -len(HISTORY_SUFFIX)]
+        present.add(history_uid)
+        filepath = os.path.join(conf_dir, filename)
+        entry = index.get(history_uid)
+        if entry is None or entry.get("size") != os.path.getsize(filepath):
+            index[history_uid] = _scan_entry(filepath)
+            changed = True
+    for history_uid in set(index) - present:
+        del index[history_uid]
+        changed = True
+
+    if changed:
+        _save_index(conf_dir)
+    return index
+
+
+def _update_index_entry(filepath: str, entry: dict | None) -> None:
+    conf_dir = os.path.dirname(filepath)
+    index = _indexes.get(conf_dir)
+    if index is None:
+        # Loading scans the file, which already includes this change
+        _load_index(conf_dir)
+        return
+    history_uid = os.path.basename(filepath)[: -len(HISTORY_SUFFIX)]
+    if entry is None:
+        index.pop(history_uid, None)
+    else:
+        index[history_uid] = entry
+    _save_index(conf_dir)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def _create_history_file(conf_uid: str, history_uid: str) -> str:
+    conf_dir = _ensure_conf_dir(conf_uid)  # conf_uid is sanitized here
+    filepath = os.path.join(conf_dir, f"{history_uid}{HISTORY_SUFFIX}")
+    initial_metadata = {
+        "role": "metadata",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+    size = _append_record(filepath, initial_metadata)
+    _update_index_entry(filepath, {"size": size, "count": 0, "latest_message": None})
+    return filepath
+
+
+def _create_new_history(conf_uid: str) -> Future[str]:
     if not conf_uid:
         logger.warning("No conf_uid provided")
-        return ""
+        return _resolved("")
 
     # Use uuid.uuid4().hex to generate a UUID without hyphens
-    # New format: UUID_YYYY-MM-DD_HH-MM-SS
+    # New format: YYYY-MM-DD_HH-MM-SS_UUID
     history_uid = f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{uuid.uuid4().hex}"
-    conf_dir = _ensure_conf_dir(conf_uid)  # conf_uid is sanitized here
 
-    # Create history file with empty metadata
-    try:
-        filepath = os.path.join(conf_dir, f"{history_uid}.json")
-        initial_data = [
-            {
-                "role": "metadata",
-                "timestamp": datetime.now().isoformat(timespec="seconds"),
-            }
-        ]
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(initial_data, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        logger.error(f"Failed to create new history file: {e}")
-        return ""
+    def create() -> str:
+        # Create history file with empty metadata
+        try:
+            filepath = _create_history_file(conf_uid, history_uid)
+        except Exception as e:
+            logger.error(f"Failed to create new history file: {e}")
+            return ""
+
+        logger.debug(f"Created new history file with empty metadata: {filepath}")
+        return history_uid
+
+    return _writer.submit(create)
+
+
+def create_new_history(conf_uid: str) -> str:
+    """Create a new history file with a unique ID and return the history_uid"""
+    return _create_new_history(conf_uid).result()
+
+
+async def async_create_new_history(conf_uid: str) -> str:
+    """Async variant of ``create_new_history``"""
+    return await asyncio.wrap_future(_create_new_history(conf_uid))
+
+
+def _store_record(filepath: str, record: dict) -> None:
+    conf_dir = os.path.dirname(filepath)
+    os.makedirs(conf_dir, exist_ok=True)
+    _migrate_legacy_files(conf_dir)
 
-    logger.debug(f"Created new history file with empty metadata: {filepath}")
-    return history_uid
+    history_uid = os.path.basename(filepath)[: -len(HISTORY_SUFFIX)]
+    entry = _indexes.get(conf_dir, {}).get(history_uid)
+    old_size = os.path.getsize(filepath) if os.path.exists(filepath) else 0
+    size = _append_record(filepath, record)
+    if entry is not None and entry["size"] == old_size:
+        entry = {"size": size, "count": entry["count"] + 1, "latest_message": record}
+    else:
+        entry = _scan_entry(filepath)
+    _update_index_entry(filepath, entry)
+    logger.debug(f"Successfully stored {record['role']} message")
 
 
 def store_message(
@@ -100,6 +329,9 @@ def store_message(
 ):
     """Store a message in a specific history file
 
+    The append runs on the history writer thread; this call does not wait
+    for it. Reads through this module always see the message.
+
     Args:
         conf_uid: Configuration unique identifier
         history_uid: History unique identifier
@@ -118,15 +350,6 @@ def store_message(
     filepath = _get_safe_history_path(conf_uid, history_uid)
     logger.debug(f"Storing {role} message to {filepath}")
 
-    history_data = []
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                history_data = json.load(f)
-        except Exception:
-            logger.error(f"Failed to load history file: {filepath}")
-            pass
-
     now_str = datetime.now().isoformat(timespec="seconds")
     new_item = {
         "role": role,
@@ -140,31 +363,74 @@ def store_message(
     if avatar is not None:
         new_item["avatar"] = avatar
 
-    history_data.append(new_item)
+    _writer.submit(_store_record, filepath, new_item).add_done_callback(
+        _log_write_error
+    )
+
+
+def _read_metadata(filepath: str) -> dict:
+    _migrate_legacy_files(os.path.dirname(filepath))
+    if not os.path.exists(filepath):
+        return {}
+    return _merge_metadata(_read_records(filepath))
+
+
+def _get_metadata(conf_uid: str, history_uid: str) -> Future[dict]:
+    if not conf_uid or not history_uid:
+        return _resolved({})
+
+    filepath = _get_safe_history_path(conf_uid, history_uid)
+
+    def read() -> dict:
+        try:
+            return _read_metadata(filepath)
+        except Exception as e:
+            logger.error(f"Failed to get metadata: {e}")
+        return {}
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(history_data, f, ensure_ascii=False, indent=2)
-    logger.debug(f"Successfully stored {role} message")
+    return _writer.submit(read)
 
 
 def get_metadata(conf_uid: str, history_uid: str) -> dict:
     """Get metadata from history file"""
+    return _get_metadata(conf_uid, history_uid).result()
+
+
+async def async_get_metadata(conf_uid: str, history_uid: str) -> dict:
+    """Async variant of ``get_metadata``"""
+    return await asyncio.wrap_future(_get_metadata(conf_uid, history_uid))
+
+
+def _append_metadata(filepath: str, metadata: dict) -> bool:
+    if not os.path.exists(filepath):
+        return False
+    record = {"role": "metadata"}
+    if not _read_metadata(filepath):
+        # Create new metadata with timestamp if none exists
+        record["timestamp"] = datetime.now().isoformat(timespec="seconds")
+    record.update(metadata)
+    _append_record(filepath, record)
+    _update_index_entry(filepath, _scan_entry(filepath))
+    return True
+
+
+def _update_metadata(conf_uid: str, history_uid: str, metadata: dict) -> Future[bool]:
     if not conf_uid or not history_uid:
-        return {}
+        return _resolved(False)
 
     filepath = _get_safe_history_path(conf_uid, history_uid)
-    if not os.path.exists(filepath):
-        return {}
 
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            history_data = json.load(f)
+    def update() -> bool:
+        try:
+            # Later metadata records override earlier fields when read
+            if _append_metadata(filepath, metadata):
+                logger.debug(f"Updated metadata for history {history_uid}")
+                return True
+        except Exception as e:
+            logger.error(f"Failed to set metadata: {e}")
+        return False
 
-        if history_data and history_data[0]["role"] == "metadata":
-            return history_data[0]
-    except Exception as e:
-        logger.error(f"Failed to get metadata: {e}")
-    return {}
+    return _writer.submit(update)
 
 
 def update_metadate(conf_uid: str, history_uid: str, metadata: dict) -> bool:
@@ -173,139 +439,174 @@ def update_metadate(conf_uid: str, history_uid: str, metadata: dict) -> bool:
     Updates existing metadata with new fields, preserving existing ones.
     If no metadata exists, creates new metadata entry.
     """
-    if not conf_uid or not history_uid:
-        return False
+    return _update_metadata(conf_uid, history_uid, metadata).result()
 
-    filepath = _get_safe_history_path(conf_uid, history_uid)
-    if not os.path.exists(filepath):
-        return False
 
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            history_data = json.load(f)
-
-        if history_data and history_data[0]["role"] == "metadata":
-            # Update existing metadata while preserving other fields
-            history_data[0].update(metadata)
-        else:
-            # Create new metadata with timestamp if none exists
-            new_metadata = {
-                "role": "metadata",
-                "timestamp": datetime.now().isoformat(timespec="seconds"),
-            }
-            new_metadata.update(metadata)  # Add new fields
-            history_data.insert(0, new_metadata)
+async def async_update_metadate(
+    conf_uid: str, history_uid: str, metadata: dict
+) -> bool:
+    """Async variant of ``update_metadate``"""
+    return await asyncio.wrap_future(_update_metadata(conf_uid, history_uid, metadata))
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(history_data, f, ensure_ascii=False, indent=2)
 
-        logger.debug(f"Updated metadata for history {history_uid}")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to set metadata: {e}")
-    return False
+def _read_messages(filepath: str) -> List[HistoryMessage] | None:
+    _migrate_legacy_files(os.path.dirname(filepath))
+    if not os.path.exists(filepath):
+        return None
+    return [r for r in _read_records(filepath) if r.get("role") != "metadata"]
 
 
-def get_history(conf_uid: str, history_uid: str) -> List[HistoryMessage]:
-    """Read chat history for the given conf_uid and history_uid"""
+def _get_history(conf_uid: str, history_uid: str) -> Future[List[HistoryMessage]]:
     if not conf_uid or not history_uid:
         if not conf_uid:
             logger.warning("Missing conf_uid")
         if not history_uid:
             logger.warning("Missing history_uid")
-        return []
+        return _resolved([])
 
     filepath = _get_safe_history_path(conf_uid, history_uid)
 
-    if not os.path.exists(filepath):
-        logger.warning(f"History file not found: {filepath}")
-        return []
+    def read() -> List[HistoryMessage]:
+        try:
+            messages = _read_messages(filepath)
+        except Exception:
+            return []
 
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            history_data = json.load(f)
-            # Filter out metadata
-            return [msg for msg in history_data if msg["role"] != "metadata"]
-    except Exception:
-        return []
+        if messages is None:
+            logger.warning(f"History file not found: {filepath}")
+            return []
+        return messages
 
+    return _writer.submit(read)
 
-def delete_history(conf_uid: str, history_uid: str) -> bool:
-    """Delete a specific history file"""
+
+def get_history(conf_uid: str, history_uid: str) -> List[HistoryMessage]:
+    """Read chat history for the given conf_uid and history_uid"""
+    return _get_history(conf_uid, history_uid).result()
+
+
+async def async_get_history(conf_uid: str, history_uid: str) -> List[HistoryMessage]:
+    """Async variant of ``get_history``"""
+    return await asyncio.wrap_future(_get_history(conf_uid, history_uid))
+
+
+def _delete_history_file(filepath: str) -> bool:
+    _migrate_legacy_files(os.path.dirname(filepath))
+    if not os.path.exists(filepath):
+        return False
+    os.remove(filepath)
+    _update_index_entry(filepath, None)
+    return True
+
+
+def _delete_history(conf_uid: str, history_uid: str) -> Future[bool]:
     if not conf_uid or not history_uid:
         logger.warning("Missing conf_uid or history_uid")
-        return False
+        return _resolved(False)
 
     filepath = _get_safe_history_path(conf_uid, history_uid)
-    try:
-        if os.path.exists(filepath):
-            os.remove(filepath)
-            logger.debug(f"Successfully deleted history file: {filepath}")
-            return True
-    except Exception as e:
-        logger.error(f"Failed to delete history file: {e}")
-    return False
 
+    def delete() -> bool:
+        try:
+            if _delete_history_file(filepath):
+                logger.debug(f"Successfully deleted history file: {filepath}")
+                return True
+        except Exception as e:
+            logger.error(f"Failed to delete history file: {e}")
+        return False
 
-def get_history_list(conf_uid: str) -> List[dict]:
-    """Get list of histories with their latest messages"""
-    if not conf_uid:
-        return []
+    return _writer.submit(delete)
 
-    histories = []
-    conf_dir = _ensure_conf_dir(conf_uid)
-    empty_history_uids = []
 
-    try:
-        for filename in os.listdir(conf_dir):
-            if not filename.endswith(".json"):
-                continue
+def delete_history(conf_uid: str, history_uid: str) -> bool:
+    """Delete a specific history file"""
+    return _delete_history(conf_uid, history_uid).result()
+
 
-            history_uid = filename[:-5]
-            filepath = os.path.join(conf_dir, filename)
+async def async_delete_history(conf_uid: str, history_uid: str) -> bool:
+    """Async variant of ``delete_history``"""
+    return await asyncio.wrap_future(_delete_history(conf_uid, history_uid))
 
+
+def _list_histories(conf_uid: str) -> List[dict]:
+    conf_dir = _ensure_conf_dir(conf_uid)
+    index = _load_index(conf_dir)
+
+    histories = []
+    empty_history_uids = []
+    for history_uid, entry in index.items():
+        if not entry["count"]:
+            empty_history_uids.append(history_uid)
+            continue
+        latest_message = entry["latest_message"]
+        histories.append(
+            {
+                "uid": history_uid,
+                "latest_message": latest_message,
+                "timestamp": latest_message["timestamp"] if latest_message else None,
+            }
+        )
+
+    # Clean up empty histories if there are other non-empty ones
+    if empty_history_uids and len(index) > 1:
+        for uid in empty_history_uids:
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    messages = json.load(f)
-
-                    # Filter out metadata for checking if history is empty
-                    actual_messages = [
-                        msg for msg in messages if msg["role"] != "metadata"
-                    ]
-                    if not actual_messages:
-                        empty_history_uids.append(history_uid)
-                        continue
-
-                    latest_message = actual_messages[-1]
-                    history_info = {
-                        "uid": history_uid,
-                        "latest_message": latest_message,
-                        "timestamp": (
-                            latest_message["timestamp"] if latest_message else None
-                        ),
-                    }
-                    histories.append(history_info)
+                _delete_history_file(os.path.join(conf_dir, f"{uid}{HISTORY_SUFFIX}"))
+                logger.info(f"Removed empty history file: {uid}")
             except Exception as e:
-                logger.error(f"Error reading history file {filename}: {e}")
-                continue
+                logger.error(f"Failed to remove empty history file {uid}: {e}")
+
+    histories.sort(key=lambda x: x["timestamp"] if x["timestamp"] else "", reverse=True)
+    return histories
+
+
+def _get_history_list(conf_uid: str) -> Future[List[dict]]:
+    if not conf_uid:
+        return _resolved([])
+
+    def list_histories() -> List[dict]:
+        try:
+            return _list_histories(conf_uid)
+        except Exception as e:
+            logger.error(f"Error listing histories: {e}")
+            return []
+
+    return _writer.submit(list_histories)
+
+
+def get_history_list(conf_uid: str) -> List[dict]:
+    """Get list of histories with their latest messages"""
+    return _get_history_list(conf_uid).result()
+
+
+async def async_get_history_list(conf_uid: str) -> List[dict]:
+    """Async variant of ``get_history_list``"""
+    return await asyncio.wrap_future(_get_history_list(conf_uid))
 
-        # Clean up empty histories if there are other non-empty ones
-        if len(empty_history_uids) > 0 and len(os.listdir(conf_dir)) > 1:
-            for uid in empty_history_uids:
-                try:
-                    os.remove(os.path.join(conf_dir, f"{uid}.json"))
-                    logger.info(f"Removed empty history file: {uid}")
-                except Exception as e:
-                    logger.error(f"Failed to remove empty history file {uid}: {e}")
-
-        histories.sort(
-            key=lambda x: x["timestamp"] if x["timestamp"] else "", reverse=True
+
+def _modify_latest(filepath: str, role: str, new_content: str) -> bool:
+    _migrate_legacy_files(os.path.dirname(filepath))
+    if not os.path.exists(filepath):
+        logger.warning(f"History file not found: {filepath}")
+        return False
+
+    records = _read_records(filepath)
+    messages = [r for r in records if r.get("role") != "metadata"]
+    if not messages:
+        logger.warning("History is empty")
+        return False
+
+    latest_message = messages[-1]
+    if latest_message["role"] != role:
+        logger.warning(
+            f"Latest message role ({latest_message['role']}) doesn't match requested role ({role})"
         )
-        return histories
+        return False
 
-    except Exception as e:
-        logger.error(f"Error listing histories: {e}")
-        return []
+    latest_message["content"] = new_content
+    _write_records(filepath, records)
+    _update_index_entry(filepath, _scan_entry(filepath))
+    return True
 
 
 def modify_latest_message(
@@ -320,37 +621,27 @@ def modify_latest_message(
         return False
 
     filepath = _get_safe_history_path(conf_uid, history_uid)
-    if not os.path.exists(filepath):
-        logger.warning(f"History file not found: {filepath}")
-        return False
-
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            history_data = json.load(f)
-
-        if not history_data:
-            logger.warning("History is empty")
-            return False
-
-        latest_message = history_data[-1]
-        if latest_message["role"] != role:
-            logger.warning(
-                f"Latest message role ({latest_message['role']}) doesn't match requested role ({role})"
-            )
-            return False
-
-        latest_message["content"] = new_content
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(history_data, f, ensure_ascii=False, indent=2)
-
-        logger.debug(f"Successfully modified latest {role} message")
-        return True
+        if _run(_modify_latest, filepath, role, new_content):
+            logger.debug(f"Successfully modified latest {role} message")
+            return True
+        return False
 
     except Exception as e:
         logger.error(f"Failed to modify latest message: {e}")
         return False
 
 
+def _rename_history_file(old_filepath: str, new_filepath: str) -> bool:
+    _migrate_legacy_files(os.path.dirname(old_filepath))
+    if not os.path.exists(old_filepath):
+        return False
+    os.rename(old_filepath, new_filepath)
+    _update_index_entry(old_filepath, None)
+    _update_index_entry(new_filepath, _scan_entry(new_filepath))
+    return True
+
+
 def rename_history_file(
     conf_uid: str, old_history_uid: str, new_history_uid: str
 ) -> bool:
@@ -363,8 +654,7 @@ def rename_history_file(
     new_filepath = _get_safe_history_path(conf_uid, new_history_uid)
 
     try:
-        if os.path.exists(old_filepath):
-            os.rename(old_filepath, new_filepath)
+        if _run(_rename_history_file, old_filepath, new_filepath):
             logger.info(
                 f"Renamed history file from {old_history_uid} to {new_history_uid}"
             )
@@ -213,6 +213,7 @@ class LlamaCppConfig(StatelessLLMBaseConfig):
     """Configuration for LlamaCpp."""
 
     model_path: str = Field(..., alias="model_path")
+    prompt_cache_size: int = Field(0, alias="prompt_cache_size")
     interrupt_method: Literal["system", "user"] = Field(
         "system", alias="interrupt_method"
     )
@@ -221,6 +222,10 @@ class LlamaCppConfig(StatelessLLMBaseConfig):
         "model_path": Description(
             en="Path to the GGUF model file", zh="GGUF 模型文件路径"
         ),
+        "prompt_cache_size": Description(
+            en="RAM in bytes for reusing the evaluated prompt prefix across turns (0 to disable)",
+            zh="跨轮次复用已计算提示词前缀的内存大小(字节, 0 表示禁用)",
+        ),
     }
 
     DESCRIPTIONS: ClassVar[dict[str, Description]] = {
@@ -13,6 +13,7 @@ class SystemConfig(I18nMixin):
     config_alts_dir: str = Field(..., alias="config_alts_dir")
     tool_prompts: Dict[str, str] = Field(..., alias="tool_prompts")
     enable_proxy: bool = Field(False, alias="enable_proxy")
+    proxy_coalesce_text_input: bool = Field(False, alias="proxy_coalesce_text_input")
     cors_origins: list[str] = Field(default=["*"], alias="cors_origins")
 
     # Specify namespace for this config class
@@ -27,6 +28,7 @@ class SystemConfig(I18nMixin):
         "config_alts_dir": "config_alts_dir",
         "tool_prompts": "tool_prompts",
         "enable_proxy": "enable_proxy",
+        "proxy_coalesce_text_input": "proxy_coalesce_text_input",
         "cors_origins": "cors_origins",
     }
 
@@ -456,6 +456,7 @@ class OpenAITTSConfig(I18nMixin):
     api_key: Optional[str] = Field(None, alias="api_key")
     base_url: Optional[str] = Field(None, alias="base_url")
     file_extension: Literal["mp3", "wav"] = Field("mp3", alias="file_extension")
+    stream: bool = Field(False, alias="stream")
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "model": Description(
@@ -478,6 +479,10 @@ class OpenAITTSConfig(I18nMixin):
             en="Audio file format (mp3 or wav, defaults to mp3)",
             zh="音频文件格式（mp3 或 wav，默认为 mp3）",
         ),
+        "stream": Description(
+            en="Stream 24 kHz PCM while generating (server must support the pcm format)",
+            zh="边生成边流式传输 24 kHz PCM（服务器需支持 pcm 格式）",
+        ),
     }
 
 
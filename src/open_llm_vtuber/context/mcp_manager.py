@@ -1,5 +1,6 @@
 """MCP (Model Context Protocol) component management."""
 
+import asyncio
 from typing import Callable, List
 from loguru import logger
 
@@ -20,6 +21,8 @@ class MCPManager:
         self.mcp_client: MCPClient | None = None
         self.tool_executor: ToolExecutor | None = None
         self.mcp_prompt: str = ""
+        # Background start of servers whose tools came from the schema cache
+        self._warm_up_task: asyncio.Task | None = None
 
     async def initialize(
         self,
@@ -58,6 +61,9 @@ class MCPManager:
 
     def _reset_components(self) -> None:
         """Reset all MCP components to initial state."""
+        if self._warm_up_task:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
         self.server_registry = None
         self.tool_manager = None
         self.mcp_client = None
@@ -83,7 +89,10 @@ class MCPManager:
             self.mcp_prompt = "[Error: ToolAdapter not initialized]"
             return
 
-        # 3. Get tools from ToolAdapter
+        # 3. Initialize MCPClient
+        self._init_mcp_client(send_text, client_uid)
+
+        # 4. Get tools from ToolAdapter (servers it starts stay up in the client)
         try:
             await self._init_tool_manager(enabled_servers)
         except Exception as e:
@@ -93,23 +102,27 @@ class MCPManager:
             self.tool_manager = None
             self.mcp_prompt = "[Error constructing MCP tools/prompt]"
 
-        # 4. Initialize MCPClient
-        self._init_mcp_client(send_text, client_uid)
-
         # 5. Initialize ToolExecutor
         self._init_tool_executor()
 
+        # 6. Start servers skipped thanks to the schema cache, off the boot path
+        if self.mcp_client:
+            self._warm_up_task = asyncio.create_task(
+                self.tool_adapter.warm_up(enabled_servers, self.mcp_client)
+            )
+
         logger.info("MCP components initialization complete.")
 
     async def _init_tool_manager(self, enabled_servers: List[str]) -> None:
         """Initialize the ToolManager with fetched tools."""
-        (
-            mcp_prompt_string,
-            openai_tools,
-            claude_tools,
-        ) = await self.tool_adapter.get_tools(enabled_servers)
+        servers_info, raw_tools_dict = await self.tool_adapter.get_server_and_tool_info(
+            enabled_servers, self.mcp_client
+        )
+        self.mcp_prompt = self.tool_adapter.construct_mcp_prompt_string(servers_info)
+        openai_tools, claude_tools = self.tool_adapter.format_tools_for_api(
+            raw_tools_dict
+        )
 
-        self.mcp_prompt = mcp_prompt_string
         logger.info(
             f"Dynamically generated MCP prompt string (length: {len(self.mcp_prompt)})."
         )
@@ -117,9 +130,6 @@ class MCPManager:
             f"Dynamically formatted tools - OpenAI: {len(openai_tools)}, Claude: {len(claude_tools)}."
         )
 
-        _, raw_tools_dict = await self.tool_adapter.get_server_and_tool_info(
-            enabled_servers
-        )
         self.tool_manager = ToolManager(
             formatted_tools_openai=openai_tools,
             formatted_tools_claude=claude_tools,
@@ -159,6 +169,9 @@ class MCPManager:
 
     async def close(self) -> None:
         """Clean up MCP resources."""
+        if self._warm_up_task:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
         if self.mcp_client:
             logger.info("Closing MCPClient...")
             await self.mcp_client.aclose()
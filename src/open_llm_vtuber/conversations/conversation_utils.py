@@ -10,6 +10,7 @@ from .types import WebSocketSend, BroadcastContext
 from .tts_manager import TTSTaskManager
 from ..agent.output_types import SentenceOutput, AudioOutput
 from ..agent.input_types import BatchInput, TextData, ImageData, TextSource, ImageSource
+from ..agent.agents.agent_interface import AgentInterface
 from ..asr.asr_interface import ASRInterface
 from ..live2d_model import Live2dModel
 from ..tts.tts_interface import TTSInterface
@@ -147,18 +148,37 @@ async def process_user_input(
     user_input: Union[str, np.ndarray],
     asr_engine: ASRInterface,
     websocket_send: WebSocketSend,
+    agent_engine: Optional[AgentInterface] = None,
+    images: Optional[List[Dict[str, Any]]] = None,
 ) -> str:
-    """Process user input, converting audio to text if needed"""
+    """Process user input, converting audio to text if needed
+
+    If the agent supports it, memory retrieval for the turn is started as
+    soon as the text is known, overlapping the rest of the turn setup.
+    ``images`` are the turn's images, which are part of the agent's prompt.
+    """
     if isinstance(user_input, np.ndarray):
         logger.info("Transcribing audio input...")
         input_text = await asr_engine.async_transcribe_np(user_input)
+        _prefetch_context(agent_engine, input_text, images)
         await websocket_send(
             json.dumps({"type": "user-input-transcription", "text": input_text})
         )
         return input_text
+    _prefetch_context(agent_engine, user_input, images)
     return user_input
 
 
+def _prefetch_context(
+    agent_engine: Optional[AgentInterface],
+    input_text: str,
+    images: Optional[List[Dict[str, Any]]],
+) -> None:
+    """Start the agent's memory retrieval for the turn, if it supports it"""
+    if hasattr(agent_engine, "prefetch_context"):
+        agent_engine.prefetch_context(create_batch_input(input_text, images, ""))
+
+
 async def finalize_conversation_turn(
     tts_manager: TTSTaskManager,
     websocket_send: WebSocketSend,
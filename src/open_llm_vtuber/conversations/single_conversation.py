@@ -66,7 +66,11 @@ async def process_single_conversation(
         # Process user input
         try:
             input_text = await process_user_input(
-                user_input, context.asr_engine, websocket_send
+                user_input,
+                context.asr_engine,
+                websocket_send,
+                context.agent_engine,
+                images=images,
             )
         except Exception as e:
             logger.error(f"Error processing user input: {e}")
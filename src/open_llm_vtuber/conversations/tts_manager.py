@@ -1,17 +1,27 @@
 import asyncio
 import json
 import re
-import uuid
-from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from loguru import logger
 
 from ..agent.output_types import DisplayText, Actions
 from ..live2d_model import Live2dModel
 from ..tts.tts_interface import TTSInterface
-from ..utils.stream_audio import prepare_audio_payload
+from ..utils.stream_audio import (
+    pcm_rms_by_chunks,
+    prepare_audio_chunk_payload,
+    prepare_audio_payload,
+)
 from .types import WebSocketSend
 
+# Audio per frame when forwarding a TTS engine's output. The first frame is
+# kept short so playback starts early; later frames are longer to limit
+# per-message overhead. A file-based engine's sentence arrives as one chunk
+# and is sent as one frame.
+STREAM_FIRST_FRAME_MS = 250
+STREAM_FRAME_MS = 1000
+VOLUME_CHUNK_MS = 20
+
 
 class TTSTaskManager:
     """Manages TTS tasks and ensures ordered delivery to frontend while allowing parallel TTS generation"""
@@ -19,8 +29,11 @@ class TTSTaskManager:
     def __init__(self) -> None:
         self.task_list: List[asyncio.Task] = []
         self._lock = asyncio.Lock()
-        # Queue to store ordered payloads
-        self._payload_queue: asyncio.Queue[Dict] = asyncio.Queue()
+        # Queue of (payload, sequence_number, final); a sentence may queue
+        # several frames, the last one flagged final (its payload may be None)
+        self._payload_queue: asyncio.Queue[Tuple[Optional[Dict], int, bool]] = (
+            asyncio.Queue()
+        )
         # Task to handle sending payloads in order
         self._sender_task: Optional[asyncio.Task] = None
         # Counter for maintaining order
@@ -93,19 +106,31 @@ class TTSTaskManager:
         """
         Process and send payloads in correct order.
         Runs continuously until all payloads are processed.
+
+        Frames of the sentence currently being played are forwarded as soon
+        as they arrive; frames of later sentences wait until every earlier
+        sentence has queued its final frame.
         """
-        buffered_payloads: Dict[int, Dict] = {}
+        buffered_payloads: Dict[int, List[Dict]] = {}
+        finished: set[int] = set()
 
         while True:
             try:
                 # Get payload from queue
-                payload, sequence_number = await self._payload_queue.get()
-                buffered_payloads[sequence_number] = payload
+                payload, sequence_number, final = await self._payload_queue.get()
+                if payload is not None:
+                    buffered_payloads.setdefault(sequence_number, []).append(payload)
+                if final:
+                    finished.add(sequence_number)
 
                 # Send payloads in order
-                while self._next_sequence_to_send in buffered_payloads:
-                    next_payload = buffered_payloads.pop(self._next_sequence_to_send)
-                    await websocket_send(json.dumps(next_payload))
+                while True:
+                    current = self._next_sequence_to_send
+                    for next_payload in buffered_payloads.pop(current, []):
+                        await websocket_send(json.dumps(next_payload))
+                    if current not in finished:
+                        break
+                    finished.discard(current)
                     self._next_sequence_to_send += 1
 
                 self._payload_queue.task_done()
@@ -125,7 +150,7 @@ class TTSTaskManager:
             display_text=display_text,
             actions=actions,
         )
-        await self._payload_queue.put((audio_payload, sequence_number))
+        await self._payload_queue.put((audio_payload, sequence_number, True))
 
     async def _process_tts(
         self,
@@ -136,40 +161,59 @@ class TTSTaskManager:
         tts_engine: TTSInterface,
         sequence_number: int,
     ) -> None:
-        """Process TTS generation and queue the result for ordered delivery"""
-        audio_file_path = None
-        try:
-            audio_file_path = await self._generate_audio(tts_engine, tts_text)
-            payload = prepare_audio_payload(
-                audio_path=audio_file_path,
-                display_text=display_text,
-                actions=actions,
+        """
+        Forward the engine's audio as frames while it is synthesized.
+
+        Frames are queued for ordered delivery; if the engine produces no
+        audio, a silent payload carries the subtitle and actions instead.
+        """
+        logger.debug(f"🏃Synthesizing audio for '''{tts_text}'''...")
+        pending = bytearray()
+        sample_rate = 0
+        frame_ms = STREAM_FIRST_FRAME_MS
+        peak = 0.0
+        frames_sent = 0
+
+        async def queue_frame(pcm: bytes) -> None:
+            nonlocal peak, frames_sent
+            volumes = pcm_rms_by_chunks(pcm, sample_rate, VOLUME_CHUNK_MS)
+            # Normalize to the loudest chunk so far, as file payloads do
+            peak = max(peak, *volumes)
+            payload = prepare_audio_chunk_payload(
+                pcm=pcm,
+                sample_rate=sample_rate,
+                volumes=[v / peak if peak else 0.0 for v in volumes],
+                chunk_length_ms=VOLUME_CHUNK_MS,
+                # The subtitle and actions (expressions) apply once, with the
+                # first frame, so clients do not repeat them per frame
+                display_text=display_text if frames_sent == 0 else None,
+                actions=actions if frames_sent == 0 else None,
             )
-            # Queue the payload with its sequence number
-            await self._payload_queue.put((payload, sequence_number))
+            await self._payload_queue.put((payload, sequence_number, False))
+            frames_sent += 1
 
+        try:
+            async for chunk in tts_engine.async_audio_chunks(tts_text):
+                sample_rate = chunk.sample_rate
+                pending += chunk.pcm
+                if len(pending) >= sample_rate * frame_ms // 1000 * 2:
+                    # Whole 16-bit samples only
+                    usable = len(pending) - len(pending) % 2
+                    await queue_frame(bytes(pending[:usable]))
+                    del pending[:usable]
+                    frame_ms = STREAM_FRAME_MS
+            usable = len(pending) - len(pending) % 2
+            if usable:
+                await queue_frame(bytes(pending[:usable]))
         except Exception as e:
             logger.error(f"Error preparing audio payload: {e}")
-            # Queue silent payload for error case
-            payload = prepare_audio_payload(
-                audio_path=None,
-                display_text=display_text,
-                actions=actions,
-            )
-            await self._payload_queue.put((payload, sequence_number))
-
-        finally:
-            if audio_file_path:
-                tts_engine.remove_file(audio_file_path)
-                logger.debug("Audio cache file cleaned.")
-
-    async def _generate_audio(self, tts_engine: TTSInterface, text: str) -> str:
-        """Generate audio file from text"""
-        logger.debug(f"🏃Generating audio for '''{text}'''...")
-        return await tts_engine.async_generate_audio(
-            text=text,
-            file_name_no_ext=f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}",
-        )
+
+        if frames_sent == 0:
+            # Queue silent payload so the subtitle and actions still arrive
+            await self._send_silent_payload(display_text, actions, sequence_number)
+            return
+        # Lets the sender move on to the next sentence
+        await self._payload_queue.put((None, sequence_number, True))
 
     def clear(self) -> None:
         """Clear all pending tasks and reset state"""
@@ -4,12 +4,16 @@
 동시에 들어오는 여러 입력(채팅 메시지, 음성 명령)을 큐에 저장하고
 순차적으로 처리하는 시스템입니다.
 초당 10개 이상의 메시지를 안정적으로 처리합니다.
+
+대화를 시작하는 입력만 우선순위 큐(처리 간격 적용)를 거치고, 오디오 청크 같은
+스트리밍 메시지는 클라이언트별 레인에서 도착 순서대로 지연 없이 처리됩니다.
 """
 
 import asyncio
 import logging
+import time
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Coroutine, Dict, List, Optional
 from datetime import datetime, timedelta
 from enum import Enum
@@ -34,6 +38,28 @@ class MetricSnapshot:
     total_processed: int
 
 
+@dataclass
+class ClientLane:
+    """
+    클라이언트별 순차 처리 레인
+
+    한 클라이언트의 메시지를 도착 순서대로 처리합니다. 대화 트리거는
+    우선순위 큐로 넘긴 뒤 처리가 끝날 때까지 레인을 멈춰 순서를 보장합니다.
+    """
+
+    client_uid: str
+    queue: asyncio.Queue
+    task: Optional[asyncio.Task] = None
+    total_received: int = 0
+    total_processed: int = 0
+    total_failed: int = 0
+    total_dropped: int = 0
+    total_handoffs: int = 0
+    max_pending: int = 0
+    processing_times: deque = field(default_factory=lambda: deque(maxlen=100))
+    last_activity: Optional[datetime] = None
+
+
 class InputType(Enum):
     """입력 타입 분류"""
 
@@ -67,7 +93,11 @@ class InputQueueManager:
             alert_callback: 알림 콜백 함수 (alert_type, message, severity)
         """
         self.config = config or QueueConfig()
-        self._queue = PriorityQueue(self.config, alert_callback=alert_callback)
+        self._queue = PriorityQueue(
+            self.config,
+            alert_callback=alert_callback,
+            drop_callback=self._release_handoff,
+        )
         self._message_handler = message_handler
         self._alert_callback = alert_callback
 
@@ -86,6 +116,10 @@ class InputQueueManager:
         self._current_message: Optional[Dict[str, Any]] = None
         self._processing_start_time: Optional[float] = None
 
+        # 클라이언트별 레인과 우선순위 큐로 넘긴 메시지의 처리 완료 대기
+        self._lanes: Dict[str, ClientLane] = {}
+        self._handoffs: Dict[int, asyncio.Future] = {}
+
         # 메트릭 히스토리 (최근 5분, 1초 간격 = 300개)
         self._metric_history: deque[MetricSnapshot] = deque(maxlen=300)
         self._last_snapshot_time: Optional[datetime] = None
@@ -142,6 +176,11 @@ class InputQueueManager:
                         worker.cancel()
 
         self._workers.clear()
+
+        # 클라이언트 레인 종료
+        for client_uid in list(self._lanes):
+            await self.remove_client(client_uid)
+
         logger.info("InputQueueManager 중지 완료")
 
     async def enqueue(self, message: Dict[str, Any]) -> bool:
@@ -167,6 +206,11 @@ class InputQueueManager:
         if "timestamp" not in message:
             message["timestamp"] = datetime.now().isoformat()
 
+        # 클라이언트 메시지는 클라이언트 레인에서 도착 순서대로 처리
+        client_uid = message.get("client_uid")
+        if client_uid:
+            return self._enqueue_lane(client_uid, message)
+
         # 큐에 추가
         success = await self._queue.put(message)
 
@@ -181,6 +225,138 @@ class InputQueueManager:
 
         return success
 
+    def _enqueue_lane(self, client_uid: str, message: Dict[str, Any]) -> bool:
+        """
+        메시지를 클라이언트 레인에 추가합니다.
+
+        Args:
+            client_uid: 클라이언트 식별자
+            message: 추가할 메시지
+
+        Returns:
+            bool: 레인에 추가되었으면 True, 레인이 가득 차 드롭되었으면 False
+        """
+        lane = self._lanes.get(client_uid)
+        if lane is None:
+            lane = ClientLane(
+                client_uid=client_uid,
+                queue=asyncio.Queue(maxsize=self.config.lane_max_size),
+            )
+            lane.task = asyncio.create_task(
+                self._lane_worker(lane), name=f"input_lane_{client_uid}"
+            )
+            self._lanes[client_uid] = lane
+
+        try:
+            lane.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            lane.total_dropped += 1
+            logger.warning(
+                f"메시지 드롭됨 (레인 오버플로우): {client_uid}, "
+                f"{message.get('type', 'unknown')}"
+            )
+            return False
+
+        lane.total_received += 1
+        lane.max_pending = max(lane.max_pending, lane.queue.qsize())
+        return True
+
+    async def _lane_worker(self, lane: ClientLane):
+        """
+        클라이언트 레인 워커: 레인 메시지를 도착 순서대로 처리합니다.
+
+        스트리밍 메시지는 바로 처리하고, 대화 트리거는 우선순위 큐로 넘긴 뒤
+        처리가 끝날 때까지 기다립니다.
+
+        Args:
+            lane: 처리할 클라이언트 레인
+        """
+        while True:
+            message = await lane.queue.get()
+            lane.last_activity = datetime.now()
+            try:
+                if message.get("type") in self.config.prioritized_message_types:
+                    await self._handoff(lane, message)
+                else:
+                    await self._process_lane_message(lane, message)
+            except Exception as e:
+                logger.error(f"레인 {lane.client_uid} 에러: {e}", exc_info=True)
+            finally:
+                lane.queue.task_done()
+
+    async def _process_lane_message(self, lane: ClientLane, message: Dict[str, Any]):
+        """
+        레인 메시지를 처리 간격 없이 바로 처리합니다.
+
+        Args:
+            lane: 메시지가 속한 레인
+            message: 처리할 메시지
+        """
+        start = time.perf_counter()
+        try:
+            if self._message_handler:
+                await self._message_handler(message)
+            lane.total_processed += 1
+        except Exception as e:
+            lane.total_failed += 1
+            logger.error(
+                f"레인 메시지 처리 실패: {message.get('type', 'unknown')}, 에러: {e}",
+                exc_info=True,
+            )
+        finally:
+            lane.processing_times.append(time.perf_counter() - start)
+
+    async def _handoff(self, lane: ClientLane, message: Dict[str, Any]):
+        """
+        대화 트리거를 우선순위 큐로 넘기고 처리가 끝날 때까지 기다립니다.
+
+        Args:
+            lane: 메시지가 속한 레인
+            message: 넘길 메시지
+        """
+        done = asyncio.get_running_loop().create_future()
+        self._handoffs[id(message)] = done
+        lane.total_handoffs += 1
+
+        if await self._queue.put(message):
+            self._total_received += 1
+            await done
+        else:
+            self._handoffs.pop(id(message), None)
+            logger.warning(
+                f"메시지 드롭됨 (큐 오버플로우): {message.get('type', 'unknown')}"
+            )
+
+    def _release_handoff(self, message: Dict[str, Any]) -> None:
+        """
+        우선순위 큐로 넘긴 메시지를 기다리는 레인을 재개합니다.
+
+        메시지가 처리되었거나 큐에서 드롭되었을 때 호출됩니다.
+
+        Args:
+            message: 처리 또는 드롭된 메시지
+        """
+        done = self._handoffs.pop(id(message), None)
+        if done is not None and not done.done():
+            done.set_result(None)
+
+    async def remove_client(self, client_uid: str):
+        """
+        클라이언트 레인을 종료하고 제거합니다.
+
+        Args:
+            client_uid: 클라이언트 식별자
+        """
+        lane = self._lanes.pop(client_uid, None)
+        if lane is None or lane.task is None:
+            return
+
+        lane.task.cancel()
+        try:
+            await lane.task
+        except asyncio.CancelledError:
+            pass
+
     async def _worker(self, worker_id: int):
         """
         백그라운드 워커: 큐에서 메시지를 가져와 처리합니다.
@@ -271,6 +447,7 @@ class InputQueueManager:
         finally:
             self._current_message = None
             self._processing_start_time = None
+            self._release_handoff(message)
 
     def _determine_priority(self, message: Dict[str, Any]) -> int:
         """
@@ -413,6 +590,47 @@ class InputQueueManager:
             "processing_rate": self._calculate_processing_rate(),
         }
 
+    def get_lane_status(self) -> Dict[str, Any]:
+        """
+        레인별 상태를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 우선순위 레인과 클라이언트 레인 상태
+        """
+        status = self.get_status()
+        clients = []
+        for lane in self._lanes.values():
+            times = lane.processing_times
+            clients.append(
+                {
+                    "client_uid": lane.client_uid,
+                    "pending": lane.queue.qsize(),
+                    "max_pending": lane.max_pending,
+                    "total_received": lane.total_received,
+                    "total_processed": lane.total_processed,
+                    "total_failed": lane.total_failed,
+                    "total_dropped": lane.total_dropped,
+                    "total_handoffs": lane.total_handoffs,
+                    "avg_processing_time": sum(times) / len(times) if times else 0.0,
+                    "last_activity": (
+                        lane.last_activity.isoformat() if lane.last_activity else None
+                    ),
+                }
+            )
+
+        return {
+            "prioritized": {
+                "pending": status["queue_size"],
+                "max_size": status["queue_max_size"],
+                "total_received": status["total_received"],
+                "total_processed": status["total_processed"],
+                "total_dropped": status["total_dropped"],
+                "avg_processing_time": status["avg_processing_time"],
+                "message_types": sorted(self.config.prioritized_message_types),
+            },
+            "client_lanes": clients,
+        }
+
     def _calculate_processing_rate(self) -> float:
         """
         초당 처리 메시지 수를 계산합니다.
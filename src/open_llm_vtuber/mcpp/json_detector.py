@@ -1,16 +1,41 @@
 import json
-from typing import List, Dict, Any, Optional, Tuple
+import re
+from typing import List, Dict, Any, Optional
 from loguru import logger
 
+# Characters that matter inside an object, outside and inside string literals.
+# Outside strings that is the structural characters plus anything that
+# cannot appear in JSON there, which shows the candidate is really prose.
+_STRUCTURAL = re.compile(r"[^\s\[\]:,0-9.+\-eEtrufalsn]")
+_STRING_SPECIAL = re.compile(r'["\\\x00-\x1f]')
+
 
 class StreamJSONDetector:
-    """Detector for real-time JSON detection in streaming text."""
+    """Detector for real-time JSON detection in streaming text.
+
+    Text is scanned once, keeping brace depth and string/escape state across
+    chunks. Only the text of the object currently being read is kept, and
+    json.loads runs only when a top-level object closes. An object that turns
+    out not to be JSON, such as prose with a stray quote, is dropped as soon
+    as that shows and scanning resumes at the next "{" inside it.
+    """
 
     def __init__(self):
-        self.buffer = ""  # Store text that has not been fully processed
-        self.potential_jsons = []  # Store possible JSON starting positions
         self.completed_jsons = []  # Store completed JSON objects
-        self.processed_ranges = []  # Store processed intervals [start, end]
+        self._parts: List[str] = []  # Text of the open object from earlier chunks
+        self._depth = 0  # Brace depth of the open object, 0 if none
+        self._in_string = False
+        self._escape = False  # Previous chunk ended with a backslash in a string
+        self._opening = False  # Saw "{" and only whitespace since
+        self._closed_string = False  # Saw a string's end and only whitespace since
+        # Offset in the open object's text of the first "{" after its opening
+        # one, where scanning resumes if the object turns out not to be JSON
+        self._restart: Optional[int] = None
+
+    @property
+    def buffer(self) -> str:
+        """Text of the object currently being read."""
+        return "".join(self._parts)
 
     def process_chunk(self, chunk: str) -> List[Dict[str, Any]]:
         """Process a single text chunk, return a list of complete JSON objects found in this chunk.
@@ -21,104 +46,153 @@ class StreamJSONDetector:
         Returns:
             List[Dict[str, Any]]: List of complete JSON objects parsed from the current chunk
         """
-        # Add new chunk to buffer
-        old_length = len(self.buffer)
-        self.buffer += chunk
-
-        # Update potential JSON starting positions
-        self._find_potential_starts(old_length)
-
-        # Try to parse potential JSON objects
-        new_jsons = self._try_parse_jsons()
-
+        new_jsons = self._scan(chunk)
+        self.completed_jsons.extend(new_jsons)
         return new_jsons
 
-    def _find_potential_starts(self, start_from: int) -> None:
-        """Find new potential JSON starting positions in the buffer.
+    def _scan(self, text: str) -> List[Dict[str, Any]]:
+        """Advance the scanner over `text`.
 
         Args:
-            start_from (int): Position to start searching from
-        """
-        for i in range(start_from, len(self.buffer)):
-            if self.buffer[i] == "{" and not self._is_in_processed_range(i):
-                self.potential_jsons.append(i)
-
-    def _is_in_processed_range(self, pos: int) -> bool:
-        """Check if a specified position is within a processed range.
-
-        Args:
-            pos (int): Position to check
+            text (str): Text following everything scanned so far
 
         Returns:
-            bool: True if position is within a processed range, otherwise False
+            List[Dict[str, Any]]: Objects completed within `text`
         """
-        for start, end in self.processed_ranges:
-            if start <= pos <= end:
-                return True
-        return False
-
-    def _try_parse_jsons(self) -> List[Dict[str, Any]]:
-        """Try to parse JSON objects from the current buffer.
-
-        Returns:
-            List[Dict[str, Any]]: List of newly parsed JSON objects
-        """
-        new_jsons = []
-        remaining_potential = []
-
-        # Sort by starting position, process outermost JSON first
-        self.potential_jsons.sort()
-
-        for start_idx in self.potential_jsons:
-            # Skip if this position is already within a processed range
-            if self._is_in_processed_range(start_idx):
-                continue
-
-            result, end_idx = self._extract_json(start_idx)
-            if result is not None:
-                new_jsons.append(result)
-                # Mark this range as processed
-                self.processed_ranges.append((start_idx, end_idx))
-                self.completed_jsons.append(result)
+        found = []
+        i = 0
+        # Where the open object's text starts in `text`
+        piece = 0
+        while i < len(text):
+            if not self._depth:
+                i = text.find("{", i)
+                if i < 0:
+                    return found
+                piece = i
+                self._depth = 1
+                self._opening = True
+                i += 1
+            elif self._opening:
+                # An object's "{" is followed by a key or "}"; anything else
+                # is prose such as "use {braces}" and is skipped
+                while i < len(text) and text[i] in " \t\r\n":
+                    i += 1
+                if i == len(text):
+                    break
+                self._opening = False
+                if text[i] not in '"}':
+                    self._depth = 0
+                    self._parts = []
+            elif self._closed_string:
+                while i < len(text) and text[i] in " \t\r\n":
+                    i += 1
+                if i == len(text):
+                    break
+                self._closed_string = False
+                if text[i] not in ":,]}":
+                    # A JSON string is followed by one of ":,]}", so the
+                    # quotes in 'say {"x" {"tool": 1}' pair up wrongly
+                    text = self._abandon(text, piece, i)
+                    i = piece = 0
+            elif self._escape:
+                self._escape = False
+                if text[i] not in '"\\/bfnrtu':
+                    # Not a JSON escape, so this is not a JSON string either
+                    text = self._abandon(text, piece, i)
+                    i = piece = 0
+                else:
+                    i += 1
+            elif self._in_string:
+                match = _STRING_SPECIAL.search(text, i)
+                end = match.start() if match else len(text)
+                if self._restart is None:
+                    self._note_restart(text, piece, text.find("{", i, end))
+                if not match:
+                    i = len(text)
+                    break
+                char, i = match.group(), match.end()
+                if char == '"':
+                    self._in_string = False
+                    self._closed_string = True
+                elif char == "\\":
+                    self._escape = True
+                else:
+                    # Raw control characters are invalid in JSON strings, so
+                    # this "{" did not start an object; look inside it instead
+                    text = self._abandon(text, piece, i)
+                    i = piece = 0
             else:
-                # This JSON may not be complete yet, keep it
-                remaining_potential.append(start_idx)
-
-        self.potential_jsons = remaining_potential
-        return new_jsons
-
-    def _extract_json(self, start_idx: int) -> Tuple[Optional[Dict[str, Any]], int]:
-        """Try to extract a complete JSON object from the given position.
-
-        Args:
-            start_idx (int): Potential starting position of JSON
-
-        Returns:
-            Tuple[Optional[Dict[str, Any]], int]: Parsed JSON object and ending position,
-                                               or (None, -1) if incomplete
-        """
-        stack = 1
-        i = start_idx + 1
-
-        while i < len(self.buffer) and stack > 0:
-            if self.buffer[i] == "{":
-                stack += 1
-            elif self.buffer[i] == "}":
-                stack -= 1
-            i += 1
-
-        # If complete JSON is found
-        if stack == 0:
-            json_str = self.buffer[start_idx:i]
-            try:
-                json_data = json.loads(json_str)
-                return json_data, i - 1
-            except json.JSONDecodeError:
-                logger.warning(
-                    f"JSON structure found but parsing failed: {json_str[:50]}..."
-                )
-
-        return None, -1
+                match = _STRUCTURAL.search(text, i)
+                if not match:
+                    i = len(text)
+                    break
+                char, i = match.group(), match.end()
+                if char == '"':
+                    self._in_string = True
+                elif char == "{":
+                    if self._restart is None:
+                        self._note_restart(text, piece, i - 1)
+                    self._depth += 1
+                elif char == "}":
+                    self._depth -= 1
+                    if not self._depth:
+                        restart = self._restart
+                        json_str = self._take_object(text, piece, i)
+                        json_data = self._parse(json_str)
+                        if json_data is not None:
+                            found.append(json_data)
+                        else:
+                            # Look for objects inside the unparsable one
+                            text = self._rest(json_str, restart) + text[i:]
+                            i = 0
+                else:
+                    # Prose such as 'He said {"hi} then {"tool": 1}', where
+                    # the quotes pair up wrongly; look inside it instead
+                    text = self._abandon(text, piece, i)
+                    i = piece = 0
+
+        if self._depth:
+            self._parts.append(text[piece:])
+        return found
+
+    def _note_restart(self, text: str, start: int, pos: int) -> None:
+        """Record `text[pos]` as the first "{" after the open object's opening one."""
+        if pos >= 0:
+            self._restart = sum(map(len, self._parts)) + pos - start
+
+    @staticmethod
+    def _rest(json_str: str, restart: Optional[int]) -> str:
+        """Return the part of a rejected object that may hold other objects."""
+        return json_str[restart:] if restart is not None else ""
+
+    def _abandon(self, text: str, start: int, end: int) -> str:
+        """Drop the open object at `text[end]`, returning the text to rescan."""
+        restart = self._restart
+        return self._rest(self._take_object(text, start, end), restart) + text[end:]
+
+    def _take_object(self, text: str, start: int, end: int) -> str:
+        """Return the open object's text ending at `text[end]` and close it."""
+        self._parts.append(text[start:end])
+        json_str = "".join(self._parts)
+        self._parts = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._opening = False
+        self._closed_string = False
+        self._restart = None
+        return json_str
+
+    def _parse(self, json_str: str) -> Optional[Dict[str, Any]]:
+        """Parse a balanced {...} span, or None if it is not a JSON object."""
+        try:
+            json_data = json.loads(json_str)
+        except json.JSONDecodeError:
+            logger.warning(
+                f"JSON structure found but parsing failed: {json_str[:50]}..."
+            )
+            return None
+        return json_data if isinstance(json_data, dict) else None
 
     def get_all_jsons(self) -> List[Dict[str, Any]]:
         """Get all JSON objects parsed so far.
@@ -130,10 +204,14 @@ class StreamJSONDetector:
 
     def reset(self) -> None:
         """Reset detector state, prepare to process a new stream."""
-        self.buffer = ""
-        self.potential_jsons = []
         self.completed_jsons = []
-        self.processed_ranges = []
+        self._parts = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._opening = False
+        self._closed_string = False
+        self._restart = None
 
 
 # Usage example
@@ -1,7 +1,7 @@
 """MCP Client for Open-LLM-Vtuber."""
 
-from contextlib import AsyncExitStack
-from typing import Dict, Any, List, Callable
+import asyncio
+from typing import Dict, Any, List, Callable, Tuple
 from loguru import logger
 from datetime import timedelta
 
@@ -26,9 +26,12 @@ class MCPClient:
         client_uid: str = None,
     ) -> None:
         """Initialize the MCP Client."""
-        self.exit_stack: AsyncExitStack = AsyncExitStack()
         self.active_sessions: Dict[str, ClientSession] = {}
+        # Server name -> (task holding the session open, event that closes it)
+        self._session_tasks: Dict[str, Tuple[asyncio.Task, asyncio.Event]] = {}
         self._list_tools_cache: Dict[str, List[Tool]] = {}  # Cache for list_tools
+        # Serializes startup per server, so concurrent first calls share a process
+        self._session_locks: Dict[str, asyncio.Lock] = {}
         self._send_text: Callable = send_text
         self._client_uid: str = client_uid
 
@@ -47,6 +50,19 @@ class MCPClient:
         if server_name in self.active_sessions:
             return self.active_sessions[server_name]
 
+        lock = self._session_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            if server_name in self.active_sessions:
+                return self.active_sessions[server_name]
+            return await self._start_session(server_name)
+
+    async def _start_session(self, server_name: str) -> ClientSession:
+        """Start the server process and open an initialized session to it.
+
+        The session is owned by a background task that enters and exits the
+        stdio transport itself, so it can be opened, used and closed from
+        different tasks (e.g. started during discovery, used by tool calls).
+        """
         logger.info(f"MCPC: Starting and connecting to server '{server_name}'...")
         server = self.server_registery.get_server(server_name)
         if not server:
@@ -60,26 +76,70 @@ class MCPClient:
             command=server.command, args=server.args, env=server.env, cwd=server.cwd
         )
 
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(
+            self._run_session(server_name, server_params, timeout, ready, stop)
+        )
         try:
-            stdio_transport = await self.exit_stack.enter_async_context(
-                stdio_client(server_params)
+            session = await asyncio.wait_for(
+                asyncio.shield(ready), timeout=server.startup_timeout
             )
-            read, write = stdio_transport
-
-            session = await self.exit_stack.enter_async_context(
-                ClientSession(read, write, read_timeout_seconds=timeout)
+        except asyncio.TimeoutError as e:
+            task.cancel()
+            logger.error(
+                f"MCPC: Server '{server_name}' did not start within "
+                f"{server.startup_timeout}s."
             )
-            await session.initialize()
-
-            self.active_sessions[server_name] = session
-            logger.info(f"MCPC: Successfully connected to server '{server_name}'.")
-            return session
+            raise RuntimeError(
+                f"MCPC: Failed to connect to server '{server_name}'."
+            ) from e
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
         except Exception as e:
             logger.exception(f"MCPC: Failed to connect to server '{server_name}': {e}")
             raise RuntimeError(
                 f"MCPC: Failed to connect to server '{server_name}'."
             ) from e
 
+        self.active_sessions[server_name] = session
+        self._session_tasks[server_name] = (task, stop)
+        logger.info(f"MCPC: Successfully connected to server '{server_name}'.")
+        return session
+
+    async def _run_session(
+        self,
+        server_name: str,
+        server_params: StdioServerParameters,
+        timeout: timedelta,
+        ready: asyncio.Future,
+        stop: asyncio.Event,
+    ) -> None:
+        """Hold a server session open until `stop` is set."""
+        try:
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(
+                    read, write, read_timeout_seconds=timeout
+                ) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.error(f"MCPC: Connection to server '{server_name}' lost: {e}")
+        finally:
+            if not ready.done():
+                ready.cancel()
+            # Let the next call restart a server whose connection went away
+            entry = self._session_tasks.get(server_name)
+            if entry and entry[0] is asyncio.current_task():
+                del self._session_tasks[server_name]
+                self.active_sessions.pop(server_name, None)
+                self._list_tools_cache.pop(server_name, None)
+
     async def list_tools(self, server_name: str) -> List[Tool]:
         """List all available tools on the specified server."""
         # Check cache first
@@ -159,10 +219,16 @@ class MCPClient:
         logger.info(
             f"MCPC: Closing client instance and {len(self.active_sessions)} active connections..."
         )
-        await self.exit_stack.aclose()
+        session_tasks = list(self._session_tasks.values())
+        self._session_tasks.clear()
+        for _, stop in session_tasks:
+            stop.set()
+        await asyncio.gather(
+            *(task for task, _ in session_tasks), return_exceptions=True
+        )
         self.active_sessions.clear()
         self._list_tools_cache.clear()  # Clear cache on close
-        self.exit_stack = AsyncExitStack()
+        self._session_locks.clear()
         logger.info("MCPC: Client instance closed.")
 
     async def __aenter__(self) -> "MCPClient":
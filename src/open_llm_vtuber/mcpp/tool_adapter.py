@@ -1,24 +1,44 @@
 """Constructs prompts for servers and tools, formats tool information for OpenAI API."""
 
+import asyncio
+from pathlib import Path
 from typing import Dict, Optional, List, Tuple, Any
 from loguru import logger
 
 from .types import FormattedTool
 from .mcp_client import MCPClient
 from .server_registry import ServerRegistry
+from .tool_schema_cache import DEFAULT_SCHEMA_CACHE_PATH, ToolSchemaCache
 
 
 class ToolAdapter:
     """Dynamically fetches tool information from enabled MCP servers and formats it."""
 
-    def __init__(self, server_registery: Optional[ServerRegistry] = None) -> None:
-        """Initialize with an ServerRegistry."""
+    def __init__(
+        self,
+        server_registery: Optional[ServerRegistry] = None,
+        schema_cache_path: Optional[str | Path] = DEFAULT_SCHEMA_CACHE_PATH,
+    ) -> None:
+        """Initialize with an ServerRegistry.
+
+        Args:
+            schema_cache_path: File to persist tool info in; None disables it.
+        """
         self.server_registery = server_registery or ServerRegistry()
+        self.schema_cache: Optional[ToolSchemaCache] = (
+            ToolSchemaCache(schema_cache_path) if schema_cache_path else None
+        )
 
     async def get_server_and_tool_info(
-        self, enabled_servers: List[str]
+        self, enabled_servers: List[str], client: Optional[MCPClient] = None
     ) -> Tuple[Dict[str, Dict[str, str]], Dict[str, FormattedTool]]:
-        """Fetch tool information from specified enabled MCP servers."""
+        """Fetch tool information from specified enabled MCP servers.
+
+        Servers are queried concurrently; those with an up-to-date entry in the
+        tool schema cache are not started at all. Pass the session's `client`
+        to keep the started servers running for later tool calls; otherwise a
+        temporary client is used and closed afterwards.
+        """
         servers_info: Dict[str, Dict[str, str]] = {}
         formatted_tools: Dict[str, FormattedTool] = {}
 
@@ -30,58 +50,101 @@ class ToolAdapter:
 
         logger.debug(f"MC: Fetching tool info for enabled servers: {enabled_servers}")
 
-        # Use a single client instance for efficiency
-        async with MCPClient(self.server_registery) as client:
-            for server_name in enabled_servers:
-                if server_name not in self.server_registery.servers:
-                    logger.warning(
-                        f"MC: Enabled server '{server_name}' not found in Server Manager. Skipping."
-                    )
-                    continue
+        server_names = []
+        for server_name in enabled_servers:
+            if server_name not in self.server_registery.servers:
+                logger.warning(
+                    f"MC: Enabled server '{server_name}' not found in Server Manager. Skipping."
+                )
+                continue
+            server_names.append(server_name)
 
-                try:
-                    servers_info[server_name] = {}
-                    tools = await client.list_tools(server_name)
-                    logger.debug(
-                        f"MC: Found {len(tools)} tools on server '{server_name}'"
-                    )
-                    for tool in tools:
-                        servers_info[server_name][tool.name] = {}
-                        tool_info = servers_info[server_name][tool.name]
-                        tool_info["description"] = tool.description
-                        tool_info["parameters"] = tool.inputSchema.get("properties", {})
-                        tool_info["required"] = tool.inputSchema.get("required", [])
-
-                        # Store the tool info in FormattedTool format
-                        formatted_tools[tool.name] = FormattedTool(
-                            input_schema=tool.inputSchema,
-                            related_server=server_name,
-                            description=tool.description,
-                            # Generic schema will be generated later if needed
-                            generic_schema=None,
-                        )
-                except (ValueError, RuntimeError, ConnectionError) as e:
-                    logger.error(
-                        f"MC: Failed to get info for server '{server_name}': {e}"
-                    )
-                    if (
-                        server_name not in servers_info
-                    ):  # Ensure entry exists even on error
-                        servers_info[server_name] = {}
-                    continue  # Continue to next server
-                except Exception as e:
-                    logger.error(
-                        f"MC: Unexpected error for server '{server_name}': {e}"
-                    )
-                    if server_name not in servers_info:
-                        servers_info[server_name] = {}
-                    continue  # Continue to next server
+        owns_client = client is None
+        if owns_client:
+            client = MCPClient(self.server_registery)
+        try:
+            server_tools = await asyncio.gather(
+                *(self._fetch_server_tools(client, name) for name in server_names)
+            )
+        finally:
+            if owns_client:
+                await client.aclose()
+
+        for server_name, tools in zip(server_names, server_tools):
+            servers_info[server_name] = {}
+            for tool in tools:
+                input_schema = tool["inputSchema"]
+                servers_info[server_name][tool["name"]] = {
+                    "description": tool["description"],
+                    "parameters": input_schema.get("properties", {}),
+                    "required": input_schema.get("required", []),
+                }
+                # Store the tool info in FormattedTool format
+                formatted_tools[tool["name"]] = FormattedTool(
+                    input_schema=input_schema,
+                    related_server=server_name,
+                    description=tool["description"],
+                    # Generic schema will be generated later if needed
+                    generic_schema=None,
+                )
 
         logger.debug(
             f"MC: Finished fetching tool info. Found {len(formatted_tools)} tools across enabled servers."
         )
         return servers_info, formatted_tools
 
+    async def _fetch_server_tools(
+        self, client: MCPClient, server_name: str, use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get a server's tools from the schema cache, or from the server itself.
+
+        Returns:
+            List of {"name", "description", "inputSchema"} dicts; empty if the
+            server could not be reached.
+        """
+        server = self.server_registery.get_server(server_name)
+        if use_cache and self.schema_cache:
+            cached = self.schema_cache.get(server)
+            if cached is not None:
+                logger.debug(f"MC: Using cached tool info for server '{server_name}'")
+                return cached
+
+        try:
+            tools = await client.list_tools(server_name)
+        except Exception as e:
+            logger.error(f"MC: Failed to get info for server '{server_name}': {e}")
+            return []
+
+        logger.debug(f"MC: Found {len(tools)} tools on server '{server_name}'")
+        tool_dicts = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema,
+            }
+            for tool in tools
+        ]
+        if self.schema_cache and self.schema_cache.put(server, tool_dicts):
+            logger.info(f"MC: Updated cached tool info for server '{server_name}'")
+        return tool_dicts
+
+    async def warm_up(self, enabled_servers: List[str], client: MCPClient) -> None:
+        """Start servers in `client` and refresh their cached tool info.
+
+        Meant to run in the background after discovery was served from the
+        cache: the first tool call then finds its server already running, and
+        tool changes are picked up on the next start.
+        """
+        server_names = [
+            name for name in enabled_servers if name in self.server_registery.servers
+        ]
+        await asyncio.gather(
+            *(
+                self._fetch_server_tools(client, name, use_cache=False)
+                for name in server_names
+            )
+        )
+
     def construct_mcp_prompt_string(
         self, servers_info: Dict[str, Dict[str, str]]
     ) -> str:
@@ -217,14 +280,14 @@ class ToolAdapter:
         return openai_tools, claude_tools
 
     async def get_tools(
-        self, enabled_servers: List[str]
+        self, enabled_servers: List[str], client: Optional[MCPClient] = None
     ) -> Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]:
         """Run the dynamic fetching and formatting process."""
         logger.info(
             f"MC: Running dynamic tool construction for servers: {enabled_servers}"
         )
         servers_info, formatted_tools_dict = await self.get_server_and_tool_info(
-            enabled_servers
+            enabled_servers, client
         )
         mcp_prompt_string = self.construct_mcp_prompt_string(servers_info)
         openai_tools, claude_tools = self.format_tools_for_api(formatted_tools_dict)
@@ -1,3 +1,5 @@
+import asyncio
+import copy
 import json
 import datetime
 from loguru import logger
@@ -14,6 +16,15 @@ from .types import ToolCallObject
 from .mcp_client import MCPClient
 from .tool_manager import ToolManager
 
+# Used when a tool's server is missing from the registry
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def _is_error_result(result: Dict[str, Any]) -> bool:
+    """Whether an MCPClient.call_tool result reports a tool error."""
+    content_items = result.get("content_items", [])
+    return bool(content_items) and content_items[0].get("type") == "error"
+
 
 class ToolExecutor:
     def __init__(
@@ -23,6 +34,10 @@ class ToolExecutor:
     ):
         self._mcp_client = mcp_client
         self._tool_manager = tool_manager
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        # (server, tool, canonical args) -> (expires_at, call task)
+        self._result_cache: Dict[tuple[str, str, str], tuple[float, asyncio.Task]] = {}
+        self.cache_hits = 0
 
     def parse_tool_call(self, call: Union[Dict[str, Any], ToolCallObject]) -> tuple:
         """Parse tool call from different formats.
@@ -157,148 +172,252 @@ class ToolExecutor:
         tool_calls: Union[List[Dict[str, Any]], List[ToolCallObject]],
         caller_mode: Literal["Claude", "OpenAI", "Prompt"],
     ) -> AsyncIterator[Dict[str, Any]]:
-        """Execute tools and yield status updates."""
-        tool_results_for_llm = []
+        """Execute tools and yield status updates.
+
+        All calls are started at once (bounded per server by
+        ``MCPServer.max_concurrency``) and their status updates are yielded as
+        they finish. The final results keep the order of ``tool_calls``.
+        """
+        tool_results_for_llm: List[Dict[str, Any] | None] = [None] * len(tool_calls)
+        # Running task -> (position in tool_calls, tool_name, tool_id)
+        running: Dict[asyncio.Task, tuple[int, str, str]] = {}
 
         logger.info(f"Executing {len(tool_calls)} tool(s) for {caller_mode} caller.")
-        for call in tool_calls:
-            (
-                tool_name,
-                tool_id,
-                tool_input,
-                is_error,
-                result_content,
-                parse_error,
-            ) = self.parse_tool_call(call)
-
-            logger.info(f"Executing tool: {call}")
-
-            if parse_error:
-                logger.warning(
-                    f"Skipping tool call due to parsing error: {result_content}"
+        try:
+            for index, call in enumerate(tool_calls):
+                (
+                    tool_name,
+                    tool_id,
+                    tool_input,
+                    _,
+                    result_content,
+                    parse_error,
+                ) = self.parse_tool_call(call)
+
+                logger.info(f"Executing tool: {call}")
+
+                if parse_error:
+                    logger.warning(
+                        f"Skipping tool call due to parsing error: {result_content}"
+                    )
+                    status_update = {
+                        "type": "tool_call_status",
+                        "tool_id": tool_id
+                        or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
+                        "tool_name": tool_name or "Unknown Tool",
+                        "status": "error",
+                        "content": result_content,
+                        "timestamp": datetime.datetime.now(
+                            datetime.timezone.utc
+                        ).isoformat()
+                        + "Z",
+                    }
+                    yield status_update
+                    # Even on parse error, we might need to format a result for the LLM
+                    # Use dummy values or the error message
+                    tool_results_for_llm[index] = self.format_tool_result(
+                        caller_mode,
+                        tool_id
+                        or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
+                        result_content,
+                        True,  # is_error
+                    )
+                    continue  # Skip execution logic for this call
+
+                # Start the tool, then yield 'running' while it executes
+                task = asyncio.create_task(
+                    self.run_single_tool(tool_name, tool_id, tool_input)
                 )
-                status_update = {
+                running[task] = (index, tool_name, tool_id)
+                yield {
                     "type": "tool_call_status",
-                    "tool_id": tool_id
-                    or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
-                    "tool_name": tool_name or "Unknown Tool",
-                    "status": "error",
-                    "content": result_content,
+                    "tool_id": tool_id,
+                    "tool_name": tool_name,
+                    "status": "running",
+                    "content": f"Input: {json.dumps(tool_input)}",
                     "timestamp": datetime.datetime.now(
                         datetime.timezone.utc
                     ).isoformat()
                     + "Z",
                 }
-                yield status_update
-                # Even on parse error, we might need to format a result for the LLM
-                # Use dummy values or the error message
-                formatted_result = self.format_tool_result(
-                    caller_mode,
-                    tool_id
-                    or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
-                    result_content,
-                    True,  # is_error
-                )
-                if formatted_result:
-                    tool_results_for_llm.append(formatted_result)
-                continue  # Skip execution logic for this call
 
-            # Yield 'running' status before execution
-            yield {
-                "type": "tool_call_status",
-                "tool_id": tool_id,
-                "tool_name": tool_name,
-                "status": "running",
-                "content": f"Input: {json.dumps(tool_input)}",
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
-                + "Z",
-            }
-
-            # Execute the tool
-            (
-                is_error,
-                text_content,
-                metadata,
-                content_items,
-            ) = await self.run_single_tool(tool_name, tool_id, tool_input)
-
-            # Determine content for status update and LLM result format
-            status_content = text_content  # Default to text content
-            llm_formatted_content = text_content  # Default to text content for LLM
-
-            if content_items:
-                image_items = [
-                    item for item in content_items if item.get("type") == "image"
-                ]
-                if image_items:
-                    num_images = len(image_items)
-                    status_content = (
-                        f"{text_content}\n[Tool returned {num_images} image(s)]".strip()
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda t: running[t][0]):
+                    index, tool_name, tool_id = running.pop(task)
+                    status_update, formatted_result = self._build_tool_outcome(
+                        caller_mode, tool_name, tool_id, *task.result()
                     )
+                    tool_results_for_llm[index] = formatted_result
+                    yield status_update
+        finally:
+            # The consumer stopped early (e.g. the turn was interrupted)
+            for task in running:
+                task.cancel()
+
+        results = [result for result in tool_results_for_llm if result]
+        logger.info(f"Finished executing tools with {len(results)} results.")
+        yield {"type": "final_tool_results", "results": results}
+
+    def _build_tool_outcome(
+        self,
+        caller_mode: Literal["Claude", "OpenAI", "Prompt"],
+        tool_name: str,
+        tool_id: str,
+        is_error: bool,
+        text_content: str,
+        metadata: Dict[str, Any],
+        content_items: List[Dict[str, Any]],
+    ) -> tuple[Dict[str, Any], Dict[str, Any] | None]:
+        """Build the status update and the LLM result for a finished tool call.
 
-                    if caller_mode == "Claude":
-                        # Format for Claude: list of blocks
-                        claude_blocks = []
-                        if text_content:
-                            claude_blocks.append({"type": "text", "text": text_content})
-                        for item in content_items:
-                            if (
-                                item.get("type") == "image"
-                                and "data" in item
-                                and "mimeType" in item
-                            ):
-                                claude_blocks.append(
-                                    {
-                                        "type": "image",
-                                        "source": {
-                                            "type": "base64",
-                                            "media_type": item["mimeType"],
-                                            "data": item["data"],
-                                        },
-                                    }
-                                )
-                            # Add other non-text types here
-                        llm_formatted_content = (
-                            claude_blocks if claude_blocks else ""
-                        )  # Use blocks or empty string
-                    elif caller_mode in ["OpenAI", "Prompt"]:
-                        llm_formatted_content = status_content
-
-            # Prepare and yield tool call status update
-            status_update = {
-                "type": "tool_call_status",
-                "tool_id": tool_id,
-                "tool_name": tool_name,
-                "status": "error" if is_error else "completed",
-                "content": status_content
-                if not is_error
-                else f"Error: {text_content}",  # Use descriptive content or error message
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
-                + "Z",
-            }
+        Returns:
+            tuple: (status_update, formatted_result)
+        """
+        # Determine content for status update and LLM result format
+        status_content = text_content  # Default to text content
+        llm_formatted_content = text_content  # Default to text content for LLM
+
+        if content_items:
+            image_items = [
+                item for item in content_items if item.get("type") == "image"
+            ]
+            if image_items:
+                num_images = len(image_items)
+                status_content = (
+                    f"{text_content}\n[Tool returned {num_images} image(s)]".strip()
+                )
 
-            # For stagehand_navigate tool, include browser view links if available
-            if tool_name == "stagehand_navigate" and not is_error:
-                live_view_data = metadata.get("liveViewData", {})
-                if live_view_data:
-                    logger.info(
-                        f"Found live view data for stagehand_navigate: {live_view_data}"
-                    )
-                    status_update["browser_view"] = live_view_data
+                if caller_mode == "Claude":
+                    # Format for Claude: list of blocks
+                    claude_blocks = []
+                    if text_content:
+                        claude_blocks.append({"type": "text", "text": text_content})
+                    for item in content_items:
+                        if (
+                            item.get("type") == "image"
+                            and "data" in item
+                            and "mimeType" in item
+                        ):
+                            claude_blocks.append(
+                                {
+                                    "type": "image",
+                                    "source": {
+                                        "type": "base64",
+                                        "media_type": item["mimeType"],
+                                        "data": item["data"],
+                                    },
+                                }
+                            )
+                        # Add other non-text types here
+                    llm_formatted_content = (
+                        claude_blocks if claude_blocks else ""
+                    )  # Use blocks or empty string
+                elif caller_mode in ["OpenAI", "Prompt"]:
+                    llm_formatted_content = status_content
+
+        # Prepare tool call status update
+        status_update = {
+            "type": "tool_call_status",
+            "tool_id": tool_id,
+            "tool_name": tool_name,
+            "status": "error" if is_error else "completed",
+            "content": status_content
+            if not is_error
+            else f"Error: {text_content}",  # Use descriptive content or error message
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat() + "Z",
+        }
+
+        # For stagehand_navigate tool, include browser view links if available
+        if tool_name == "stagehand_navigate" and not is_error:
+            live_view_data = metadata.get("liveViewData", {})
+            if live_view_data:
+                logger.info(
+                    f"Found live view data for stagehand_navigate: {live_view_data}"
+                )
+                status_update["browser_view"] = live_view_data
 
-            yield status_update
+        # Format result for LLM
+        formatted_result = self.format_tool_result(
+            caller_mode, tool_id, llm_formatted_content, is_error
+        )
+        return status_update, formatted_result
 
-            # Format result for LLM and add to list
-            formatted_result = self.format_tool_result(
-                caller_mode, tool_id, llm_formatted_content, is_error
-            )
-            if formatted_result:
-                tool_results_for_llm.append(formatted_result)
+    async def _call_tool(
+        self, server_name: str, tool_name: str, tool_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Call a tool through MCPClient, using the result cache if configured.
 
-        logger.info(
-            f"Finished executing tools with {len(tool_results_for_llm)} results."
+        Results of tools listed in the server's ``cache_ttl`` are reused for
+        identical arguments until they expire; a call made while an identical
+        one is still running waits for that one instead of starting another.
+        Error results are never cached.
+        """
+        server = self._mcp_client.server_registery.get_server(server_name)
+        ttl = server.cache_ttl.get(tool_name, 0) if server else 0
+        if ttl <= 0:
+            return await self._call_tool_limited(server_name, tool_name, tool_args)
+
+        loop = asyncio.get_running_loop()
+        key = (
+            server_name,
+            tool_name,
+            json.dumps(tool_args, sort_keys=True, separators=(",", ":")),
         )
-        yield {"type": "final_tool_results", "results": tool_results_for_llm}
+        entry = self._result_cache.get(key)
+        if entry is not None and entry[0] > loop.time():
+            self.cache_hits += 1
+            logger.debug(f"Cache hit for tool '{tool_name}' on '{server_name}'.")
+            return copy.deepcopy(await asyncio.shield(entry[1]))
+
+        self._prune_result_cache(loop.time())
+        task = asyncio.create_task(
+            self._call_tool_limited(server_name, tool_name, tool_args)
+        )
+        # Until it finishes, the entry only serves concurrent identical calls
+        self._result_cache[key] = (float("inf"), task)
+
+        def settle(done: asyncio.Task) -> None:
+            if self._result_cache.get(key, (0, None))[1] is not done:
+                return
+            if (
+                done.cancelled()
+                or done.exception() is not None
+                or _is_error_result(done.result())
+            ):
+                del self._result_cache[key]
+            else:
+                self._result_cache[key] = (loop.time() + ttl, done)
+
+        task.add_done_callback(settle)
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _call_tool_limited(
+        self, server_name: str, tool_name: str, tool_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Call a tool, waiting for a free slot under the server's concurrency limit."""
+        semaphore = self._semaphores.get(server_name)
+        if semaphore is None:
+            server = self._mcp_client.server_registery.get_server(server_name)
+            limit = server.max_concurrency if server else DEFAULT_MAX_CONCURRENCY
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._semaphores[server_name] = semaphore
+        async with semaphore:
+            return await self._mcp_client.call_tool(
+                server_name=server_name,
+                tool_name=tool_name,
+                tool_args=tool_args,
+            )
+
+    def _prune_result_cache(self, now: float) -> None:
+        """Drop expired entries from the result cache."""
+        expired = [
+            key for key, (expires, _) in self._result_cache.items() if expires <= now
+        ]
+        for key in expired:
+            del self._result_cache[key]
 
     async def run_single_tool(
         self, tool_name: str, tool_id: str, tool_input: Any
@@ -331,10 +450,8 @@ class ToolExecutor:
             is_error = True
         else:
             try:
-                result_dict = await self._mcp_client.call_tool(
-                    server_name=tool_info.related_server,
-                    tool_name=tool_name,
-                    tool_args=tool_input,
+                result_dict = await self._call_tool(
+                    tool_info.related_server, tool_name, tool_input
                 )
 
                 metadata = result_dict.get("metadata", {})
@@ -0,0 +1,83 @@
+"""On-disk cache of the tools each MCP server provides."""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from .types import MCPServer
+
+DEFAULT_SCHEMA_CACHE_PATH = "mcp_tool_cache.json"
+
+
+class ToolSchemaCache:
+    """Persists each server's tool list so restarts can skip discovery.
+
+    Entries are keyed by a hash of how the server is launched (command, args,
+    env, cwd), so editing a server in mcp_servers.json invalidates its entry.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_SCHEMA_CACHE_PATH) -> None:
+        """Load the cache file, if there is one."""
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    @staticmethod
+    def server_key(server: MCPServer) -> str:
+        """Hash of the settings that determine which server process is run."""
+        launch = json.dumps(
+            {
+                "command": server.command,
+                "args": server.args,
+                "env": server.env,
+                "cwd": server.cwd,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(launch.encode("utf-8")).hexdigest()
+
+    def get(self, server: MCPServer) -> Optional[List[Dict[str, Any]]]:
+        """Get the cached tools of a server, or None if missing or stale."""
+        entry = self._entries.get(server.name)
+        if entry and entry.get("key") == self.server_key(server):
+            return entry.get("tools")
+        return None
+
+    def put(self, server: MCPServer, tools: List[Dict[str, Any]]) -> bool:
+        """Store a server's tools, writing the file if they changed.
+
+        Returns:
+            bool: Whether the cached entry changed.
+        """
+        entry = {"key": self.server_key(server), "tools": tools}
+        if self._entries.get(server.name) == entry:
+            return False
+        self._entries[server.name] = entry
+        self._save()
+        return True
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the cache file, treating a missing or broken file as empty."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"MCPTC: Ignoring unreadable tool cache '{self.path}': {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        """Write the cache file atomically."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps(self._entries, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"MCPTC: Failed to write tool cache '{self.path}': {e}")
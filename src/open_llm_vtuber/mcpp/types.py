@@ -14,6 +14,9 @@ class MCPServer:
         env (Optional[dict[str, str]], optional): Environment variables for the command. Defaults to None.
         cwd (Optional[str], optional): Working directory for the command. Defaults to None.
         timeout (Optional[timedelta], optional): Timeout for the command. Defaults to 10 seconds.
+        startup_timeout (float, optional): Seconds to wait for the server to start and initialize. Defaults to 60.
+        max_concurrency (int, optional): Maximum number of tool calls in flight on the server at once. Defaults to 4.
+        cache_ttl (dict[str, float], optional): Seconds to cache results of the named tools, for idempotent lookups. Defaults to no caching.
     """
 
     name: str
@@ -23,6 +26,9 @@ class MCPServer:
     cwd: str | None = None
     timeout: Optional[timedelta] = timedelta(seconds=30)
     description: str = "No description available."
+    startup_timeout: float = 60.0
+    max_concurrency: int = 4
+    cache_ttl: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -3,50 +3,40 @@
 
 메시지 우선순위에 따라 처리 순서를 결정하는 비동기 큐 시스템입니다.
 큐 오버플로우 시 낮은 우선순위 메시지부터 드롭합니다.
+
+우선순위 레벨마다 FIFO 버킷(deque)을 두므로 추가, 추출, 오버플로우
+드롭이 모두 큐 크기와 무관하게 O(1)로 처리됩니다.
 """
 
 import asyncio
-import heapq
-from typing import Any, Callable, Coroutine, Dict, List, Optional
+from collections import deque
+from typing import Any, Callable, Coroutine, Deque, Dict, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from .queue_config import QueueConfig, MessagePriority
 
 
-@dataclass(order=True)
+@dataclass
 class PriorityMessage:
     """
     우선순위가 포함된 메시지 래퍼 클래스
 
-    heapq는 최소 힙이므로, 우선순위가 높을수록 먼저 처리되도록
-    priority 값을 음수로 저장합니다.
+    priority는 메시지가 들어갈 버킷과 오버플로우 시 드롭 여부를 정하는
+    우선순위 레벨입니다 (높을수록 먼저 처리).
     """
 
-    priority: int = field(compare=True)
-    timestamp: float = field(compare=True)
-    data: Dict[str, Any] = field(compare=False)
-
-    def __init__(self, priority: int, data: Dict[str, Any]):
-        """
-        우선순위 메시지를 초기화합니다.
-
-        Args:
-            priority: 메시지 우선순위 (높을수록 먼저 처리)
-            data: 메시지 데이터
-        """
-        # heapq는 최소 힙이므로 우선순위를 음수로 저장
-        self.priority = -priority
-        self.timestamp = datetime.now().timestamp()
-        self.data = data
+    priority: int
+    data: Dict[str, Any]
+    timestamp: float = field(default_factory=lambda: datetime.now().timestamp())
 
 
 class PriorityQueue:
     """
     우선순위 기반 비동기 메시지 큐
 
-    메시지를 우선순위에 따라 정렬하고, 큐 오버플로우 시
-    낮은 우선순위 메시지부터 드롭합니다.
+    메시지를 우선순위 레벨별 버킷에 도착 순서대로 저장하고, 큐 오버플로우 시
+    가장 낮은 우선순위 버킷의 오래된 메시지부터 드롭합니다.
     """
 
     def __init__(
@@ -55,6 +45,7 @@ class PriorityQueue:
         alert_callback: Optional[
             Callable[[str, str, str], Coroutine[Any, Any, None]]
         ] = None,
+        drop_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
     ):
         """
         우선순위 큐를 초기화합니다.
@@ -62,9 +53,15 @@ class PriorityQueue:
         Args:
             config: 큐 설정 객체 (None일 경우 기본 설정 사용)
             alert_callback: 알림 콜백 함수 (alert_type, message, severity)
+            drop_callback: 큐에서 드롭되거나 비워진 메시지마다 호출되는 함수
         """
         self.config = config or QueueConfig()
-        self._queue: List[PriorityMessage] = []
+        # 우선순위 레벨별 FIFO 버킷 (높은 우선순위 순으로 정렬)
+        self._levels = sorted(MessagePriority, reverse=True)
+        self._buckets: Dict[int, Deque[PriorityMessage]] = {
+            level: deque() for level in self._levels
+        }
+        self._size = 0
         self._lock = asyncio.Lock()
         self._not_empty = asyncio.Condition(self._lock)
 
@@ -75,6 +72,7 @@ class PriorityQueue:
 
         # 알림 콜백
         self._alert_callback = alert_callback
+        self._drop_callback = drop_callback
         self._last_overflow_alert: Optional[datetime] = None
 
     async def put(self, message: Dict[str, Any]) -> bool:
@@ -99,7 +97,7 @@ class PriorityQueue:
             priority_msg = PriorityMessage(priority=priority_level, data=message)
 
             # 큐 오버플로우 체크
-            if len(self._queue) >= self.config.max_queue_size:
+            if self._size >= self.config.max_queue_size:
                 # 드롭 처리
                 dropped = await self._drop_low_priority_messages()
                 if not dropped:
@@ -114,8 +112,9 @@ class PriorityQueue:
                     # 드롭이 발생한 경우 알림
                     await self._send_overflow_alert(dropped)
 
-            # 큐에 메시지 추가
-            heapq.heappush(self._queue, priority_msg)
+            # 해당 우선순위 버킷 끝에 메시지 추가
+            self._buckets[priority_level].append(priority_msg)
+            self._size += 1
             self._total_enqueued += 1
 
             # 대기 중인 get() 호출에 알림
@@ -135,7 +134,7 @@ class PriorityQueue:
         """
         async with self._not_empty:
             # 큐에 메시지가 있을 때까지 대기
-            while not self._queue:
+            while not self._size:
                 try:
                     if timeout:
                         await asyncio.wait_for(self._not_empty.wait(), timeout=timeout)
@@ -144,8 +143,13 @@ class PriorityQueue:
                 except asyncio.TimeoutError:
                     return None
 
-            # 우선순위가 가장 높은 메시지 추출
-            priority_msg = heapq.heappop(self._queue)
+            # 우선순위가 가장 높은 비어있지 않은 버킷에서 가장 오래된 메시지 추출
+            for level in self._levels:
+                bucket = self._buckets[level]
+                if bucket:
+                    priority_msg = bucket.popleft()
+                    break
+            self._size -= 1
             self._total_dequeued += 1
 
             return priority_msg.data
@@ -157,48 +161,45 @@ class PriorityQueue:
         Returns:
             bool: 메시지를 드롭했으면 True, 아니면 False
         """
-        # 현재 큐에서 가장 낮은 우선순위 찾기
-        if not self._queue:
+        # 현재 큐에서 가장 낮은 우선순위 버킷 찾기
+        bucket = self._lowest_bucket()
+        if bucket is None:
             return False
 
-        # priority가 음수로 저장되어 있으므로, 가장 큰 값(가장 덜 음수)이 가장 낮은 우선순위
-        # 우선순위별로 메시지 그룹화
-        low_priority_indices = []
-        max_priority = float("-inf")  # 가장 낮은 우선순위 (가장 큰 음수가 아닌 값)
-
-        for i, msg in enumerate(self._queue):
-            if msg.priority > max_priority:
-                max_priority = msg.priority
-                low_priority_indices = [i]
-            elif msg.priority == max_priority:
-                low_priority_indices.append(i)
-
-        # 낮은 우선순위 메시지 중 가장 오래된 것 드롭
-        if low_priority_indices:
-            # 설정에 따라 드롭할 개수 결정
-            drop_count = min(self.config.overflow_drop_count, len(low_priority_indices))
-
-            # 타임스탬프로 정렬하여 가장 오래된 것부터 드롭
-            # (priority, timestamp) 튜플로 정렬
-            low_priority_with_timestamp = [
-                (i, self._queue[i].timestamp) for i in low_priority_indices
-            ]
-            low_priority_with_timestamp.sort(key=lambda x: x[1])  # 오래된 것부터
-
-            # 제거할 인덱스 추출 및 역순 정렬 (리스트 인덱스 변경 방지)
-            indices_to_drop = [x[0] for x in low_priority_with_timestamp[:drop_count]]
-            indices_to_drop.sort(reverse=True)
-
-            for i in indices_to_drop:
-                self._queue.pop(i)
-                self._total_dropped += 1
-
-            # 힙 재구성
-            heapq.heapify(self._queue)
+        # 버킷은 도착 순서이므로 앞쪽부터 설정된 개수만큼 드롭
+        drop_count = min(self.config.overflow_drop_count, len(bucket))
+        for _ in range(drop_count):
+            self._notify_dropped(bucket.popleft())
+        self._size -= drop_count
+        self._total_dropped += drop_count
 
-            return True
+        return True
 
-        return False
+    def _notify_dropped(self, priority_msg: PriorityMessage) -> None:
+        """
+        드롭 콜백에 제거된 메시지를 전달합니다.
+
+        Args:
+            priority_msg: 큐에서 제거된 메시지
+        """
+        if self._drop_callback:
+            try:
+                self._drop_callback(priority_msg.data)
+            except Exception:
+                # 드롭 콜백 에러는 무시
+                pass
+
+    def _lowest_bucket(self) -> Optional[Deque[PriorityMessage]]:
+        """
+        메시지가 있는 가장 낮은 우선순위 버킷을 반환합니다.
+
+        Returns:
+            Optional[Deque[PriorityMessage]]: 버킷, 큐가 비어있으면 None
+        """
+        for level in reversed(self._levels):
+            if self._buckets[level]:
+                return self._buckets[level]
+        return None
 
     def _should_drop_current_message(self, current_msg: PriorityMessage) -> bool:
         """
@@ -210,14 +211,14 @@ class PriorityQueue:
         Returns:
             bool: 드롭해야 하면 True
         """
-        if not self._queue:
+        bucket = self._lowest_bucket()
+        if bucket is None:
             return False
 
-        # priority가 음수로 저장되어 있으므로, max()로 가장 큰 값(가장 낮은 우선순위)을 찾음
-        lowest_priority_msg = max(self._queue, key=lambda x: x.priority)
+        lowest_priority_msg = bucket[0]
 
         # 현재 메시지가 큐의 최저 우선순위보다 낮거나 같으면 드롭
-        return current_msg.priority >= lowest_priority_msg.priority
+        return current_msg.priority <= lowest_priority_msg.priority
 
     async def _send_overflow_alert(self, dropped_count: int) -> None:
         """
@@ -253,7 +254,7 @@ class PriorityQueue:
         Returns:
             int: 메시지 개수
         """
-        return len(self._queue)
+        return self._size
 
     def empty(self) -> bool:
         """
@@ -262,7 +263,7 @@ class PriorityQueue:
         Returns:
             bool: 비어있으면 True
         """
-        return len(self._queue) == 0
+        return self._size == 0
 
     def full(self) -> bool:
         """
@@ -271,7 +272,7 @@ class PriorityQueue:
         Returns:
             bool: 가득 찼으면 True
         """
-        return len(self._queue) >= self.config.max_queue_size
+        return self._size >= self.config.max_queue_size
 
     def get_metrics(self) -> Dict[str, int]:
         """
@@ -296,6 +297,10 @@ class PriorityQueue:
             int: 제거된 메시지 개수
         """
         async with self._lock:
-            count = len(self._queue)
-            self._queue.clear()
+            count = self._size
+            for bucket in self._buckets.values():
+                for priority_msg in bucket:
+                    self._notify_dropped(priority_msg)
+                bucket.clear()
+            self._size = 0
             return count
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Dict, Optional, Deque, Any, Callable
+from typing import Dict, Optional, Deque, Any, Callable, Set, Tuple
 from collections import deque
 from loguru import logger
 
@@ -8,16 +8,28 @@ class ProxyMessageQueue:
     """
     Manages message queuing and consumption for the proxy handler.
     Implements a producer-consumer pattern with conversation state awareness.
+
+    The consumer sleeps on an event that is set when a message is queued or
+    the conversation becomes inactive, so a message is forwarded as soon as it
+    can be, without polling.
     """
 
-    def __init__(self):
-        """Initialize the message queue manager"""
+    def __init__(self, coalesce_text_input: bool = False):
+        """
+        Initialize the message queue manager
+
+        Args:
+            coalesce_text_input: Merge consecutive queued text-input messages
+                from the same sender into a single turn
+        """
         self.message_queue: Deque[Dict] = deque()
         self._conversation_active = False
-        self.lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
         self._consumer_task = None
         self._forward_func = None
+        self._forward_tasks: Set[asyncio.Task] = set()
         self._running = False
+        self._coalesce_text_input = coalesce_text_input
 
     def initialize(self, forward_func: Callable[[Dict, Optional[str]], Any]):
         """
@@ -43,6 +55,7 @@ class ProxyMessageQueue:
             f"Queuing message: {message.get('text', '')} (active conversation: {self._conversation_active})"
         )
         self.message_queue.append(queue_item)
+        self._wakeup.set()
 
         # Start consumer if needed
         self._ensure_consumer_running()
@@ -64,9 +77,11 @@ class ProxyMessageQueue:
             logger.debug(f"Setting conversation active state to: {active}")
             self._conversation_active = active
 
-            # If conversation becomes inactive, make sure consumer is running to process any queued messages
-            if not active and self.has_pending_messages():
-                self._ensure_consumer_running()
+            # If conversation becomes inactive, wake the consumer to process any queued messages
+            if not active:
+                self._wakeup.set()
+                if self.has_pending_messages():
+                    self._ensure_consumer_running()
 
     def has_pending_messages(self) -> bool:
         """
@@ -92,38 +107,23 @@ class ProxyMessageQueue:
         """Background task that consumes messages based on conversation state"""
         try:
             while self._running:
-                # Wait a short time to prevent CPU hogging
-                await asyncio.sleep(0.1)
-
-                # Try to consume a message if appropriate
-                async with self.lock:
-                    if not self._conversation_active and self.has_pending_messages():
-                        # Get next message
-                        queue_item = self.message_queue.popleft()
-                        message = queue_item["message"]
-                        sender_id = queue_item["sender_id"]
-
-                        logger.info(
-                            f"Consumer processing message: {message.get('text', '')}"
-                        )
-
-                        # Set active before forwarding to prevent race conditions
-                        self._conversation_active = True
-
-                        # Forward the message outside the lock to prevent deadlocks
-                        asyncio.create_task(self._forward_message(message, sender_id))
-
-                # If queue is empty and we've been idle for a while, we can pause the consumer
-                if not self.has_pending_messages() and not self._conversation_active:
-                    await asyncio.sleep(1)  # Wait a bit longer before deciding to stop
-                    if (
-                        not self.has_pending_messages()
-                        and not self._conversation_active
-                    ):
-                        logger.debug(
-                            "No more pending messages and no active conversation, pausing consumer"
-                        )
-                        break
+                # Sleep until a message arrives or the conversation ends
+                while self._conversation_active or not self.has_pending_messages():
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    if not self._running:
+                        return
+
+                message, sender_id = self._next_message()
+                logger.info(f"Consumer processing message: {message.get('text', '')}")
+
+                # Set active before forwarding to prevent race conditions
+                self._conversation_active = True
+
+                # Forward the message in its own task so the consumer never blocks on it
+                task = asyncio.create_task(self._forward_message(message, sender_id))
+                self._forward_tasks.add(task)
+                task.add_done_callback(self._forward_tasks.discard)
 
         except Exception as e:
             logger.error(f"Error in message consumer loop: {e}")
@@ -131,6 +131,41 @@ class ProxyMessageQueue:
             self._running = False
             logger.debug("Message consumer task ended")
 
+    def _next_message(self) -> Tuple[Dict, Optional[str]]:
+        """
+        Pop the next message, coalescing a burst of text inputs if enabled.
+
+        Returns:
+            Tuple[Dict, Optional[str]]: The message to forward and its sender ID
+        """
+        queue_item = self.message_queue.popleft()
+        message = queue_item["message"]
+        sender_id = queue_item["sender_id"]
+
+        if not self._coalesce_text_input or message.get("type") != "text-input":
+            return message, sender_id
+
+        burst = [message]
+        while self.message_queue:
+            next_item = self.message_queue[0]
+            if (
+                next_item["sender_id"] != sender_id
+                or next_item["message"].get("type") != "text-input"
+            ):
+                break
+            burst.append(self.message_queue.popleft()["message"])
+
+        if len(burst) == 1:
+            return message, sender_id
+
+        merged = dict(burst[-1])
+        merged["text"] = "\n".join(m.get("text", "") for m in burst)
+        images = [image for m in burst for image in (m.get("images") or [])]
+        if images:
+            merged["images"] = images
+        logger.info(f"Coalesced {len(burst)} text inputs from {sender_id}")
+        return merged, sender_id
+
     async def _forward_message(self, message: Dict, sender_id: Optional[str] = None):
         """Forward a message using the provided forward function"""
         try:
@@ -150,11 +185,12 @@ class ProxyMessageQueue:
         except Exception as e:
             logger.error(f"Error forwarding message: {e}")
             # If forwarding fails, mark conversation as inactive to allow next message
-            self._conversation_active = False
+            self.conversation_active = False
 
     def stop(self):
         """Stop the consumer task"""
         self._running = False
+        self._wakeup.set()
         if self._consumer_task and not self._consumer_task.done():
             self._consumer_task.cancel()
 
@@ -54,6 +54,19 @@ class QueueConfig:
         # 큐 워커 수 (기본값: 1, 비동기 처리)
         self.worker_count: int = int(os.getenv("QUEUE_WORKER_COUNT", "1"))
 
+        # 우선순위 큐(처리 간격 적용)를 거치는 대화 트리거 메시지 타입
+        # 그 외 클라이언트 메시지(오디오 청크 등)는 클라이언트별 레인에서 지연 없이 처리
+        self.prioritized_message_types: frozenset = frozenset(
+            t.strip()
+            for t in os.getenv(
+                "QUEUE_PRIORITIZED_TYPES", "mic-audio-end,text-input,ai-speak-signal"
+            ).split(",")
+            if t.strip()
+        )
+
+        # 클라이언트 레인당 최대 대기 메시지 수 (기본값: 1000)
+        self.lane_max_size: int = int(os.getenv("QUEUE_LANE_MAX_SIZE", "1000"))
+
         # 메트릭 수집 활성화 여부
         self.enable_metrics: bool = os.getenv(
             "QUEUE_ENABLE_METRICS", "true"
@@ -89,6 +102,9 @@ class QueueConfig:
         if self.worker_count <= 0:
             return False
 
+        if self.lane_max_size <= 0:
+            return False
+
         # 우선순위 규칙 유효성 검증
         if not self.priority_rules.validate():
             return False
@@ -1,7 +1,7 @@
 """Queue status API routes.
 
 메시지 대기열 상태 관리를 위한 API 라우트.
-큐 상태 조회, 메트릭 히스토리, 우선순위 규칙 관리 기능을 제공합니다.
+큐 상태 조회, 레인별 메트릭, 메트릭 히스토리, 우선순위 규칙 관리 기능을 제공합니다.
 """
 
 from typing import Optional
@@ -13,6 +13,7 @@ from ..websocket.handler import WebSocketHandler
 from ..schemas.api import (
     QueueStatus,
     QueueHistoryResponse,
+    QueueLanesResponse,
     PriorityRules,
     PriorityRulesUpdateResponse,
     ErrorResponse,
@@ -89,6 +90,35 @@ def init_queue_routes(ws_handler: WebSocketHandler) -> APIRouter:
                 {"error": f"큐 상태 조회 중 오류 발생: {str(e)}"}, status_code=500
             )
 
+    @router.get(
+        "/api/queue/lanes",
+        tags=["queue"],
+        summary="레인별 큐 상태 조회",
+        description="대화 트리거가 거치는 우선순위 레인과 클라이언트별 스트리밍 레인의 상태를 조회합니다.",
+        response_model=QueueLanesResponse,
+        responses={
+            200: {"description": "레인 상태 반환 성공", "model": QueueLanesResponse},
+            500: {"description": "서버 오류", "model": ErrorResponse},
+        },
+    )
+    async def get_queue_lanes():
+        """
+        레인별 큐 상태를 조회합니다.
+
+        Returns:
+            JSONResponse: 레인 상태 정보
+                - prioritized: 우선순위 레인 (대기/처리/드롭 수, 대상 메시지 타입)
+                - client_lanes: 클라이언트별 레인 (대기 수, 처리/실패/드롭 수,
+                  우선순위 레인으로 넘긴 수, 평균 처리 시간)
+        """
+        try:
+            lanes = ws_handler.get_queue_lanes()
+            return JSONResponse(lanes, status_code=200)
+        except Exception as e:
+            return JSONResponse(
+                {"error": f"레인 상태 조회 중 오류 발생: {str(e)}"}, status_code=500
+            )
+
     @router.get(
         "/api/queue/history",
         tags=["queue"],
@@ -84,18 +84,20 @@ def init_client_ws_route(default_context_cache: ServiceContext) -> APIRouter:
     return router
 
 
-def init_proxy_route(server_url: str) -> APIRouter:
+def init_proxy_route(server_url: str, coalesce_text_input: bool = False) -> APIRouter:
     """
     Create and return API routes for handling proxy connections.
 
     Args:
         server_url: The WebSocket URL of the actual server.
+        coalesce_text_input: Merge bursts of queued text inputs from the same
+            client into one conversation turn.
 
     Returns:
         APIRouter: Configured router with proxy WebSocket endpoint.
     """
     router = APIRouter()
-    proxy_handler = ProxyHandler(server_url)
+    proxy_handler = ProxyHandler(server_url, coalesce_text_input=coalesce_text_input)
 
     @router.websocket(
         "/proxy-ws",
@@ -18,6 +18,9 @@ from .api import (
     QueueStatus,
     QueueHistoryItem,
     QueueHistoryResponse,
+    PrioritizedLaneStatus,
+    ClientLaneStatus,
+    QueueLanesResponse,
     PriorityRules,
     PriorityRulesUpdateResponse,
     # 설정 관련
@@ -49,6 +52,9 @@ __all__ = [
     "QueueStatus",
     "QueueHistoryItem",
     "QueueHistoryResponse",
+    "PrioritizedLaneStatus",
+    "ClientLaneStatus",
+    "QueueLanesResponse",
     "PriorityRules",
     "PriorityRulesUpdateResponse",
     # 설정 관련
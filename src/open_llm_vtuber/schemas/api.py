@@ -319,6 +319,46 @@ class QueueHistoryResponse(BaseModel):
     }
 
 
+class PrioritizedLaneStatus(BaseModel):
+    """우선순위 레인(대화 트리거) 상태 스키마."""
+
+    pending: int = Field(..., description="대기 중인 메시지 수")
+    max_size: int = Field(..., description="최대 큐 크기")
+    total_received: int = Field(..., description="총 수신 메시지 수")
+    total_processed: int = Field(..., description="총 처리 완료 메시지 수")
+    total_dropped: int = Field(..., description="드롭된 메시지 수")
+    avg_processing_time: float = Field(..., description="평균 처리 시간 (초)")
+    message_types: list[str] = Field(
+        ...,
+        description="우선순위 레인을 거치는 메시지 타입",
+        json_schema_extra={"example": ["mic-audio-end", "text-input"]},
+    )
+
+
+class ClientLaneStatus(BaseModel):
+    """클라이언트 레인 상태 스키마."""
+
+    client_uid: str = Field(..., description="클라이언트 식별자")
+    pending: int = Field(..., description="대기 중인 메시지 수")
+    max_pending: int = Field(..., description="최대 대기 메시지 수")
+    total_received: int = Field(..., description="총 수신 메시지 수")
+    total_processed: int = Field(..., description="레인에서 처리된 메시지 수")
+    total_failed: int = Field(..., description="처리 실패 메시지 수")
+    total_dropped: int = Field(..., description="레인 오버플로우로 드롭된 메시지 수")
+    total_handoffs: int = Field(..., description="우선순위 레인으로 넘긴 메시지 수")
+    avg_processing_time: float = Field(..., description="평균 처리 시간 (초)")
+    last_activity: Optional[str] = Field(
+        None, description="마지막 처리 시각 (ISO 8601)"
+    )
+
+
+class QueueLanesResponse(BaseModel):
+    """큐 레인별 상태 응답 스키마."""
+
+    prioritized: PrioritizedLaneStatus = Field(..., description="우선순위 레인")
+    client_lanes: list[ClientLaneStatus] = Field(..., description="클라이언트별 레인")
+
+
 class PriorityRules(BaseModel):
     """우선순위 규칙 스키마."""
 
@@ -189,7 +189,10 @@ class WebSocketServer:
             port = system_config.port
             server_url = f"ws://{host}:{port}/client-ws"
             self.app.include_router(
-                init_proxy_route(server_url=server_url),
+                init_proxy_route(
+                    server_url=server_url,
+                    coalesce_text_input=system_config.proxy_coalesce_text_input,
+                ),
             )
 
         # Mount cache directory first (to ensure audio file access)
@@ -4,9 +4,12 @@ import sys
 from pathlib import Path
 
 from loguru import logger
-from openai import OpenAI  # Use the official OpenAI library
+from openai import AsyncOpenAI, OpenAI  # Use the official OpenAI library
 
-from .tts_interface import TTSInterface
+from .tts_interface import AudioChunk, TTSInterface
+
+# Sample rate of the raw PCM the OpenAI speech API returns for "pcm"
+PCM_SAMPLE_RATE = 24000
 
 # Add the current directory to sys.path for relative imports if needed
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -27,6 +30,7 @@ class TTSEngine(TTSInterface):
         api_key="not-needed",  # Default for local/compatible servers that don't require auth
         base_url="http://localhost:8880/v1",  # Default to the specified endpoint
         file_extension: str = "mp3",  # Configurable file extension
+        stream: bool = False,  # Stream raw PCM instead of writing a file
         **kwargs,  # Allow passing additional args to OpenAI client
     ):
         """
@@ -37,6 +41,7 @@ class TTSEngine(TTSInterface):
             voice (str): The voice to use (e.g., 'alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer').
             api_key (str, optional): API key for the TTS service. Defaults to "not-needed".
             base_url (str, optional): Base URL of the OpenAI-compatible TTS endpoint. Defaults to "http://localhost:8880/v1".
+            stream (bool, optional): Stream speech as 24 kHz PCM while it is generated. The server must support response_format "pcm". Defaults to False.
         """
         self.model = model
         self.voice = voice
@@ -52,12 +57,46 @@ class TTSEngine(TTSInterface):
         try:
             # Initialize OpenAI client
             self.client = OpenAI(api_key=api_key, base_url=base_url, **kwargs)
+            self.async_client = (
+                AsyncOpenAI(api_key=api_key, base_url=base_url, **kwargs)
+                if stream
+                else None
+            )
+            self.supports_streaming = stream
             logger.info(
                 f"OpenAI-compatible TTS Engine initialized, targeting endpoint: {base_url}"
             )
         except Exception as e:
             logger.critical(f"Failed to initialize OpenAI client: {e}")
             self.client = None  # Ensure client is None if init fails
+            self.async_client = None
+
+    async def async_stream_audio(self, text, speed=1.0):
+        """
+        Stream speech as raw PCM chunks while the server generates it.
+
+        Args:
+            text (str): The text to synthesize.
+            speed (float): The speed of the speech (0.25 to 4.0). Defaults to 1.0.
+
+        Yields:
+            AudioChunk: 16-bit mono PCM at 24 kHz.
+        """
+        if not self.async_client:
+            raise RuntimeError("OpenAI async client not initialized")
+
+        logger.debug(
+            f"Streaming audio via {self.async_client.base_url} for text: '{text[:50]}...'"
+        )
+        async with self.async_client.audio.speech.with_streaming_response.create(
+            model=self.model,
+            voice=self.voice,
+            input=text,
+            response_format="pcm",
+            speed=speed,
+        ) as response:
+            async for pcm in response.iter_bytes(chunk_size=4096):
+                yield AudioChunk(pcm=pcm, sample_rate=PCM_SAMPLE_RATE)
 
     def generate_audio(self, text, file_name_no_ext=None, speed=1.0):
         """
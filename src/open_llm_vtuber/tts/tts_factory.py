@@ -178,6 +178,7 @@ def _create_openai_tts(**kwargs) -> TTSInterface:
         api_key=kwargs.get("api_key"),
         base_url=kwargs.get("base_url"),
         file_extension=kwargs.get("file_extension"),
+        stream=kwargs.get("stream", False),
     )
 
 
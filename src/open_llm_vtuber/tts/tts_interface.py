@@ -1,20 +1,45 @@
 import abc
 import os
 import asyncio
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator
 
 from loguru import logger
+from pydub import AudioSegment
 
 # Default cache directory for TTS audio files
 DEFAULT_CACHE_DIR = "cache"
 
 
+@dataclass
+class AudioChunk:
+    """A piece of streamed speech audio.
+
+    Attributes:
+        pcm: Raw 16-bit little-endian mono PCM samples
+        sample_rate: Sample rate of ``pcm`` in Hz
+    """
+
+    pcm: bytes
+    sample_rate: int
+
+
 class TTSInterface(metaclass=abc.ABCMeta):
     """Abstract base class for TTS engines.
 
     Provides common functionality for all TTS implementations including
     cache file generation and cleanup methods.
+
+    Audio is consumed through ``async_audio_chunks``. Engines that can emit
+    audio while synthesizing override ``async_stream_audio`` and set
+    ``supports_streaming`` to True; for all other engines the default
+    ``async_stream_audio`` decodes the ``async_generate_audio`` file.
     """
 
+    supports_streaming: bool = False
+
     def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
         """Initialize TTS with optional cache directory.
 
@@ -46,6 +71,74 @@ class TTSInterface(metaclass=abc.ABCMeta):
         """
         return await asyncio.to_thread(self.generate_audio, text, file_name_no_ext)
 
+    async def async_stream_audio(self, text: str) -> AsyncIterator[AudioChunk]:
+        """
+        Stream speech audio for the text as PCM chunks while it is synthesized.
+
+        Streaming engines override this with an async generator. Chunks may
+        have any length; the caller regroups them into playable frames. By
+        default the file from ``async_generate_audio`` is decoded and yielded
+        as a single chunk, and the file is removed afterwards.
+
+        text: str
+            the text to speak
+
+        Returns:
+        AsyncIterator[AudioChunk]: the audio, in playback order
+
+        """
+        logger.debug(f"🏃Generating audio for '''{text}'''...")
+        audio_file_path = await self.async_generate_audio(
+            text=text,
+            file_name_no_ext=f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}",
+        )
+        if not audio_file_path:
+            raise RuntimeError("TTS engine returned no audio file")
+        try:
+            yield await asyncio.to_thread(self._decode_audio_file, audio_file_path)
+        finally:
+            self.remove_file(audio_file_path)
+            logger.debug("Audio cache file cleaned.")
+
+    async def async_audio_chunks(self, text: str) -> AsyncIterator[AudioChunk]:
+        """
+        Speech audio for the text as PCM chunks, from whichever path applies.
+
+        Streams through ``async_stream_audio`` when ``supports_streaming`` is
+        True and otherwise decodes the generated file. If streaming fails or
+        ends before the first chunk, the file-based path is used instead.
+
+        text: str
+            the text to speak
+
+        Returns:
+        AsyncIterator[AudioChunk]: the audio, in playback order
+
+        """
+        if self.supports_streaming:
+            streamed = False
+            try:
+                async for chunk in self.async_stream_audio(text):
+                    streamed = True
+                    yield chunk
+            except Exception as e:
+                if streamed:
+                    raise
+                logger.warning(f"Streaming TTS failed, falling back to file: {e}")
+            else:
+                if streamed:
+                    return
+                logger.warning("Streaming TTS produced no audio, falling back to file")
+        async for chunk in TTSInterface.async_stream_audio(self, text):
+            yield chunk
+
+    @staticmethod
+    def _decode_audio_file(audio_file_path: str) -> AudioChunk:
+        """Decode an audio file to 16-bit mono PCM."""
+        audio = AudioSegment.from_file(audio_file_path)
+        audio = audio.set_channels(1).set_sample_width(2)
+        return AudioChunk(pcm=audio.raw_data, sample_rate=audio.frame_rate)
+
     @abc.abstractmethod
     def generate_audio(self, text: str, file_name_no_ext=None) -> str:
         """
@@ -18,9 +18,14 @@ from .models import (
     RetrievalResult,
 )
 from .config import MemoryConfig
+from .consolidation_scheduler import ConsolidationScheduler
 from .embedding import EmbeddingService
+from .embedding_cache import EmbeddingCache
+from .embedding_worker import EmbeddingWorker
 from .evolution import MemoryEvolver
 from .extraction import MemoryExtractor
+from .extraction_worker import ExtractionWorker
+from .idle_batch_scheduler import IdleBatchScheduler
 from .memory_service import MemoryService, MemoryServiceInterface
 from .retrieval import HybridRetriever
 from .working_memory import WorkingMemory
@@ -40,9 +45,14 @@ __all__ = [
     "EntityProfile",
     "RetrievalResult",
     "MemoryConfig",
+    "ConsolidationScheduler",
     "EmbeddingService",
+    "EmbeddingCache",
+    "EmbeddingWorker",
     "MemoryEvolver",
     "MemoryExtractor",
+    "ExtractionWorker",
+    "IdleBatchScheduler",
     "HybridRetriever",
     "MemoryService",
     "MemoryServiceInterface",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from typing import Literal
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -12,6 +13,13 @@ class StorageConfig(BaseModel):
 
     lance_db_path: str = "./memory/lance_db"
     sqlite_db_path: str = "./memory/umsa.db"
+    write_flush_interval_ms: int = 1000  # max delay for buffered access updates
+    read_pool_size: int = 4  # read-only SQLite connections (0 = use writer)
+    # SQLite PRAGMAs applied to every connection
+    synchronous: Literal["OFF", "NORMAL", "FULL"] = "NORMAL"
+    mmap_size_mb: int = 256
+    cache_size_mb: int = 64  # page cache per connection
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
 
     @model_validator(mode="after")
     def _validate_paths(self) -> "StorageConfig":
@@ -33,6 +41,13 @@ class EmbeddingConfig(BaseModel):
     model: str = "nomic-ai/nomic-embed-text-v2-moe"
     dimension: int = 768
     trust_remote_code: bool = False
+    batch_size: int = 32  # texts per model call and per background batch
+    # New nodes are embedded by a background worker once the service has
+    # been idle for idle_seconds, at most max_delay_seconds late
+    idle_seconds: float = 1.0
+    max_delay_seconds: float = 30.0
+    cache_size: int = 4096  # in-memory LRU entries (0 disables the cache)
+    cache_db_path: str = ""  # SQLite file persisting the cache ("" = memory only)
 
 
 class StreamContextConfig(BaseModel):
@@ -74,6 +89,13 @@ class ExtractionConfig(BaseModel):
     regex_enabled: bool = True
     llm_extraction_mode: str = "auto"  # "local", "cli", "auto", "disabled"
     cli_command: str = ""
+    # Extract LLM batches in a background worker instead of after the turn:
+    # a batch runs once batch_size turns are queued and the service has been
+    # idle for idle_seconds, or when the oldest turn is max_delay_seconds old
+    background: bool = True
+    max_batch_turns: int = 20  # turns per extraction LLM call
+    idle_seconds: float = 2.0
+    max_delay_seconds: float = 30.0
 
 
 class ConsolidationConfig(BaseModel):
@@ -84,8 +106,13 @@ class ConsolidationConfig(BaseModel):
     episode_compress_threshold: int = 200
     pruning_threshold: float = 0.1
     decay_half_life_days: float = 30.0  # 30 days for general facts
-    max_merge_candidates: int = 500
+    merge_exact_limit: int = 10_000  # above this, merge pairs via clustering
     reflection_threshold: int = 10
+    # Run end_session(defer=True) consolidation in the background once the
+    # service has been idle for idle_seconds, at most max_delay_seconds late
+    deferred: bool = True
+    idle_seconds: float = 5.0
+    max_delay_seconds: float = 60.0
 
 
 class RetrievalConfig(BaseModel):
@@ -96,7 +123,15 @@ class RetrievalConfig(BaseModel):
     fts_weight: float = 0.3
     graph_weight: float = 0.2
     embedding_provider: str = "local"  # "local", "api", "disabled"
-    max_latency_ms: int = 200
+    max_latency_ms: int = 200  # default per-source retrieval deadline
+    # Per-source deadline overrides, e.g. {"vector": 150, "graph": 50}
+    source_deadlines_ms: dict[str, int] = Field(default_factory=dict)
+    vector_candidates: int = 50  # nearest neighbours scored per vector query
+    vector_index: str = "exact"  # "exact" or "ivf" (approximate)
+    ivf_nlist: int = 0  # IVF lists per entity, 0 = sqrt(node count)
+    ivf_nprobe: int = 8  # IVF lists scanned per query
+    ivf_min_train_size: int = 4096  # below this, IVF partitions stay exact
+    prefetch_ttl_seconds: float = 10.0  # max age of a prefetched retrieval
 
 
 class FewShotConfig(BaseModel):
@@ -0,0 +1,55 @@
+"""Deferred session consolidation for UMSA.
+
+Ending a session with ``MemoryService.end_session(..., defer=True)`` only
+snapshots the session and records it in the ``pending_consolidations``
+table. This scheduler collects those jobs and runs them as one batch once
+the service has been quiet for ``idle_seconds`` (or the oldest job has
+waited ``max_delay_seconds``). It does not start a batch while a live turn
+is in progress until the oldest job has waited ``max_delay_seconds``.
+Jobs left in the table by a crash are picked up again on the next start.
+"""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable
+
+from .idle_batch_scheduler import IdleBatchScheduler
+
+
+class ConsolidationScheduler(IdleBatchScheduler):
+    """Scheduler that coalesces deferred session consolidations.
+
+    Every queued job goes to ``run_batch`` in one call after an idle gap.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[dict]], Awaitable[None]],
+        is_busy: Callable[[], bool],
+        idle_seconds: float = 5.0,
+        max_delay_seconds: float = 60.0,
+        busy_poll: float = 0.1,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            run_batch: Coroutine function consolidating a list of jobs
+            is_busy: Returns True while a live turn is in progress
+            idle_seconds: Quiet time after the last activity before a batch runs
+            max_delay_seconds: Max wait for the oldest job, even without a gap
+                or during live turns
+            busy_poll: Seconds between busy checks while waiting for a turn
+        """
+        super().__init__(
+            run_batch,
+            is_busy,
+            idle_seconds=idle_seconds,
+            max_delay_seconds=max_delay_seconds,
+            busy_poll=busy_poll,
+            name="Deferred consolidation",
+        )
+
+    @property
+    def consolidated(self) -> int:
+        """Sessions consolidated so far."""
+        return self.processed
@@ -31,6 +31,9 @@ class AssembledContext:
     messages: list[dict] = field(default_factory=list)
     """Recent conversation messages fitted to the token budget."""
 
+    timings: dict[str, float] = field(default_factory=dict)
+    """Milliseconds spent per build stage (set by ``MemoryService.build_context``)."""
+
 
 class ContextAssembler:
     """Assembles LLM context from multiple components within token budget.
@@ -156,7 +159,7 @@ class ContextAssembler:
         # Log token usage
         system_tokens = self.token_counter.count(system_content)
         messages_tokens = sum(
-            self.token_counter.count(msg["content"]) for msg in messages_fitted
+            self.token_counter.count_content(msg["content"]) for msg in messages_fitted
         )
         total_used = system_tokens + messages_tokens
         logger.info(
@@ -308,23 +311,11 @@ class ContextAssembler:
         if current_tokens <= max_tokens:
             return text
 
-        # Binary search for fitting text length
-        # Estimate character ratio
-        char_ratio = len(text) / max(current_tokens, 1)
-        estimated_chars = int(max_tokens * char_ratio * 0.9)  # 90% safety margin
-
-        # Start with estimated length
-        fitted_text = text[:estimated_chars]
-        fitted_tokens = self.token_counter.count(fitted_text)
-
-        # Adjust if needed
-        while fitted_tokens > max_tokens and len(fitted_text) > 0:
-            # Reduce by 10%
-            fitted_text = fitted_text[: int(len(fitted_text) * 0.9)]
-            fitted_tokens = self.token_counter.count(fitted_text)
+        fitted_text = self.token_counter.truncate(text, max_tokens)
 
         logger.debug(
-            f"Fitted text from {current_tokens} to {fitted_tokens} tokens "
+            f"Fitted text from {current_tokens} to "
+            f"{self.token_counter.count(fitted_text)} tokens "
             f"(budget: {max_tokens})"
         )
 
@@ -345,8 +336,11 @@ class ContextAssembler:
         if not messages:
             return []
 
-        # Calculate total tokens
-        total_tokens = sum(self.token_counter.count(msg["content"]) for msg in messages)
+        # Calculate total tokens (each message is counted once)
+        message_tokens = [
+            self.token_counter.count_content(msg["content"]) for msg in messages
+        ]
+        total_tokens = sum(message_tokens)
 
         if total_tokens <= max_tokens:
             return messages
@@ -356,24 +350,24 @@ class ContextAssembler:
         current_tokens = 0
 
         # Iterate in reverse to prioritize recent messages
-        for msg in reversed(messages):
-            msg_tokens = self.token_counter.count(msg["content"])
-
+        for msg, msg_tokens in zip(reversed(messages), reversed(message_tokens)):
             if current_tokens + msg_tokens <= max_tokens:
-                fitted_messages.insert(0, msg)
+                fitted_messages.append(msg)
                 current_tokens += msg_tokens
             else:
                 # Try to fit partial message if it's the first one
-                if not fitted_messages:
+                if not fitted_messages and isinstance(msg["content"], str):
                     remaining_tokens = max_tokens - current_tokens
                     fitted_content = self._fit_text(msg["content"], remaining_tokens)
                     if fitted_content:
-                        fitted_messages.insert(
-                            0, {"role": msg["role"], "content": fitted_content}
+                        fitted_messages.append(
+                            {"role": msg["role"], "content": fitted_content}
                         )
                         current_tokens += self.token_counter.count(fitted_content)
                 break
 
+        fitted_messages.reverse()
+
         logger.debug(
             f"Fitted {len(fitted_messages)}/{len(messages)} messages, "
             f"{current_tokens}/{max_tokens} tokens"
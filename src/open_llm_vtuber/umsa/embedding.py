@@ -2,18 +2,21 @@
 
 Provides vector embeddings for memory content using sentence-transformers.
 Lazy-loads the model on first use to avoid startup overhead.
-Batches encoding for efficiency and queues work between conversation turns
-to prevent GPU contention during real-time conversation.
+Batches encoding for efficiency and caches vectors by content hash. Node
+embeddings are queued by ``EmbeddingWorker`` and encoded once no conversation
+turn is in progress, to prevent GPU contention during real-time conversation.
 """
 
 from __future__ import annotations
 
 import struct
+import threading
 from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from .config import EmbeddingConfig
+from .embedding_cache import EmbeddingCache
 
 if TYPE_CHECKING:
     import numpy as np
@@ -25,6 +28,7 @@ class EmbeddingService:
     Features:
     - Lazy model loading (only when first embedding is requested)
     - Batch encoding for efficiency
+    - Content-hash LRU cache, so repeated texts are encoded once
     - Serialization helpers for SQLite BLOB storage
     """
 
@@ -36,17 +40,39 @@ class EmbeddingService:
         """
         self._config = config or EmbeddingConfig()
         self._model = None
+        self._model_lock = threading.Lock()
         self._dimension = self._config.dimension
+        self._cache: EmbeddingCache | None = None
+        if self._config.cache_size > 0:
+            self._cache = EmbeddingCache(
+                model=self._config.model,
+                max_entries=self._config.cache_size,
+                db_path=self._config.cache_db_path or None,
+            )
 
     @property
     def dimension(self) -> int:
         return self._dimension
 
+    @property
+    def cache(self) -> EmbeddingCache | None:
+        """Embedding cache in front of the model, if enabled."""
+        return self._cache
+
     def _ensure_model(self) -> None:
-        """Lazy-load the sentence-transformers model."""
+        """Lazy-load the sentence-transformers model.
+
+        Thread-safe, since encoding may run in worker threads.
+        """
         if self._model is not None:
             return
 
+        with self._model_lock:
+            if self._model is None:
+                self._load_model()
+
+    def _load_model(self) -> None:
+        """Load the sentence-transformers model (caller holds the lock)."""
         try:
             from sentence_transformers import SentenceTransformer
         except ImportError:
@@ -76,15 +102,30 @@ class EmbeddingService:
         if not texts:
             return []
 
+        if self._cache is None:
+            return self._encode_uncached(texts).tolist()
+
+        blobs = self._cache.get_many(texts)
+        # Encode each distinct missing text once
+        missing = list(dict.fromkeys(t for t, b in zip(texts, blobs) if b is None))
+        if missing:
+            encoded = self._encode_uncached(missing).astype("<f4")
+            new_blobs = [row.tobytes() for row in encoded]
+            self._cache.put_many(missing, new_blobs)
+            by_text = dict(zip(missing, new_blobs))
+            blobs = [b if b is not None else by_text[t] for t, b in zip(texts, blobs)]
+        return [self.deserialize_embedding(blob) for blob in blobs]
+
+    def _encode_uncached(self, texts: list[str]) -> np.ndarray:
+        """Run the model on ``texts``."""
         self._ensure_model()
 
-        embeddings: np.ndarray = self._model.encode(
+        return self._model.encode(
             texts,
-            batch_size=32,
+            batch_size=self._config.batch_size,
             show_progress_bar=False,
             normalize_embeddings=True,
         )
-        return embeddings.tolist()
 
     def encode_single(self, text: str) -> list[float]:
         """Encode a single text into an embedding vector.
@@ -0,0 +1,155 @@
+"""Content-addressed embedding cache for UMSA.
+
+Embeddings are keyed by a SHA-256 digest of the model name and the text, so
+identical content (a repeated query, a re-extracted fact) is encoded once.
+Entries live in an in-memory LRU and can optionally be persisted to a small
+SQLite database so they survive restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from loguru import logger
+
+
+class EmbeddingCache:
+    """LRU cache of serialized embeddings keyed by content hash.
+
+    Thread-safe, since encoding runs in worker threads. Values are the
+    float32 BLOBs used for storage, which take a fraction of the memory of
+    Python float lists.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        max_entries: int = 4096,
+        db_path: str | None = None,
+    ):
+        """Initialize embedding cache.
+
+        Args:
+            model: Embedding model name, part of every key
+            max_entries: In-memory LRU capacity
+            db_path: Optional SQLite file persisting every cached entry
+        """
+        self._model = model
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embedding_cache (
+                    key TEXT PRIMARY KEY,
+                    embedding BLOB NOT NULL
+                )
+                """
+            )
+            self._db.commit()
+            logger.debug(f"EmbeddingCache persisted at {db_path}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, text: str) -> str:
+        """Content hash of ``text`` under the configured model."""
+        return hashlib.sha256(f"{self._model}\0{text}".encode()).hexdigest()
+
+    def get_many(self, texts: list[str]) -> list[bytes | None]:
+        """Look up cached embeddings.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            Serialized embedding per text, or None on a miss
+        """
+        keys = [self.key(text) for text in texts]
+        found: list[bytes | None] = [None] * len(keys)
+        with self._lock:
+            for i, key in enumerate(keys):
+                blob = self._entries.get(key)
+                if blob is not None:
+                    self._entries.move_to_end(key)
+                    found[i] = blob
+
+            missing = [i for i, blob in enumerate(found) if blob is None]
+            if missing and self._db is not None:
+                stored = self._load([keys[i] for i in missing])
+                for i in missing:
+                    blob = stored.get(keys[i])
+                    if blob is not None:
+                        found[i] = blob
+                        self._remember(keys[i], blob)
+
+        hits = sum(blob is not None for blob in found)
+        self.hits += hits
+        self.misses += len(found) - hits
+        return found
+
+    def put_many(self, texts: list[str], blobs: list[bytes]) -> None:
+        """Cache serialized embeddings for ``texts``.
+
+        Args:
+            texts: Encoded texts
+            blobs: Serialized embedding per text
+        """
+        rows = [(self.key(text), blob) for text, blob in zip(texts, blobs)]
+        with self._lock:
+            for key, blob in rows:
+                self._remember(key, blob)
+            if self._db is not None and rows:
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embedding_cache (key, embedding) "
+                        "VALUES (?, ?)",
+                        rows,
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to persist embedding cache: {e}")
+
+    def close(self) -> None:
+        """Close the persistent store, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, blob: bytes) -> None:
+        """Insert into the LRU (caller holds the lock)."""
+        self._entries[key] = blob
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, keys: list[str]) -> dict[str, bytes]:
+        """Read persisted entries (caller holds the lock)."""
+        stored: dict[str, bytes] = {}
+        try:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT key, embedding FROM embedding_cache "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                stored.update(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read embedding cache: {e}")
+        return stored
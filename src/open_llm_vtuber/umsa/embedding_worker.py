@@ -0,0 +1,81 @@
+"""Background embedding worker for UMSA.
+
+New knowledge nodes are stored immediately without a vector, recorded in the
+``pending_embeddings`` table and queued here. The worker embeds them in
+batches off the event loop once the service has been quiet for
+``idle_seconds`` (or the oldest node has waited ``max_delay_seconds``), and
+not while a live turn is in progress unless the oldest node is overdue. The
+vectors are written back in one transaction per batch. Nodes left in the
+table by a crash are queued again on the next start.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Callable
+
+from loguru import logger
+
+from .embedding import EmbeddingService
+from .idle_batch_scheduler import IdleBatchScheduler
+from .storage.sqlite_store import SQLiteStore
+
+
+class EmbeddingWorker(IdleBatchScheduler):
+    """Worker that batches pending node embeddings.
+
+    ``submit()`` queues dicts with node_id and content. A batch of up to
+    ``batch_size`` nodes is encoded with one ``EmbeddingService.encode`` call
+    in a worker thread and all vectors are stored with
+    ``update_node_embeddings``.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteStore,
+        embedding_service: EmbeddingService,
+        is_busy: Callable[[], bool],
+        batch_size: int = 32,
+        idle_seconds: float = 1.0,
+        max_delay_seconds: float = 30.0,
+        busy_poll: float = 0.1,
+    ):
+        """Initialize embedding worker.
+
+        Args:
+            store: SQLite store receiving the vectors
+            embedding_service: Embedding service used for encoding
+            is_busy: Returns True while a live turn is in progress
+            batch_size: Maximum nodes per encode call and transaction
+            idle_seconds: Quiet time after the last activity before a batch runs
+            max_delay_seconds: Max wait for the oldest node, even during live turns
+            busy_poll: Seconds between busy checks while waiting for a turn
+        """
+        super().__init__(
+            self._embed,
+            is_busy,
+            max_batch=batch_size,
+            idle_seconds=idle_seconds,
+            max_delay_seconds=max_delay_seconds,
+            busy_poll=busy_poll,
+            name="Embedding batch",
+        )
+        self._store = store
+        self._embedding = embedding_service
+
+    @property
+    def embedded(self) -> int:
+        """Nodes embedded so far."""
+        return self.processed
+
+    async def _embed(self, batch: list[dict]) -> None:
+        vectors = await asyncio.to_thread(
+            self._embedding.encode, [node["content"] for node in batch]
+        )
+        await self._store.update_node_embeddings(
+            [
+                (node["node_id"], EmbeddingService.serialize_embedding(vector))
+                for node, vector in zip(batch, vectors)
+            ]
+        )
+        logger.debug(f"Embedded {len(batch)} queued knowledge nodes")
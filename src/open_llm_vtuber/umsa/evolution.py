@@ -11,13 +11,17 @@ Evolution only handles structural deduplication and cleanup.
 
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
 from datetime import datetime, timezone
 
+import numpy as np
 from loguru import logger
 
 from .config import ConsolidationConfig
 from .embedding import EmbeddingService
 from .storage.sqlite_store import SQLiteStore
+from .storage.vector_index import find_similar_pairs
 
 
 class MemoryEvolver:
@@ -69,88 +73,90 @@ class MemoryEvolver:
     async def _merge_similar(self, entity_id: str | None) -> int:
         """Merge memories with high cosine similarity.
 
-        For each pair above the threshold, keep the higher-importance node
-        and delete the other, creating a ``merged_from`` edge to preserve
-        provenance.
+        Similar pairs are searched across all of the entity's embedded
+        memories. For each pair, in order, whose nodes are both still
+        present, keep the higher-importance node and delete the other,
+        creating a ``merged_from`` edge to preserve provenance. All edges and
+        deletes are written in one transaction.
         """
-        nodes = await self._store.get_all_embeddings(entity_id)
+        nodes = [
+            node
+            for node in await self._store.get_all_embeddings(entity_id)
+            if node.get("embedding")
+        ]
         if len(nodes) < 2:
             return 0
 
-        # Deserialize embeddings
-        node_embeddings: list[tuple[dict, list[float]]] = []
-        for node in nodes:
-            blob = node.get("embedding")
-            if not blob:
-                continue
-            embedding = EmbeddingService.deserialize_embedding(blob)
-            node_embeddings.append((node, embedding))
-
-        if len(node_embeddings) < 2:
+        # Pair search is CPU-bound: keep it off the event loop
+        merges = await asyncio.to_thread(self._plan_merges, nodes)
+        if not merges:
             return 0
 
-        # Cap candidates to avoid O(n^2) blow-up on large memory stores
-        max_candidates = self._config.max_merge_candidates
-        if len(node_embeddings) > max_candidates:
-            node_embeddings.sort(
-                key=lambda pair: pair[0].get("last_accessed_at") or "",
-                reverse=True,
+        async with self._store.transaction():
+            await self._store.insert_knowledge_edges(
+                [
+                    {
+                        "edge_id": f"merge_{keep['node_id']}_{discard['node_id']}",
+                        "source_node_id": keep["node_id"],
+                        "target_node_id": discard["node_id"],
+                        "edge_type": "merged_from",
+                        "strength": similarity,
+                    }
+                    for keep, discard, similarity in merges
+                ]
+            )
+            await self._store.delete_knowledge_nodes_by_ids(
+                [discard["node_id"] for _, discard, _ in merges]
             )
-            node_embeddings = node_embeddings[:max_candidates]
 
-        merged_ids: set[str] = set()
-        merge_count = 0
+        for keep, discard, similarity in merges:
+            logger.debug(
+                f"Merged memory {discard['node_id']} into {keep['node_id']} "
+                f"(similarity={similarity:.3f})"
+            )
+        return len(merges)
 
-        # Pairwise comparison (O(n^2) but n is typically small per entity)
-        for i in range(len(node_embeddings)):
-            node_a, emb_a = node_embeddings[i]
-            if node_a["node_id"] in merged_ids:
-                continue
+    def _plan_merges(self, nodes: list[dict]) -> list[tuple[dict, dict, float]]:
+        """Decide which nodes to merge.
 
-            for j in range(i + 1, len(node_embeddings)):
-                node_b, emb_b = node_embeddings[j]
-                if node_b["node_id"] in merged_ids:
-                    continue
+        Args:
+            nodes: Nodes with an ``embedding`` BLOB
 
-                similarity = EmbeddingService.cosine_similarity(emb_a, emb_b)
+        Returns:
+            (keep, discard, similarity) triples
+        """
+        # Embeddings of another dimension (model change) cannot be compared
+        sizes = Counter(len(node["embedding"]) for node in nodes)
+        size = sizes.most_common(1)[0][0]
+        nodes = [node for node in nodes if len(node["embedding"]) == size]
+
+        matrix = np.frombuffer(
+            b"".join(node["embedding"] for node in nodes), dtype="<f4"
+        ).reshape(len(nodes), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+
+        rows_a, rows_b, scores = find_similar_pairs(
+            matrix,
+            self.MERGE_SIMILARITY_THRESHOLD,
+            exact_limit=self._config.merge_exact_limit,
+        )
+
+        merged: set[int] = set()
+        merges: list[tuple[dict, dict, float]] = []
+        for a, b, similarity in zip(rows_a.tolist(), rows_b.tolist(), scores.tolist()):
+            if a in merged or b in merged:
+                continue
 
-                if similarity < self.MERGE_SIMILARITY_THRESHOLD:
-                    continue
+            # Keep the one with higher importance
+            imp_a = nodes[a].get("importance", 0.5)
+            imp_b = nodes[b].get("importance", 0.5)
+            keep, discard = (a, b) if imp_a >= imp_b else (b, a)
 
-                # Keep the one with higher importance
-                imp_a = node_a.get("importance", 0.5)
-                imp_b = node_b.get("importance", 0.5)
-
-                if imp_a >= imp_b:
-                    keep, discard = node_a, node_b
-                else:
-                    keep, discard = node_b, node_a
-
-                # Record merge provenance as a graph edge
-                try:
-                    await self._store.insert_knowledge_edge(
-                        {
-                            "edge_id": f"merge_{keep['node_id']}_{discard['node_id']}",
-                            "source_node_id": keep["node_id"],
-                            "target_node_id": discard["node_id"],
-                            "edge_type": "merged_from",
-                            "strength": similarity,
-                        }
-                    )
-                except Exception:
-                    pass  # Edge creation is best-effort
-
-                # Delete the lower-importance duplicate
-                await self._store.delete_knowledge_node(discard["node_id"])
-                merged_ids.add(discard["node_id"])
-                merge_count += 1
-
-                logger.debug(
-                    f"Merged memory {discard['node_id']} into {keep['node_id']} "
-                    f"(similarity={similarity:.3f})"
-                )
-
-        return merge_count
+            merged.add(discard)
+            merges.append((nodes[keep], nodes[discard], similarity))
+        return merges
 
     async def _prune_stale(self, entity_id: str | None) -> int:
         """Remove old, unaccessed memories with very low importance.
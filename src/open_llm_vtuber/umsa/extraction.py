@@ -1,7 +1,9 @@
 """SimpleMem-style memory extraction pipeline.
 
 Uses a single LLM prompt to extract structured facts from conversation turns.
-Accumulated turns are batched before extraction to reduce LLM calls.
+Accumulated turns are batched before extraction to reduce LLM calls; a
+batch may mix turns from several entities, each fact being attributed to
+the turn it came from.
 
 When LLM is unavailable or disabled, a regex-based extractor provides
 synchronous hot-path extraction as a fallback. When both are available,
@@ -37,6 +39,7 @@ Return a JSON array of extracted memories. Each element must have:
 - "subject": who/what the fact is about (string, nullable)
 - "predicate": the relationship or action (string, nullable, for triples only)
 - "object": the target of the relationship (string, nullable, for triples only)
+- "turn": the number N of the [Turn N] the fact comes from (integer)
 
 Guidelines:
 - "atomic_fact": standalone facts (e.g. "User is a university student")
@@ -98,10 +101,7 @@ class MemoryExtractor:
             self._regex_extractor = RegexExtractor()
 
         # Validate that at least one extraction method is available
-        llm_available = (
-            self._llm is not None and self._config.llm_extraction_mode != "disabled"
-        )
-        if not llm_available and self._regex_extractor is None:
+        if not self.llm_available and self._regex_extractor is None:
             raise ValueError(
                 "No extraction backend available: LLM is None or disabled "
                 "and regex_enabled is False.  Enable at least one extraction "
@@ -112,6 +112,11 @@ class MemoryExtractor:
     def buffer_size(self) -> int:
         return len(self._turn_buffer)
 
+    @property
+    def llm_available(self) -> bool:
+        """Whether extraction makes an LLM call."""
+        return self._llm is not None and self._config.llm_extraction_mode != "disabled"
+
     def add_turn(
         self,
         user_content: str,
@@ -170,28 +175,51 @@ class MemoryExtractor:
 
         turns_to_process = list(self._turn_buffer)
         self._turn_buffer.clear()
+        return await self.extract_turns(turns_to_process, entity_id)
 
-        llm_available = (
-            self._llm is not None and self._config.llm_extraction_mode != "disabled"
-        )
+    async def extract_turns(
+        self,
+        turns: list[dict],
+        entity_id: str | None = None,
+        raise_llm_errors: bool = False,
+    ) -> ExtractionResult:
+        """Extract memories from the given turns, bypassing the buffer.
+
+        Turns may belong to different entities: unless *entity_id* is
+        given, each memory gets the ``entity_id`` of the turn it was
+        extracted from.
+
+        Args:
+            turns: Turn dicts (``user``, ``assistant``, ``entity_id``).
+            entity_id: Entity_id for every extracted memory, overriding the
+                turns' own.
+            raise_llm_errors: Raise when the LLM call fails instead of
+                returning the regex results only.
+
+        Returns:
+            ExtractionResult with extracted SemanticMemory instances.
+        """
+        if not turns:
+            return ExtractionResult()
 
         memories: list[SemanticMemory] = []
 
         # --- Regex hot-path (synchronous, user messages only) ---------------
         if self._regex_extractor is not None:
-            regex_memories = self._extract_regex(turns_to_process, entity_id)
+            regex_memories = self._extract_regex(turns, entity_id)
             memories.extend(regex_memories)
             logger.debug(
                 f"Regex extracted {len(regex_memories)} memories "
-                f"from {len(turns_to_process)} turns"
+                f"from {len(turns)} turns"
             )
 
         # --- LLM batch extraction -------------------------------------------
-        if llm_available:
-            conversation_text = self._format_turns(turns_to_process)
-            raw_json = await self._call_llm(conversation_text)
+        if self.llm_available:
+            conversation_text = self._format_turns(turns)
+            raw_json = await self._call_llm(conversation_text, raise_llm_errors)
             if raw_json:
-                llm_memories = self._parse_response(raw_json, entity_id)
+                turn_entities = [entity_id or turn.get("entity_id") for turn in turns]
+                llm_memories = self._parse_response(raw_json, entity_id, turn_entities)
                 memories = self._merge_and_dedup(memories, llm_memories)
             else:
                 logger.debug("LLM extraction returned empty response")
@@ -199,9 +227,7 @@ class MemoryExtractor:
         # --- Filter by thresholds -------------------------------------------
         memories = self._filter_by_thresholds(memories)
 
-        logger.info(
-            f"Extracted {len(memories)} memories from {len(turns_to_process)} turns"
-        )
+        logger.info(f"Extracted {len(memories)} memories from {len(turns)} turns")
         return ExtractionResult(memories=memories)
 
     def _format_turns(self, turns: list[dict]) -> str:
@@ -234,7 +260,7 @@ class MemoryExtractor:
 
         Args:
             turns: List of turn dicts (``user``, ``assistant``, ``entity_id``).
-            entity_id: Default entity ID to assign to extracted memories.
+            entity_id: Entity ID overriding each turn's own.
 
         Returns:
             List of ``SemanticMemory`` instances from regex matches.
@@ -243,18 +269,22 @@ class MemoryExtractor:
 
         # Process each user message individually so that end-of-string
         # anchors in regex patterns work correctly for each sentence.
-        all_results: list[dict] = []
-        seen_contents: set[str] = set()
+        all_results: list[tuple[str | None, dict]] = []
+        seen_contents: set[tuple[str | None, str]] = set()
         for turn in turns:
+            turn_entity_id = entity_id or turn.get("entity_id")
             raw_results = self._regex_extractor.extract(turn["user"])
             for item in raw_results:
-                content_key = " ".join(item["content"].split()).lower()
+                content_key = (
+                    turn_entity_id,
+                    " ".join(item["content"].split()).lower(),
+                )
                 if content_key not in seen_contents:
                     seen_contents.add(content_key)
-                    all_results.append(item)
+                    all_results.append((turn_entity_id, item))
 
         memories: list[SemanticMemory] = []
-        for item in all_results:
+        for turn_entity_id, item in all_results:
             type_str = item.get("memory_type", "atomic_fact")
             try:
                 memory_type = MemoryType(type_str)
@@ -263,7 +293,7 @@ class MemoryExtractor:
 
             memories.append(
                 SemanticMemory(
-                    entity_id=entity_id,
+                    entity_id=turn_entity_id,
                     memory_type=memory_type,
                     content=item["content"],
                     importance=item.get("importance", 0.5),
@@ -305,11 +335,14 @@ class MemoryExtractor:
 
         return merged
 
-    async def _call_llm(self, conversation_text: str) -> str:
+    async def _call_llm(
+        self, conversation_text: str, raise_errors: bool = False
+    ) -> str:
         """Call LLM to extract facts from conversation text.
 
         Args:
             conversation_text: Formatted conversation transcript
+            raise_errors: Re-raise a failed call instead of returning ""
 
         Returns:
             Raw JSON string from LLM response
@@ -339,6 +372,8 @@ class MemoryExtractor:
                 elif isinstance(chunk, dict) and chunk.get("type") == "text_delta":
                     response_parts.append(chunk.get("text", ""))
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"LLM extraction call failed: {e}")
             return ""
 
@@ -348,12 +383,17 @@ class MemoryExtractor:
         self,
         raw_json: str,
         default_entity_id: str | None,
+        turn_entities: list[str | None] | None = None,
     ) -> list[SemanticMemory]:
         """Parse LLM JSON response into SemanticMemory list.
 
         Args:
             raw_json: Raw JSON string from LLM
             default_entity_id: Entity ID to assign if not specified
+            turn_entities: Entity ID of each transcript turn, used for items
+                naming a valid ``turn``. If the turns belong to more than one
+                entity, items without a valid ``turn`` are dropped, since
+                they cannot be attributed.
 
         Returns:
             List of parsed SemanticMemory instances
@@ -378,6 +418,7 @@ class MemoryExtractor:
             logger.warning(f"Extraction expected JSON array, got {type(data).__name__}")
             return []
 
+        entities = set(turn_entities) if turn_entities else {default_entity_id}
         memories: list[SemanticMemory] = []
         for item in data:
             if not isinstance(item, dict):
@@ -398,9 +439,23 @@ class MemoryExtractor:
                 importance = 0.5
             importance = max(0.0, min(1.0, float(importance)))
 
+            turn = item.get("turn")
+            if (
+                turn_entities
+                and isinstance(turn, int)
+                and not isinstance(turn, bool)
+                and 1 <= turn <= len(turn_entities)
+            ):
+                memory_entity_id = turn_entities[turn - 1]
+            elif len(entities) == 1:
+                memory_entity_id = next(iter(entities))
+            else:
+                logger.debug(f"Dropped unattributed extraction item: {content[:80]}")
+                continue
+
             memories.append(
                 SemanticMemory(
-                    entity_id=default_entity_id,
+                    entity_id=memory_entity_id,
                     memory_type=memory_type,
                     content=content,
                     subject=item.get("subject"),
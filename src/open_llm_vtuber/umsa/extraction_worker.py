@@ -0,0 +1,74 @@
+"""Background LLM memory extraction for UMSA.
+
+``MemoryService.process_turn`` records each turn in the
+``pending_extractions`` table and hands it to this worker instead of
+awaiting an extraction LLM call after the response. The worker collects
+turns from every session and entity and extracts them together, one LLM
+call per batch, once the service has been quiet for ``idle_seconds`` (or the
+oldest turn has waited ``max_delay_seconds``), and not while a live turn is
+in progress unless the oldest turn is overdue. Turns left in the table by a
+crash are queued again on the next start.
+"""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable
+
+from .idle_batch_scheduler import IdleBatchScheduler
+
+
+class ExtractionWorker(IdleBatchScheduler):
+    """Worker that batches queued turns into extraction calls.
+
+    A batch runs after an idle gap once at least ``batch_size`` turns are
+    queued, or when the oldest turn has waited ``max_delay_seconds``; it
+    passes up to ``max_batch_turns`` turns to ``run_batch`` in one call.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[dict]], Awaitable[None]],
+        is_busy: Callable[[], bool],
+        batch_size: int = 5,
+        max_batch_turns: int = 20,
+        idle_seconds: float = 2.0,
+        max_delay_seconds: float = 30.0,
+        busy_poll: float = 0.1,
+    ):
+        """Initialize the worker.
+
+        Args:
+            run_batch: Coroutine function extracting and persisting a list of turns
+            is_busy: Returns True while a live turn is in progress
+            batch_size: Queued turns needed before an idle gap starts a batch
+            max_batch_turns: Maximum turns passed to one ``run_batch`` call
+            idle_seconds: Quiet time after the last activity before a batch runs
+            max_delay_seconds: Max wait for the oldest turn, even below batch_size
+            busy_poll: Seconds between busy checks while waiting for a turn
+        """
+        super().__init__(
+            run_batch,
+            is_busy,
+            batch_size=batch_size,
+            max_batch=max_batch_turns,
+            idle_seconds=idle_seconds,
+            max_delay_seconds=max_delay_seconds,
+            busy_poll=busy_poll,
+            name="Extraction batch",
+        )
+
+    @property
+    def extracted(self) -> int:
+        """Turns extracted so far."""
+        return self.processed
+
+    def metrics(self) -> dict:
+        """Backlog and throughput counters.
+
+        Returns:
+            Dict with pending, oldest_pending_seconds, batches, extracted,
+            failed and last_batch_seconds
+        """
+        metrics = super().metrics()
+        metrics["extracted"] = metrics.pop("processed")
+        return metrics
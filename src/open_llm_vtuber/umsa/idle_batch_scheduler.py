@@ -0,0 +1,181 @@
+"""Idle-time batching shared by UMSA's background workers.
+
+Deferred session consolidation, background memory extraction and node
+embedding all queue work during a live conversation and run it in batches
+once the service has gone quiet. ``IdleBatchScheduler`` holds that logic;
+``ConsolidationScheduler``, ``ExtractionWorker`` and ``EmbeddingWorker``
+configure it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable
+
+from loguru import logger
+
+
+class IdleBatchScheduler:
+    """Asyncio scheduler that runs queued items in batches during idle time.
+
+    ``submit()`` queues an item. A batch runs after an idle gap of
+    ``idle_seconds`` once at least ``batch_size`` items are queued, or when
+    the oldest item has waited ``max_delay_seconds``; it passes up to
+    ``max_batch`` items (all when None) to ``run_batch`` in one call.
+
+    ``is_busy`` reports whether a live turn is running. No batch starts
+    while it returns True, and ``run_batch`` can await ``wait_until_idle()``
+    between steps to keep yielding to turns. Once the oldest item has waited
+    ``max_delay_seconds`` the batch runs regardless.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[dict]], Awaitable[None]],
+        is_busy: Callable[[], bool],
+        batch_size: int = 1,
+        max_batch: int | None = None,
+        idle_seconds: float = 5.0,
+        max_delay_seconds: float = 60.0,
+        busy_poll: float = 0.1,
+        name: str = "batch",
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            run_batch: Coroutine function processing a list of items
+            is_busy: Returns True while a live turn is in progress
+            batch_size: Queued items needed before an idle gap starts a batch
+            max_batch: Maximum items passed to one ``run_batch`` call
+            idle_seconds: Quiet time after the last activity before a batch runs
+            max_delay_seconds: Max wait for the oldest item, even below
+                batch_size, without a gap or during live turns
+            busy_poll: Seconds between busy checks while waiting for a turn
+            name: Label used in log messages
+        """
+        self._run_batch = run_batch
+        self._is_busy = is_busy
+        self.batch_size = max(1, batch_size)
+        self.max_batch = max(1, max_batch) if max_batch is not None else None
+        self.idle_seconds = idle_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.name = name
+        self._busy_poll = busy_poll
+        # (queued_at, item), oldest first
+        self._items: list[tuple[float, dict]] = []
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+        self._flush_requested = False
+        # Set while a batch runs past max_delay_seconds
+        self._overdue = False
+        self._last_activity = float("-inf")
+        self.batches = 0
+        self.processed = 0
+        self.failed = 0
+        self.last_batch_seconds = 0.0
+
+    @property
+    def pending(self) -> int:
+        """Items waiting for the next batch."""
+        return len(self._items)
+
+    @property
+    def oldest_pending_seconds(self) -> float:
+        """How long the oldest queued item has been waiting (0 when idle)."""
+        if not self._items:
+            return 0.0
+        return asyncio.get_running_loop().time() - self._items[0][0]
+
+    def metrics(self) -> dict:
+        """Backlog and throughput counters.
+
+        Returns:
+            Dict with pending, oldest_pending_seconds, batches, processed,
+            failed and last_batch_seconds
+        """
+        return {
+            "pending": self.pending,
+            "oldest_pending_seconds": self.oldest_pending_seconds,
+            "batches": self.batches,
+            "processed": self.processed,
+            "failed": self.failed,
+            "last_batch_seconds": self.last_batch_seconds,
+        }
+
+    def touch(self) -> None:
+        """Record live activity, postponing the next batch."""
+        self._last_activity = asyncio.get_running_loop().time()
+
+    def submit(self, item: dict) -> None:
+        """Queue an item.
+
+        Args:
+            item: Item passed through to ``run_batch``
+        """
+        self.touch()
+        self._items.append((self._last_activity, item))
+        self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def wait_until_idle(self) -> None:
+        """Wait until no live turn is in progress.
+
+        Returns immediately when flushing or when the batch is overdue.
+        """
+        while self._is_busy() and not (self._flush_requested or self._overdue):
+            await asyncio.sleep(self._busy_poll)
+
+    async def flush(self) -> None:
+        """Run every queued item now and wait for it to finish."""
+        if self._task is None or self._task.done():
+            return
+        self._flush_requested = True
+        self._wake.set()
+        await asyncio.shield(self._task)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._items:
+                if not self._flush_requested:
+                    deadline = self._items[0][0] + self.max_delay_seconds
+                    ready_at = deadline
+                    if len(self._items) >= self.batch_size:
+                        ready_at = min(
+                            ready_at, self._last_activity + self.idle_seconds
+                        )
+                    timeout = ready_at - loop.time()
+                    if timeout > 0:
+                        self._wake.clear()
+                        try:
+                            await asyncio.wait_for(self._wake.wait(), timeout)
+                        except asyncio.TimeoutError:
+                            pass
+                        continue
+                    self._overdue = loop.time() >= deadline
+                    if self._is_busy() and not self._overdue:
+                        await asyncio.sleep(
+                            min(self._busy_poll, deadline - loop.time())
+                        )
+                        continue
+
+                size = self.max_batch or len(self._items)
+                batch = [item for _, item in self._items[:size]]
+                del self._items[:size]
+                started = loop.time()
+                try:
+                    await self._run_batch(batch)
+                    self.batches += 1
+                    self.processed += len(batch)
+                except Exception as e:
+                    self.failed += len(batch)
+                    logger.warning(f"{self.name} of {len(batch)} items failed: {e}")
+                self.last_batch_seconds = loop.time() - started
+                logger.debug(
+                    f"{self.name} of {len(batch)} items took "
+                    f"{self.last_batch_seconds:.2f}s, {self.pending} pending"
+                )
+        finally:
+            self._flush_requested = False
+            self._overdue = False
@@ -7,23 +7,28 @@ stream context tracking, procedural memory, reflection, and session management.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Protocol
+from typing import Awaitable, Callable, Protocol
 
 from loguru import logger
 
 from .config import MemoryConfig
 from .conflict_detector import ConflictDetector
+from .consolidation_scheduler import ConsolidationScheduler
 from .context_assembler import AssembledContext, ContextAssembler
 from .embedding import EmbeddingService
+from .embedding_worker import EmbeddingWorker
 from .evolution import MemoryEvolver
 from .extraction import MemoryExtractor
+from .extraction_worker import ExtractionWorker
 from .models import Message, SemanticMemory
 from .procedural_memory import ProceduralMemory
 from .reflection import ReflectionEngine
-from .retrieval import HybridRetriever
+from .retrieval import HybridRetriever, build_vector_index
 from .storage.sqlite_store import SQLiteStore
 from .stream_context import StreamContext
 from .token_counter import TokenCounter
@@ -60,7 +65,7 @@ class MemoryServiceInterface(Protocol):
         """Start a new conversation session."""
         ...
 
-    async def end_session(self, session_id: str) -> None:
+    async def end_session(self, session_id: str, defer: bool = False) -> None:
         """End a conversation session."""
         ...
 
@@ -124,9 +129,15 @@ class MemoryService:
         self._store_initialized: bool = False
         self._extractor: MemoryExtractor | None = None
         self._embedding_service: EmbeddingService | None = None
+        self._embedding_worker: EmbeddingWorker | None = None
         self._retriever: HybridRetriever | None = None
         self._evolver: MemoryEvolver | None = None
+        self._consolidation: ConsolidationScheduler | None = None
+        self._extraction_worker: ExtractionWorker | None = None
         self._active_sessions: dict[str, dict] = {}
+        # (query, entity_id) -> (started_at, retrieval task), see prefetch_context
+        self._prefetched: dict[tuple[str, str | None], tuple[float, asyncio.Task]] = {}
+        self._episodic_summary: str | None = None
 
         # Phase 2 cognitive components (eager initialization, in-memory)
         sc_cfg = self.config.stream_context
@@ -195,8 +206,19 @@ class MemoryService:
     async def _ensure_store(self) -> SQLiteStore:
         """Lazy initialization of SQLite store."""
         if self._store is None:
-            db_path = self.config.storage.sqlite_db_path
-            self._store = SQLiteStore(db_path=db_path)
+            storage = self.config.storage
+            self._store = SQLiteStore(
+                db_path=storage.sqlite_db_path,
+                vector_index=build_vector_index(self.config.retrieval),
+                flush_interval=storage.write_flush_interval_ms / 1000.0,
+                read_pool_size=storage.read_pool_size,
+                pragmas={
+                    "synchronous": storage.synchronous,
+                    "mmap_size": storage.mmap_size_mb * 1024 * 1024,
+                    "cache_size": -storage.cache_size_mb * 1024,
+                    "temp_store": storage.temp_store,
+                },
+            )
         if not self._store_initialized:
             await self._store.initialize()
             self._store_initialized = True
@@ -205,19 +227,49 @@ class MemoryService:
             )
         return self._store
 
-    async def _ensure_retriever(self) -> HybridRetriever:
-        """Lazy initialization of embedding service and hybrid retriever."""
+    def _ensure_embedding_service(self) -> EmbeddingService:
+        """Lazy initialization of embedding service."""
         if self._embedding_service is None:
             self._embedding_service = EmbeddingService(
                 config=self.config.embedding,
             )
             logger.debug("EmbeddingService initialized")
+        return self._embedding_service
+
+    async def _ensure_embedding_worker(self) -> EmbeddingWorker:
+        """Lazy initialization of the background embedding worker.
 
+        On creation, nodes left in the pending_embeddings table by a
+        previous run are queued again.
+        """
+        if self._embedding_worker is None:
+            store = await self._ensure_store()
+            cfg = self.config.embedding
+            worker = EmbeddingWorker(
+                store=store,
+                embedding_service=self._ensure_embedding_service(),
+                # Sessions wrap each live turn, so any active one means busy
+                is_busy=lambda: bool(self._active_sessions),
+                batch_size=cfg.batch_size,
+                idle_seconds=cfg.idle_seconds,
+                max_delay_seconds=cfg.max_delay_seconds,
+            )
+            pending = await store.get_pending_embeddings()
+            for node in pending:
+                worker.submit(node)
+            if pending:
+                logger.info(f"Recovered {len(pending)} nodes pending embedding")
+            self._embedding_worker = worker
+            logger.debug("EmbeddingWorker initialized")
+        return self._embedding_worker
+
+    async def _ensure_retriever(self) -> HybridRetriever:
+        """Lazy initialization of embedding service and hybrid retriever."""
         if self._retriever is None:
             store = await self._ensure_store()
             self._retriever = HybridRetriever(
                 store=store,
-                embedding_service=self._embedding_service,
+                embedding_service=self._ensure_embedding_service(),
                 config=self.config.retrieval,
             )
             logger.debug("HybridRetriever initialized")
@@ -227,21 +279,121 @@ class MemoryService:
     async def _ensure_evolver(self) -> MemoryEvolver:
         """Lazy initialization of memory evolver."""
         if self._evolver is None:
-            if self._embedding_service is None:
-                self._embedding_service = EmbeddingService(
-                    config=self.config.embedding,
-                )
             store = await self._ensure_store()
             self._evolver = MemoryEvolver(
                 store=store,
-                embedding_service=self._embedding_service,
+                embedding_service=self._ensure_embedding_service(),
                 config=self.config.consolidation,
             )
             logger.debug("MemoryEvolver initialized")
         return self._evolver
 
+    async def _ensure_consolidation_scheduler(self) -> ConsolidationScheduler:
+        """Lazy initialization of the deferred consolidation scheduler.
+
+        On creation, sessions left in the pending_consolidations table by a
+        previous run are queued again.
+        """
+        if self._consolidation is None:
+            store = await self._ensure_store()
+            cfg = self.config.consolidation
+            scheduler = ConsolidationScheduler(
+                run_batch=self._consolidate_pending,
+                # Sessions wrap each live turn, so any active one means busy
+                is_busy=lambda: bool(self._active_sessions),
+                idle_seconds=cfg.idle_seconds,
+                max_delay_seconds=cfg.max_delay_seconds,
+            )
+            pending = await store.get_pending_consolidations()
+            for job in pending:
+                scheduler.submit(job)
+            if pending:
+                logger.info(f"Recovered {len(pending)} pending consolidations")
+            self._consolidation = scheduler
+            logger.debug("ConsolidationScheduler initialized")
+        return self._consolidation
+
+    def _background_extraction(self) -> bool:
+        """Whether turns go to the ExtractionWorker instead of the inline buffer.
+
+        Regex-only extraction makes no LLM call, so it stays inline.
+        """
+        return (
+            self._extractor is not None
+            and self._extractor.llm_available
+            and self.config.extraction.background
+        )
+
+    async def _ensure_extraction_worker(self) -> ExtractionWorker:
+        """Lazy initialization of the background extraction worker.
+
+        On creation, turns left in the pending_extractions table by a
+        previous run are queued again.
+        """
+        if self._extraction_worker is None:
+            store = await self._ensure_store()
+            cfg = self.config.extraction
+            worker = ExtractionWorker(
+                run_batch=self._extract_pending,
+                # Sessions wrap each live turn, so any active one means busy
+                is_busy=lambda: bool(self._active_sessions),
+                batch_size=cfg.batch_size,
+                max_batch_turns=cfg.max_batch_turns,
+                idle_seconds=cfg.idle_seconds,
+                max_delay_seconds=cfg.max_delay_seconds,
+            )
+            pending = await store.get_pending_extractions()
+            for turn in pending:
+                worker.submit(turn)
+            if pending:
+                logger.info(f"Recovered {len(pending)} turns pending extraction")
+            self._extraction_worker = worker
+            logger.debug("ExtractionWorker initialized")
+        return self._extraction_worker
+
+    def extraction_metrics(self) -> dict:
+        """Backlog of the background extraction worker.
+
+        Returns:
+            Dict with pending, oldest_pending_seconds, batches, extracted,
+            failed and last_batch_seconds (all zero before the first turn)
+        """
+        if self._extraction_worker is None:
+            return {
+                "pending": 0,
+                "oldest_pending_seconds": 0.0,
+                "batches": 0,
+                "extracted": 0,
+                "failed": 0,
+                "last_batch_seconds": 0.0,
+            }
+        return self._extraction_worker.metrics()
+
     async def close(self) -> None:
         """Close resources (SQLite connection, etc.)."""
+        for _, task in self._prefetched.values():
+            task.cancel()
+        self._prefetched.clear()
+        if self._extraction_worker is not None:
+            try:
+                await self._extraction_worker.flush()
+            except Exception as e:
+                logger.warning(f"Failed to run pending extractions on close: {e}")
+            self._extraction_worker = None
+        if self._consolidation is not None:
+            try:
+                await self._consolidation.flush()
+            except Exception as e:
+                logger.warning(f"Failed to run pending consolidations on close: {e}")
+            self._consolidation = None
+        if self._embedding_worker is not None:
+            try:
+                await self._embedding_worker.flush()
+            except Exception as e:
+                logger.warning(f"Failed to drain embedding queue on close: {e}")
+            self._embedding_worker = None
+        if self._embedding_service is not None and self._embedding_service.cache:
+            self._embedding_service.cache.close()
         if self._store and self._store_initialized:
             await self._store.close()
             self._store_initialized = False
@@ -261,6 +413,10 @@ class MemoryService:
         context and procedural rules, loads recent episodic summaries, then
         assembles everything within the token budget.
 
+        If ``prefetch_context()`` was called with the same messages, the
+        retrieval it started is awaited instead of running a new one. Stage
+        timings are returned in ``AssembledContext.timings``.
+
         Args:
             messages: Recent conversation messages
             entity_id: Optional entity identifier for personalization
@@ -276,35 +432,30 @@ class MemoryService:
             f"Building context: {len(messages)} messages, "
             f"max_tokens={max_tokens}, entity_id={entity_id}"
         )
+        started = time.perf_counter()
+        timings: dict[str, float] = {}
 
         # Retrieve relevant memories from recent user messages
         retrieved_memories = []
-        if messages:
-            query_parts = [
-                msg["content"]
-                for msg in messages[-3:]
-                if msg.get("role") == "user" and isinstance(msg.get("content"), str)
-            ]
-            if query_parts:
-                query = " ".join(query_parts)
-                try:
-                    retriever = await self._ensure_retriever()
-                    retrieved_memories = await retriever.retrieve(
-                        query=query,
-                        entity_id=entity_id,
-                        top_k=self.config.retrieval.top_k,
-                    )
-                    logger.debug(
-                        f"Retrieved {len(retrieved_memories)} memories for context"
-                    )
-                except Exception as e:
-                    logger.warning(f"Memory retrieval failed: {e}")
+        prefetched = False
+        query = self._retrieval_query(messages)
+        if query:
+            task = self._take_prefetched(query, entity_id)
+            prefetched = task is not None
+            if prefetched:
+                retrieved_memories = await task
+            else:
+                retrieved_memories = await self._retrieve(query, entity_id)
+        timings["retrieval"] = (time.perf_counter() - started) * 1000.0
 
         # Gather Phase 2 context: stream context, procedural rules, episodic summary
+        stage = time.perf_counter()
         stream_context_text = self._stream_context.format_for_context()
         procedural_rules_text = self._procedural_memory.format_for_context()
         episodic_summary = await self._load_episodic_summary()
+        timings["episodic"] = (time.perf_counter() - stage) * 1000.0
 
+        stage = time.perf_counter()
         ctx = self._context_assembler.assemble_split(
             system_prompt=system_prompt,
             recent_messages=messages,
@@ -314,33 +465,122 @@ class MemoryService:
             episodic_summary=episodic_summary,
             retrieved_memories=retrieved_memories or None,
         )
+        timings["assembly"] = (time.perf_counter() - stage) * 1000.0
+        timings["total"] = (time.perf_counter() - started) * 1000.0
+        ctx.timings = timings
 
+        timing_text = ", ".join(f"{k}={v:.1f}ms" for k, v in timings.items())
         logger.info(
             f"Context built: system={len(ctx.system_content)}chars, "
             f"{len(ctx.messages)} messages "
-            f"(from {len(messages)} input, {len(retrieved_memories)} memories)"
+            f"(from {len(messages)} input, {len(retrieved_memories)} memories"
+            f"{', prefetched' if prefetched else ''}; {timing_text})"
         )
 
         return ctx
 
+    def prefetch_context(
+        self,
+        messages: list[dict],
+        entity_id: str | None = None,
+    ) -> None:
+        """Start memory retrieval for an upcoming ``build_context`` call.
+
+        Call as soon as the user's text is known (e.g. right after ASR) with
+        the messages the turn will be built from. Retrieval then runs while
+        the rest of the turn is set up, and ``build_context`` picks up the
+        result if it is asked for the same query within
+        ``retrieval.prefetch_ttl_seconds``.
+
+        Args:
+            messages: Conversation messages including the new user message
+            entity_id: Optional entity identifier
+        """
+        query = self._retrieval_query(messages)
+        if not query:
+            return
+
+        now = time.monotonic()
+        ttl = self.config.retrieval.prefetch_ttl_seconds
+        for key, (created, task) in list(self._prefetched.items()):
+            if now - created > ttl:
+                task.cancel()
+                del self._prefetched[key]
+
+        key = (query, entity_id)
+        if key not in self._prefetched:
+            task = asyncio.create_task(self._retrieve(query, entity_id))
+            self._prefetched[key] = (now, task)
+            logger.debug(f"Prefetching memories for '{query[:50]}'")
+
+    def _take_prefetched(
+        self, query: str, entity_id: str | None
+    ) -> asyncio.Task | None:
+        """Pop a still-fresh prefetched retrieval for the query, if any."""
+        entry = self._prefetched.pop((query, entity_id), None)
+        if entry is None:
+            return None
+        created, task = entry
+        if time.monotonic() - created > self.config.retrieval.prefetch_ttl_seconds:
+            task.cancel()
+            return None
+        return task
+
+    @staticmethod
+    def _retrieval_query(messages: list[dict]) -> str:
+        """Build the retrieval query from the last user messages."""
+        query_parts = []
+        for msg in messages[-3:]:
+            if msg.get("role") != "user":
+                continue
+            content = msg.get("content")
+            if isinstance(content, list):
+                # Multimodal messages: use the text parts
+                content = " ".join(
+                    part.get("text", "")
+                    for part in content
+                    if isinstance(part, dict) and part.get("type") == "text"
+                )
+            if isinstance(content, str) and content:
+                query_parts.append(content)
+        return " ".join(query_parts)
+
+    async def _retrieve(self, query: str, entity_id: str | None) -> list:
+        """Run hybrid retrieval for context building, [] on failure."""
+        try:
+            retriever = await self._ensure_retriever()
+            retrieved_memories = await retriever.retrieve(
+                query=query,
+                entity_id=entity_id,
+                top_k=self.config.retrieval.top_k,
+            )
+            logger.debug(f"Retrieved {len(retrieved_memories)} memories for context")
+            return retrieved_memories
+        except Exception as e:
+            logger.warning(f"Memory retrieval failed: {e}")
+            return []
+
     async def _load_episodic_summary(self) -> str:
         """Load recent stream episodes and format as episodic summary text.
 
+        The result is cached until the next stream episode is saved.
+
         Returns:
             Formatted episodic summary string, or "" if unavailable.
         """
+        if self._episodic_summary is not None:
+            return self._episodic_summary
         try:
             if self._store is None or not self._store_initialized:
                 return ""
             episodes = await self._store.get_stream_episodes(limit=5)
-            if not episodes:
-                return ""
             parts = []
             for ep in episodes:
                 summary = ep.get("summary", "")
                 if summary:
                     parts.append(f"- {summary}")
-            return "\n".join(parts) if parts else ""
+            self._episodic_summary = "\n".join(parts)
+            return self._episodic_summary
         except Exception as e:
             logger.warning(f"Failed to load episodic summary: {e}")
             return ""
@@ -353,9 +593,13 @@ class MemoryService:
     ) -> None:
         """Process a conversation turn for memory extraction and stream context.
 
-        Updates the stream context with the user message, then adds the turn
-        to the extraction buffer. When the buffer reaches batch_size, triggers
-        LLM-based extraction and persists results.
+        Updates the stream context with the user message, then queues the
+        turn for extraction. When extraction uses the LLM (and
+        ``extraction.background`` is set) the turn is recorded in the
+        pending_extractions table and extracted later by the background
+        ExtractionWorker, so the next turn never waits for the LLM call.
+        Otherwise the turn is added to the extraction buffer, and a full
+        buffer (batch_size turns) is extracted and persisted right away.
 
         Args:
             user_message: User's message
@@ -377,6 +621,16 @@ class MemoryService:
             logger.debug("process_turn: extractor not available, skipping")
             return
 
+        if self._background_extraction():
+            await self._queue_extraction(
+                {
+                    "user": user_message.content,
+                    "assistant": assistant_message.content,
+                    "entity_id": entity_id,
+                }
+            )
+            return
+
         should_extract = self._extractor.add_turn(
             user_content=user_message.content,
             assistant_content=assistant_message.content,
@@ -389,14 +643,55 @@ class MemoryService:
     async def flush_extraction(self, entity_id: str | None = None) -> None:
         """Force extraction of any remaining buffered turns.
 
-        Called at session end to ensure no turns are lost.
+        Called at session end to ensure no turns are lost. Also runs every
+        turn queued for background extraction and waits for it.
 
         Args:
             entity_id: Default entity_id for extracted memories
         """
+        if self._extraction_worker is not None:
+            await self._extraction_worker.flush()
         if self._extractor and self._extractor.buffer_size > 0:
             await self._run_extraction(entity_id)
 
+    async def _queue_extraction(self, turn: dict) -> None:
+        """Record a turn and hand it to the background extraction worker."""
+        try:
+            worker = await self._ensure_extraction_worker()
+            store = await self._ensure_store()
+        except Exception as e:
+            logger.warning(f"Extraction skipped, store unavailable: {e}")
+            return
+        # Persisted first so the turn survives a crash before its batch runs
+        try:
+            turn["id"] = await store.insert_pending_extraction(turn)
+        except Exception as e:
+            logger.warning(f"Failed to persist pending extraction: {e}")
+        worker.submit(turn)
+        logger.debug(f"Turn queued for extraction ({worker.pending} pending)")
+
+    async def _extract_pending(self, turns: list[dict]) -> None:
+        """Extract a batch of queued turns (ExtractionWorker).
+
+        All turns, whichever session or entity they belong to, go to one
+        LLM call. The memories and the removal of the turns from
+        pending_extractions are committed together; if the LLM call or the
+        write fails, the turns stay in the table for the next start.
+        """
+        result = await self._extractor.extract_turns(turns, raise_llm_errors=True)
+        store = await self._ensure_store()
+        async with store.transaction():
+            await self._insert_memories(store, result.memories)
+            await store.delete_pending_extractions(
+                [turn["id"] for turn in turns if turn.get("id") is not None]
+            )
+        if result.memories:
+            logger.info(
+                f"Persisted {len(result.memories)} memories extracted "
+                f"from {len(turns)} queued turns"
+            )
+            await self._queue_embeddings(result.memories)
+
     async def _run_extraction(self, entity_id: str | None = None) -> None:
         """Run extraction on buffered turns, persist results, and embed."""
         if not self._extractor:
@@ -414,11 +709,28 @@ class MemoryService:
         if not result.memories:
             return
 
-        # Persist extracted memories to SQLite
+        # Persist extracted memories in one batch; vectors are added by the
+        # background embedding worker so the turn never waits on the model
         try:
             store = await self._ensure_store()
-            for memory in result.memories:
-                await store.insert_knowledge_node(
+            await self._insert_memories(store, result.memories)
+            logger.info(
+                f"Persisted {len(result.memories)} extracted memories to SQLite"
+            )
+        except Exception as e:
+            logger.error(f"Failed to persist extracted memories: {e}")
+            return
+
+        await self._queue_embeddings(result.memories)
+
+    @staticmethod
+    async def _insert_memories(
+        store: SQLiteStore, memories: list[SemanticMemory]
+    ) -> None:
+        """Store memories without vectors, recorded in pending_embeddings."""
+        async with store.transaction():
+            await store.insert_knowledge_nodes(
+                [
                     {
                         "node_id": memory.id,
                         "entity_id": memory.entity_id,
@@ -427,28 +739,24 @@ class MemoryService:
                         "importance": memory.importance,
                         "metadata": None,
                     }
-                )
-            logger.info(
-                f"Persisted {len(result.memories)} extracted memories to SQLite"
+                    for memory in memories
+                ]
             )
-        except Exception as e:
-            logger.error(f"Failed to persist extracted memories: {e}")
-            return
+            await store.insert_pending_embeddings([memory.id for memory in memories])
 
-        # Generate and store embeddings
+    async def _queue_embeddings(self, memories: list[SemanticMemory]) -> None:
+        """Hand freshly stored memories to the background embedding worker."""
         try:
-            if self._embedding_service is None:
-                self._embedding_service = EmbeddingService(
-                    config=self.config.embedding,
+            if self._embedding_worker is None:
+                # Creating the worker queues everything in pending_embeddings
+                await self._ensure_embedding_worker()
+                return
+            for memory in memories:
+                self._embedding_worker.submit(
+                    {"node_id": memory.id, "content": memory.content}
                 )
-            contents = [m.content for m in result.memories]
-            embeddings = self._embedding_service.encode(contents)
-            for memory, embedding in zip(result.memories, embeddings):
-                blob = EmbeddingService.serialize_embedding(embedding)
-                await store.update_node_embedding(memory.id, blob)
-            logger.info(f"Embedded {len(embeddings)} extracted memories")
         except Exception as e:
-            logger.warning(f"Failed to embed extracted memories: {e}")
+            logger.warning(f"Failed to queue memories for embedding: {e}")
 
     async def start_session(
         self,
@@ -502,17 +810,40 @@ class MemoryService:
         # Phase 2: Clear stream context for new session
         self._stream_context.clear()
 
+        # Recover queued extractions and hold them off during the turn
+        if self._background_extraction():
+            try:
+                worker = await self._ensure_extraction_worker()
+                worker.touch()
+            except Exception as e:
+                logger.warning(f"Extraction worker unavailable: {e}")
+
+        # Recover queued embeddings and hold them off during the turn
+        try:
+            worker = await self._ensure_embedding_worker()
+            worker.touch()
+        except Exception as e:
+            logger.warning(f"Embedding worker unavailable: {e}")
+
+        # Recover deferred consolidations and hold them off during the turn
+        if self.config.consolidation.deferred:
+            try:
+                scheduler = await self._ensure_consolidation_scheduler()
+                scheduler.touch()
+            except Exception as e:
+                logger.warning(f"Consolidation scheduler unavailable: {e}")
+
         logger.info(
             f"Session started: {session_id} (entity={entity_id}, platform={platform})"
         )
         return session_id
 
-    async def end_session(self, session_id: str) -> None:
+    async def end_session(self, session_id: str, defer: bool = False) -> None:
         """End a conversation session.
 
         Performs full session consolidation:
-        1. Persists session end to SQLite
-        2. Flushes any remaining extraction buffer
+        1. Flushes any remaining extraction buffer
+        2. Persists session end to SQLite
         3. Saves stream context as a stream episode
         4. Creates an Episode node summarizing the session
         5. Updates entity profile (touch_entity)
@@ -521,8 +852,17 @@ class MemoryService:
         8. Writes a consolidation log entry
         9. Clears stream context
 
+        Steps 2-8 run inside a single store transaction.
+
+        With ``defer=True`` (and ``consolidation.deferred`` enabled) only a
+        snapshot of the session is recorded in the pending_consolidations
+        table and the stream context is cleared; steps 1-8 run later in the
+        background, batched with other ended sessions, once no session has
+        been active for ``consolidation.idle_seconds``.
+
         Args:
             session_id: Session identifier to end
+            defer: Hand consolidation to the background scheduler
         """
         session_data = self._active_sessions.pop(session_id, None)
         if session_data is None:
@@ -534,9 +874,210 @@ class MemoryService:
         entity_id = session_data.get("entity_id")
         platform = session_data.get("platform", "direct")
 
-        # 1. Persist session end
+        if defer and self.config.consolidation.deferred:
+            await self._defer_consolidation(
+                session_id, ended_at, message_count, entity_id, platform
+            )
+            return
+
+        # 1. Flush remaining extraction buffer. This may call the LLM, so it
+        #    runs before the consolidation transaction is opened.
+        try:
+            await self.flush_extraction(entity_id)
+            # Evolution compares embeddings, so wait for queued vectors
+            if self._embedding_worker is not None:
+                await self._embedding_worker.flush()
+        except Exception as e:
+            logger.warning(f"Flush extraction failed at session end: {e}")
+
+        # Steps 2-8 share one transaction: a single commit for the whole
+        # consolidation instead of one per row.
         try:
             store = await self._ensure_store()
+        except Exception as e:
+            logger.warning(f"Session consolidation skipped, store unavailable: {e}")
+            self._stream_context.clear()
+            return
+
+        evolution_result = {"merged": 0, "pruned": 0}
+        try:
+            async with store.transaction():
+                evolution_result = await self._consolidate_session(
+                    store, session_id, ended_at, message_count, entity_id, platform
+                )
+        except Exception as e:
+            logger.warning(f"Session consolidation rolled back: {e}")
+
+        # 9. Clear stream context (Phase 2)
+        self._stream_context.clear()
+
+        logger.info(
+            f"Session ended: {session_id} (messages={message_count}, "
+            f"merged={evolution_result['merged']}, "
+            f"pruned={evolution_result['pruned']})"
+        )
+
+    async def _defer_consolidation(
+        self,
+        session_id: str,
+        ended_at: str,
+        message_count: int,
+        entity_id: str | None,
+        platform: str,
+    ) -> None:
+        """Snapshot an ended session and queue its consolidation."""
+        job = {
+            "session_id": session_id,
+            "entity_id": entity_id,
+            "platform": platform,
+            "ended_at": ended_at,
+            "message_count": message_count,
+            "episode_json": json.dumps(self._stream_context.to_episode_dict()),
+        }
+        self._stream_context.clear()
+
+        try:
+            scheduler = await self._ensure_consolidation_scheduler()
+            store = await self._ensure_store()
+        except Exception as e:
+            logger.warning(f"Session consolidation skipped, store unavailable: {e}")
+            return
+        # Persisted first so the job survives a crash before the batch runs
+        try:
+            await store.insert_pending_consolidation(job)
+        except Exception as e:
+            logger.warning(f"Failed to persist pending consolidation: {e}")
+        scheduler.submit(job)
+
+        logger.info(
+            f"Session ended: {session_id} (messages={message_count}, "
+            f"consolidation deferred, {scheduler.pending} pending)"
+        )
+
+    async def _consolidate_pending(self, jobs: list[dict]) -> None:
+        """Consolidate a batch of deferred sessions (ConsolidationScheduler).
+
+        Runs end_session steps 1-8 for every job, with reflection and memory
+        evolution once per entity rather than once per session. Per entity,
+        the session records and the removal of the jobs from
+        pending_consolidations are committed together; reflection, evolution
+        and the consolidation logs follow in their own short transactions.
+        The store holds other writers while a transaction is open, so the
+        batch yields to live turns before each of these steps.
+        """
+        # 1. Extraction and queued embeddings, outside any transaction. The
+        #    buffered turns span the batch's entities, so each keeps its own.
+        try:
+            await self.flush_extraction()
+            if self._embedding_worker is not None:
+                await self._embedding_worker.flush()
+        except Exception as e:
+            logger.warning(f"Flush extraction failed before consolidation: {e}")
+
+        store = await self._ensure_store()
+        by_entity: dict[str | None, list[dict]] = {}
+        for job in jobs:
+            by_entity.setdefault(job.get("entity_id"), []).append(job)
+
+        for entity_id, entity_jobs in by_entity.items():
+            await self._consolidation.wait_until_idle()
+            try:
+                async with store.transaction():
+                    episode_node_ids = [
+                        await self._record_session_end(
+                            store,
+                            job["session_id"],
+                            job["ended_at"],
+                            job.get("message_count") or 0,
+                            entity_id,
+                            job.get("platform") or "direct",
+                            episode=json.loads(job.get("episode_json") or "{}"),
+                        )
+                        for job in entity_jobs
+                    ]
+                    await store.delete_pending_consolidations(
+                        [job["session_id"] for job in entity_jobs]
+                    )
+            except Exception as e:
+                # The rows stay in pending_consolidations for the next start
+                logger.warning(f"Deferred consolidation rolled back: {e}")
+                continue
+
+            await self._consolidation.wait_until_idle()
+            evolution_result = await self._reflect_and_evolve(
+                store, entity_id, self._consolidation.wait_until_idle
+            )
+
+            await self._consolidation.wait_until_idle()
+            try:
+                async with store.transaction():
+                    for job, episode_node_id in zip(entity_jobs, episode_node_ids):
+                        await self._log_consolidation(
+                            store,
+                            job["session_id"],
+                            job["ended_at"],
+                            job.get("message_count") or 0,
+                            episode_node_id,
+                            evolution_result,
+                        )
+            except Exception as e:
+                logger.warning(f"Failed to log deferred consolidation: {e}")
+
+            logger.info(
+                f"Consolidated {len(entity_jobs)} deferred sessions "
+                f"(entity={entity_id}, merged={evolution_result['merged']}, "
+                f"pruned={evolution_result['pruned']})"
+            )
+
+    async def _consolidate_session(
+        self,
+        store: SQLiteStore,
+        session_id: str,
+        ended_at: str,
+        message_count: int,
+        entity_id: str | None,
+        platform: str,
+    ) -> dict:
+        """Write the session consolidation records (end_session steps 2-8).
+
+        Returns:
+            Memory evolution result with ``merged`` and ``pruned`` counts
+        """
+        episode_node_id = await self._record_session_end(
+            store, session_id, ended_at, message_count, entity_id, platform
+        )
+        evolution_result = await self._reflect_and_evolve(store, entity_id)
+        await self._log_consolidation(
+            store,
+            session_id,
+            ended_at,
+            message_count,
+            episode_node_id,
+            evolution_result,
+        )
+        return evolution_result
+
+    async def _record_session_end(
+        self,
+        store: SQLiteStore,
+        session_id: str,
+        ended_at: str,
+        message_count: int,
+        entity_id: str | None,
+        platform: str,
+        episode: dict | None = None,
+    ) -> str | None:
+        """Persist the session end, stream episode and episode node (steps 2-5).
+
+        Args:
+            episode: Stream episode snapshot; taken from the live stream
+                context when not given
+
+        Returns:
+            Episode node ID, or None if none was created
+        """
+        # 2. Persist session end
+        try:
             await store.end_session(
                 session_id=session_id,
                 ended_at=ended_at,
@@ -545,16 +1086,11 @@ class MemoryService:
         except Exception as e:
             logger.warning(f"Failed to persist session end to SQLite: {e}")
 
-        # 2. Flush remaining extraction buffer
-        try:
-            await self.flush_extraction(entity_id)
-        except Exception as e:
-            logger.warning(f"Flush extraction failed at session end: {e}")
-
         # 3. Save stream context as a stream episode (Phase 2)
         try:
-            store = await self._ensure_store()
-            ep_dict = self._stream_context.to_episode_dict()
+            ep_dict = episode
+            if ep_dict is None:
+                ep_dict = self._stream_context.to_episode_dict()
             episode_id = f"streamepisode_{session_id}"
             ep_data = {
                 "id": episode_id,
@@ -568,6 +1104,7 @@ class MemoryService:
                 "ended_at": ep_dict.get("ended_at"),
             }
             await store.insert_stream_episode(ep_data)
+            self._episodic_summary = None
             logger.debug(f"Stream episode saved: {episode_id}")
         except Exception as e:
             logger.warning(f"Failed to save stream episode: {e}")
@@ -576,7 +1113,6 @@ class MemoryService:
         episode_node_id = None
         if message_count > 0:
             try:
-                store = await self._ensure_store()
                 episode_node_id = f"episode_{session_id}"
                 summary = (
                     f"Session {session_id}: {message_count} messages "
@@ -600,34 +1136,53 @@ class MemoryService:
         # 5. Update entity profile
         if entity_id:
             try:
-                store = await self._ensure_store()
                 await store.touch_entity(entity_id, platform)
             except Exception as e:
                 logger.warning(f"Failed to touch entity profile: {e}")
 
+        return episode_node_id
+
+    async def _reflect_and_evolve(
+        self,
+        store: SQLiteStore,
+        entity_id: str | None,
+        between_steps: Callable[[], Awaitable[None]] | None = None,
+    ) -> dict:
+        """Run reflection and memory evolution for an entity (steps 6-7).
+
+        Args:
+            store: Initialized store
+            entity_id: Entity whose memories are reflected on and evolved
+            between_steps: Awaited after reflection, before evolution
+
+        Returns:
+            Memory evolution result with ``merged`` and ``pruned`` counts
+        """
         # 6. Run reflection engine on recent knowledge nodes (Phase 2)
         try:
-            store = await self._ensure_store()
             recent_nodes = await store.get_knowledge_nodes(
                 entity_id=entity_id,
                 limit=50,
             )
             if recent_nodes:
                 insights = self._reflection_engine.reflect_sync(recent_nodes)
-                for insight in insights:
-                    try:
-                        await store.insert_knowledge_node(
-                            {
-                                "node_id": insight["id"],
-                                "entity_id": insight.get("entity_id"),
-                                "node_type": insight.get("memory_type", "meta_summary"),
-                                "content": insight["content"],
-                                "importance": insight.get("importance", 0.5),
-                                "metadata": None,
-                            }
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to persist reflection insight: {e}")
+                async with store.transaction():
+                    for insight in insights:
+                        try:
+                            await store.insert_knowledge_node(
+                                {
+                                    "node_id": insight["id"],
+                                    "entity_id": insight.get("entity_id"),
+                                    "node_type": insight.get(
+                                        "memory_type", "meta_summary"
+                                    ),
+                                    "content": insight["content"],
+                                    "importance": insight.get("importance", 0.5),
+                                    "metadata": None,
+                                }
+                            )
+                        except Exception as e:
+                            logger.warning(f"Failed to persist reflection insight: {e}")
                 if insights:
                     logger.debug(f"Reflection generated {len(insights)} insights")
         except Exception as e:
@@ -636,15 +1191,28 @@ class MemoryService:
         # 7. Run memory evolution if consolidation is enabled
         evolution_result = {"merged": 0, "pruned": 0}
         if self.config.consolidation.enabled:
+            if between_steps is not None:
+                await between_steps()
             try:
                 evolver = await self._ensure_evolver()
                 evolution_result = await evolver.evolve(entity_id=entity_id)
             except Exception as e:
                 logger.warning(f"Memory evolution failed: {e}")
 
+        return evolution_result
+
+    async def _log_consolidation(
+        self,
+        store: SQLiteStore,
+        session_id: str,
+        ended_at: str,
+        message_count: int,
+        episode_node_id: str | None,
+        evolution_result: dict,
+    ) -> None:
+        """Write the consolidation log entry for a session (step 8)."""
         # 8. Write consolidation log
         try:
-            store = await self._ensure_store()
             await store.insert_consolidation_log(
                 {
                     "session_id": session_id,
@@ -661,14 +1229,25 @@ class MemoryService:
         except Exception as e:
             logger.warning(f"Failed to write consolidation log: {e}")
 
-        # 9. Clear stream context (Phase 2)
-        self._stream_context.clear()
+    async def rebuild_vector_index(self, entity_id: str | None = None) -> int:
+        """Rebuild the in-memory vector index from storage.
 
-        logger.info(
-            f"Session ended: {session_id} (messages={message_count}, "
-            f"merged={evolution_result['merged']}, "
-            f"pruned={evolution_result['pruned']})"
-        )
+        Compacts the index and, for the IVF backend, retrains its clusters.
+        Useful after bulk imports or large deletions.
+
+        Args:
+            entity_id: Entity to rebuild, or None for all entities
+
+        Returns:
+            Number of vectors indexed for the entity (all entities when
+            None), or 0 on failure
+        """
+        try:
+            store = await self._ensure_store()
+            return await store.rebuild_vector_index(entity_id)
+        except Exception as e:
+            logger.warning(f"rebuild_vector_index failed: {e}")
+            return 0
 
     def increment_session_message_count(self, session_id: str) -> None:
         """Increment message count for an active session.
@@ -726,7 +1305,7 @@ class MemoryService:
         return memories
 
     async def add_memory(self, memory: SemanticMemory) -> str:
-        """Add a semantic memory to storage with embedding.
+        """Add a semantic memory to storage and queue its embedding.
 
         Args:
             memory: Memory to add
@@ -735,28 +1314,8 @@ class MemoryService:
             Memory ID
         """
         store = await self._ensure_store()
-        await store.insert_knowledge_node(
-            {
-                "node_id": memory.id,
-                "entity_id": memory.entity_id,
-                "node_type": memory.memory_type.value,
-                "content": memory.content,
-                "importance": memory.importance,
-                "metadata": None,
-            }
-        )
-
-        # Generate and store embedding
-        try:
-            if self._embedding_service is None:
-                self._embedding_service = EmbeddingService(
-                    config=self.config.embedding,
-                )
-            embedding = self._embedding_service.encode_single(memory.content)
-            blob = EmbeddingService.serialize_embedding(embedding)
-            await store.update_node_embedding(memory.id, blob)
-        except Exception as e:
-            logger.warning(f"Failed to embed memory {memory.id}: {e}")
+        await self._insert_memories(store, [memory])
+        await self._queue_embeddings([memory])
 
         logger.info(f"Memory added: {memory.id}")
         return memory.id
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .token_counter import cjk_char_count
+
+if TYPE_CHECKING:
+    from .token_counter import TokenCounter
 
 
 def _utcnow() -> datetime:
@@ -36,16 +41,20 @@ class Message(BaseModel):
     platform: str | None = None
     important: bool = False  # Protected from eviction when True
 
+    # Token count of ``_counted_content``, reused until the content changes
+    _token_count: int | None = PrivateAttr(default=None)
+    _counted_content: str | None = PrivateAttr(default=None)
+
+    def token_count(self, counter: TokenCounter) -> int:
+        """Tokens in ``content``, counted once per distinct content."""
+        if self._token_count is None or self._counted_content != self.content:
+            self._token_count = counter.count(self.content)
+            self._counted_content = self.content
+        return self._token_count
+
     def token_estimate(self) -> int:
         """Rough token estimate (4 chars ≈ 1 token for English, 2 chars for CJK)."""
-        cjk_count = sum(
-            1
-            for c in self.content
-            if "\u4e00" <= c <= "\u9fff"
-            or "\uac00" <= c <= "\ud7af"
-            or "\u3040" <= c <= "\u309f"
-            or "\u30a0" <= c <= "\u30ff"
-        )
+        cjk_count = cjk_char_count(self.content)
         non_cjk = len(self.content) - cjk_count
         return (non_cjk // 4) + (cjk_count // 2) + 4  # +4 for role/overhead
 
@@ -4,6 +4,10 @@ Runs synchronously with zero LLM dependency. Provides fast, pattern-matched
 extraction of preferences, facts, activities, and decisions from bilingual
 (Korean/English) chat messages. All extractions carry confidence=0.5 to
 distinguish them from LLM-extracted memories (confidence=0.8).
+
+Each pattern declares trigger literals, at least one of which occurs in
+every text it can match. A single scan for all triggers selects the patterns
+worth running, so most chat messages skip most patterns entirely.
 """
 
 from __future__ import annotations
@@ -23,6 +27,21 @@ class _PatternEntry:
     category: str
     group_index: int = 1
     template: str | None = None
+    triggers: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class _TriggerIndex:
+    """Maps trigger literals found in a text to the patterns they enable."""
+
+    # Lookahead alternation of all triggers, longest first, so one finditer
+    # pass reports the longest trigger starting at every position
+    regex: re.Pattern[str] | None
+    # Lowercased trigger -> indices of patterns it (or a trigger it
+    # contains) belongs to
+    patterns_by_trigger: dict[str, frozenset[int]]
+    # Patterns without triggers, which always run
+    always: frozenset[int]
 
 
 # ---------------------------------------------------------------------------
@@ -30,13 +49,19 @@ class _PatternEntry:
 # ---------------------------------------------------------------------------
 _REGEX_CONFIDENCE: float = 0.5
 
+# Longest content a pattern's leading lazy group may capture. An unbounded
+# leading ``(.+?)`` is retried from every start position when the rest of
+# the pattern fails, which is quadratic in the message length.
+_MAX_LEADING_CAPTURE: int = 100
+
 
 def _build_patterns() -> tuple[_PatternEntry, ...]:
     """Build and compile all extraction patterns.
 
     Patterns are grouped logically by language and semantic category.
     Each pattern's first (or specified) capture group provides the
-    extracted content.
+    extracted content.  ``triggers`` lists literals (matched
+    case-insensitively) at least one of which appears in every match.
     """
     raw: list[dict] = []
 
@@ -46,6 +71,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*좋아해",
+            "triggers": ["좋아해"],
             "memory_type": "preference",
             "importance": 0.6,
             "category": "preference",
@@ -55,6 +81,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:이|가)?\s*좋아",
+            "triggers": ["좋아"],
             "memory_type": "preference",
             "importance": 0.5,
             "category": "preference",
@@ -64,6 +91,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*(?:제일|가장)\s*좋아",
+            "triggers": ["좋아"],
             "memory_type": "preference",
             "importance": 0.7,
             "category": "preference",
@@ -73,6 +101,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:이|가)?\s*최고",
+            "triggers": ["최고"],
             "memory_type": "preference",
             "importance": 0.6,
             "category": "preference",
@@ -86,6 +115,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*싫어해?",
+            "triggers": ["싫어"],
             "memory_type": "preference",
             "importance": 0.6,
             "category": "negative_preference",
@@ -95,6 +125,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:이|가)?\s*싫어",
+            "triggers": ["싫어"],
             "memory_type": "preference",
             "importance": 0.5,
             "category": "negative_preference",
@@ -104,6 +135,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:은|는)\s*별로",
+            "triggers": ["별로"],
             "memory_type": "preference",
             "importance": 0.5,
             "category": "negative_preference",
@@ -113,6 +145,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*(?:안|못)\s*(?:먹어|먹)",
+            "triggers": ["먹"],
             "memory_type": "preference",
             "importance": 0.5,
             "category": "negative_preference",
@@ -126,6 +159,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*하고\s*있어",
+            "triggers": ["하고"],
             "memory_type": "atomic_fact",
             "importance": 0.4,
             "category": "activity",
@@ -135,6 +169,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"지금\s+(.+?)(?:을|를)?\s*(?:하고|하는)\s*(?:있어|중)",
+            "triggers": ["지금"],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "activity",
@@ -144,6 +179,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"요즘\s+(.+?)(?:을|를)?\s*(?:하고|배우고)\s*있어",
+            "triggers": ["요즘"],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "activity",
@@ -153,6 +189,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*(?:매일|자주)\s*(?:해|하고)",
+            "triggers": ["매일", "자주"],
             "memory_type": "preference",
             "importance": 0.5,
             "category": "activity",
@@ -166,6 +203,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:으로|로)?\s*(?:결정했어|정했어)",
+            "triggers": ["정했어"],
             "memory_type": "atomic_fact",
             "importance": 0.6,
             "category": "decision",
@@ -175,6 +213,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*(?:하기로|배우기로)\s*(?:했어|결심)",
+            "triggers": ["기로"],
             "memory_type": "atomic_fact",
             "importance": 0.6,
             "category": "decision",
@@ -184,6 +223,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*시작했어",
+            "triggers": ["시작했어"],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "decision",
@@ -193,6 +233,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*그만(?:뒀어|둘래)",
+            "triggers": ["그만"],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "decision",
@@ -206,6 +247,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"저는\s+(.+?)(?:이에요|입니다|예요)",
+            "triggers": ["저는"],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "fact",
@@ -215,6 +257,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"나는?\s+(.+?)(?:이야|야)",
+            "triggers": ["야"],
             "memory_type": "atomic_fact",
             "importance": 0.4,
             "category": "fact",
@@ -224,6 +267,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(?:제|나)\s*(?:이름은?|이름이)\s+(.+?)(?:이에요|예요|이야|야|입니다)",
+            "triggers": ["이름"],
             "memory_type": "atomic_fact",
             "importance": 0.7,
             "category": "fact",
@@ -233,6 +277,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)에\s*살(?:아요|고\s*있어|아)",
+            "triggers": ["살"],
             "memory_type": "atomic_fact",
             "importance": 0.6,
             "category": "fact",
@@ -246,6 +291,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:을|를)?\s*(?:사용|쓰고)\s*(?:하고|있어)",
+            "triggers": ["사용", "쓰고"],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "technical",
@@ -255,6 +301,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?)(?:으로|로)\s*(?:개발|코딩)\s*(?:하고|해)",
+            "triggers": ["개발", "코딩"],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "technical",
@@ -268,6 +315,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I (?:really )?like (.+?)(?:\.|!|$)",
+            "triggers": ["like "],
             "memory_type": "preference",
             "importance": 0.6,
             "category": "preference",
@@ -277,6 +325,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I love (.+?)(?:\.|!|$)",
+            "triggers": ["love "],
             "memory_type": "preference",
             "importance": 0.7,
             "category": "preference",
@@ -286,6 +335,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I enjoy (.+?)(?:\.|!|$)",
+            "triggers": ["enjoy "],
             "memory_type": "preference",
             "importance": 0.6,
             "category": "preference",
@@ -295,6 +345,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"(.+?) is my favorite",
+            "triggers": [" is my favorite"],
             "memory_type": "preference",
             "importance": 0.7,
             "category": "preference",
@@ -304,6 +355,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I prefer (.+?) (?:over|to) (.+)",
+            "triggers": ["prefer "],
             "memory_type": "preference",
             "importance": 0.7,
             "category": "preference",
@@ -318,6 +370,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I (?:really )?(?:don't like|dislike|hate) (.+?)(?:\.|!|$)",
+            "triggers": ["don't like ", "dislike ", "hate "],
             "memory_type": "preference",
             "importance": 0.6,
             "category": "negative_preference",
@@ -327,6 +380,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I(?:'m| am) not (?:a )?fan of (.+?)(?:\.|!|$)",
+            "triggers": ["fan of "],
             "memory_type": "preference",
             "importance": 0.5,
             "category": "negative_preference",
@@ -336,6 +390,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I can't stand (.+?)(?:\.|!|$)",
+            "triggers": ["can't stand "],
             "memory_type": "preference",
             "importance": 0.6,
             "category": "negative_preference",
@@ -349,6 +404,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I(?:'m| am) (?:currently )?(?:playing|doing|working on) (.+?)(?:\.|!|$)",
+            "triggers": ["playing ", "doing ", "working on "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "activity",
@@ -358,6 +414,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I(?:'ve| have) been (?:playing|doing|working on|learning) (.+?)(?:\.|!|$)",
+            "triggers": ["been "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "activity",
@@ -367,6 +424,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I(?:'m| am) (?:currently )?(?:studying|learning) (.+?)(?:\.|!|$)",
+            "triggers": ["studying ", "learning "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "activity",
@@ -380,6 +438,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I (?:decided|chose) to (.+?)(?:\.|!|$)",
+            "triggers": ["decided to ", "chose to "],
             "memory_type": "atomic_fact",
             "importance": 0.6,
             "category": "decision",
@@ -389,6 +448,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I(?:'m| am) going to (?:start|learn|use) (.+?)(?:\.|!|$)",
+            "triggers": ["going to "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "decision",
@@ -398,6 +458,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I just (?:started|began) (.+?)(?:\.|!|$)",
+            "triggers": ["just "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "decision",
@@ -407,6 +468,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I(?:'m| am) (?:going to |gonna )?(?:quit|stop|drop) (.+?)(?:\.|!|$)",
+            "triggers": ["quit ", "stop ", "drop "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "decision",
@@ -420,6 +482,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I(?:'m| am) (?:a |an )?(.+?)(?:\.|!|$)",
+            "triggers": ["'m ", " am "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "fact",
@@ -429,6 +492,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I work (?:at|for|as) (.+?)(?:\.|!|$)",
+            "triggers": ["work "],
             "memory_type": "atomic_fact",
             "importance": 0.6,
             "category": "fact",
@@ -438,6 +502,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I live in (.+?)(?:\.|!|$)",
+            "triggers": ["live in "],
             "memory_type": "atomic_fact",
             "importance": 0.6,
             "category": "fact",
@@ -447,6 +512,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"My name is (.+?)(?:\.|!|$)",
+            "triggers": ["name is "],
             "memory_type": "atomic_fact",
             "importance": 0.7,
             "category": "fact",
@@ -456,6 +522,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I(?:'m| am) (\d+) years old",
+            "triggers": [" years old"],
             "memory_type": "atomic_fact",
             "importance": 0.6,
             "category": "fact",
@@ -465,6 +532,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I(?:'ve| have) (?:a |an )?(.+?) (?:named|called) (.+?)(?:\.|!|$)",
+            "triggers": ["named ", "called "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "fact",
@@ -479,6 +547,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I (?:use|switched to|moved to) (.+?)(?:\.|!|$)",
+            "triggers": ["use ", "switched to ", "moved to "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "technical",
@@ -488,6 +557,7 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     raw.append(
         {
             "pattern": r"I (?:code|program|develop) (?:in|with) (.+?)(?:\.|!|$)",
+            "triggers": ["code ", "program ", "develop "],
             "memory_type": "atomic_fact",
             "importance": 0.5,
             "category": "technical",
@@ -500,20 +570,51 @@ def _build_patterns() -> tuple[_PatternEntry, ...]:
     # ===================================================================
     entries: list[_PatternEntry] = []
     for r in raw:
+        pattern = r["pattern"]
+        if pattern.startswith("(.+?)"):
+            pattern = f"(.{{1,{_MAX_LEADING_CAPTURE}}}?)" + pattern[len("(.+?)") :]
         entries.append(
             _PatternEntry(
-                pattern=re.compile(r["pattern"], re.IGNORECASE),
+                pattern=re.compile(pattern, re.IGNORECASE),
                 memory_type=r["memory_type"],
                 importance=r["importance"],
                 category=r["category"],
                 group_index=r.get("group_index", 1),
                 template=r.get("template"),
+                triggers=tuple(r.get("triggers", ())),
             )
         )
 
     return tuple(entries)
 
 
+def _build_trigger_index(patterns: Sequence[_PatternEntry]) -> _TriggerIndex:
+    """Build the trigger index for *patterns*."""
+    owners: dict[str, set[int]] = {}
+    always: set[int] = set()
+    for i, entry in enumerate(patterns):
+        if not entry.triggers:
+            always.add(i)
+        for trigger in entry.triggers:
+            owners.setdefault(trigger.lower(), set()).add(i)
+
+    # The scan reports only the longest trigger at each position, so a
+    # trigger also enables the patterns of every trigger inside it
+    patterns_by_trigger = {
+        trigger: frozenset(
+            i for other, indices in owners.items() if other in trigger for i in indices
+        )
+        for trigger in owners
+    }
+    regex = None
+    if owners:
+        alternation = "|".join(
+            re.escape(t) for t in sorted(owners, key=len, reverse=True)
+        )
+        regex = re.compile(f"(?=({alternation}))", re.IGNORECASE)
+    return _TriggerIndex(regex, patterns_by_trigger, frozenset(always))
+
+
 # Compile once at module load
 _PATTERNS: tuple[_PatternEntry, ...] = _build_patterns()
 
@@ -522,15 +623,20 @@ _PATTERNS: tuple[_PatternEntry, ...] = _build_patterns()
 class RegexExtractor:
     """Synchronous regex-based memory extractor for the hot path.
 
-    Runs all compiled patterns against input text and returns deduplicated,
-    importance-sorted extraction results. Every result carries
-    ``confidence=0.5`` to distinguish regex extractions from LLM-based ones.
+    Runs the compiled patterns whose triggers occur in the input text and
+    returns deduplicated, importance-sorted extraction results. Every result
+    carries ``confidence=0.5`` to distinguish regex extractions from
+    LLM-based ones.
     """
 
     _patterns: Sequence[_PatternEntry] = field(
         default_factory=lambda: _PATTERNS,
         repr=False,
     )
+    _trigger_index: _TriggerIndex = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._trigger_index = _build_trigger_index(self._patterns)
 
     # ------------------------------------------------------------------
     # Public API
@@ -554,7 +660,8 @@ class RegexExtractor:
         results: list[dict] = []
         seen_contents: set[str] = set()
 
-        for entry in self._patterns:
+        for index in self._candidate_patterns(text):
+            entry = self._patterns[index]
             for match in entry.pattern.finditer(text):
                 content = self._extract_content(match, entry)
                 if not content:
@@ -588,6 +695,21 @@ class RegexExtractor:
     # Internals
     # ------------------------------------------------------------------
 
+    def _candidate_patterns(self, text: str) -> list[int]:
+        """Indices, in pattern order, of the patterns whose triggers occur in *text*."""
+        index = self._trigger_index
+        if index.regex is None:
+            return sorted(index.always)
+
+        selected = set(index.always)
+        for match in index.regex.finditer(text):
+            indices = index.patterns_by_trigger.get(match.group(1).lower())
+            if indices is None:
+                # Case folding that str.lower() disagrees with; be safe
+                return list(range(len(self._patterns)))
+            selected |= indices
+        return sorted(selected)
+
     @staticmethod
     def _extract_content(match: re.Match, entry: _PatternEntry) -> str:
         """Pull the meaningful content string from a regex *match*.
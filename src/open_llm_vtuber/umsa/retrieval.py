@@ -1,18 +1,27 @@
 """Hybrid retrieval with Stanford 3-factor scoring.
 
 Combines three retrieval sources:
-- Vector search: cosine similarity on embeddings stored in SQLite
+- Vector search: cosine similarity over an in-memory index of the SQLite embeddings
 - FTS5 search: SQLite full-text search on knowledge_nodes.content
 - Graph traversal: follow knowledge_edges from recently accessed nodes
 
+The three sources run concurrently, each bounded by its own deadline
+(``RetrievalConfig.source_deadlines_ms``, falling back to ``max_latency_ms``),
+so a slow source degrades to partial results instead of delaying the reply.
+The vector index backend is chosen by ``RetrievalConfig.vector_index``
+(see ``build_vector_index``).
+
 Results are scored using Stanford's 3-factor model:
   score = (recency_weight * recency) + (relevance_weight * relevance) + (importance_weight * importance)
 """
 
 from __future__ import annotations
 
+import asyncio
 import math
+import time
 from datetime import datetime, timezone
+from typing import Awaitable
 
 from loguru import logger
 
@@ -20,6 +29,32 @@ from .config import RetrievalConfig
 from .embedding import EmbeddingService
 from .models import RetrievalResult
 from .storage.sqlite_store import SQLiteStore
+from .storage.vector_index import IVFVectorIndex, VectorIndex
+
+
+def build_vector_index(config: RetrievalConfig | None = None) -> VectorIndex:
+    """Create the vector index backend selected in the retrieval config.
+
+    Args:
+        config: Retrieval configuration
+
+    Returns:
+        ``VectorIndex`` for exact search or ``IVFVectorIndex`` for
+        approximate search
+    """
+    config = config or RetrievalConfig()
+    backend = config.vector_index.lower()
+    if backend == "ivf":
+        return IVFVectorIndex(
+            nlist=config.ivf_nlist,
+            nprobe=config.ivf_nprobe,
+            min_train_size=config.ivf_min_train_size,
+        )
+    if backend != "exact":
+        logger.warning(
+            f"Unknown vector_index backend {config.vector_index!r}, using exact search"
+        )
+    return VectorIndex()
 
 
 class HybridRetriever:
@@ -72,10 +107,23 @@ class HybridRetriever:
         """
         top_k = top_k or self._config.top_k
 
-        # Run all three sources
-        vector_results = await self._vector_search(query, entity_id)
-        fts_results = await self._fts_search(query, entity_id)
-        graph_results = await self._graph_search(query, entity_id)
+        # Fan out all three sources, each bounded by its own deadline
+        timings: dict[str, float] = {}
+        timed_out: list[str] = []
+        vector_results, fts_results, graph_results = await asyncio.gather(
+            self._run_source(
+                "vector",
+                self._vector_search(query, entity_id, top_k),
+                timings,
+                timed_out,
+            ),
+            self._run_source(
+                "fts", self._fts_search(query, entity_id), timings, timed_out
+            ),
+            self._run_source(
+                "graph", self._graph_search(query, entity_id), timings, timed_out
+            ),
+        )
 
         # Merge and deduplicate
         merged = self._merge_results(
@@ -87,29 +135,74 @@ class HybridRetriever:
         # Sort by final score descending and limit
         merged.sort(key=lambda r: r.score, reverse=True)
         results = merged[:top_k]
-
-        # Touch accessed nodes to update recency
         for result in results:
-            try:
-                await self._store.touch_node(result.id)
-            except Exception:
-                pass
+            result.metadata["source_timings_ms"] = timings
+            if timed_out:
+                result.metadata["timed_out_sources"] = timed_out
+
+        # Touch accessed nodes to update recency (buffered, one batched commit)
+        try:
+            await self._store.touch_nodes([result.id for result in results])
+        except Exception as e:
+            logger.debug(f"Failed to touch retrieved nodes: {e}")
 
+        timing_text = ", ".join(f"{k}={v:.1f}ms" for k, v in timings.items())
         logger.info(
             f"Retrieved {len(results)} memories "
             f"(vector={len(vector_results)}, fts={len(fts_results)}, "
-            f"graph={len(graph_results)})"
+            f"graph={len(graph_results)}; {timing_text})"
         )
         return results
 
+    async def _run_source(
+        self,
+        name: str,
+        search: Awaitable[list[RetrievalResult]],
+        timings: dict[str, float],
+        timed_out: list[str],
+    ) -> list[RetrievalResult]:
+        """Await one retrieval source within its deadline.
+
+        Args:
+            name: Source name ("vector", "fts" or "graph")
+            search: Pending source search
+            timings: Collects elapsed milliseconds per source
+            timed_out: Collects names of sources that missed their deadline
+
+        Returns:
+            The source's results, or [] if it missed its deadline
+        """
+        deadline_ms = self._config.source_deadlines_ms.get(
+            name, self._config.max_latency_ms
+        )
+        start = time.perf_counter()
+        try:
+            return await asyncio.wait_for(search, timeout=deadline_ms / 1000.0)
+        except asyncio.TimeoutError:
+            timed_out.append(name)
+            logger.warning(
+                f"Retrieval source '{name}' exceeded {deadline_ms}ms deadline, "
+                "continuing with partial results"
+            )
+            return []
+        finally:
+            timings[name] = (time.perf_counter() - start) * 1000.0
+
     async def _vector_search(
         self,
         query: str,
         entity_id: str | None,
+        top_k: int,
     ) -> list[RetrievalResult]:
-        """Search by embedding cosine similarity."""
+        """Search by embedding cosine similarity.
+
+        Only the nearest ``vector_candidates`` nodes from the store's
+        in-memory vector index are scored, rather than every stored node.
+        """
         try:
-            query_embedding = self._embedding.encode_single(query)
+            query_embedding = await asyncio.to_thread(
+                self._embedding.encode_single, query
+            )
         except Exception as e:
             logger.warning(f"Embedding encode failed: {e}")
             return []
@@ -117,24 +210,20 @@ class HybridRetriever:
         if not query_embedding:
             return []
 
+        limit = max(self._config.vector_candidates, top_k)
         try:
-            nodes = await self._store.get_all_embeddings(entity_id)
+            nodes = await self._store.search_embeddings(
+                query_embedding,
+                entity_id,
+                limit=limit,
+            )
         except Exception as e:
-            logger.warning(f"Failed to load embeddings: {e}")
+            logger.warning(f"Vector index search failed: {e}")
             return []
 
         results: list[RetrievalResult] = []
         for node in nodes:
-            blob = node.get("embedding")
-            if not blob:
-                continue
-
-            node_embedding = EmbeddingService.deserialize_embedding(blob)
-            relevance = EmbeddingService.cosine_similarity(
-                query_embedding,
-                node_embedding,
-            )
-
+            relevance = node["similarity"]
             recency = self._compute_recency(node.get("last_accessed_at"))
             importance = node.get("importance", 0.5)
 
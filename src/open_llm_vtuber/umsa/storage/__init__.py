@@ -6,10 +6,12 @@ Unified Memory System Architecture.
 
 from __future__ import annotations
 
+from .vector_index import IVFVectorIndex, VectorIndex
+
 try:
     from .sqlite_store import SQLiteStore
 
-    __all__ = ["SQLiteStore"]
+    __all__ = ["SQLiteStore", "VectorIndex", "IVFVectorIndex"]
 except ImportError:
     # aiosqlite not installed
-    __all__ = []
+    __all__ = ["VectorIndex", "IVFVectorIndex"]
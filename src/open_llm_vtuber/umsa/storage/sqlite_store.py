@@ -9,11 +9,18 @@ Phase 2+: Full knowledge graph, session tracking, and consolidation support.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
 
 from loguru import logger
 
+from .vector_index import VectorIndex
+
 try:
     import aiosqlite
 except ImportError:
@@ -23,6 +30,25 @@ except ImportError:
     )
     aiosqlite = None
 
+T = TypeVar("T")
+
+
+def _writes(
+    method: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Run a store write method in its own ``transaction()``.
+
+    Inside an open transaction of the calling task the method joins it;
+    otherwise it waits for other tasks' transactions and commits on return.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "SQLiteStore", *args, **kwargs) -> T:
+        async with self.transaction():
+            return await method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class SQLiteStore:
     """SQLite storage backend for UMSA.
@@ -31,13 +57,48 @@ class SQLiteStore:
     sessions, sentiment history, and consolidation logs.
 
     Uses WAL mode for concurrent reads and proper async handling.
+    Node embeddings are mirrored in an in-memory ``VectorIndex`` that is
+    kept in sync by the node write methods.
+
+    Writes can be grouped into a single commit with ``transaction()``; a
+    write from another task waits until the open transaction ends.
+    Access-recency updates from retrieval are buffered by ``touch_nodes()``
+    and flushed in one ``executemany`` at most ``flush_interval`` seconds later.
+
+    All writes go through one writer connection, whose aiosqlite worker
+    thread executes them in submission order. Read-only queries borrow a
+    connection from a pool of ``read_pool_size`` query-only connections so
+    retrieval is not queued behind consolidation writes; WAL mode lets them
+    read the last committed state while a write is in progress.
     """
 
-    def __init__(self, db_path: str = "./memory/umsa.db"):
+    # Pending touches that force an immediate flush
+    MAX_PENDING_TOUCHES = 1000
+
+    # Connection PRAGMAs; values can be overridden via ``pragmas``
+    DEFAULT_PRAGMAS: dict[str, str | int] = {
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # negative: KiB
+        "temp_store": "MEMORY",
+    }
+
+    def __init__(
+        self,
+        db_path: str = "./memory/umsa.db",
+        vector_index: VectorIndex | None = None,
+        flush_interval: float = 1.0,
+        read_pool_size: int = 4,
+        pragmas: dict[str, str | int] | None = None,
+    ):
         """Initialize SQLite store.
 
         Args:
             db_path: Path to SQLite database file
+            vector_index: Embedding index to maintain (defaults to exact search)
+            flush_interval: Max seconds buffered node touches wait before commit
+            read_pool_size: Read-only connections; 0 serves reads from the writer
+            pragmas: PRAGMA overrides applied to every connection
         """
         if aiosqlite is None:
             raise ImportError(
@@ -47,8 +108,30 @@ class SQLiteStore:
 
         self.db_path = db_path
         self._db: aiosqlite.Connection | None = None
+        self._vector_index = vector_index or VectorIndex()
+        self._index_loads: dict[str | None, asyncio.Task] = {}
+        # Held by the task inside transaction(); other writers wait on it
+        self._write_lock = asyncio.Lock()
+        self._flush_interval = flush_interval
+        self._pending_touches: dict[str, int] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._read_pool_size = 0 if db_path == ":memory:" else max(read_pool_size, 0)
+        self._readers: list[aiosqlite.Connection] = []
+        self._read_pool: asyncio.Queue[aiosqlite.Connection] | None = None
+        self._pragmas = {**self.DEFAULT_PRAGMAS, **(pragmas or {})}
+        # Task inside transaction(), so its reads use the writer connection
+        # and see its own uncommitted writes. Tasks created inside the block
+        # inherit the value but are not the owner.
+        self._in_transaction: ContextVar[asyncio.Task | None] = ContextVar(
+            f"sqlite_store_txn_{id(self)}", default=None
+        )
         logger.info(f"SQLiteStore initialized with db_path: {db_path}")
 
+    @property
+    def vector_index(self) -> VectorIndex:
+        """In-memory embedding index mirrored from knowledge_nodes."""
+        return self._vector_index
+
     async def initialize(self) -> None:
         """Create database tables and indexes if they don't exist.
 
@@ -66,6 +149,7 @@ class SQLiteStore:
         # Enable WAL mode for concurrent reads
         await self._db.execute("PRAGMA journal_mode=WAL")
         await self._db.execute("PRAGMA foreign_keys=ON")
+        await self._apply_pragmas(self._db)
 
         # Create tables
         await self._create_tables()
@@ -73,7 +157,49 @@ class SQLiteStore:
         await self._create_indexes()
 
         await self._db.commit()
-        logger.info("SQLite database initialized successfully")
+
+        # Readers are opened after the schema exists
+        if self._read_pool_size:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            self._read_pool = asyncio.Queue()
+            for _ in range(self._read_pool_size):
+                reader = await aiosqlite.connect(uri, uri=True)
+                await reader.execute("PRAGMA query_only=ON")
+                await self._apply_pragmas(reader)
+                self._readers.append(reader)
+                self._read_pool.put_nowait(reader)
+
+        logger.info(
+            f"SQLite database initialized successfully "
+            f"({self._read_pool_size} read connections)"
+        )
+
+    async def _apply_pragmas(self, db: aiosqlite.Connection) -> None:
+        """Apply the configured performance PRAGMAs to a connection."""
+        for name, value in self._pragmas.items():
+            if not name.isidentifier() or not str(value).lstrip("-").isalnum():
+                raise ValueError(f"Invalid PRAGMA {name}={value!r}")
+            await db.execute(f"PRAGMA {name}={value}")
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection from the pool.
+
+        Falls back to the writer connection when the pool is disabled or the
+        calling task is inside ``transaction()``.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        if self._read_pool is None or self._owns_transaction():
+            yield self._db
+            return
+
+        reader = await self._read_pool.get()
+        try:
+            yield reader
+        finally:
+            self._read_pool.put_nowait(reader)
 
     async def _create_tables(self) -> None:
         """Create all UMSA tables."""
@@ -178,6 +304,43 @@ class SQLiteStore:
             )
         """)
 
+        # Pending Consolidations table: sessions ended with defer=True whose
+        # consolidation has not run yet; rows survive a crash and are retried
+        await self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pending_consolidations (
+                session_id TEXT PRIMARY KEY,
+                entity_id TEXT,
+                platform TEXT,
+                ended_at TEXT NOT NULL,
+                message_count INTEGER DEFAULT 0,
+                episode_json TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Pending Extractions table: turns queued for background LLM
+        # extraction; rows survive a crash and are retried
+        await self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pending_extractions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                entity_id TEXT,
+                user_content TEXT NOT NULL,
+                assistant_content TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Pending Embeddings table: nodes stored without a vector whose
+        # embedding has not run yet; rows survive a crash and are retried
+        await self._db.execute("""
+            CREATE TABLE IF NOT EXISTS pending_embeddings (
+                node_id TEXT PRIMARY KEY,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (node_id) REFERENCES knowledge_nodes(node_id)
+                    ON DELETE CASCADE
+            )
+        """)
+
         # Example Metadata table (for few-shot learning)
         await self._db.execute("""
             CREATE TABLE IF NOT EXISTS example_metadata (
@@ -334,11 +497,64 @@ class SQLiteStore:
 
         logger.debug("All indexes created successfully")
 
+    def _owns_transaction(self) -> bool:
+        """Whether the current task is inside ``transaction()``."""
+        owner = self._in_transaction.get()
+        return owner is not None and owner is asyncio.current_task()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator["SQLiteStore"]:
+        """Group all writes in the block into a single commit.
+
+        Store methods called inside the block skip their own commit; the
+        outermost block commits once on exit or rolls back on error. Blocks
+        may be nested within a task. Other tasks' writes and transactions
+        wait until the block ends, so they are neither rolled back with it
+        nor hidden from the read pool.
+
+        Example:
+            async with store.transaction():
+                await store.insert_knowledge_node(node)
+                await store.touch_entity(entity_id, platform)
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        if self._owns_transaction():
+            # Nested block: the outermost one commits or rolls back
+            yield self
+            return
+
+        async with self._write_lock:
+            token = self._in_transaction.set(asyncio.current_task())
+            try:
+                yield self
+            except BaseException:
+                await self._db.rollback()
+                # The index may hold rows that were just rolled back
+                self._vector_index.reset()
+                raise
+            else:
+                await self._db.commit()
+            finally:
+                self._in_transaction.reset(token)
+
     async def close(self) -> None:
-        """Close database connection."""
+        """Flush buffered writes and close database connection."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
         if self._db:
+            try:
+                await self.flush_pending_writes()
+            except Exception as e:
+                logger.warning(f"Failed to flush pending writes on close: {e}")
             await self._db.close()
-            logger.info("SQLite database connection closed")
+            self._db = None
+        for reader in self._readers:
+            await reader.close()
+        self._readers.clear()
+        self._read_pool = None
+        logger.info("SQLite database connection closed")
 
     async def get_entity(self, name: str, platform: str) -> dict | None:
         """Get entity profile by name and platform.
@@ -353,36 +569,38 @@ class SQLiteStore:
         if not self._db:
             raise RuntimeError("Database not initialized. Call initialize() first.")
 
-        async with self._db.execute(
-            """
-            SELECT entity_id, name, platform, first_seen_at, last_seen_at,
-                   total_interactions, preferred_topics, communication_style,
-                   sentiment_baseline, metadata, created_at, updated_at
-            FROM entity_profiles
-            WHERE name = ? AND platform = ?
-            """,
-            (name, platform),
-        ) as cursor:
-            row = await cursor.fetchone()
-
-            if row is None:
-                return None
-
-            return {
-                "entity_id": row[0],
-                "name": row[1],
-                "platform": row[2],
-                "first_seen_at": row[3],
-                "last_seen_at": row[4],
-                "total_interactions": row[5],
-                "preferred_topics": row[6],
-                "communication_style": row[7],
-                "sentiment_baseline": row[8],
-                "metadata": row[9],
-                "created_at": row[10],
-                "updated_at": row[11],
-            }
+        async with self._reader() as db:
+            async with db.execute(
+                """
+                SELECT entity_id, name, platform, first_seen_at, last_seen_at,
+                       total_interactions, preferred_topics, communication_style,
+                       sentiment_baseline, metadata, created_at, updated_at
+                FROM entity_profiles
+                WHERE name = ? AND platform = ?
+                """,
+                (name, platform),
+            ) as cursor:
+                row = await cursor.fetchone()
+
+                if row is None:
+                    return None
+
+                return {
+                    "entity_id": row[0],
+                    "name": row[1],
+                    "platform": row[2],
+                    "first_seen_at": row[3],
+                    "last_seen_at": row[4],
+                    "total_interactions": row[5],
+                    "preferred_topics": row[6],
+                    "communication_style": row[7],
+                    "sentiment_baseline": row[8],
+                    "metadata": row[9],
+                    "created_at": row[10],
+                    "updated_at": row[11],
+                }
 
+    @_writes
     async def upsert_entity(self, entity: dict) -> str:
         """Insert or update entity profile.
 
@@ -426,11 +644,11 @@ class SQLiteStore:
             ),
         )
 
-        await self._db.commit()
         logger.debug(f"Entity upserted: {entity['entity_id']}")
 
         return entity["entity_id"]
 
+    @_writes
     async def insert_session(self, session: dict) -> str:
         """Insert a new session record.
 
@@ -461,10 +679,10 @@ class SQLiteStore:
             ),
         )
 
-        await self._db.commit()
         logger.debug(f"Session inserted: {session['session_id']}")
         return session["session_id"]
 
+    @_writes
     async def end_session(
         self,
         session_id: str,
@@ -494,9 +712,9 @@ class SQLiteStore:
             (ended_at, message_count, sentiment_avg, topics, session_id),
         )
 
-        await self._db.commit()
         logger.debug(f"Session ended: {session_id}")
 
+    @_writes
     async def insert_knowledge_node(self, node: dict) -> str:
         """Insert a knowledge node (semantic memory).
 
@@ -528,10 +746,58 @@ class SQLiteStore:
             ),
         )
 
-        await self._db.commit()
+        if node.get("embedding"):
+            self._vector_index.add(
+                node["node_id"], node.get("entity_id"), node["embedding"]
+            )
         logger.debug(f"Knowledge node inserted: {node['node_id']}")
         return node["node_id"]
 
+    @_writes
+    async def insert_knowledge_nodes(self, nodes: list[dict]) -> list[str]:
+        """Insert several knowledge nodes with one executemany and commit.
+
+        Args:
+            nodes: Node dictionaries as accepted by ``insert_knowledge_node``
+
+        Returns:
+            Node IDs in input order
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        if not nodes:
+            return []
+
+        await self._db.executemany(
+            """
+            INSERT INTO knowledge_nodes (
+                node_id, entity_id, node_type, content,
+                importance, embedding, metadata
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    node["node_id"],
+                    node.get("entity_id"),
+                    node["node_type"],
+                    node["content"],
+                    node.get("importance", 0.5),
+                    node.get("embedding"),
+                    node.get("metadata"),
+                )
+                for node in nodes
+            ],
+        )
+
+        for node in nodes:
+            if node.get("embedding"):
+                self._vector_index.add(
+                    node["node_id"], node.get("entity_id"), node["embedding"]
+                )
+        logger.debug(f"Inserted {len(nodes)} knowledge nodes")
+        return [node["node_id"] for node in nodes]
+
     async def get_knowledge_nodes(
         self, entity_id: str | None = None, limit: int = 50
     ) -> list[dict]:
@@ -569,7 +835,7 @@ class SQLiteStore:
             """
             params = (limit,)
 
-        async with self._db.execute(query, params) as cursor:
+        async with self._reader() as db, db.execute(query, params) as cursor:
             rows = await cursor.fetchall()
             return [
                 {
@@ -590,6 +856,7 @@ class SQLiteStore:
                 for row in rows
             ]
 
+    @_writes
     async def update_node_embedding(
         self,
         node_id: str,
@@ -608,7 +875,69 @@ class SQLiteStore:
             "UPDATE knowledge_nodes SET embedding = ? WHERE node_id = ?",
             (embedding, node_id),
         )
-        await self._db.commit()
+
+        if not self._vector_index.has_loaded():
+            return
+        known, entity_id = self._vector_index.entity_of(node_id)
+        if not known:
+            async with self._db.execute(
+                "SELECT entity_id FROM knowledge_nodes WHERE node_id = ?",
+                (node_id,),
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                return
+            entity_id = row[0]
+        self._vector_index.add(node_id, entity_id, embedding)
+
+    @_writes
+    async def update_node_embeddings(
+        self,
+        embeddings: list[tuple[str, bytes]],
+    ) -> None:
+        """Update the embedding BLOBs of several nodes in one commit.
+
+        The nodes are also removed from pending_embeddings.
+
+        Args:
+            embeddings: (node_id, serialized embedding) pairs
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        if not embeddings:
+            return
+
+        await self._db.executemany(
+            "UPDATE knowledge_nodes SET embedding = ? WHERE node_id = ?",
+            [(blob, node_id) for node_id, blob in embeddings],
+        )
+        await self._db.executemany(
+            "DELETE FROM pending_embeddings WHERE node_id = ?",
+            [(node_id,) for node_id, _ in embeddings],
+        )
+
+        if not self._vector_index.has_loaded():
+            return
+        entities: dict[str, str | None] = {}
+        unknown: list[str] = []
+        for node_id, _ in embeddings:
+            known, entity_id = self._vector_index.entity_of(node_id)
+            if known:
+                entities[node_id] = entity_id
+            else:
+                unknown.append(node_id)
+        for start in range(0, len(unknown), 500):
+            chunk = unknown[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            async with self._db.execute(
+                f"SELECT node_id, entity_id FROM knowledge_nodes "
+                f"WHERE node_id IN ({placeholders})",
+                chunk,
+            ) as cursor:
+                entities.update(await cursor.fetchall())
+        for node_id, blob in embeddings:
+            if node_id in entities:
+                self._vector_index.add(node_id, entities[node_id], blob)
 
     async def get_all_embeddings(
         self,
@@ -643,7 +972,7 @@ class SQLiteStore:
             """
             params = ()
 
-        async with self._db.execute(query, params) as cursor:
+        async with self._reader() as db, db.execute(query, params) as cursor:
             rows = await cursor.fetchall()
             return [
                 {
@@ -658,6 +987,164 @@ class SQLiteStore:
                 for row in rows
             ]
 
+    async def search_embeddings(
+        self,
+        query_embedding: list[float],
+        entity_id: str | None = None,
+        limit: int = 50,
+    ) -> list[dict]:
+        """Nearest-neighbour search over node embeddings via the vector index.
+
+        Loads the entity's embeddings into the index on first use; later
+        queries never touch the BLOB column.
+
+        Args:
+            query_embedding: Normalized query vector
+            entity_id: Optional entity filter
+            limit: Maximum results
+
+        Returns:
+            List of dicts with node_id, content, importance, created_at,
+            last_accessed_at, access_count and similarity, best match first
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        if not self._vector_index.is_loaded(entity_id):
+            # The load is a shared task so a caller cancelled by its
+            # retrieval deadline does not abort it for everyone else.
+            task = self._index_loads.get(entity_id)
+            if task is None:
+                task = asyncio.ensure_future(self._load_vector_index(entity_id))
+                self._index_loads[entity_id] = task
+                task.add_done_callback(
+                    lambda t, key=entity_id: self._on_index_load_done(key, t)
+                )
+            await asyncio.shield(task)
+
+        hits = await asyncio.to_thread(
+            self._vector_index.search, query_embedding, entity_id, limit
+        )
+        if not hits:
+            return []
+
+        by_id = {
+            node["node_id"]: node
+            for node in await self.get_knowledge_nodes_by_ids(
+                [node_id for node_id, _ in hits]
+            )
+        }
+        results = []
+        for node_id, similarity in hits:
+            node = by_id.get(node_id)
+            if node is None:
+                continue
+            node["similarity"] = similarity
+            results.append(node)
+        return results
+
+    async def _load_vector_index(self, entity_id: str | None) -> None:
+        """Populate the vector index from stored embedding BLOBs."""
+        if entity_id:
+            query = """
+                SELECT node_id, entity_id, embedding
+                FROM knowledge_nodes
+                WHERE embedding IS NOT NULL AND entity_id = ?
+            """
+            params = (entity_id,)
+        else:
+            query = """
+                SELECT node_id, entity_id, embedding
+                FROM knowledge_nodes
+                WHERE embedding IS NOT NULL
+            """
+            params = ()
+
+        # Writes hold the write lock until they commit, so once it is free
+        # every vector added so far is visible to the SELECT; the index
+        # buffers the ones added from here on and replays them in load().
+        if self._owns_transaction():
+            buffer = self._vector_index.begin_load(entity_id)
+        else:
+            async with self._write_lock:
+                buffer = self._vector_index.begin_load(entity_id)
+        try:
+            async with self._reader() as db, db.execute(query, params) as cursor:
+                rows = await cursor.fetchall()
+            await asyncio.to_thread(self._vector_index.load, rows, entity_id, buffer)
+        finally:
+            # No-op once load() has applied the buffer
+            self._vector_index.end_load(buffer)
+
+    def _on_index_load_done(self, entity_id: str | None, task: asyncio.Task) -> None:
+        """Forget a finished index load and surface its failure, if any."""
+        self._index_loads.pop(entity_id, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Vector index load failed: {task.exception()}")
+
+    async def rebuild_vector_index(self, entity_id: str | None = None) -> int:
+        """Rebuild the vector index from SQLite, compacting and retraining it.
+
+        Args:
+            entity_id: Entity to rebuild, or None to rebuild every entity
+
+        Returns:
+            Number of vectors indexed afterwards for ``entity_id`` (all
+            entities when None)
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        await self._load_vector_index(entity_id)
+        count = self._vector_index.count(entity_id)
+        logger.info(
+            f"Vector index rebuilt (entity_id={entity_id}): {count} vectors indexed"
+        )
+        return count
+
+    async def get_knowledge_nodes_by_ids(self, node_ids: list[str]) -> list[dict]:
+        """Get knowledge nodes by ID (order not preserved).
+
+        Args:
+            node_ids: Node identifiers
+
+        Returns:
+            List of dicts with node_id, entity_id, content, importance,
+            created_at, last_accessed_at, access_count
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        results: list[dict] = []
+        # Stay below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds
+        for start in range(0, len(node_ids), 500):
+            chunk = node_ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            async with self._reader() as db:
+                async with db.execute(
+                    f"""
+                    SELECT node_id, entity_id, content, importance,
+                           created_at, last_accessed_at, access_count
+                    FROM knowledge_nodes
+                    WHERE node_id IN ({placeholders})
+                    """,
+                    chunk,
+                ) as cursor:
+                    rows = await cursor.fetchall()
+            results.extend(
+                {
+                    "node_id": row[0],
+                    "entity_id": row[1],
+                    "content": row[2],
+                    "importance": row[3],
+                    "created_at": row[4],
+                    "last_accessed_at": row[5],
+                    "access_count": row[6],
+                }
+                for row in rows
+            )
+        return results
+
     async def search_fts(
         self,
         query: str,
@@ -702,7 +1189,7 @@ class SQLiteStore:
             params = (query, limit)
 
         try:
-            async with self._db.execute(sql, params) as cursor:
+            async with self._reader() as db, db.execute(sql, params) as cursor:
                 rows = await cursor.fetchall()
                 return [
                     {
@@ -751,21 +1238,23 @@ class SQLiteStore:
             ORDER BY ke.strength DESC
             LIMIT ?
         """
-        async with self._db.execute(sql, (node_id, node_id, limit)) as cursor:
-            rows = await cursor.fetchall()
-            return [
-                {
-                    "node_id": row[0],
-                    "content": row[1],
-                    "importance": row[2],
-                    "created_at": row[3],
-                    "last_accessed_at": row[4],
-                    "edge_type": row[5],
-                    "edge_strength": row[6],
-                }
-                for row in rows
-            ]
+        async with self._reader() as db:
+            async with db.execute(sql, (node_id, node_id, limit)) as cursor:
+                rows = await cursor.fetchall()
+                return [
+                    {
+                        "node_id": row[0],
+                        "content": row[1],
+                        "importance": row[2],
+                        "created_at": row[3],
+                        "last_accessed_at": row[4],
+                        "edge_type": row[5],
+                        "edge_strength": row[6],
+                    }
+                    for row in rows
+                ]
 
+    @_writes
     async def touch_node(self, node_id: str) -> None:
         """Update last_accessed_at and increment access_count for a node.
 
@@ -784,8 +1273,64 @@ class SQLiteStore:
             """,
             (node_id,),
         )
-        await self._db.commit()
 
+    async def touch_nodes(self, node_ids: list[str]) -> None:
+        """Buffer access updates for several nodes.
+
+        Touches are coalesced per node and written with a single
+        ``executemany`` by ``flush_pending_writes()``, which runs at most
+        ``flush_interval`` seconds later (or immediately once
+        ``MAX_PENDING_TOUCHES`` nodes are pending).
+
+        Args:
+            node_ids: Node identifiers that were accessed
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        for node_id in node_ids:
+            self._pending_touches[node_id] = self._pending_touches.get(node_id, 0) + 1
+
+        if len(self._pending_touches) >= self.MAX_PENDING_TOUCHES:
+            await self.flush_pending_writes()
+        elif self._pending_touches and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self) -> None:
+        """Background flush of buffered touches after ``flush_interval``."""
+        await asyncio.sleep(self._flush_interval)
+        try:
+            await self.flush_pending_writes()
+        except Exception as e:
+            logger.warning(f"Failed to flush buffered node touches: {e}")
+
+    async def flush_pending_writes(self) -> int:
+        """Write all buffered node touches in one transaction.
+
+        Returns:
+            Number of nodes updated
+        """
+        if not self._pending_touches or not self._db:
+            return 0
+
+        async with self.transaction():
+            pending = self._pending_touches
+            self._pending_touches = {}
+            await self._db.executemany(
+                """
+                UPDATE knowledge_nodes
+                SET last_accessed_at = CURRENT_TIMESTAMP,
+                    access_count = access_count + ?
+                WHERE node_id = ?
+                """,
+                [(count, node_id) for node_id, count in pending.items()],
+            )
+        logger.debug(f"Flushed access updates for {len(pending)} knowledge nodes")
+        return len(pending)
+
+    @_writes
     async def insert_knowledge_edge(self, edge: dict) -> str:
         """Insert a knowledge edge (relationship between nodes).
 
@@ -816,10 +1361,49 @@ class SQLiteStore:
             ),
         )
 
-        await self._db.commit()
         logger.debug(f"Knowledge edge inserted: {edge['edge_id']}")
         return edge["edge_id"]
 
+    @_writes
+    async def insert_knowledge_edges(self, edges: list[dict]) -> list[str]:
+        """Insert several knowledge edges with one executemany and commit.
+
+        Args:
+            edges: Edge dictionaries as accepted by ``insert_knowledge_edge``
+
+        Returns:
+            Edge IDs in input order
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        if not edges:
+            return []
+
+        await self._db.executemany(
+            """
+            INSERT OR IGNORE INTO knowledge_edges (
+                edge_id, source_node_id, target_node_id,
+                edge_type, strength, metadata
+            )
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    edge["edge_id"],
+                    edge["source_node_id"],
+                    edge["target_node_id"],
+                    edge.get("edge_type", "related"),
+                    edge.get("strength", 1.0),
+                    edge.get("metadata"),
+                )
+                for edge in edges
+            ],
+        )
+
+        logger.debug(f"Inserted {len(edges)} knowledge edges")
+        return [edge["edge_id"] for edge in edges]
+
+    @_writes
     async def delete_knowledge_node(self, node_id: str) -> bool:
         """Delete a single knowledge node by ID.
 
@@ -836,12 +1420,38 @@ class SQLiteStore:
             "DELETE FROM knowledge_nodes WHERE node_id = ?",
             (node_id,),
         )
-        await self._db.commit()
+        self._vector_index.remove(node_id)
         deleted = cursor.rowcount > 0
         if deleted:
             logger.debug(f"Knowledge node deleted: {node_id}")
         return deleted
 
+    @_writes
+    async def delete_knowledge_nodes_by_ids(self, node_ids: list[str]) -> int:
+        """Delete several knowledge nodes with one executemany and commit.
+
+        Args:
+            node_ids: Node identifiers
+
+        Returns:
+            Number of deleted nodes
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        if not node_ids:
+            return 0
+
+        cursor = await self._db.executemany(
+            "DELETE FROM knowledge_nodes WHERE node_id = ?",
+            [(node_id,) for node_id in node_ids],
+        )
+        for node_id in node_ids:
+            self._vector_index.remove(node_id)
+        count = cursor.rowcount
+        logger.debug(f"Deleted {count} knowledge nodes by id")
+        return count
+
+    @_writes
     async def delete_knowledge_nodes(
         self,
         entity_id: str | None = None,
@@ -866,11 +1476,12 @@ class SQLiteStore:
         else:
             cursor = await self._db.execute("DELETE FROM knowledge_nodes")
 
-        await self._db.commit()
+        self._vector_index.drop_entity(entity_id)
         count = cursor.rowcount
         logger.debug(f"Deleted {count} knowledge nodes (entity_id={entity_id})")
         return count
 
+    @_writes
     async def touch_entity(
         self,
         entity_id: str,
@@ -899,9 +1510,9 @@ class SQLiteStore:
             """,
             (entity_id, entity_id, platform, now_iso, now_iso, now_iso),
         )
-        await self._db.commit()
         logger.debug(f"Entity touched: {entity_id}")
 
+    @_writes
     async def insert_consolidation_log(self, log: dict) -> None:
         """Insert a consolidation log entry.
 
@@ -926,11 +1537,186 @@ class SQLiteStore:
                 log.get("summary"),
             ),
         )
-        await self._db.commit()
         logger.debug(f"Consolidation log inserted for session {log['session_id']}")
 
+    @_writes
+    async def insert_pending_consolidation(self, job: dict) -> None:
+        """Record a session whose consolidation was deferred.
+
+        Args:
+            job: Dict with session_id, entity_id, platform, ended_at,
+                 message_count, episode_json
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        await self._db.execute(
+            """
+            INSERT OR REPLACE INTO pending_consolidations
+                (session_id, entity_id, platform, ended_at, message_count,
+                 episode_json)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                job["session_id"],
+                job.get("entity_id"),
+                job.get("platform", "direct"),
+                job["ended_at"],
+                job.get("message_count", 0),
+                job.get("episode_json"),
+            ),
+        )
+
+    async def get_pending_consolidations(self) -> list[dict]:
+        """Get deferred consolidations that have not run yet, oldest first.
+
+        Returns:
+            List of pending job dictionaries
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        async with self._reader() as db:
+            async with db.execute(
+                "SELECT * FROM pending_consolidations ORDER BY created_at, rowid"
+            ) as cursor:
+                rows = await cursor.fetchall()
+                cols = [d[0] for d in cursor.description]
+                return [dict(zip(cols, row)) for row in rows]
+
+    @_writes
+    async def delete_pending_consolidations(self, session_ids: list[str]) -> int:
+        """Remove deferred consolidations once they have run.
+
+        Args:
+            session_ids: Session identifiers
+
+        Returns:
+            Number of deleted rows
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        if not session_ids:
+            return 0
+
+        cursor = await self._db.executemany(
+            "DELETE FROM pending_consolidations WHERE session_id = ?",
+            [(session_id,) for session_id in session_ids],
+        )
+        return cursor.rowcount
+
+    @_writes
+    async def insert_pending_extraction(self, turn: dict) -> int:
+        """Record a turn queued for background extraction.
+
+        Args:
+            turn: Dict with user, assistant and entity_id
+
+        Returns:
+            Row id of the pending turn
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        cursor = await self._db.execute(
+            """
+            INSERT INTO pending_extractions
+                (entity_id, user_content, assistant_content)
+            VALUES (?, ?, ?)
+            """,
+            (turn.get("entity_id"), turn["user"], turn.get("assistant")),
+        )
+        return cursor.lastrowid
+
+    async def get_pending_extractions(self) -> list[dict]:
+        """Get turns whose extraction has not run yet, oldest first.
+
+        Returns:
+            List of turn dictionaries with id, user, assistant and entity_id
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        async with self._reader() as db:
+            async with db.execute(
+                """
+                SELECT id, user_content, assistant_content, entity_id
+                FROM pending_extractions ORDER BY id
+                """
+            ) as cursor:
+                rows = await cursor.fetchall()
+                return [
+                    {
+                        "id": row[0],
+                        "user": row[1],
+                        "assistant": row[2] or "",
+                        "entity_id": row[3],
+                    }
+                    for row in rows
+                ]
+
+    @_writes
+    async def delete_pending_extractions(self, ids: list[int]) -> int:
+        """Remove queued turns once they have been extracted.
+
+        Args:
+            ids: Row ids from ``insert_pending_extraction``
+
+        Returns:
+            Number of deleted rows
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        if not ids:
+            return 0
+
+        cursor = await self._db.executemany(
+            "DELETE FROM pending_extractions WHERE id = ?",
+            [(row_id,) for row_id in ids],
+        )
+        return cursor.rowcount
+
+    @_writes
+    async def insert_pending_embeddings(self, node_ids: list[str]) -> None:
+        """Record nodes whose embedding is queued for the background worker.
+
+        Args:
+            node_ids: Node IDs stored without a vector
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        if not node_ids:
+            return
+
+        await self._db.executemany(
+            "INSERT OR IGNORE INTO pending_embeddings (node_id) VALUES (?)",
+            [(node_id,) for node_id in node_ids],
+        )
+
+    async def get_pending_embeddings(self) -> list[dict]:
+        """Get nodes whose embedding has not run yet, oldest first.
+
+        Returns:
+            List of dicts with node_id and content
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        async with self._reader() as db:
+            async with db.execute(
+                """
+                SELECT p.node_id, n.content
+                FROM pending_embeddings p
+                JOIN knowledge_nodes n ON n.node_id = p.node_id
+                ORDER BY p.created_at, p.rowid
+                """
+            ) as cursor:
+                rows = await cursor.fetchall()
+                return [{"node_id": row[0], "content": row[1]} for row in rows]
+
     # ── Phase 2 methods ─────────────────────────────────────────────────
 
+    @_writes
     async def insert_stream_episode(self, episode: dict) -> str:
         """Insert a stream episode record.
 
@@ -962,7 +1748,6 @@ class SQLiteStore:
                 episode.get("ended_at"),
             ),
         )
-        await self._db.commit()
         logger.debug(f"Stream episode inserted: {episode['id']}")
         return episode["id"]
 
@@ -978,14 +1763,16 @@ class SQLiteStore:
         if not self._db:
             raise RuntimeError("Database not initialized. Call initialize() first.")
 
-        async with self._db.execute(
-            "SELECT * FROM stream_episodes ORDER BY created_at DESC LIMIT ?",
-            (limit,),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            cols = [d[0] for d in cursor.description]
-            return [dict(zip(cols, row)) for row in rows]
+        async with self._reader() as db:
+            async with db.execute(
+                "SELECT * FROM stream_episodes ORDER BY created_at DESC LIMIT ?",
+                (limit,),
+            ) as cursor:
+                rows = await cursor.fetchall()
+                cols = [d[0] for d in cursor.description]
+                return [dict(zip(cols, row)) for row in rows]
 
+    @_writes
     async def insert_procedural_rule(self, rule: dict) -> str:
         """Insert a procedural rule.
 
@@ -1013,7 +1800,6 @@ class SQLiteStore:
                 rule.get("active", 1),
             ),
         )
-        await self._db.commit()
         logger.debug(f"Procedural rule inserted: {rule['id']}")
         return rule["id"]
 
@@ -1026,13 +1812,15 @@ class SQLiteStore:
         if not self._db:
             raise RuntimeError("Database not initialized. Call initialize() first.")
 
-        async with self._db.execute(
-            "SELECT * FROM procedural_rules WHERE active = 1 ORDER BY confidence DESC"
-        ) as cursor:
-            rows = await cursor.fetchall()
-            cols = [d[0] for d in cursor.description]
-            return [dict(zip(cols, row)) for row in rows]
+        async with self._reader() as db:
+            async with db.execute(
+                "SELECT * FROM procedural_rules WHERE active = 1 ORDER BY confidence DESC"
+            ) as cursor:
+                rows = await cursor.fetchall()
+                cols = [d[0] for d in cursor.description]
+                return [dict(zip(cols, row)) for row in rows]
 
+    @_writes
     async def update_mention(
         self,
         node_id: str,
@@ -1057,7 +1845,6 @@ class SQLiteStore:
             """,
             (importance_boost, node_id),
         )
-        await self._db.commit()
         logger.debug(f"Knowledge node mention updated: {node_id}")
 
     async def insert_supersedes_edge(
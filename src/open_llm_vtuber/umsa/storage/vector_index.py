@@ -0,0 +1,733 @@
+"""In-memory embedding index for UMSA vector search.
+
+Keeps node embeddings as contiguous float32 NumPy matrices, partitioned by
+entity, so a vector query is a single matrix-vector product followed by an
+``argpartition`` top-k instead of deserializing and scoring every BLOB in
+Python.
+
+The index is populated lazily from SQLite (one partition per entity on first
+query) and afterwards kept in sync incrementally by ``SQLiteStore`` whenever
+nodes are inserted, re-embedded or deleted.
+
+Two backends are available:
+- ``VectorIndex``: exact brute-force search (default)
+- ``IVFVectorIndex``: approximate inverted-file search over k-means clusters,
+  probing only the closest lists so query cost grows sub-linearly
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from typing import Iterable
+
+import numpy as np
+from loguru import logger
+
+
+class _Partition:
+    """Growable float32 embedding matrix for a single entity.
+
+    Rows ``[0, size)`` are live. Removal swaps the last row into the freed
+    slot so both insert and delete are amortized O(1).
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, dimension: int | None = None):
+        self.dimension = dimension
+        self.ids: list[str] = []
+        self.rows: dict[str, int] = {}
+        self.matrix: np.ndarray | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    def _reserve(self, capacity: int) -> None:
+        if self.matrix is not None and self.matrix.shape[0] >= capacity:
+            return
+        new_capacity = max(self._INITIAL_CAPACITY, capacity)
+        if self.matrix is not None:
+            new_capacity = max(new_capacity, self.matrix.shape[0] * 2)
+        grown = np.empty((new_capacity, self.dimension), dtype=np.float32)
+        if self.matrix is not None and self.size:
+            grown[: self.size] = self.matrix[: self.size]
+        self.matrix = grown
+
+    def bulk_load(self, node_ids: list[str], matrix: np.ndarray) -> None:
+        """Replace the partition contents with a prebuilt matrix."""
+        self.dimension = int(matrix.shape[1])
+        self.ids = list(node_ids)
+        self.rows = {nid: i for i, nid in enumerate(self.ids)}
+        self.matrix = None
+        self._reserve(len(self.ids))
+        self.matrix[: len(self.ids)] = matrix
+
+    def upsert(self, node_id: str, vector: np.ndarray) -> bool:
+        """Insert or overwrite a node vector. Returns False on dimension mismatch."""
+        if self.dimension is None:
+            self.dimension = int(vector.shape[0])
+        if vector.shape[0] != self.dimension:
+            return False
+
+        row = self.rows.get(node_id)
+        if row is None:
+            self._reserve(self.size + 1)
+            row = self.size
+            self.ids.append(node_id)
+            self.rows[node_id] = row
+        self.matrix[row] = vector
+        return True
+
+    def remove(self, node_id: str) -> bool:
+        """Remove a node by swapping the last row into its slot."""
+        row = self.rows.pop(node_id, None)
+        if row is None:
+            return False
+
+        last = self.size - 1
+        if row != last:
+            moved_id = self.ids[last]
+            self.matrix[row] = self.matrix[last]
+            self.ids[row] = moved_id
+            self.rows[moved_id] = row
+        self.ids.pop()
+        return True
+
+    def search(self, query: np.ndarray, k: int) -> list[tuple[str, float]]:
+        """Return the ``k`` most similar nodes as ``(node_id, score)`` pairs."""
+        n = self.size
+        if n == 0 or k <= 0 or query.shape[0] != self.dimension:
+            return []
+
+        scores = self.matrix[:n] @ query
+        k = min(k, n)
+        if k < n:
+            top = np.argpartition(scores, n - k)[n - k :]
+        else:
+            top = np.arange(n)
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(self.ids[i], float(scores[i])) for i in top]
+
+
+class VectorIndex:
+    """Exact in-memory vector index over knowledge node embeddings.
+
+    Embeddings are assumed to be L2-normalized (as produced by
+    ``EmbeddingService.encode``), so the dot product equals cosine similarity.
+
+    Entity partitions are only tracked once they have been loaded; writes to
+    entities that were never queried are ignored and picked up by the next
+    lazy load instead. Writes made while a load reads storage are buffered
+    by ``begin_load()`` and replayed by ``load()``, so they are not lost to
+    the load's older snapshot.
+
+    All public methods are serialized by a lock so searches and bulk loads
+    can run in a worker thread while writes arrive from the event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._partitions: dict[str | None, _Partition] = {}
+        self._node_entity: dict[str, str | None] = {}
+        self._loaded: set[str] = set()
+        self._all_loaded = False
+        # (entity_id or None for a full load, writes made since begin_load)
+        self._load_buffers: list[tuple[str | None, list[tuple]]] = []
+
+    def _new_partition(self) -> _Partition:
+        """Create an empty partition for this index backend."""
+        return _Partition()
+
+    @staticmethod
+    def decode(blob: bytes) -> np.ndarray:
+        """Decode a little-endian float32 BLOB without copying."""
+        return np.frombuffer(blob, dtype="<f4")
+
+    @property
+    def size(self) -> int:
+        """Number of indexed vectors across all loaded partitions."""
+        return len(self._node_entity)
+
+    def count(self, entity_id: str | None = None) -> int:
+        """Number of indexed vectors of an entity (None = all entities)."""
+        with self._lock:
+            if entity_id is None:
+                return self.size
+            partition = self._partitions.get(entity_id)
+            return partition.size if partition else 0
+
+    def is_loaded(self, entity_id: str | None) -> bool:
+        """Whether queries for ``entity_id`` (None = all entities) can be served."""
+        if self._all_loaded:
+            return True
+        return entity_id is not None and entity_id in self._loaded
+
+    def has_loaded(self) -> bool:
+        """Whether any partition is currently tracked or being loaded."""
+        return self._all_loaded or bool(self._loaded) or bool(self._load_buffers)
+
+    def entity_of(self, node_id: str) -> tuple[bool, str | None]:
+        """Return ``(known, entity_id)`` for an indexed node."""
+        if node_id in self._node_entity:
+            return True, self._node_entity[node_id]
+        return False, None
+
+    def begin_load(self, entity_id: str | None = None) -> list[tuple]:
+        """Start buffering writes for a load that is about to read storage.
+
+        Call it before the rows are read and pass the returned buffer to
+        ``load()``, or to ``end_load()`` if the load is abandoned.
+
+        Args:
+            entity_id: Entity to be loaded, or None for a full load
+
+        Returns:
+            Buffer of the writes made to the entity until the load finishes
+        """
+        with self._lock:
+            buffer: list[tuple] = []
+            self._load_buffers.append((entity_id, buffer))
+            return buffer
+
+    def end_load(self, buffer: list[tuple]) -> None:
+        """Stop buffering writes for a load started with ``begin_load()``."""
+        with self._lock:
+            self._load_buffers = [
+                entry for entry in self._load_buffers if entry[1] is not buffer
+            ]
+
+    def _buffer_write(self, entity_id: str | None, op: tuple) -> None:
+        for key, buffer in self._load_buffers:
+            if key is None or entity_id is None or key == entity_id:
+                buffer.append(op)
+
+    def load(
+        self,
+        rows: Iterable[tuple[str, str | None, bytes]],
+        entity_id: str | None = None,
+        buffer: list[tuple] | None = None,
+    ) -> None:
+        """Bulk-load ``(node_id, entity_id, blob)`` rows from storage.
+
+        Args:
+            rows: Node rows with serialized embeddings
+            entity_id: Entity the rows belong to, or None for a full load
+            buffer: Buffer from ``begin_load()``; its writes are applied
+                after the rows
+        """
+        with self._lock:
+            grouped: dict[str | None, tuple[list[str], list[bytes]]] = {}
+            for node_id, node_entity, blob in rows:
+                if not blob:
+                    continue
+                ids, blobs = grouped.setdefault(node_entity, ([], []))
+                ids.append(node_id)
+                blobs.append(blob)
+
+            if entity_id is None:
+                self._partitions.clear()
+                self._node_entity.clear()
+                self._loaded.clear()
+            else:
+                self._drop_partition(entity_id)
+
+            total = 0
+            for key, (ids, blobs) in grouped.items():
+                ids, matrix = self._stack(ids, blobs)
+                partition = self._new_partition()
+                if ids:
+                    partition.bulk_load(ids, matrix)
+                self._partitions[key] = partition
+                for nid in ids:
+                    self._node_entity[nid] = key
+                total += len(ids)
+
+            if entity_id is None:
+                self._all_loaded = True
+            else:
+                if entity_id not in self._partitions:
+                    self._partitions[entity_id] = self._new_partition()
+                self._loaded.add(entity_id)
+
+            if buffer is not None:
+                self.end_load(buffer)
+                for op, *args in buffer:
+                    getattr(self, op)(*args)
+
+            logger.debug(f"VectorIndex loaded {total} vectors (entity_id={entity_id})")
+
+    @classmethod
+    def _stack(cls, ids: list[str], blobs: list[bytes]) -> tuple[list[str], np.ndarray]:
+        """Stack BLOBs into one matrix, dropping rows of a foreign dimension."""
+        sizes = {len(b) for b in blobs}
+        if len(sizes) > 1:
+            # Mixed dimensions after an embedding model change: keep the
+            # majority dimension, the rest could never match a query anyway.
+            common = max(sizes, key=lambda s: sum(1 for b in blobs if len(b) == s))
+            kept = [(i, b) for i, b in zip(ids, blobs) if len(b) == common]
+            ids = [i for i, _ in kept]
+            blobs = [b for _, b in kept]
+        dim = len(blobs[0]) // 4
+        matrix = np.frombuffer(b"".join(blobs), dtype="<f4").reshape(-1, dim)
+        return ids, matrix
+
+    def add(self, node_id: str, entity_id: str | None, blob: bytes) -> None:
+        """Insert or replace the embedding of a node if its entity is tracked."""
+        with self._lock:
+            self._buffer_write(entity_id, ("add", node_id, entity_id, blob))
+            if not blob or not self.is_loaded(entity_id):
+                return
+
+            known, previous = self.entity_of(node_id)
+            if known and previous != entity_id:
+                self._remove(node_id)
+
+            partition = self._partitions.get(entity_id)
+            if partition is None:
+                partition = self._partitions[entity_id] = self._new_partition()
+            if partition.upsert(node_id, self.decode(blob)):
+                self._node_entity[node_id] = entity_id
+            else:
+                logger.debug(
+                    f"VectorIndex skipped {node_id}: embedding dimension mismatch"
+                )
+
+    def remove(self, node_id: str) -> bool:
+        """Remove a node from the index. Returns True if it was indexed."""
+        with self._lock:
+            for _, buffer in self._load_buffers:
+                buffer.append(("remove", node_id))
+            return self._remove(node_id)
+
+    def _remove(self, node_id: str) -> bool:
+        if node_id not in self._node_entity:
+            return False
+        entity_id = self._node_entity.pop(node_id)
+        partition = self._partitions.get(entity_id)
+        return partition.remove(node_id) if partition else False
+
+    def drop_entity(self, entity_id: str | None) -> None:
+        """Forget all vectors of an entity (None = every entity)."""
+        with self._lock:
+            self._buffer_write(entity_id, ("drop_entity", entity_id))
+            if entity_id is None:
+                self._partitions.clear()
+                self._node_entity.clear()
+                return
+            self._drop_partition(entity_id)
+            if self.is_loaded(entity_id):
+                self._partitions[entity_id] = self._new_partition()
+
+    def reset(self) -> None:
+        """Forget everything, including which partitions were loaded."""
+        with self._lock:
+            # Buffered writes may be the ones being rolled back
+            for _, buffer in self._load_buffers:
+                buffer.clear()
+            self._partitions.clear()
+            self._node_entity.clear()
+            self._loaded.clear()
+            self._all_loaded = False
+
+    def _drop_partition(self, entity_id: str | None) -> None:
+        partition = self._partitions.pop(entity_id, None)
+        if partition is None:
+            return
+        for nid in partition.ids:
+            self._node_entity.pop(nid, None)
+
+    def search(
+        self,
+        query_embedding: list[float] | np.ndarray,
+        entity_id: str | None = None,
+        k: int = 10,
+    ) -> list[tuple[str, float]]:
+        """Find the ``k`` nearest nodes by cosine similarity.
+
+        Args:
+            query_embedding: Normalized query vector
+            entity_id: Optional entity filter (None searches all partitions)
+            k: Number of results
+
+        Returns:
+            ``(node_id, similarity)`` pairs sorted by similarity descending
+        """
+        with self._lock:
+            query = np.asarray(query_embedding, dtype=np.float32)
+            if query.ndim != 1 or query.size == 0:
+                return []
+
+            if entity_id is not None:
+                partition = self._partitions.get(entity_id)
+                return partition.search(query, k) if partition else []
+
+            hits: list[tuple[str, float]] = []
+            for partition in self._partitions.values():
+                hits.extend(partition.search(query, k))
+            hits.sort(key=lambda h: h[1], reverse=True)
+            return hits[:k]
+
+
+def _assign(data: np.ndarray, centroids: np.ndarray, chunk: int = 8192) -> np.ndarray:
+    """Index of the most similar centroid for every row of ``data``."""
+    out = np.empty(len(data), dtype=np.int64)
+    for start in range(0, len(data), chunk):
+        block = data[start : start + chunk] @ centroids.T
+        out[start : start + chunk] = np.argmax(block, axis=1)
+    return out
+
+
+def _spherical_kmeans(
+    data: np.ndarray,
+    nlist: int,
+    iterations: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Train unit-norm centroids with spherical k-means (cosine distance)."""
+    centroids = data[rng.choice(len(data), nlist, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _assign(data, centroids)
+        counts = np.bincount(assignment, minlength=nlist)
+        order = np.argsort(assignment, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        nonempty = counts > 0
+
+        sums = np.zeros_like(centroids)
+        sums[nonempty] = np.add.reduceat(data[order], starts[nonempty], axis=0)
+        # Re-seed empty clusters from random points
+        empty = np.flatnonzero(~nonempty)
+        if len(empty):
+            sums[empty] = data[rng.choice(len(data), len(empty), replace=False)]
+
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        centroids = (sums / norms).astype(np.float32)
+    return centroids
+
+
+class _IVFPartition:
+    """Inverted-file partition: k-means centroids plus one ``_Partition`` per list.
+
+    Until ``min_train_size`` vectors are present the partition stays a single
+    flat list (exact search). Inserts go to the nearest centroid's list and
+    the centroids are retrained whenever the partition doubles in size since
+    the last training, keeping lists balanced as memory grows. Retraining
+    runs in a background thread on a copy of the vectors: searches keep
+    using the current lists until the new ones are swapped in under
+    ``lock``, and writes made in the meantime are replayed onto them.
+    """
+
+    def __init__(
+        self,
+        nlist: int,
+        nprobe: int,
+        min_train_size: int,
+        train_sample: int,
+        iterations: int,
+        lock: threading.RLock | None = None,
+    ):
+        self.dimension: int | None = None
+        self._nlist = nlist
+        self._nprobe = nprobe
+        self._min_train_size = min_train_size
+        self._train_sample = train_sample
+        self._iterations = iterations
+        self._centroids: np.ndarray | None = None
+        self._lists: list[_Partition] = [_Partition()]
+        self._where: dict[str, int] = {}
+        self._trained_size = 0
+        self._lock = lock or threading.RLock()
+        # node_id -> vector (None = removed) written during a retrain
+        self._retrain_log: dict[str, np.ndarray | None] | None = None
+        self._retrain_thread: threading.Thread | None = None
+
+    @property
+    def ids(self) -> list[str]:
+        return list(self._where)
+
+    @property
+    def size(self) -> int:
+        return len(self._where)
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    def bulk_load(self, node_ids: list[str], matrix: np.ndarray) -> None:
+        self.dimension = int(matrix.shape[1])
+        self._train(list(node_ids), np.asarray(matrix, dtype=np.float32))
+
+    def upsert(self, node_id: str, vector: np.ndarray) -> bool:
+        if self.dimension is None:
+            self.dimension = int(vector.shape[0])
+        if vector.shape[0] != self.dimension:
+            return False
+
+        target = 0
+        if self._centroids is not None:
+            target = int(np.argmax(self._centroids @ vector))
+        current = self._where.get(node_id)
+        if current is not None and current != target:
+            self._lists[current].remove(node_id)
+        self._lists[target].upsert(node_id, vector)
+        self._where[node_id] = target
+
+        if self._retrain_log is not None:
+            self._retrain_log[node_id] = vector
+        elif self.size >= max(self._min_train_size, 2 * self._trained_size):
+            self._start_retrain()
+        return True
+
+    def remove(self, node_id: str) -> bool:
+        if self._retrain_log is not None:
+            self._retrain_log[node_id] = None
+        target = self._where.pop(node_id, None)
+        if target is None:
+            return False
+        return self._lists[target].remove(node_id)
+
+    def search(self, query: np.ndarray, k: int) -> list[tuple[str, float]]:
+        if self.size == 0 or k <= 0 or query.shape[0] != self.dimension:
+            return []
+        if self._centroids is None:
+            return self._lists[0].search(query, k)
+
+        centroid_scores = self._centroids @ query
+        nprobe = min(self._nprobe, len(self._lists))
+        probe = np.argpartition(centroid_scores, len(self._lists) - nprobe)[
+            len(self._lists) - nprobe :
+        ]
+        hits: list[tuple[str, float]] = []
+        for list_id in probe:
+            hits.extend(self._lists[list_id].search(query, k))
+        hits.sort(key=lambda h: h[1], reverse=True)
+        return hits[:k]
+
+    def rebuild(self) -> None:
+        """Retrain centroids on the current vectors and compact all lists."""
+        ids, matrix = self._snapshot()
+        if not ids:
+            self._centroids = None
+            self._lists = [_Partition(self.dimension)]
+            self._where = {}
+            self._trained_size = 0
+            return
+        self._train(ids, matrix)
+
+    def _snapshot(self) -> tuple[list[str], np.ndarray | None]:
+        """Copy the ids and vectors of every list."""
+        ids: list[str] = []
+        blocks: list[np.ndarray] = []
+        for lst in self._lists:
+            if lst.size:
+                ids.extend(lst.ids)
+                blocks.append(lst.matrix[: lst.size])
+        return ids, np.concatenate(blocks) if blocks else None
+
+    def _start_retrain(self) -> None:
+        ids, matrix = self._snapshot()
+        self._retrain_log = {}
+        self._retrain_thread = threading.Thread(
+            target=self._retrain, args=(ids, matrix), name="ivf-retrain", daemon=True
+        )
+        self._retrain_thread.start()
+
+    def _retrain(self, node_ids: list[str], matrix: np.ndarray) -> None:
+        """Background thread: fit new lists, then swap them in."""
+        try:
+            trained = self._fit(node_ids, matrix)
+        except Exception as e:
+            logger.warning(f"IVF partition retraining failed: {e}")
+            with self._lock:
+                self._retrain_log = None
+            return
+
+        with self._lock:
+            log, self._retrain_log = self._retrain_log, None
+            self._centroids, self._lists, self._where, self._trained_size = trained
+            for node_id, vector in log.items():
+                if vector is None:
+                    self.remove(node_id)
+                else:
+                    self.upsert(node_id, vector)
+
+    def _train(self, node_ids: list[str], matrix: np.ndarray) -> None:
+        self._centroids, self._lists, self._where, self._trained_size = self._fit(
+            node_ids, matrix
+        )
+
+    def _fit(
+        self, node_ids: list[str], matrix: np.ndarray
+    ) -> tuple[np.ndarray | None, list[_Partition], dict[str, int], int]:
+        """Cluster the vectors into lists.
+
+        Returns:
+            (centroids, lists, node_id -> list index, trained size)
+        """
+        n = len(node_ids)
+        if n < self._min_train_size:
+            flat = _Partition(self.dimension)
+            if n:
+                flat.bulk_load(node_ids, matrix)
+            return None, [flat], dict.fromkeys(node_ids, 0), 0
+
+        nlist = self._nlist or max(1, int(math.sqrt(n)))
+        nlist = min(nlist, n)
+        rng = np.random.default_rng(0)
+        sample = matrix
+        if n > self._train_sample:
+            sample = matrix[rng.choice(n, self._train_sample, replace=False)]
+        centroids = _spherical_kmeans(sample, nlist, self._iterations, rng)
+
+        assignment = _assign(matrix, centroids)
+        order = np.argsort(assignment, kind="stable")
+        counts = np.bincount(assignment, minlength=nlist)
+        ids_array = np.asarray(node_ids, dtype=object)
+
+        lists = []
+        offset = 0
+        for count in counts:
+            lst = _Partition(self.dimension)
+            if count:
+                rows = order[offset : offset + count]
+                lst.bulk_load(ids_array[rows].tolist(), matrix[rows])
+            lists.append(lst)
+            offset += count
+        logger.debug(f"IVF partition trained: {n} vectors in {nlist} lists")
+        return centroids, lists, dict(zip(node_ids, assignment.tolist())), n
+
+
+class IVFVectorIndex(VectorIndex):
+    """Approximate vector index using an inverted file over k-means clusters.
+
+    Each entity partition is clustered into ``nlist`` lists (``sqrt(n)`` when
+    0) and a query scans only the ``nprobe`` lists whose centroids are closest
+    to it. Small partitions fall back to exact search.
+    """
+
+    def __init__(
+        self,
+        nlist: int = 0,
+        nprobe: int = 8,
+        min_train_size: int = 4096,
+        train_sample: int = 50_000,
+        iterations: int = 10,
+    ):
+        super().__init__()
+        self._nlist = nlist
+        self._nprobe = nprobe
+        self._min_train_size = min_train_size
+        self._train_sample = train_sample
+        self._iterations = iterations
+
+    def _new_partition(self) -> _IVFPartition:
+        return _IVFPartition(
+            nlist=self._nlist,
+            nprobe=self._nprobe,
+            min_train_size=self._min_train_size,
+            train_sample=self._train_sample,
+            iterations=self._iterations,
+            lock=self._lock,
+        )
+
+
+def _pairs_above(
+    matrix: np.ndarray,
+    rows: np.ndarray,
+    threshold: float,
+    max_block: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """All pairs ``rows[a] < rows[b]`` with similarity >= threshold.
+
+    ``rows`` must be sorted. Similarities are computed in row blocks of the
+    upper triangle so at most ``max_block`` scores are held at once.
+    """
+    n = len(rows)
+    vectors = matrix[rows]
+    block = max(1, max_block // max(n, 1))
+    found_i, found_j, found_s = [], [], []
+    for start in range(0, n, block):
+        end = min(start + block, n)
+        scores = vectors[start:end] @ vectors[start:].T
+        # Mask the diagonal and everything left of it
+        scores[np.tril_indices(end - start, m=n - start)] = -np.inf
+        a, b = np.nonzero(scores >= threshold)
+        found_i.append(rows[a + start])
+        found_j.append(rows[b + start])
+        found_s.append(scores[a, b])
+    if not found_i:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float32)
+    return np.concatenate(found_i), np.concatenate(found_j), np.concatenate(found_s)
+
+
+def find_similar_pairs(
+    matrix: np.ndarray,
+    threshold: float,
+    exact_limit: int = 10_000,
+    probes: int = 2,
+    max_block: int = 16_000_000,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find every pair of unit vectors with cosine similarity >= threshold.
+
+    Up to ``exact_limit`` rows all pairs are scored with blocked matrix
+    products. Larger inputs are first clustered with spherical k-means into
+    ``sqrt(n)`` lists; each row is placed in its ``probes`` nearest lists
+    and pairs are scored within each list. Near-duplicates sit next to each
+    other, so they share a list unless they straddle more than ``probes``
+    cluster boundaries.
+
+    Args:
+        matrix: (n, dim) float32 matrix of L2-normalized rows
+        threshold: Minimum cosine similarity
+        exact_limit: Largest input scored exhaustively
+        probes: Lists each row is assigned to above ``exact_limit``
+        max_block: Upper bound on similarity scores held in memory at once
+        seed: Clustering seed
+
+    Returns:
+        Row indices ``i``, ``j`` (with ``i < j``) and similarities, ordered
+        by ``(i, j)``
+    """
+    n = len(matrix)
+    if n <= exact_limit:
+        return _pairs_above(matrix, np.arange(n), threshold, max_block)
+
+    nlist = max(1, int(math.sqrt(n)))
+    probes = max(1, min(probes, nlist))
+    rng = np.random.default_rng(seed)
+    sample = matrix[rng.choice(n, min(n, 50 * nlist), replace=False)]
+    centroids = _spherical_kmeans(sample, nlist, 8, rng)
+
+    lists: list[list[np.ndarray]] = [[] for _ in range(nlist)]
+    for start in range(0, n, 8192):
+        scores = matrix[start : start + 8192] @ centroids.T
+        nearest = np.argpartition(-scores, probes - 1, axis=1)[:, :probes]
+        for p in range(probes):
+            assignment = nearest[:, p]
+            order = np.argsort(assignment, kind="stable")
+            bounds = np.searchsorted(assignment[order], np.arange(nlist + 1))
+            for c in range(nlist):
+                if bounds[c] < bounds[c + 1]:
+                    lists[c].append(order[bounds[c] : bounds[c + 1]] + start)
+
+    codes, sims = [], []
+    for members in lists:
+        if not members:
+            continue
+        rows = np.unique(np.concatenate(members))
+        if len(rows) < 2:
+            continue
+        i, j, s = _pairs_above(matrix, rows, threshold, max_block)
+        codes.append(i * n + j)
+        sims.append(s)
+    if not codes:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float32)
+
+    # Rows assigned to several lists can yield the same pair twice
+    codes, first = np.unique(np.concatenate(codes), return_index=True)
+    return codes // n, codes % n, np.concatenate(sims)[first]
@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
+import re
+from collections import OrderedDict
+
 from loguru import logger
 
+# CJK Unified, Korean Hangul, Hiragana, Katakana
+_CJK_PATTERN = re.compile("[\u4e00-\u9fff\uac00-\ud7af\u3040-\u309f\u30a0-\u30ff]")
+
+
+def cjk_char_count(text: str) -> int:
+    """Count CJK characters in ``text`` (regex scan, no Python-level loop)."""
+    return len(text) - len(_CJK_PATTERN.sub("", text))
+
 
 class TokenCounter:
     """Counts tokens for budget management.
 
     Uses tiktoken when available, falls back to character-based estimation
-    with CJK-aware heuristics.
+    with CJK-aware heuristics. Counts are memoized per text in a bounded LRU,
+    so messages and prompt sections that repeat every turn are tokenized once.
     """
 
+    CACHE_SIZE = 4096
+
     def __init__(self, model: str = "gpt-4"):
         self._encoder = None
         self._model = model
+        self._cache: OrderedDict[str, int] = OrderedDict()
         try:
             import tiktoken
 
@@ -27,9 +42,65 @@ class TokenCounter:
 
     def count(self, text: str) -> int:
         """Count tokens in a text string."""
+        cached = self._cache.get(text)
+        if cached is not None:
+            self._cache.move_to_end(text)
+            return cached
+
+        if self._encoder:
+            tokens = len(self._encoder.encode(text))
+        else:
+            tokens = self._estimate_tokens(text)
+
+        self._cache[text] = tokens
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return tokens
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Return the longest prefix of ``text`` within ``max_tokens``.
+
+        With tiktoken the text is encoded once and the token ids are sliced.
+        Otherwise the cut is found by binary search over character offsets,
+        counting CJK characters only in the newly probed span so the whole
+        search scans the text about once.
+        """
+        if max_tokens <= 0:
+            return ""
+
         if self._encoder:
-            return len(self._encoder.encode(text))
-        return self._estimate_tokens(text)
+            tokens = self._encoder.encode(text)
+            if len(tokens) <= max_tokens:
+                return text
+            # A cut inside a multi-byte character decodes to U+FFFD
+            return self._encoder.decode(tokens[:max_tokens]).rstrip("\ufffd")
+
+        if self.count(text) <= max_tokens:
+            return text
+        lo, hi = 0, len(text)
+        lo_cjk = 0
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            mid_cjk = lo_cjk + cjk_char_count(text[lo:mid])
+            if self._estimate_from_counts(mid, mid_cjk) <= max_tokens:
+                lo, lo_cjk = mid, mid_cjk
+            else:
+                hi = mid - 1
+        return text[:lo]
+
+    def count_content(self, content: str | list) -> int:
+        """Count tokens in a message's content, plain or multimodal."""
+        if isinstance(content, str):
+            return self.count(content)
+        total = 0
+        if isinstance(content, list):
+            # Multimodal content (text + images)
+            for item in content:
+                if isinstance(item, dict) and item.get("type") == "text":
+                    total += self.count(item.get("text", ""))
+                elif isinstance(item, dict) and item.get("type") == "image_url":
+                    total += 85  # Approximate token cost for image reference
+        return total
 
     def count_messages(self, messages: list[dict]) -> int:
         """Count total tokens in a list of chat messages."""
@@ -37,16 +108,7 @@ class TokenCounter:
         for msg in messages:
             # Per-message overhead (role, formatting)
             total += 4
-            content = msg.get("content", "")
-            if isinstance(content, str):
-                total += self.count(content)
-            elif isinstance(content, list):
-                # Multimodal content (text + images)
-                for item in content:
-                    if isinstance(item, dict) and item.get("type") == "text":
-                        total += self.count(item.get("text", ""))
-                    elif isinstance(item, dict) and item.get("type") == "image_url":
-                        total += 85  # Approximate token cost for image reference
+            total += self.count_content(msg.get("content", ""))
             if msg.get("name"):
                 total += self.count(msg["name"])
         total += 2  # Priming tokens
@@ -59,13 +121,10 @@ class TokenCounter:
         English: ~4 characters per token
         CJK (Korean, Japanese, Chinese): ~2 characters per token
         """
-        cjk_count = sum(
-            1
-            for c in text
-            if "\u4e00" <= c <= "\u9fff"  # CJK Unified
-            or "\uac00" <= c <= "\ud7af"  # Korean Hangul
-            or "\u3040" <= c <= "\u309f"  # Hiragana
-            or "\u30a0" <= c <= "\u30ff"  # Katakana
-        )
-        non_cjk = len(text) - cjk_count
+        return TokenCounter._estimate_from_counts(len(text), cjk_char_count(text))
+
+    @staticmethod
+    def _estimate_from_counts(length: int, cjk_count: int) -> int:
+        """Token estimate for ``length`` characters, ``cjk_count`` of them CJK."""
+        non_cjk = length - cjk_count
         return max(1, (non_cjk // 4) + (cjk_count // 2))
@@ -7,6 +7,8 @@ with intelligent eviction policies.
 Key features:
 - Token-budget-aware message buffer with automatic eviction
 - Important message protection (preserved until >90% full)
+- Amortized O(1) add/evict/interrupt via per-message cached token counts and
+  separate eviction queues for important and unimportant messages
 - Returns evicted messages for absorption into Session Memory
 - Interrupt handling for truncating incomplete assistant responses
 - Thread-safe for async single-threaded environments
@@ -14,6 +16,7 @@ Key features:
 
 from __future__ import annotations
 
+from collections import OrderedDict, deque
 from datetime import datetime
 from typing import Any
 
@@ -46,7 +49,14 @@ class WorkingMemory:
         """
         self.max_tokens = max_tokens
         self.token_counter = token_counter or TokenCounter()
-        self._messages: list[Message] = []
+        # Messages in conversation order keyed by a monotonically increasing
+        # sequence number, with the token count charged for each one
+        self._entries: OrderedDict[int, tuple[Message, int]] = OrderedDict()
+        # Sequence numbers in arrival order, split by importance, so the next
+        # eviction candidate is always at the left end of one of them
+        self._unimportant: deque[int] = deque()
+        self._important: deque[int] = deque()
+        self._next_seq = 0
         self._current_tokens = 0
 
         logger.debug(f"WorkingMemory initialized with max_tokens={max_tokens}")
@@ -80,12 +90,8 @@ class WorkingMemory:
             important=important,
         )
 
-        # Calculate tokens for this message
-        message_tokens = self.token_counter.count(content)
-
-        # Add message
-        self._messages.append(message)
-        self._current_tokens += message_tokens
+        # Add message (its token count is cached on the message)
+        message_tokens = self._append(message)
 
         logger.debug(
             f"Added message: role={role}, tokens={message_tokens}, "
@@ -106,7 +112,7 @@ class WorkingMemory:
         Returns:
             Copy of message list
         """
-        return self._messages.copy()
+        return [message for message, _ in self._entries.values()]
 
     def to_chat_messages(self) -> list[dict[str, Any]]:
         """Convert messages to LLM chat format.
@@ -115,7 +121,7 @@ class WorkingMemory:
             List of message dicts in format [{"role": ..., "content": ...}]
         """
         chat_messages = []
-        for msg in self._messages:
+        for msg, _ in self._entries.values():
             chat_msg: dict[str, Any] = {
                 "role": msg.role,
                 "content": msg.content,
@@ -137,11 +143,11 @@ class WorkingMemory:
             heard_response: The partial response that was heard before interruption
             interrupt_role: Role of the interrupting party (default: "user")
         """
-        if not self._messages:
+        if not self._entries:
             logger.warning("handle_interrupt called but no messages in buffer")
             return
 
-        last_message = self._messages[-1]
+        last_message = self.last_message
 
         if last_message.role != "assistant":
             logger.warning(
@@ -154,12 +160,7 @@ class WorkingMemory:
         interrupted_content = f"{heard_response}\n[INTERRUPTED by {interrupt_role}]"
 
         # Recalculate tokens
-        old_tokens = self.token_counter.count(last_message.content)
-        new_tokens = self.token_counter.count(interrupted_content)
-        token_delta = new_tokens - old_tokens
-
-        last_message.content = interrupted_content
-        self._current_tokens += token_delta
+        token_delta = self._replace_last_content(interrupted_content)
 
         logger.info(
             f"Handled interrupt: truncated assistant message, "
@@ -168,8 +169,10 @@ class WorkingMemory:
 
     def clear(self) -> None:
         """Clear all messages from working memory."""
-        message_count = len(self._messages)
-        self._messages.clear()
+        message_count = len(self._entries)
+        self._entries.clear()
+        self._unimportant.clear()
+        self._important.clear()
         self._current_tokens = 0
         logger.info(f"Cleared {message_count} messages from working memory")
 
@@ -200,9 +203,7 @@ class WorkingMemory:
                 important=False,  # History messages not automatically important
             )
 
-            message_tokens = self.token_counter.count(content)
-            self._messages.append(message)
-            self._current_tokens += message_tokens
+            self._append(message)
 
         # Evict oldest if over budget
         evicted = self._evict_if_needed()
@@ -233,12 +234,15 @@ class WorkingMemory:
         Returns:
             Count of messages in buffer
         """
-        return len(self._messages)
+        return len(self._entries)
 
     @property
     def last_message(self) -> Message | None:
         """Get the last message in working memory, or None if empty."""
-        return self._messages[-1] if self._messages else None
+        if not self._entries:
+            return None
+        message, _ = self._entries[next(reversed(self._entries))]
+        return message
 
     def update_last_content(self, new_content: str) -> None:
         """Update the content of the last message, adjusting token count.
@@ -246,14 +250,42 @@ class WorkingMemory:
         Args:
             new_content: New content for the last message
         """
-        if not self._messages:
+        if not self._entries:
             logger.warning("update_last_content called but no messages in buffer")
             return
 
-        old_tokens = self.token_counter.count(self._messages[-1].content)
-        self._messages[-1].content = new_content
-        new_tokens = self.token_counter.count(new_content)
+        self._replace_last_content(new_content)
+
+    def _append(self, message: Message) -> int:
+        """Append a message to the buffer and charge its tokens.
+
+        Returns:
+            Token count of the message
+        """
+        message_tokens = message.token_count(self.token_counter)
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[seq] = (message, message_tokens)
+        if message.important:
+            self._important.append(seq)
+        else:
+            self._unimportant.append(seq)
+        self._current_tokens += message_tokens
+        return message_tokens
+
+    def _replace_last_content(self, new_content: str) -> int:
+        """Replace the last message's content and re-charge its tokens.
+
+        Returns:
+            Token delta applied to the buffer
+        """
+        seq = next(reversed(self._entries))
+        message, old_tokens = self._entries[seq]
+        message.content = new_content
+        new_tokens = message.token_count(self.token_counter)
+        self._entries[seq] = (message, new_tokens)
         self._current_tokens += new_tokens - old_tokens
+        return new_tokens - old_tokens
 
     def _evict_if_needed(self) -> list[Message]:
         """Evict oldest messages if over token budget.
@@ -267,28 +299,18 @@ class WorkingMemory:
         """
         evicted: list[Message] = []
 
-        while self._current_tokens > self.max_tokens and self._messages:
-            # First pass: find oldest non-important message
-            evicted_index = None
-            for i, msg in enumerate(self._messages):
-                if not msg.important:
-                    evicted_index = i
-                    break
-
-            # Second pass: if no non-important found, evict oldest important
-            if evicted_index is None:
-                evicted_index = 0
-
+        while self._current_tokens > self.max_tokens and self._entries:
             # Safety: don't evict the only remaining message
-            if len(self._messages) <= 1:
+            if len(self._entries) <= 1:
                 logger.warning(
                     "Cannot evict: only one message remains. "
                     f"tokens={self._current_tokens}/{self.max_tokens}"
                 )
                 break
 
-            evicted_message = self._messages.pop(evicted_index)
-            evicted_tokens = self.token_counter.count(evicted_message.content)
+            # Oldest non-important message first, oldest important otherwise
+            queue = self._unimportant or self._important
+            evicted_message, evicted_tokens = self._entries.pop(queue.popleft())
             self._current_tokens -= evicted_tokens
             evicted.append(evicted_message)
 
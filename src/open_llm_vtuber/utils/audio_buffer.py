@@ -0,0 +1,80 @@
+"""Growable float32 audio buffer for per-client microphone input."""
+
+import numpy as np
+
+
+class AudioBuffer:
+    """
+    Preallocated float32 arena that accumulates audio samples.
+
+    Appends copy into spare capacity and double the arena when it runs out,
+    so collecting an utterance is amortized O(1) per sample instead of the
+    full copy ``np.append`` makes on every chunk. ``take()`` hands the
+    collected samples out as a view of the arena without copying and starts
+    a fresh arena, so later appends never overwrite audio that is still
+    being transcribed.
+    """
+
+    def __init__(self, initial_capacity: int = 16000 * 10):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            initial_capacity: Samples to preallocate on first append
+                (10 seconds at 16 kHz by default)
+        """
+        self._initial_capacity = max(1, initial_capacity)
+        self._data: np.ndarray | None = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, samples) -> None:
+        """
+        Append samples to the buffer.
+
+        Args:
+            samples: Float samples as a list, array or buffer view
+        """
+        chunk = np.asarray(samples, dtype=np.float32).reshape(-1)
+        needed = self._size + len(chunk)
+        if self._data is None or needed > len(self._data):
+            self._grow(needed)
+        self._data[self._size : needed] = chunk
+        self._size = needed
+
+    def view(self) -> np.ndarray:
+        """
+        Get the collected samples without copying.
+
+        The view is only valid until the next ``append``; use ``take`` to
+        keep the samples.
+
+        Returns:
+            np.ndarray: float32 view of the collected samples
+        """
+        if self._data is None:
+            return np.empty(0, dtype=np.float32)
+        return self._data[: self._size]
+
+    def take(self) -> np.ndarray:
+        """
+        Detach the collected samples and reset the buffer.
+
+        Returns:
+            np.ndarray: float32 view of the collected samples (no copy)
+        """
+        samples = self.view()
+        self._data = None
+        self._size = 0
+        return samples
+
+    def _grow(self, needed: int) -> None:
+        capacity = self._initial_capacity if self._data is None else len(self._data)
+        while capacity < needed:
+            capacity *= 2
+        data = np.empty(capacity, dtype=np.float32)
+        if self._data is not None:
+            data[: self._size] = self._data[: self._size]
+        self._data = data
@@ -1,4 +1,8 @@
 import base64
+import io
+import wave
+
+import numpy as np
 from pydub import AudioSegment
 from pydub.utils import make_chunks
 from ..agent.output_types import Actions
@@ -82,5 +86,89 @@ def prepare_audio_payload(
     return payload
 
 
+def pcm_to_wav(pcm: bytes, sample_rate: int) -> bytes:
+    """
+    Wrap raw 16-bit mono PCM in a WAV container.
+
+    Parameters:
+        pcm (bytes): 16-bit little-endian mono samples
+        sample_rate (int): Sample rate in Hz
+
+    Returns:
+        bytes: The WAV file contents
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def pcm_rms_by_chunks(pcm: bytes, sample_rate: int, chunk_length_ms: int) -> list:
+    """
+    Calculate the RMS of each chunk of 16-bit mono PCM, relative to full scale.
+
+    Unlike _get_volume_by_chunks the values are not normalized to the loudest
+    chunk, since a streamed sentence's loudest chunk may not have arrived yet.
+
+    Parameters:
+        pcm (bytes): 16-bit little-endian mono samples
+        sample_rate (int): Sample rate in Hz
+        chunk_length_ms (int): The length of each audio chunk in milliseconds
+
+    Returns:
+        list: RMS per chunk in [0, 1]
+    """
+    samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+    chunk_size = max(1, sample_rate * chunk_length_ms // 1000)
+    volumes = []
+    for start in range(0, len(samples), chunk_size):
+        chunk = samples[start : start + chunk_size]
+        volumes.append(float(np.sqrt(np.mean(chunk * chunk))))
+    return volumes
+
+
+def prepare_audio_chunk_payload(
+    pcm: bytes,
+    sample_rate: int,
+    volumes: list,
+    chunk_length_ms: int = 20,
+    display_text: DisplayText = None,
+    actions: Actions = None,
+    forwarded: bool = False,
+) -> dict[str, any]:
+    """
+    Prepares an audio payload for one frame of streamed speech.
+
+    The frame is sent as a regular "audio" payload carrying a short WAV, so
+    clients play consecutive frames of a sentence back to back.
+
+    Parameters:
+        pcm (bytes): 16-bit little-endian mono samples of the frame
+        sample_rate (int): Sample rate in Hz
+        volumes (list): Volume envelope of the frame, one value per chunk
+        chunk_length_ms (int): The length of each volume chunk in milliseconds
+        display_text (DisplayText, optional): Text to be displayed with the audio
+        actions (Actions, optional): Actions associated with the audio
+
+    Returns:
+        dict: The audio payload to be sent
+    """
+    if isinstance(display_text, DisplayText):
+        display_text = display_text.to_dict()
+
+    return {
+        "type": "audio",
+        "audio": base64.b64encode(pcm_to_wav(pcm, sample_rate)).decode("utf-8"),
+        "volumes": volumes,
+        "slice_length": chunk_length_ms,
+        "display_text": display_text,
+        "actions": actions.to_dict() if actions else None,
+        "forwarded": forwarded,
+    }
+
+
 # Example usage:
 # payload, duration = prepare_audio_payload("path/to/audio.mp3", display_text="Hello", expression_list=[0,1,2])
@@ -0,0 +1,96 @@
+"""Batched VAD inference shared by all client sessions."""
+
+import asyncio
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+# infer(windows, states) -> one speech probability per window
+BatchInferFn = Callable[[np.ndarray, List[Any]], np.ndarray]
+
+
+class VADBatchScheduler:
+    """
+    Collect VAD windows from concurrent sessions into batched model calls.
+
+    Each ``submit`` parks one window with its session state. A single flush
+    task stacks whatever is pending into one batch and runs ``infer`` in a
+    worker thread, so the event loop never blocks on the model. Windows that
+    arrive while a batch is running are picked up by the next one.
+
+    A session must await each window before submitting the next one, since
+    its recurrent state carries over from window to window.
+    """
+
+    def __init__(
+        self,
+        infer: BatchInferFn,
+        max_batch_size: int = 32,
+        max_wait: float = 0.002,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            infer: Batched inference function, called off the event loop
+            max_batch_size: Maximum number of windows per model call
+            max_wait: Seconds to wait for other sessions before the first batch
+        """
+        self._infer = infer
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+        self._pending: List[Tuple[Any, np.ndarray, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.total_windows = 0
+        self.total_batches = 0
+
+    async def submit(self, state: Any, window: np.ndarray) -> float:
+        """
+        Queue one window for inference and wait for its probability.
+
+        Args:
+            state: Session state passed through to ``infer``
+            window: One VAD window of float32 samples
+
+        Returns:
+            float: Speech probability for the window
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((state, window, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self) -> None:
+        if self.max_wait > 0:
+            await asyncio.sleep(self.max_wait)
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+
+            states = [state for state, _, _ in batch]
+            windows = np.stack([window for _, window, _ in batch])
+            try:
+                probs = await asyncio.to_thread(self._infer, windows, states)
+            except Exception as e:
+                logger.error(f"VAD batch inference failed: {e}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.total_windows += len(batch)
+            self.total_batches += 1
+            for (_, _, future), prob in zip(batch, probs):
+                # The submitting session may have been cancelled meanwhile
+                if not future.done():
+                    future.set_result(float(prob))
+
+    @property
+    def average_batch_size(self) -> float:
+        """Average number of windows per model call so far."""
+        if not self.total_batches:
+            return 0.0
+        return self.total_windows / self.total_batches
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from collections import deque
 from enum import Enum
 
@@ -14,6 +15,7 @@ from ..constants.audio import (
     VAD_WINDOW_SIZE_16KHZ,
     WAV_HEADER_SIZE_BYTES,
 )
+from .batch_scheduler import VADBatchScheduler
 from .vad_interface import VADInterface
 
 
@@ -27,6 +29,87 @@ class SileroVADConfig(BaseModel):
     smoothing_window: int = 5
 
 
+class SileroVADModel:
+    """
+    Silero-VAD network shared by every session of an engine.
+
+    ``load_silero_vad()`` returns a TorchScript module that keeps its
+    recurrent state and audio context in the ``_state`` and ``_context``
+    attributes, and resets them when ``_last_sr`` or ``_last_batch_size``
+    differ from the call. ``infer`` swaps the states of the given sessions
+    in as one batch and writes the updated rows back, so the model holds no
+    per-client state between calls.
+    """
+
+    STATE_SIZE = 128
+    # TorchScript attributes infer() reads and writes
+    STATE_ATTRIBUTES = ("_state", "_context", "_last_sr", "_last_batch_size")
+
+    def __init__(self, sample_rate: int = 16000):
+        self.sample_rate = sample_rate
+        # 512 / 16000 = 0.032s
+        self.window_size = (
+            VAD_WINDOW_SIZE_16KHZ if sample_rate == 16000 else VAD_WINDOW_SIZE_8KHZ
+        )
+        self.context_size = 64 if sample_rate == 16000 else 32
+        self._lock = threading.Lock()
+        logger.info("Loading Silero-VAD model...")
+        self.model = load_silero_vad()
+        missing = [a for a in self.STATE_ATTRIBUTES if not hasattr(self.model, a)]
+        if missing:
+            raise RuntimeError(
+                f"Unsupported Silero-VAD model, missing state attributes: {missing}"
+            )
+
+    def initial_state(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Return zeroed (recurrent state, context) for a new stream."""
+        return (
+            torch.zeros(2, 1, self.STATE_SIZE),
+            torch.zeros(1, self.context_size),
+        )
+
+    def infer(self, windows: np.ndarray, sessions: list["VADSession"]) -> np.ndarray:
+        """
+        Run one batched forward pass.
+
+        Args:
+            windows: (batch, window_size) float32 samples, one row per session
+            sessions: Sessions whose state is read and advanced
+
+        Returns:
+            np.ndarray: Speech probability per row
+        """
+        model = self.model
+        with self._lock, torch.no_grad():
+            model._state = torch.cat([s.rnn_state for s in sessions], dim=1)
+            model._context = torch.cat([s.context for s in sessions], dim=0)
+            # Matching sr/batch size keeps the model from resetting the state
+            model._last_sr = self.sample_rate
+            model._last_batch_size = len(sessions)
+            probs = model(torch.from_numpy(windows), self.sample_rate)
+            for i, session in enumerate(sessions):
+                session.rnn_state = model._state[:, i : i + 1]
+                session.context = model._context[i : i + 1]
+        return probs.reshape(-1).numpy()
+
+
+class VADSession:
+    """Per-client detection state: model stream state plus the state machine."""
+
+    def __init__(self, engine: "VADEngine"):
+        self.engine = engine
+        self.rnn_state, self.context = engine.model.initial_state()
+        self.state = StateMachine(engine.config)
+
+    def feed(self, speech_prob: float, chunk_np: np.ndarray):
+        """Advance the state machine by one window and yield detected bytes."""
+        if not speech_prob:
+            return
+        for probs, dbs, chunk in self.state.get_result(speech_prob, chunk_np):
+            # detected a sequence of voice bytes
+            yield bytes(chunk)
+
+
 class VADEngine(VADInterface):
     def __init__(
         self,
@@ -37,6 +120,7 @@ class VADEngine(VADInterface):
         required_hits: int = 3,
         required_misses: int = 24,
         smoothing_window: int = 5,
+        max_batch_size: int = 32,
     ):
         self.config = SileroVADConfig(
             orig_sr=orig_sr,
@@ -47,42 +131,37 @@ class VADEngine(VADInterface):
             required_misses=required_misses,
             smoothing_window=smoothing_window,
         )
-        self.model = self.load_vad_model()
-        self.state = StateMachine(self.config)
-        self.window_size_samples = (
-            VAD_WINDOW_SIZE_16KHZ
-            if self.config.target_sr == 16000
-            else VAD_WINDOW_SIZE_8KHZ
-        )
-        # 512 / 16000 = 0.032s
+        self.model = SileroVADModel(self.config.target_sr)
+        self.window_size_samples = self.model.window_size
+        self.scheduler = VADBatchScheduler(self.model.infer, max_batch_size)
+        # Used by the synchronous detect_speech, which has no client session
+        self._default_session = self.create_session()
 
-    def load_vad_model(self):
-        logger.info("Loading Silero-VAD model...")
-        return load_silero_vad()
+    def create_session(self) -> VADSession:
+        return VADSession(self)
 
-    def detect_speech(self, audio_data: list[float]):
-        audio_np = np.array(audio_data, dtype=np.float32)
+    def _windows(self, audio_data):
+        audio_np = np.asarray(audio_data, dtype=np.float32)
         for i in range(0, len(audio_np), self.window_size_samples):
             chunk_np = audio_np[i : i + self.window_size_samples]
             if len(chunk_np) < self.window_size_samples:
                 break
-            chunk = torch.Tensor(chunk_np)
-
-            with torch.no_grad():
-                speech_prob = self.model(chunk, self.config.target_sr).item()
+            yield chunk_np
 
-            if speech_prob:
-                # print(speech_prob)
-                iter = self.state.get_result(speech_prob, chunk_np)
-
-                for probs, dbs, chunk in iter:  # detected a sequence of voice bytes
-                    # rounded_probs = [round(x, 2) for x in probs]
-                    # rounded_dbs = [round(y, 2) for y in dbs]
-
-                    audio_chunk = bytes(chunk)
-                    yield audio_chunk
+    def detect_speech(self, audio_data: list[float]):
+        session = self._default_session
+        for chunk_np in self._windows(audio_data):
+            speech_prob = self.model.infer(chunk_np[np.newaxis], [session])[0]
+            yield from session.feed(speech_prob, chunk_np)
 
-        del audio_np
+    async def async_detect_speech(
+        self, audio_data: list[float], session: VADSession | None = None
+    ):
+        session = session or self._default_session
+        for chunk_np in self._windows(audio_data):
+            speech_prob = await self.scheduler.submit(session, chunk_np)
+            for audio_bytes in session.feed(speech_prob, chunk_np):
+                yield audio_bytes
 
 
 # Define state enumeration
@@ -200,7 +279,7 @@ class StateMachine:
 
 async def vad_main():
     global vad, audio_queue
-    vad = VADEngine(config=SileroVADConfig())
+    vad = VADEngine()
     audio_queue = asyncio.Queue()
     from tqdm.asyncio import tqdm
 
@@ -10,3 +10,21 @@ class VADInterface(ABC):
         :return: Returns a sequence of audio bytes containing human voice if voice activity is detected
         """
         pass
+
+    def create_session(self):
+        """
+        Create detection state for one client.
+        :return: Session object for async_detect_speech, or None if the engine keeps no per-client state
+        """
+        return None
+
+    async def async_detect_speech(self, audio_data, session=None):
+        """
+        Detect voice activity for one client's session without blocking the event loop.
+        By default this runs detect_speech in place; engines with per-client sessions override it.
+        :param audio_data: Input audio data
+        :param session: Session returned by create_session
+        :return: Async iterator over the same audio bytes as detect_speech
+        """
+        for audio_bytes in self.detect_speech(audio_data):
+            yield audio_bytes
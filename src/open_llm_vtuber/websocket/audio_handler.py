@@ -1,14 +1,49 @@
-"""Audio data processing handler for WebSocket communication."""
+"""Audio data processing handler for WebSocket communication.
 
-from typing import Dict, Callable
+Audio chunks arrive either as JSON messages with an ``audio`` float list or
+as binary PCM frames (see :func:`parse_binary_audio_frame`), which skip JSON
+float encoding entirely. Samples are collected in a per-client
+:class:`AudioBuffer`.
+"""
+
+from typing import Any, Dict, Callable, Tuple
 from fastapi import WebSocket
 import json
 import numpy as np
 
 from ..service_context import ServiceContext
 from ..chat_group import ChatGroupManager
+from ..utils.audio_buffer import AudioBuffer
 from ..utils.stream_audio import prepare_audio_payload
 
+# Binary PCM frame: one kind byte followed by little-endian float32 samples
+BINARY_FRAME_TYPES = {
+    0x01: "mic-audio-data",
+    0x02: "raw-audio-data",
+}
+
+
+def parse_binary_audio_frame(frame: bytes) -> dict | None:
+    """
+    Convert a binary PCM WebSocket frame into an audio message.
+
+    The samples are a read-only view of the frame, not a copy.
+
+    Args:
+        frame: Kind byte (see ``BINARY_FRAME_TYPES``) followed by float32 LE PCM
+
+    Returns:
+        dict | None: Message with ``type`` and ``audio``, or None if the frame
+            kind is unknown or the payload is not whole float32 samples
+    """
+    if not frame:
+        return None
+    msg_type = BINARY_FRAME_TYPES.get(frame[0])
+    payload = memoryview(frame)[1:]
+    if msg_type is None or len(payload) % 4:
+        return None
+    return {"type": msg_type, "audio": np.frombuffer(payload, dtype="<f4")}
+
 
 class AudioHandler:
     """Handles audio-related WebSocket operations."""
@@ -16,32 +51,44 @@ class AudioHandler:
     def __init__(
         self,
         client_contexts: Dict[str, ServiceContext],
-        received_data_buffers: Dict[str, np.ndarray],
+        received_data_buffers: Dict[str, AudioBuffer],
         chat_group_manager: ChatGroupManager,
     ):
         self.client_contexts = client_contexts
         self.received_data_buffers = received_data_buffers
         self.chat_group_manager = chat_group_manager
+        # client_uid -> (VAD engine, session); the engine changes on config switch
+        self._vad_sessions: Dict[str, Tuple[Any, Any]] = {}
+
+    def _get_vad_session(self, client_uid: str, vad_engine: Any) -> Any:
+        entry = self._vad_sessions.get(client_uid)
+        if entry is None or entry[0] is not vad_engine:
+            entry = (vad_engine, vad_engine.create_session())
+            self._vad_sessions[client_uid] = entry
+        return entry[1]
+
+    def remove_client(self, client_uid: str) -> None:
+        """Drop the VAD session of a disconnected client."""
+        self._vad_sessions.pop(client_uid, None)
 
     async def handle_audio_data(
         self, websocket: WebSocket, client_uid: str, data: dict
     ) -> None:
         """Handle incoming audio data."""
-        audio_data = data.get("audio", [])
-        if audio_data:
-            self.received_data_buffers[client_uid] = np.append(
-                self.received_data_buffers[client_uid],
-                np.array(audio_data, dtype=np.float32),
-            )
+        audio_data = data.get("audio")
+        if audio_data is not None and len(audio_data):
+            self.received_data_buffers[client_uid].append(audio_data)
 
     async def handle_raw_audio_data(
         self, websocket: WebSocket, client_uid: str, data: dict
     ) -> None:
         """Handle incoming raw audio data for VAD processing."""
         context = self.client_contexts[client_uid]
-        chunk = data.get("audio", [])
-        if chunk:
-            for audio_bytes in context.vad_engine.detect_speech(chunk):
+        chunk = data.get("audio")
+        if chunk is not None and len(chunk):
+            vad_engine = context.vad_engine
+            session = self._get_vad_session(client_uid, vad_engine)
+            async for audio_bytes in vad_engine.async_detect_speech(chunk, session):
                 if audio_bytes == b"<|PAUSE|>":
                     await websocket.send_text(
                         json.dumps({"type": "control", "text": "interrupt"})
@@ -50,9 +97,8 @@ class AudioHandler:
                     pass
                 elif len(audio_bytes) > 1024:
                     # Detected audio activity (voice)
-                    self.received_data_buffers[client_uid] = np.append(
-                        self.received_data_buffers[client_uid],
-                        np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32),
+                    self.received_data_buffers[client_uid].append(
+                        np.frombuffer(audio_bytes, dtype=np.int16)
                     )
                     await websocket.send_text(
                         json.dumps({"type": "control", "text": "mic-audio-end"})
@@ -4,12 +4,12 @@ from typing import Dict, Optional, Set, Callable
 from fastapi import WebSocket
 import asyncio
 import json
-import numpy as np
 from loguru import logger
 
 from ..service_context import ServiceContext
 from ..chat_group import ChatGroupManager
 from ..message_handler import message_handler
+from ..utils.audio_buffer import AudioBuffer
 
 
 class WebSocketConnectionManager:
@@ -123,7 +123,7 @@ class ConnectionManager:
         default_context_cache: ServiceContext,
         client_connections: Dict[str, WebSocket],
         client_contexts: Dict[str, ServiceContext],
-        received_data_buffers: Dict[str, np.ndarray],
+        received_data_buffers: Dict[str, AudioBuffer],
         current_conversation_tasks: Dict[str, Optional[asyncio.Task]],
         chat_group_manager: ChatGroupManager,
     ):
@@ -258,7 +258,7 @@ class ConnectionManager:
         """Store client data and initialize group status."""
         self.client_connections[client_uid] = websocket
         self.client_contexts[client_uid] = session_service_context
-        self.received_data_buffers[client_uid] = np.array([])
+        self.received_data_buffers[client_uid] = AudioBuffer()
 
         self.chat_group_manager.client_group_map[client_uid] = ""
         await send_group_update(websocket, client_uid)
@@ -9,7 +9,6 @@ from typing import Dict, Optional, Any
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
 import json
-import numpy as np
 from loguru import logger
 
 from ..service_context import ServiceContext
@@ -26,11 +25,12 @@ from .connection_manager import ConnectionManager
 from .message_router import MessageRouter
 from .group_handler import GroupHandler
 from .history_handler import HistoryHandler
-from .audio_handler import AudioHandler
+from .audio_handler import AudioHandler, parse_binary_audio_frame
 from .config_handler import ConfigHandler
 from .memory_handler import MemoryHandler
 from ..input_queue import InputQueueManager
 from ..queue_config import QueueConfig
+from ..utils.audio_buffer import AudioBuffer
 
 
 class WebSocketHandler:
@@ -56,7 +56,7 @@ class WebSocketHandler:
         self.chat_group_manager = ChatGroupManager()
         self.current_conversation_tasks: Dict[str, Optional[asyncio.Task]] = {}
         self.default_context_cache = default_context_cache
-        self.received_data_buffers: Dict[str, np.ndarray] = {}
+        self.received_data_buffers: Dict[str, AudioBuffer] = {}
 
         # Initialize OBS Service
         self._obs_service: Optional[OBSService] = None
@@ -177,11 +177,29 @@ class WebSocketHandler:
     async def handle_websocket_communication(
         self, websocket: WebSocket, client_uid: str
     ) -> None:
-        """Handle ongoing WebSocket communication with queue support."""
+        """Handle ongoing WebSocket communication with queue support.
+
+        Conversation triggers go through the prioritized, rate-limited queue;
+        every other frame (e.g. mic audio chunks) is handled in this client's
+        ordered lane without the processing interval. Binary frames carry raw
+        PCM audio (see ``parse_binary_audio_frame``).
+        """
         try:
             while True:
                 try:
-                    data = await websocket.receive_json()
+                    frame = await websocket.receive()
+                    if frame["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(frame.get("code", 1000))
+
+                    if frame.get("bytes") is not None:
+                        data = parse_binary_audio_frame(frame["bytes"])
+                        if data is None:
+                            logger.warning(
+                                f"Ignoring malformed binary frame from {client_uid}"
+                            )
+                            continue
+                    else:
+                        data = json.loads(frame["text"])
 
                     # Log message reception (optional, using existing handler)
                     message_handler.handle_message(client_uid, data)
@@ -226,6 +244,8 @@ class WebSocketHandler:
 
     async def handle_disconnect(self, client_uid: str) -> None:
         """Handle client disconnection."""
+        await self._input_queue_manager.remove_client(client_uid)
+        self.audio_handler.remove_client(client_uid)
         await self.connection_manager.handle_disconnect(
             client_uid=client_uid,
             handle_group_interrupt=handle_group_interrupt,
@@ -295,6 +315,15 @@ class WebSocketHandler:
             "processing_rate": status.get("processing_rate", 0.0),
         }
 
+    def get_queue_lanes(self) -> Dict[str, Any]:
+        """
+        Get per-lane status of the input queue.
+
+        Returns:
+            Dict[str, Any]: Prioritized lane summary and per-client lane metrics.
+        """
+        return self._input_queue_manager.get_lane_status()
+
     # ==========================================================================
     # Public API - Group Operations
     # ==========================================================================
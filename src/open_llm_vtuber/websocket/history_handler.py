@@ -6,10 +6,10 @@ import json
 
 from ..service_context import ServiceContext
 from ..chat_history_manager import (
-    create_new_history,
-    get_history,
-    delete_history,
-    get_history_list,
+    async_create_new_history,
+    async_get_history,
+    async_delete_history,
+    async_get_history_list,
 )
 
 
@@ -24,7 +24,7 @@ class HistoryHandler:
     ) -> None:
         """Handle request for chat history list."""
         context = self.client_contexts[client_uid]
-        histories = get_history_list(context.character_config.conf_uid)
+        histories = await async_get_history_list(context.character_config.conf_uid)
         await websocket.send_text(
             json.dumps({"type": "history-list", "histories": histories})
         )
@@ -40,14 +40,14 @@ class HistoryHandler:
         context = self.client_contexts[client_uid]
         # Update history_uid in service context
         context.history_uid = history_uid
-        context.agent_engine.set_memory_from_history(
+        await context.agent_engine.set_memory_from_history(
             conf_uid=context.character_config.conf_uid,
             history_uid=history_uid,
         )
 
         messages = [
             msg
-            for msg in get_history(
+            for msg in await async_get_history(
                 context.character_config.conf_uid,
                 history_uid,
             )
@@ -62,10 +62,10 @@ class HistoryHandler:
     ) -> None:
         """Handle creation of new chat history."""
         context = self.client_contexts[client_uid]
-        history_uid = create_new_history(context.character_config.conf_uid)
+        history_uid = await async_create_new_history(context.character_config.conf_uid)
         if history_uid:
             context.history_uid = history_uid
-            context.agent_engine.set_memory_from_history(
+            await context.agent_engine.set_memory_from_history(
                 conf_uid=context.character_config.conf_uid,
                 history_uid=history_uid,
             )
@@ -87,7 +87,7 @@ class HistoryHandler:
             return
 
         context = self.client_contexts[client_uid]
-        success = delete_history(
+        success = await async_delete_history(
             context.character_config.conf_uid,
             history_uid,
         )
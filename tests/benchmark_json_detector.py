@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Prompt-mode tool-call detection benchmark
+
+Streams a long LLM response (~--tokens tokens of prose with the odd
+"{placeholder}" and a tool-call JSON at the end) through StreamJSONDetector in
+token-sized chunks, and compares it with the previous detector, which kept the
+whole response and re-scanned every unclosed "{" on every chunk. The previous
+detector's cost grows with every chunk, so it is stopped after --budget
+seconds; the per-chunk figures show how far it got.
+
+Usage:
+    python tests/benchmark_json_detector.py --tokens 20000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.open_llm_vtuber.mcpp.json_detector import StreamJSONDetector  # noqa: E402
+
+SENTENCES = [
+    "Sure, let me walk you through how the overlay works on stream. ",
+    "Chat messages are formatted with a template like {author}: {message}. ",
+    "오늘 방송에서는 새로운 게임을 해볼 거예요, 기대해 주세요! ",
+    "If a line starts with { it is treated as a command block. ",
+]
+TOOL_CALL = {
+    "mcp_server": "time",
+    "tool": "get_current_time",
+    "arguments": json.dumps({"timezone": "Asia/Seoul"}),
+}
+
+
+class LegacyStreamJSONDetector:
+    """The detector StreamJSONDetector replaced."""
+
+    def __init__(self):
+        self.buffer = ""
+        self.potential_jsons = []
+        self.processed_ranges = []
+
+    def process_chunk(self, chunk):
+        old_length = len(self.buffer)
+        self.buffer += chunk
+        for i in range(old_length, len(self.buffer)):
+            if self.buffer[i] == "{" and not self._in_processed(i):
+                self.potential_jsons.append(i)
+        new_jsons, remaining = [], []
+        self.potential_jsons.sort()
+        for start in self.potential_jsons:
+            if self._in_processed(start):
+                continue
+            result, end = self._extract(start)
+            if result is not None:
+                new_jsons.append(result)
+                self.processed_ranges.append((start, end))
+            else:
+                remaining.append(start)
+        self.potential_jsons = remaining
+        return new_jsons
+
+    def _in_processed(self, pos):
+        return any(start <= pos <= end for start, end in self.processed_ranges)
+
+    def _extract(self, start):
+        stack, i = 1, start + 1
+        while i < len(self.buffer) and stack > 0:
+            if self.buffer[i] == "{":
+                stack += 1
+            elif self.buffer[i] == "}":
+                stack -= 1
+            i += 1
+        if stack == 0:
+            try:
+                return json.loads(self.buffer[start:i]), i - 1
+            except json.JSONDecodeError:
+                pass
+        return None, -1
+
+
+def make_chunks(tokens: int) -> list[str]:
+    """Split a ~`tokens`-token response into ~4-character stream chunks."""
+    text = ""
+    i = 0
+    while len(text) < tokens * 4:
+        text += SENTENCES[i % len(SENTENCES)]
+        i += 1
+    text += "Let me check the time. " + json.dumps(TOOL_CALL)
+    return [text[j : j + 4] for j in range(0, len(text), 4)]
+
+
+def run(detector, chunks: list[str], budget: float) -> tuple[float, int, list]:
+    """Feed chunks until done or `budget` seconds have passed.
+
+    Returns:
+        (elapsed ms, chunks processed, objects found)
+    """
+    found = []
+    start = time.perf_counter()
+    for count, chunk in enumerate(chunks, 1):
+        found.extend(detector.process_chunk(chunk))
+        if time.perf_counter() - start > budget:
+            break
+    return (time.perf_counter() - start) * 1000, count, found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="StreamJSONDetector benchmark")
+    parser.add_argument("--tokens", type=int, default=20_000)
+    parser.add_argument("--budget", type=float, default=30.0)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    chunks = make_chunks(args.tokens)
+    print(f"{len(chunks)} chunks, {sum(map(len, chunks))} chars")
+    print("=" * 60)
+    print(
+        f"{'detector':<14} {'chunks':>8} {'total ms':>12} {'us/chunk':>10} {'found':>6}"
+    )
+    print("-" * 60)
+    per_chunk = {}
+    for name, detector in [
+        ("legacy", LegacyStreamJSONDetector()),
+        ("incremental", StreamJSONDetector()),
+    ]:
+        ms, count, found = run(detector, chunks, args.budget)
+        per_chunk[name] = ms * 1000 / count
+        print(
+            f"{name:<14} {count:>8} {ms:>12.1f} {per_chunk[name]:>10.2f} {len(found):>6}"
+        )
+    assert found == [TOOL_CALL], found
+    print("-" * 60)
+    print(f"per-chunk speedup: {per_chunk['legacy'] / per_chunk['incremental']:.0f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
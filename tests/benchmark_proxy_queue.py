@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+ProxyMessageQueue latency benchmark
+
+Measures enqueue-to-forward latency for proxied text-input turns with the
+event-driven consumer and with the previous 100 ms polling consumer. Each
+simulated turn keeps the conversation active for --turn-ms, while clients
+send messages at random intervals, so both the "queue idle" and the
+"queued behind an active turn" paths are exercised.
+
+Usage:
+    python tests/benchmark_proxy_queue.py --messages 60
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.open_llm_vtuber.proxy_message_queue import ProxyMessageQueue  # noqa: E402
+
+
+class PollingProxyMessageQueue(ProxyMessageQueue):
+    """The previous consumer: poll every 100 ms, pause after 1 s idle."""
+
+    async def _consume_loop(self):
+        try:
+            while self._running:
+                await asyncio.sleep(0.1)
+                if not self._conversation_active and self.has_pending_messages():
+                    message, sender_id = self._next_message()
+                    self._conversation_active = True
+                    asyncio.create_task(self._forward_message(message, sender_id))
+                if not self.has_pending_messages() and not self._conversation_active:
+                    await asyncio.sleep(1)
+                    if (
+                        not self.has_pending_messages()
+                        and not self._conversation_active
+                    ):
+                        break
+        finally:
+            self._running = False
+
+
+async def run(queue_cls, args: argparse.Namespace) -> list[float]:
+    rng = random.Random(0)
+    latencies: list[float] = []
+    queue = queue_cls()
+
+    async def forward(message, sender_id):
+        if message["type"] != "text-input":
+            return
+        latencies.append(time.perf_counter() - message["sent_at"])
+        # Simulated server turn; its end signal re-opens the queue
+        await asyncio.sleep(args.turn_ms / 1000)
+        queue.conversation_active = False
+
+    queue.initialize(forward)
+    for i in range(args.messages):
+        queue.queue_message(
+            {"type": "text-input", "text": f"msg {i}", "sent_at": time.perf_counter()},
+            f"client{i % 3}",
+        )
+        await asyncio.sleep(rng.uniform(0, 2 * args.gap_ms / 1000))
+
+    while len(latencies) < args.messages:
+        await asyncio.sleep(0.01)
+    queue.stop()
+    return latencies
+
+
+def summarize(name: str, latencies: list[float]) -> None:
+    ms = sorted(x * 1000 for x in latencies)
+    print(
+        f"{name:<10} {sum(ms) / len(ms):>10.2f} {ms[len(ms) // 2]:>10.2f} "
+        f"{ms[int(len(ms) * 0.95)]:>10.2f} {ms[-1]:>10.2f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="ProxyMessageQueue benchmark")
+    parser.add_argument("--messages", type=int, default=60)
+    parser.add_argument("--gap-ms", type=float, default=150.0)
+    parser.add_argument("--turn-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(
+        f"{args.messages} text inputs, mean gap {args.gap_ms} ms, "
+        f"turn {args.turn_ms} ms"
+    )
+    print("=" * 54)
+    print(f"{'consumer':<10} {'mean (ms)':>10} {'p50':>10} {'p95':>10} {'max':>10}")
+    print("-" * 54)
+    summarize("polling", await run(PollingProxyMessageQueue, args))
+    summarize("event", await run(ProxyMessageQueue, args))
+    print("=" * 54)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
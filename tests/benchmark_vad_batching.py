@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Multi-client Silero-VAD throughput benchmark
+
+Streams noise from --clients concurrent sessions through one shared VADEngine
+and compares two ways of running the model:
+
+    per-window  one forward pass per window on the event loop (previous path)
+    batched     VADBatchScheduler, one forward pass per batch in a worker thread
+
+Requires torch and silero-vad.
+
+Usage:
+    python tests/benchmark_vad_batching.py --clients 8 --seconds 5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.open_llm_vtuber.vad.silero import VADEngine  # noqa: E402
+
+CHUNK_SAMPLES = 4096
+
+
+def make_streams(args: argparse.Namespace) -> list[list[np.ndarray]]:
+    rng = np.random.default_rng(0)
+    samples = int(args.seconds * 16000)
+    streams = []
+    for _ in range(args.clients):
+        audio = (rng.standard_normal(samples) * 0.1).astype(np.float32)
+        streams.append(
+            [audio[i : i + CHUNK_SAMPLES] for i in range(0, samples, CHUNK_SAMPLES)]
+        )
+    return streams
+
+
+async def run_per_window(engine: VADEngine, streams) -> None:
+    sessions = [engine.create_session() for _ in streams]
+
+    async def client(session, chunks):
+        for chunk in chunks:
+            for window in engine._windows(chunk):
+                prob = engine.model.infer(window[np.newaxis], [session])[0]
+                list(session.feed(prob, window))
+            # Let other clients' frames in, as the websocket loop would
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(client(s, c) for s, c in zip(sessions, streams)))
+
+
+async def run_batched(engine: VADEngine, streams) -> None:
+    sessions = [engine.create_session() for _ in streams]
+
+    async def client(session, chunks):
+        for chunk in chunks:
+            async for _ in engine.async_detect_speech(chunk, session):
+                pass
+
+    await asyncio.gather(*(client(s, c) for s, c in zip(sessions, streams)))
+
+
+async def measure_loop_lag(stop: asyncio.Event) -> float:
+    """Worst delay of a 5 ms timer while the benchmark runs."""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.005)
+        worst = max(worst, time.perf_counter() - start - 0.005)
+    return worst
+
+
+async def timed(runner, engine, streams) -> tuple[float, float]:
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop))
+    start = time.perf_counter()
+    await runner(engine, streams)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return elapsed, await lag_task
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Multi-client VAD benchmark")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=32)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    engine = VADEngine(max_batch_size=args.max_batch)
+    streams = make_streams(args)
+    windows = args.clients * int(args.seconds * 16000) // engine.window_size_samples
+
+    print(f"{args.clients} clients x {args.seconds}s audio ({windows} windows)")
+    print("=" * 60)
+    print(f"{'mode':<12} {'time (s)':>10} {'windows/s':>12} {'max loop lag':>14}")
+    print("-" * 60)
+    for name, runner in [("per-window", run_per_window), ("batched", run_batched)]:
+        elapsed, lag = await timed(runner, engine, streams)
+        print(
+            f"{name:<12} {elapsed:>10.2f} {windows / elapsed:>12.0f} "
+            f"{lag * 1000:>11.1f} ms"
+        )
+    print("=" * 60)
+    print(f"average batch size: {engine.scheduler.average_batch_size:.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
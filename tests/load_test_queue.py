@@ -3,10 +3,17 @@
 입력 큐 부하 테스트
 
 초당 10+ 메시지를 전송하여 큐 시스템의 안정성을 검증합니다.
+오버플로우 시나리오에서는 처리 속도를 크게 넘는 초당 1000+ 메시지를 보내
+큐가 가득 찬 상태에서도 enqueue 지연이 일정하게 유지되는지 확인합니다.
+
+Usage:
+    python tests/load_test_queue.py --scenario overflow --rate 2000
 """
 
+import argparse
 import asyncio
 import sys
+import time
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
@@ -332,10 +339,147 @@ def validate_results(stats: LoadTestStats, queue_manager: InputQueueManager) ->
     return success
 
 
+async def run_overflow_test(
+    messages_per_second: int = 2000,
+    duration_seconds: int = 10,
+    max_queue_size: int = 5000,
+) -> bool:
+    """
+    오버플로우 부하 테스트 실행
+
+    처리 속도(초당 약 40개)를 크게 넘는 속도로 메시지를 보내 큐를 가득 찬
+    상태로 유지하고, 매 enqueue마다 발생하는 드롭이 전송 속도를 떨어뜨리지
+    않는지 측정합니다.
+
+    Args:
+        messages_per_second: 초당 전송할 메시지 수
+        duration_seconds: 테스트 지속 시간 (초)
+        max_queue_size: 큐 최대 크기
+
+    Returns:
+        bool: 테스트 성공 여부
+    """
+    logger.info("=" * 60)
+    logger.info("오버플로우 부하 테스트 시작")
+    logger.info("=" * 60)
+
+    config = QueueConfig()
+    config.max_queue_size = max_queue_size
+    config.overflow_drop_count = 10
+    config.worker_count = 2
+
+    queue_manager = InputQueueManager(
+        config=config, message_handler=dummy_message_handler
+    )
+    # 드롭마다 남는 경고 로그가 측정을 왜곡하지 않도록 억제
+    logging.getLogger("src.open_llm_vtuber.input_queue").setLevel(logging.ERROR)
+
+    stats = LoadTestStats()
+    latencies: list = []
+    max_seen_size = 0
+    high_sent = 0
+
+    # 10ms 단위로 묶어서 전송 (sleep 해상도보다 높은 속도를 내기 위함)
+    tick = 0.01
+    per_tick = max(1, int(messages_per_second * tick))
+    total_messages = messages_per_second * duration_seconds
+
+    try:
+        await queue_manager.start()
+        stats.start_time = datetime.now().timestamp()
+        next_tick = time.perf_counter()
+
+        i = 0
+        while i < total_messages:
+            for _ in range(min(per_tick, total_messages - i)):
+                priority = MessagePriority.NORMAL
+                message_type = InputType.CHAT.value
+                if i % 10 == 0:
+                    priority = MessagePriority.HIGH
+                    message_type = InputType.SUPERCHAT.value
+                    high_sent += 1
+                elif i % 3 == 0:
+                    priority = MessagePriority.LOW
+
+                message = {
+                    "type": message_type,
+                    "content": f"플러드 메시지 #{i + 1}",
+                    "priority": priority,
+                    "test_id": i,
+                }
+                stats.record_sent(message_type)
+                start = time.perf_counter()
+                success = await queue_manager.enqueue(message)
+                latencies.append(time.perf_counter() - start)
+                stats.record_queued(success)
+                i += 1
+
+            max_seen_size = max(max_seen_size, queue_manager.get_status()["queue_size"])
+            next_tick += tick
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+
+        stats.end_time = datetime.now().timestamp()
+        final_status = queue_manager.get_status()
+    finally:
+        await queue_manager.stop()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    rate = stats.get_messages_per_second()
+
+    logger.info("=" * 60)
+    logger.info("오버플로우 테스트 결과")
+    logger.info("=" * 60)
+    logger.info(f"총 전송 메시지: {stats.total_sent}개 (HIGH {high_sent}개)")
+    logger.info(f"지속 전송 속도: {rate:.0f} messages/sec")
+    logger.info(f"큐 드롭 메시지: {final_status['total_dropped']}개")
+    logger.info(f"최대 큐 크기: {max_seen_size}/{max_queue_size}")
+    logger.info(f"enqueue 지연: p50 {p50:.1f}us, p99 {p99:.1f}us")
+
+    success = True
+    if rate >= 1000:
+        logger.info(f"✓ 오버플로우 상태에서 {rate:.0f} msgs/sec 유지")
+    else:
+        logger.error(f"✗ 전송 속도 부족: {rate:.0f} msgs/sec (요구사항: 1000+)")
+        success = False
+
+    if final_status["total_dropped"] > 0:
+        logger.info("✓ 오버플로우 드롭 발생 확인")
+    else:
+        logger.error("✗ 오버플로우가 발생하지 않음 (전송 속도/큐 크기 확인)")
+        success = False
+
+    if max_seen_size <= max_queue_size:
+        logger.info("✓ 큐 크기가 최대값을 넘지 않음")
+    else:
+        logger.error(f"✗ 큐 크기 초과: {max_seen_size}/{max_queue_size}")
+        success = False
+
+    logger.info("=" * 60)
+    return success
+
+
 async def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="입력 큐 부하 테스트")
+    parser.add_argument(
+        "--scenario", choices=["steady", "overflow", "all"], default="all"
+    )
+    parser.add_argument("--rate", type=int, default=2000, help="오버플로우 전송 속도")
+    parser.add_argument("--duration", type=int, default=10, help="오버플로우 시간")
+    parser.add_argument("--max-size", type=int, default=5000, help="큐 최대 크기")
+    args = parser.parse_args()
+
     try:
-        success = await run_load_test()
+        success = True
+        if args.scenario in ("steady", "all"):
+            success = await run_load_test() and success
+        if args.scenario in ("overflow", "all"):
+            success = (
+                await run_overflow_test(args.rate, args.duration, args.max_size)
+                and success
+            )
         sys.exit(0 if success else 1)
     except Exception as e:
         logger.error(f"부하 테스트 실행 중 에러 발생: {e}", exc_info=True)
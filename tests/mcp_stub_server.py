@@ -0,0 +1,75 @@
+"""A minimal stdio MCP server used by the MCP tests.
+
+Each request is answered on its own thread, so several calls can be in flight
+at once. The "lookup" tool sleeps for `delay` seconds and reports how many
+times it has run; "fail" always returns a tool error.
+
+Environment:
+    STUB_STARTUP_DELAY: Seconds to sleep before serving, to mimic a cold start.
+    STUB_START_LOG: File that gets one line appended per process start.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+lock = threading.Lock()
+calls = 0
+
+
+def send(message):
+    with lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def handle(request):
+    global calls
+    method, params = request["method"], request.get("params", {})
+    if method == "initialize":
+        result = {
+            "protocolVersion": params["protocolVersion"],
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": "stub", "version": "0"},
+        }
+    elif method == "tools/list":
+        schema = {
+            "type": "object",
+            "properties": {"key": {"type": "string", "description": "Lookup key"}},
+            "required": ["key"],
+        }
+        result = {
+            "tools": [
+                {
+                    "name": "lookup",
+                    "description": "Look up a key",
+                    "inputSchema": schema,
+                },
+                {"name": "fail", "description": "Always fails", "inputSchema": schema},
+            ]
+        }
+    elif method == "tools/call":
+        args = params.get("arguments") or {}
+        time.sleep(args.get("delay", 0))
+        with lock:
+            calls += 1
+            count = calls
+        failed = params["name"] == "fail"
+        text = "boom" if failed else f"{args.get('key')}#{count}"
+        result = {"content": [{"type": "text", "text": text}], "isError": failed}
+    else:
+        result = {}
+    send({"jsonrpc": "2.0", "id": request["id"], "result": result})
+
+
+if __name__ == "__main__":
+    if os.environ.get("STUB_START_LOG"):
+        with open(os.environ["STUB_START_LOG"], "a") as log:
+            log.write("start\n")
+    time.sleep(float(os.environ.get("STUB_STARTUP_DELAY", 0)))
+    for line in sys.stdin:
+        request = json.loads(line)
+        if "id" in request:
+            threading.Thread(target=handle, args=(request,), daemon=True).start()
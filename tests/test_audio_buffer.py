@@ -0,0 +1,48 @@
+"""Tests for AudioBuffer and binary PCM frame parsing."""
+
+import numpy as np
+
+from open_llm_vtuber.utils.audio_buffer import AudioBuffer
+from open_llm_vtuber.websocket.audio_handler import parse_binary_audio_frame
+
+
+def test_append_grows_past_initial_capacity():
+    buffer = AudioBuffer(initial_capacity=4)
+    buffer.append([0.1, 0.2, 0.3])
+    buffer.append(np.arange(10, dtype=np.float32))
+    assert len(buffer) == 13
+    np.testing.assert_allclose(
+        buffer.view(), [0.1, 0.2, 0.3] + list(range(10)), rtol=1e-6
+    )
+
+
+def test_take_detaches_without_copy():
+    buffer = AudioBuffer(initial_capacity=8)
+    buffer.append([1.0, 2.0])
+    arena = buffer.view().base
+    samples = buffer.take()
+
+    assert samples.base is arena
+    assert len(buffer) == 0 and buffer.view().size == 0
+    # New audio goes to a fresh arena and leaves the taken samples intact
+    buffer.append([9.0, 9.0])
+    np.testing.assert_array_equal(samples, [1.0, 2.0])
+
+
+def test_int16_chunks_keep_raw_scale():
+    buffer = AudioBuffer()
+    buffer.append(np.array([-32768, 0, 32767], dtype=np.int16))
+    assert buffer.view().dtype == np.float32
+    np.testing.assert_array_equal(buffer.view(), [-32768.0, 0.0, 32767.0])
+
+
+def test_parse_binary_audio_frame():
+    pcm = np.array([0.5, -0.25], dtype="<f4")
+    message = parse_binary_audio_frame(b"\x01" + pcm.tobytes())
+    assert message["type"] == "mic-audio-data"
+    np.testing.assert_array_equal(message["audio"], pcm)
+
+    assert parse_binary_audio_frame(b"\x02")["type"] == "raw-audio-data"
+    assert parse_binary_audio_frame(b"\x7f" + pcm.tobytes()) is None
+    assert parse_binary_audio_frame(b"\x01\x00\x00") is None
+    assert parse_binary_audio_frame(b"") is None
@@ -0,0 +1,166 @@
+"""Tests for the append-only chat history storage."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from open_llm_vtuber import chat_history_manager as chm
+
+CONF = "conf_a"
+
+
+@pytest.fixture(autouse=True)
+def history_root(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    chm._indexes.clear()
+    chm._migrated_dirs.clear()
+    yield tmp_path / "chat_history" / CONF
+    chm._run(lambda: None)
+
+
+def _lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_store_appends_one_line_per_message(history_root):
+    uid = chm.create_new_history(CONF)
+    chm.store_message(CONF, uid, "human", "hello", name="me")
+    chm.store_message(CONF, uid, "ai", "hi there")
+
+    messages = chm.get_history(CONF, uid)
+    assert [(m["role"], m["content"]) for m in messages] == [
+        ("human", "hello"),
+        ("ai", "hi there"),
+    ]
+    assert messages[0]["name"] == "me"
+    assert len(_lines(history_root / f"{uid}.jsonl")) == 3
+
+
+def test_history_list_is_served_from_index(history_root, monkeypatch):
+    first = chm.create_new_history(CONF)
+    chm.store_message(CONF, first, "human", "old")
+    second = chm.create_new_history(CONF)
+    chm.store_message(CONF, second, "human", "new")
+    chm.get_history_list(CONF)
+
+    def no_reads(filepath):
+        raise AssertionError(f"history file read: {filepath}")
+
+    monkeypatch.setattr(chm, "_read_records", no_reads)
+    chm.store_message(CONF, second, "ai", "reply")
+    histories = chm.get_history_list(CONF)
+
+    latest = {h["uid"]: h["latest_message"]["content"] for h in histories}
+    assert latest == {first: "old", second: "reply"}
+    index = json.loads((history_root / "_index.json").read_text(encoding="utf-8"))
+    assert index[second]["count"] == 2
+
+
+def test_stale_index_entry_is_rebuilt(history_root):
+    uid = chm.create_new_history(CONF)
+    chm.store_message(CONF, uid, "human", "one")
+    chm.get_history_list(CONF)
+
+    # Written behind the index's back, e.g. before a crash
+    with open(history_root / f"{uid}.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps({"role": "ai", "timestamp": "t", "content": "two"}) + "\n")
+
+    [history] = chm.get_history_list(CONF)
+    assert history["latest_message"]["content"] == "two"
+
+
+def test_empty_histories_are_cleaned_up(history_root):
+    empty = chm.create_new_history(CONF)
+    used = chm.create_new_history(CONF)
+    chm.store_message(CONF, used, "human", "hi")
+
+    assert [h["uid"] for h in chm.get_history_list(CONF)] == [used]
+    assert not (history_root / f"{empty}.jsonl").exists()
+
+
+def test_legacy_json_files_are_migrated(history_root):
+    history_root.mkdir(parents=True)
+    legacy = [
+        {"role": "metadata", "timestamp": "2024-01-01T00:00:00"},
+        {"role": "human", "timestamp": "2024-01-01T00:00:01", "content": "hey"},
+    ]
+    (history_root / "legacy.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    assert chm.get_history(CONF, "legacy")[0]["content"] == "hey"
+    assert not (history_root / "legacy.json").exists()
+    assert len(_lines(history_root / "legacy.jsonl")) == 2
+
+    chm.store_message(CONF, "legacy", "ai", "hello")
+    assert chm.get_history_list(CONF)[0]["latest_message"]["content"] == "hello"
+
+
+def test_metadata_updates_merge(history_root):
+    uid = chm.create_new_history(CONF)
+    created = chm.get_metadata(CONF, uid)["timestamp"]
+
+    assert chm.update_metadate(CONF, uid, {"agent_type": "hume", "id": "1"})
+    assert chm.update_metadate(CONF, uid, {"id": "2"})
+
+    metadata = chm.get_metadata(CONF, uid)
+    assert metadata == {
+        "role": "metadata",
+        "timestamp": created,
+        "agent_type": "hume",
+        "id": "2",
+    }
+    assert chm.get_history(CONF, uid) == []
+
+
+def test_modify_rename_and_delete(history_root):
+    uid = chm.create_new_history(CONF)
+    chm.store_message(CONF, uid, "human", "q")
+    chm.store_message(CONF, uid, "ai", "draft")
+
+    assert not chm.modify_latest_message(CONF, uid, "human", "x")
+    assert chm.modify_latest_message(CONF, uid, "ai", "final")
+    assert chm.rename_history_file(CONF, uid, "renamed")
+    assert chm.get_history(CONF, "renamed")[-1]["content"] == "final"
+    assert [h["uid"] for h in chm.get_history_list(CONF)] == ["renamed"]
+
+    assert chm.delete_history(CONF, "renamed")
+    assert chm.get_history_list(CONF) == []
+    assert not os.path.exists(history_root / "renamed.jsonl")
+
+
+@pytest.mark.asyncio
+async def test_async_variants_do_not_block_the_event_loop(history_root, monkeypatch):
+    uid = await chm.async_create_new_history(CONF)
+    chm.store_message(CONF, uid, "human", "hello")
+    assert await chm.async_update_metadate(CONF, uid, {"agent_type": "hume"})
+    assert (await chm.async_get_metadata(CONF, uid))["agent_type"] == "hume"
+
+    gate = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    read_messages = chm._read_messages
+
+    def slow_read(filepath):
+        # Returns only once the event loop is free to set the gate
+        asyncio.run_coroutine_threadsafe(gate.wait(), loop).result(timeout=5)
+        return read_messages(filepath)
+
+    monkeypatch.setattr(chm, "_read_messages", slow_read)
+    read = asyncio.create_task(chm.async_get_history(CONF, uid))
+    await asyncio.sleep(0)
+    gate.set()
+    assert [m["content"] for m in await read] == ["hello"]
+
+    assert [h["uid"] for h in await chm.async_get_history_list(CONF)] == [uid]
+    assert await chm.async_delete_history(CONF, uid)
+    assert await chm.async_get_history_list(CONF) == []
+
+
+@pytest.mark.asyncio
+async def test_missing_ids_return_defaults_without_the_writer(history_root):
+    assert chm.create_new_history("") == await chm.async_create_new_history("") == ""
+    assert chm.get_history(CONF, "") == await chm.async_get_history(CONF, "") == []
+    assert chm.get_metadata("", "x") == await chm.async_get_metadata("", "x") == {}
+    assert not await chm.async_update_metadate(CONF, "", {"a": 1})
+    assert not await chm.async_delete_history(CONF, "")
+    assert await chm.async_get_history_list("") == []
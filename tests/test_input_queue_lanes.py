@@ -0,0 +1,125 @@
+"""Tests for InputQueueManager client lanes and the prioritized lane."""
+
+import asyncio
+
+import pytest
+
+from open_llm_vtuber.input_queue import InputQueueManager
+from open_llm_vtuber.queue_config import QueueConfig
+
+
+def _config(interval: float = 0.1) -> QueueConfig:
+    config = QueueConfig()
+    config.message_processing_interval = interval
+    config.worker_count = 1
+    return config
+
+
+async def _drain(manager: InputQueueManager, timeout: float = 5.0):
+    for lane in list(manager._lanes.values()):
+        await asyncio.wait_for(lane.queue.join(), timeout)
+    while not manager.is_queue_empty() or manager._current_message:
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_audio_chunks_bypass_processing_interval():
+    handled = []
+
+    async def handler(message):
+        handled.append(message["seq"])
+
+    manager = InputQueueManager(config=_config(interval=0.5), message_handler=handler)
+    await manager.start()
+    try:
+        start = asyncio.get_running_loop().time()
+        for i in range(50):
+            await manager.enqueue(
+                {"type": "mic-audio-data", "client_uid": "a", "seq": i}
+            )
+        await _drain(manager)
+        elapsed = asyncio.get_running_loop().time() - start
+    finally:
+        await manager.stop()
+
+    assert handled == list(range(50))
+    # 50 messages through the throttled lane would take 25 seconds
+    assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_trigger_keeps_client_order():
+    handled = []
+
+    async def handler(message):
+        handled.append((message["client_uid"], message["type"], message["seq"]))
+
+    manager = InputQueueManager(config=_config(interval=0.05), message_handler=handler)
+    await manager.start()
+    try:
+        await manager.enqueue({"type": "mic-audio-data", "client_uid": "a", "seq": 0})
+        await manager.enqueue({"type": "mic-audio-end", "client_uid": "a", "seq": 1})
+        await manager.enqueue({"type": "mic-audio-data", "client_uid": "a", "seq": 2})
+        await manager.enqueue({"type": "mic-audio-data", "client_uid": "b", "seq": 0})
+        await _drain(manager)
+        status = manager.get_lane_status()
+    finally:
+        await manager.stop()
+
+    # Client a's audio after the trigger waits for it; client b is not held up
+    client_a = [entry for entry in handled if entry[0] == "a"]
+    assert [seq for _, _, seq in client_a] == [0, 1, 2]
+    assert handled.index(("b", "mic-audio-data", 0)) < handled.index(
+        ("a", "mic-audio-data", 2)
+    )
+
+    lanes = {lane["client_uid"]: lane for lane in status["client_lanes"]}
+    assert lanes["a"]["total_received"] == 3
+    assert lanes["a"]["total_processed"] == 2
+    assert lanes["a"]["total_handoffs"] == 1
+    assert status["prioritized"]["total_processed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_dropped_trigger_releases_lane():
+    handled = []
+    gate = asyncio.Event()
+
+    async def handler(message):
+        if message.get("block"):
+            await gate.wait()
+        handled.append(message["seq"])
+
+    config = _config(interval=0.01)
+    config.max_queue_size = 1
+    config.overflow_drop_count = 1
+    manager = InputQueueManager(config=config, message_handler=handler)
+    await manager.start()
+    try:
+        # Occupy the worker, then fill the queue with a trigger from client a
+        await manager.enqueue({"type": "chat", "seq": "blocker", "block": True})
+        await asyncio.sleep(0.05)
+        await manager.enqueue({"type": "text-input", "client_uid": "a", "seq": 0})
+        await manager.enqueue({"type": "heartbeat", "client_uid": "a", "seq": 1})
+        await asyncio.sleep(0.05)
+        # Overflow drops client a's trigger; its lane must resume
+        await manager.enqueue({"type": "chat", "seq": "other"})
+        await asyncio.sleep(0.05)
+        assert 1 in handled
+        gate.set()
+        await _drain(manager)
+    finally:
+        await manager.stop()
+
+    assert 0 not in handled
+
+
+@pytest.mark.asyncio
+async def test_remove_client_stops_lane():
+    manager = InputQueueManager(config=_config())
+    await manager.start()
+    await manager.enqueue({"type": "mic-audio-data", "client_uid": "a"})
+    assert "a" in manager._lanes
+    await manager.remove_client("a")
+    assert "a" not in manager._lanes
+    await manager.stop()
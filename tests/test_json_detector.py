@@ -0,0 +1,102 @@
+"""Tests for the incremental StreamJSONDetector."""
+
+import json
+
+import pytest
+
+from open_llm_vtuber.mcpp.json_detector import StreamJSONDetector
+
+TOOL_CALL = {
+    "mcp_server": "time",
+    "tool": "get_current_time",
+    "arguments": json.dumps({"timezone": "Asia/Seoul"}),
+}
+
+
+def _feed(chunks):
+    detector = StreamJSONDetector()
+    found = []
+    for chunk in chunks:
+        found.extend(detector.process_chunk(chunk))
+    return found, detector
+
+
+def _chars(text):
+    return list(text)
+
+
+@pytest.mark.parametrize("split", [lambda t: [t], _chars])
+def test_detects_object_regardless_of_chunking(split):
+    text = f"Let me check. {json.dumps(TOOL_CALL)} Done."
+    found, _ = _feed(split(text))
+
+    assert found == [TOOL_CALL]
+
+
+@pytest.mark.parametrize("split", [lambda t: [t], _chars])
+def test_braces_and_escapes_inside_strings(split):
+    payload = {"text": 'a } b { c \\" } "quoted" \\\\', "n": {"deep": [1, {"x": "}"}]}}
+    found, _ = _feed(split("prefix " + json.dumps(payload) + " suffix"))
+
+    assert found == [payload]
+
+
+def test_nested_object_is_not_reported_before_outer_closes():
+    found, detector = _feed(['{"a": {"b": 1}', ', "c": 2}'])
+
+    assert found == [{"a": {"b": 1}, "c": 2}]
+    assert detector.get_all_jsons() == found
+
+
+def test_stray_braces_in_prose_do_not_hide_later_objects():
+    found, _ = _feed(["Use { to open a block, ", "then", ' {"ok": true}'])
+
+    assert found == [{"ok": True}]
+
+
+def test_objects_inside_unparsable_spans_are_found():
+    found, _ = _feed(['{"broken": , {"ok": 1}}'])
+
+    assert found == [{"ok": 1}]
+
+
+def test_unterminated_string_gives_way_at_newline():
+    found, _ = _feed(['He said {"oops\n', 'then {"ok": 1}'])
+
+    assert found == [{"ok": 1}]
+
+
+def test_mismatched_quotes_in_prose_do_not_hide_later_objects():
+    found, _ = _feed(['He said {"hi} then {"tool": 1}', ' more "{"tool":2}'])
+
+    assert found == [{"tool": 1}, {"tool": 2}]
+
+
+@pytest.mark.parametrize(
+    "text", ['say {"x" {"tool": 1}', '{"a": {"tool": 1}, "b" oops', '{"\\q {"tool": 1}']
+)
+def test_candidates_that_cannot_be_json_are_rescanned(text):
+    found, detector = _feed(_chars(text))
+
+    assert found == [{"tool": 1}]
+    assert detector.buffer == ""
+
+
+def test_consumed_text_is_not_retained():
+    detector = StreamJSONDetector()
+    detector.process_chunk("plain text " * 1000)
+    assert detector.buffer == ""
+
+    detector.process_chunk('{"partial": "va')
+    assert detector.buffer == '{"partial": "va'
+    assert detector.process_chunk('lue"} tail') == [{"partial": "value"}]
+    assert detector.buffer == ""
+
+
+def test_reset_discards_partial_object():
+    detector = StreamJSONDetector()
+    detector.process_chunk('{"a": "open string {')
+    detector.reset()
+
+    assert detector.process_chunk('{"b": 2}') == [{"b": 2}]
+    assert detector.get_all_jsons() == [{"b": 2}]
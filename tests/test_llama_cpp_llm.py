@@ -0,0 +1,148 @@
+"""Tests for the llama.cpp producer thread, with a stub llama_cpp module."""
+
+import asyncio
+import importlib
+import sys
+import threading
+import time
+import types
+
+import pytest
+from loguru import logger
+
+
+class FakeLlama:
+    """Stands in for llama_cpp.Llama; streams numbered tokens."""
+
+    def __init__(self, model_path, tokens=100, delay=0.0, close_error=None):
+        self.tokens = tokens
+        self.delay = delay
+        self.close_error = close_error
+        self.produced = 0
+        self.closed = threading.Event()
+
+    def set_cache(self, cache):
+        pass
+
+    def create_chat_completion(self, messages, stream):
+        return FakeCompletion(self)
+
+
+class FakeCompletion:
+    def __init__(self, llama: FakeLlama):
+        self.llama = llama
+
+    def __iter__(self):
+        for i in range(self.llama.tokens):
+            if self.llama.delay:
+                time.sleep(self.llama.delay)
+            self.llama.produced += 1
+            yield {"choices": [{"delta": {"content": f"t{i} "}}]}
+
+    def close(self):
+        self.llama.closed.set()
+        if self.llama.close_error:
+            raise self.llama.close_error
+
+
+@pytest.fixture
+def llama_cpp_llm(monkeypatch):
+    fake = types.ModuleType("llama_cpp")
+    fake.Llama = FakeLlama
+    fake.LlamaRAMCache = object
+    monkeypatch.setitem(sys.modules, "llama_cpp", fake)
+    module_name = "open_llm_vtuber.agent.stateless_llm.llama_cpp_llm"
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    module = importlib.import_module(module_name)
+    yield module
+    sys.modules.pop(module_name, None)
+
+
+async def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive(llama_cpp_llm):
+    llm = llama_cpp_llm.LLM("model.gguf", tokens=10, delay=0.02)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.005)
+
+    ticking = asyncio.create_task(ticker())
+    chunks = [chunk async for chunk in llm.chat_completion([], system="sys")]
+    ticking.cancel()
+
+    assert chunks == [f"t{i} " for i in range(10)]
+    # Each token blocks its thread for 20 ms; the loop keeps ticking meanwhile
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.1
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_pauses_the_producer(llama_cpp_llm):
+    llm = llama_cpp_llm.LLM("model.gguf", max_buffered_tokens=2)
+    stream = llm.chat_completion([])
+
+    assert await stream.__anext__() == "t0 "
+    await asyncio.sleep(0.2)
+    # One token handed over, two buffered and at most one waiting to be put
+    assert llm.llm.produced <= 4
+
+    rest = [chunk async for chunk in stream]
+    assert len(rest) == 99
+    await _wait_for(llm.llm.closed.is_set)
+
+
+@pytest.mark.asyncio
+async def test_aclose_stops_generation(llama_cpp_llm):
+    llm = llama_cpp_llm.LLM("model.gguf", max_buffered_tokens=2)
+    stream = llm.chat_completion([])
+    await stream.__anext__()
+    await stream.aclose()
+
+    await _wait_for(llm.llm.closed.is_set)
+    produced = llm.llm.produced
+    await asyncio.sleep(0.1)
+    assert llm.llm.produced == produced < 100
+
+
+@pytest.mark.asyncio
+async def test_cancellation_stops_generation(llama_cpp_llm):
+    llm = llama_cpp_llm.LLM("model.gguf", max_buffered_tokens=2, delay=0.01)
+    started = asyncio.Event()
+
+    async def consume():
+        async for _ in llm.chat_completion([]):
+            started.set()
+
+    task = asyncio.create_task(consume())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await _wait_for(llm.llm.closed.is_set)
+    assert llm.llm.produced < 100
+
+
+@pytest.mark.asyncio
+async def test_producer_failure_is_logged(llama_cpp_llm):
+    llm = llama_cpp_llm.LLM(
+        "model.gguf", tokens=2, close_error=RuntimeError("close failed")
+    )
+    errors = []
+    sink = logger.add(lambda message: errors.append(str(message)), level="ERROR")
+    try:
+        chunks = [chunk async for chunk in llm.chat_completion([])]
+        await _wait_for(lambda: errors)
+    finally:
+        logger.remove(sink)
+
+    assert chunks == ["t0 ", "t1 "]
+    assert "close failed" in errors[0]
@@ -0,0 +1,131 @@
+"""Tests for AsyncLLMWithTemplate streaming against a local completion server."""
+
+import asyncio
+import json
+
+import pytest
+
+from open_llm_vtuber.agent.stateless_llm.stateless_llm_with_template import (
+    AsyncLLMWithTemplate,
+)
+
+
+class CompletionServer:
+    """Minimal llama.cpp-style /completion server streaming SSE chunks."""
+
+    def __init__(self, tokens, delay=0.03):
+        self.tokens = tokens
+        self.delay = delay
+        self.connections = 0
+        self.aborted = asyncio.Event()
+        self.prompts = []
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/completion"
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while await self._respond(reader, writer):
+                pass
+        except ConnectionError:
+            self.aborted.set()
+        finally:
+            writer.close()
+
+    async def _respond(self, reader, writer) -> bool:
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for header in head.decode().split("\r\n"):
+            if header.lower().startswith("content-length:"):
+                length = int(header.split(":")[1])
+        self.prompts.append(json.loads(await reader.readexactly(length))["prompt"])
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        events = [{"content": token, "stop": False} for token in self.tokens]
+        events.append({"content": "", "stop": True})
+        for event in events:
+            if reader.at_eof():
+                self.aborted.set()
+                return False
+            data = f"data: {json.dumps(event)}\n\n".encode()
+            writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+            await writer.drain()
+            await asyncio.sleep(self.delay)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        return True
+
+
+def _messages(text="hi"):
+    return [{"role": "user", "content": text}]
+
+
+@pytest.mark.asyncio
+async def test_streaming_does_not_block_event_loop():
+    tokens = ["Hel", "lo", " there", "!"]
+    async with CompletionServer(tokens, delay=0.05) as server:
+        llm = AsyncLLMWithTemplate(model="test", base_url=server.url)
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        received = [token async for token in llm.chat_completion(_messages())]
+        done.set()
+        await ticker_task
+        await llm.close()
+
+    assert received == tokens
+    assert "<|im_start|>user\nhi<|im_end|>" in server.prompts[0]
+    # ~250 ms of generation; a blocking client would starve the ticker
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_connection_is_reused():
+    async with CompletionServer(["a", "b"], delay=0) as server:
+        llm = AsyncLLMWithTemplate(model="test", base_url=server.url)
+        for _ in range(3):
+            assert [t async for t in llm.chat_completion(_messages())] == ["a", "b"]
+        await llm.close()
+
+    assert len(server.prompts) == 3
+    assert server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_interrupt_closes_stream():
+    async with CompletionServer([f"t{i}" for i in range(100)], delay=0.02) as server:
+        llm = AsyncLLMWithTemplate(model="test", base_url=server.url)
+        stream = llm.chat_completion(_messages())
+        assert await stream.__anext__() == "t0"
+        await stream.aclose()
+
+        await asyncio.wait_for(server.aborted.wait(), timeout=2)
+        await llm.close()
+
+
+@pytest.mark.asyncio
+async def test_eot_token_ends_stream():
+    async with CompletionServer(["ok", "<|im_end|>", "extra"], delay=0) as server:
+        llm = AsyncLLMWithTemplate(model="test", base_url=server.url)
+        received = [t async for t in llm.chat_completion(_messages())]
+        await llm.close()
+
+    assert received == ["ok"]
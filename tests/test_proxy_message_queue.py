@@ -0,0 +1,112 @@
+"""Tests for the event-driven ProxyMessageQueue consumer."""
+
+import asyncio
+
+import pytest
+
+from open_llm_vtuber.proxy_message_queue import ProxyMessageQueue
+
+
+def _text(text: str) -> dict:
+    return {"type": "text-input", "text": text}
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def queue():
+    forwarded = []
+
+    async def forward(message, sender_id):
+        forwarded.append((message["type"], message.get("text"), sender_id))
+
+    q = ProxyMessageQueue()
+    q.initialize(forward)
+    q.forwarded = forwarded
+    yield q
+    q.stop()
+
+
+@pytest.mark.asyncio
+async def test_forwards_without_polling_delay(queue):
+    queue.queue_message(_text("hi"), "a")
+    await _settle()
+    assert queue.forwarded == [
+        ("user-input-transcription", "hi", "a"),
+        ("text-input", "hi", "a"),
+    ]
+    assert queue.conversation_active
+
+
+@pytest.mark.asyncio
+async def test_waits_for_conversation_end(queue):
+    queue.queue_message(_text("first"), "a")
+    await _settle()
+    queue.queue_message(_text("second"), "a")
+    await _settle()
+    assert len(queue.forwarded) == 2
+
+    queue.conversation_active = False
+    await _settle()
+    assert queue.forwarded[-1] == ("text-input", "second", "a")
+
+
+@pytest.mark.asyncio
+async def test_idle_consumer_stays_parked(queue):
+    queue.queue_message(_text("first"), "a")
+    await _settle()
+    queue.conversation_active = False
+    await asyncio.sleep(0.05)
+    # The consumer parks on its event instead of exiting or polling
+    assert not queue._consumer_task.done()
+    queue.queue_message(_text("again"), "a")
+    await _settle()
+    assert queue.forwarded[-1] == ("text-input", "again", "a")
+
+
+@pytest.mark.asyncio
+async def test_coalesces_text_bursts_per_sender():
+    forwarded = []
+
+    async def forward(message, sender_id):
+        if message["type"] == "text-input":
+            forwarded.append((message["text"], sender_id))
+
+    queue = ProxyMessageQueue(coalesce_text_input=True)
+    queue.initialize(forward)
+    queue.queue_message(_text("busy"), "a")
+    await _settle()
+
+    # Queued while the first turn is active
+    for text, sender in [("one", "a"), ("two", "a"), ("three", "b"), ("four", "a")]:
+        queue.queue_message(_text(text), sender)
+
+    for _ in range(3):
+        queue.conversation_active = False
+        await _settle()
+    queue.stop()
+
+    assert forwarded == [
+        ("busy", "a"),
+        ("one\ntwo", "a"),
+        ("three", "b"),
+        ("four", "a"),
+    ]
+
+
+def test_proxy_route_passes_coalescing_flag(monkeypatch):
+    pytest.importorskip("aiohttp")
+    from open_llm_vtuber.routes import websocket_routes
+
+    created = []
+    monkeypatch.setattr(
+        websocket_routes,
+        "ProxyHandler",
+        lambda server_url, **kwargs: created.append((server_url, kwargs)),
+    )
+    websocket_routes.init_proxy_route("ws://server", coalesce_text_input=True)
+
+    assert created == [("ws://server", {"coalesce_text_input": True})]
@@ -0,0 +1,55 @@
+"""Tests for batched Silero-VAD inference against the real model."""
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+silero_vad = pytest.importorskip("silero_vad")
+
+from open_llm_vtuber.vad.silero import SileroVADModel  # noqa: E402
+
+WINDOW = 512
+STEPS = 12
+
+
+def _streams() -> list[np.ndarray]:
+    rng = np.random.default_rng(0)
+    t = np.arange(WINDOW * STEPS) / 16000
+    return [
+        (0.5 * np.sin(2 * np.pi * 220 * t)).astype(np.float32),
+        (0.05 * rng.normal(size=t.size)).astype(np.float32),
+        (0.3 * np.sin(2 * np.pi * 440 * t) * (t > 0.2)).astype(np.float32),
+    ]
+
+
+def _window(stream: np.ndarray, step: int) -> np.ndarray:
+    return stream[step * WINDOW : (step + 1) * WINDOW]
+
+
+class _Session:
+    def __init__(self, model: SileroVADModel):
+        self.rnn_state, self.context = model.initial_state()
+
+
+def test_batched_inference_matches_one_model_per_stream():
+    model = SileroVADModel()
+    streams = _streams()
+    sessions = [_Session(model) for _ in streams]
+
+    batched = np.zeros((STEPS, len(streams)), dtype=np.float32)
+    for step in range(STEPS):
+        # Vary the batch composition so state must survive regrouping
+        groups = [[0, 1, 2]] if step % 3 == 0 else [[2, 0], [1]]
+        for group in groups:
+            windows = np.stack([_window(streams[i], step) for i in group])
+            probs = model.infer(windows, [sessions[i] for i in group])
+            batched[step, group] = probs
+
+    for i, stream in enumerate(streams):
+        reference = silero_vad.load_silero_vad()
+        with torch.no_grad():
+            expected = [
+                float(reference(torch.from_numpy(_window(stream, step)), 16000))
+                for step in range(STEPS)
+            ]
+        assert batched[:, i] == pytest.approx(expected, abs=1e-5)
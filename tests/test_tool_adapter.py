@@ -0,0 +1,126 @@
+"""Tests for MCP tool discovery: parallel startup, warm sessions, schema cache."""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from open_llm_vtuber.mcpp.mcp_client import MCPClient
+from open_llm_vtuber.mcpp.server_registry import ServerRegistry
+from open_llm_vtuber.mcpp.tool_adapter import ToolAdapter
+
+STUB_SERVER = Path(__file__).parent / "mcp_stub_server.py"
+
+
+def _registry(tmp_path, startup_delay=0.0, names=("stub",), **server_options):
+    """Registry of stub servers that log each process start to tmp_path."""
+    servers = {
+        name: {
+            "command": sys.executable,
+            "args": [str(STUB_SERVER)],
+            "env": {
+                "STUB_STARTUP_DELAY": str(startup_delay),
+                "STUB_START_LOG": str(tmp_path / f"{name}.log"),
+            },
+            **server_options,
+        }
+        for name in names
+    }
+    config = tmp_path / "mcp_servers.json"
+    config.write_text(json.dumps({"mcp_servers": servers}))
+    return ServerRegistry(config)
+
+
+def _starts(tmp_path, name="stub"):
+    log = tmp_path / f"{name}.log"
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+def _adapter(tmp_path, registry):
+    return ToolAdapter(registry, schema_cache_path=tmp_path / "tool_cache.json")
+
+
+@pytest.mark.asyncio
+async def test_servers_start_concurrently(tmp_path):
+    names = ("a", "b", "c")
+    adapter = _adapter(tmp_path, _registry(tmp_path, startup_delay=0.8, names=names))
+
+    start = time.monotonic()
+    servers_info, _ = await adapter.get_server_and_tool_info(list(names))
+    elapsed = time.monotonic() - start
+
+    # Roughly one cold start, not three back to back
+    assert elapsed < 2.0
+    assert set(servers_info) == set(names)
+    assert set(servers_info["a"]) == {"lookup", "fail"}
+
+
+@pytest.mark.asyncio
+async def test_discovery_keeps_sessions_warm_for_the_client(tmp_path):
+    registry = _registry(tmp_path)
+    adapter = _adapter(tmp_path, registry)
+    async with MCPClient(registry) as client:
+        # Discovery starts the server from tasks other than this one
+        await asyncio.create_task(adapter.get_server_and_tool_info(["stub"], client))
+        result = await client.call_tool("stub", "lookup", {"key": "a"})
+
+    assert result["content_items"][0]["text"] == "a#1"
+    assert _starts(tmp_path) == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_schemas_skip_discovery(tmp_path):
+    first = await _adapter(tmp_path, _registry(tmp_path)).get_tools(["stub"])
+
+    registry = _registry(tmp_path)
+    async with MCPClient(registry) as client:
+        second = await _adapter(tmp_path, registry).get_tools(["stub"], client)
+        assert client.active_sessions == {}
+
+    assert second == first
+    assert "lookup" in first[0]
+    assert _starts(tmp_path) == 1
+
+
+@pytest.mark.asyncio
+async def test_changed_launch_settings_invalidate_the_cache(tmp_path):
+    await _adapter(tmp_path, _registry(tmp_path)).get_tools(["stub"])
+    await _adapter(tmp_path, _registry(tmp_path, cwd=str(tmp_path))).get_tools(["stub"])
+
+    assert _starts(tmp_path) == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_up_starts_cached_servers(tmp_path):
+    await _adapter(tmp_path, _registry(tmp_path)).get_tools(["stub"])
+
+    registry = _registry(tmp_path)
+    adapter = _adapter(tmp_path, registry)
+    async with MCPClient(registry) as client:
+        await adapter.get_tools(["stub"], client)
+        await adapter.warm_up(["stub"], client)
+        assert set(client.active_sessions) == {"stub"}
+
+    assert _starts(tmp_path) == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_server_times_out_without_blocking_others(tmp_path):
+    registry = _registry(tmp_path, names=("fast",))
+    registry.servers.update(
+        _registry(
+            tmp_path, startup_delay=5, names=("slow",), startup_timeout=0.5
+        ).servers
+    )
+    adapter = _adapter(tmp_path, registry)
+
+    start = time.monotonic()
+    servers_info, tools = await adapter.get_server_and_tool_info(["fast", "slow"])
+
+    assert time.monotonic() - start < 3
+    assert servers_info["slow"] == {}
+    assert set(servers_info["fast"]) == {"lookup", "fail"}
+    assert {tool.related_server for tool in tools.values()} == {"fast"}
@@ -0,0 +1,104 @@
+"""Tests for concurrent tool execution and result caching in ToolExecutor."""
+
+import json
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+from open_llm_vtuber.mcpp.mcp_client import MCPClient
+from open_llm_vtuber.mcpp.server_registry import ServerRegistry
+from open_llm_vtuber.mcpp.tool_executor import ToolExecutor
+from open_llm_vtuber.mcpp.tool_manager import ToolManager
+from open_llm_vtuber.mcpp.types import FormattedTool
+
+STUB_SERVER = Path(__file__).parent / "mcp_stub_server.py"
+
+
+@asynccontextmanager
+async def stub_executor(tmp_path, **server_options):
+    config = tmp_path / "mcp_servers.json"
+    server = {"command": sys.executable, "args": [str(STUB_SERVER)], **server_options}
+    config.write_text(json.dumps({"mcp_servers": {"stub": server}}))
+
+    async with MCPClient(ServerRegistry(config)) as client:
+        # Start the server up front so timings cover only the tool calls
+        await client.list_tools("stub")
+        tools = {
+            name: FormattedTool(input_schema={}, related_server="stub")
+            for name in ("lookup", "fail")
+        }
+        yield ToolExecutor(client, ToolManager(initial_tools_dict=tools))
+
+
+def _call(tool_id, key, delay=0.0, name="lookup"):
+    return {"id": tool_id, "name": name, "input": {"key": key, "delay": delay}}
+
+
+async def _run(executor, calls):
+    updates = [u async for u in executor.execute_tools(calls, caller_mode="Prompt")]
+    return updates[:-1], updates[-1]["results"]
+
+
+@pytest.mark.asyncio
+async def test_calls_run_concurrently_and_keep_order(tmp_path):
+    calls = [_call(f"t{i}", f"k{i}", delay) for i, delay in enumerate([0.9, 0.6, 0.3])]
+    async with stub_executor(tmp_path) as executor:
+        start = time.monotonic()
+        statuses, results = await _run(executor, calls)
+        elapsed = time.monotonic() - start
+
+    # Roughly the slowest call, not the 1.8 s sum
+    assert elapsed < 1.4
+    assert [r["tool_id"] for r in results] == ["t0", "t1", "t2"]
+    assert [r["content"].split("#")[0] for r in results] == ["k0", "k1", "k2"]
+    finished = [s["tool_id"] for s in statuses if s["status"] == "completed"]
+    assert finished == ["t2", "t1", "t0"]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_per_server(tmp_path):
+    calls = [_call(f"t{i}", f"k{i}", 0.2) for i in range(3)]
+    async with stub_executor(tmp_path, max_concurrency=1) as executor:
+        start = time.monotonic()
+        _, results = await _run(executor, calls)
+        elapsed = time.monotonic() - start
+
+    assert elapsed >= 0.6
+    assert len(results) == 3
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_by_canonical_arguments(tmp_path):
+    reordered = {"id": "t1", "name": "lookup", "input": {"delay": 0.0, "key": "a"}}
+    async with stub_executor(tmp_path, cache_ttl={"lookup": 60}) as executor:
+        _, first = await _run(executor, [_call("t0", "a")])
+        _, second = await _run(executor, [reordered, _call("t2", "b")])
+
+    assert second[0]["content"] == first[0]["content"] == "a#1"
+    assert second[1]["content"] == "b#2"
+    assert executor.cache_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_execution(tmp_path):
+    calls = [_call(f"t{i}", "a", 0.2) for i in range(3)]
+    async with stub_executor(tmp_path, cache_ttl={"lookup": 60}) as executor:
+        _, results = await _run(executor, calls)
+
+    assert {r["content"] for r in results} == {"a#1"}
+    assert executor.cache_hits == 2
+
+
+@pytest.mark.asyncio
+async def test_uncached_and_failed_calls_are_not_reused(tmp_path):
+    calls = [_call("t0", "a"), _call("t1", "a"), _call("t2", "x", name="fail")]
+    async with stub_executor(tmp_path, cache_ttl={"fail": 60}) as executor:
+        _, results = await _run(executor, calls)
+        _, retried = await _run(executor, [_call("t3", "x", name="fail")])
+
+    assert sorted(r["content"] for r in results[:2]) == ["a#1", "a#2"]
+    assert results[2]["is_error"] and retried[0]["is_error"]
+    assert executor.cache_hits == 0
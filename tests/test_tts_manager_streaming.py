@@ -0,0 +1,165 @@
+"""Tests for streaming TTS delivery in TTSTaskManager."""
+
+import asyncio
+import base64
+import io
+import json
+import os
+import wave
+
+import numpy as np
+import pytest
+
+from open_llm_vtuber.agent.output_types import Actions, DisplayText
+from open_llm_vtuber.conversations.tts_manager import TTSTaskManager
+from open_llm_vtuber.tts.tts_interface import AudioChunk, TTSInterface
+
+RATE = 16000
+
+
+def _tone(ms: int, amplitude: float = 0.5) -> bytes:
+    n = RATE * ms // 1000
+    samples = amplitude * np.sin(np.linspace(0, 2 * np.pi * 440 * ms / 1000, n))
+    return (samples * 32767).astype("<i2").tobytes()
+
+
+class StreamingTTS(TTSInterface):
+    supports_streaming = True
+
+    def __init__(self, tmp_path, chunks_per_text, delay=0.0, fail=False):
+        super().__init__(cache_dir=str(tmp_path))
+        self.chunks_per_text = chunks_per_text
+        self.delay = delay
+        self.fail = fail
+        self.generated_files = []
+
+    async def async_stream_audio(self, text):
+        if self.fail:
+            raise ConnectionError("no pcm support")
+        for _ in range(self.chunks_per_text[text]):
+            await asyncio.sleep(self.delay)
+            yield AudioChunk(pcm=_tone(100), sample_rate=RATE)
+
+    def generate_audio(self, text, file_name_no_ext=None):
+        path = self.generate_cache_file_name(file_name_no_ext, "wav")
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(RATE)
+            f.writeframes(_tone(200))
+        self.generated_files.append(path)
+        return path
+
+
+class Recorder:
+    def __init__(self):
+        self.payloads = []
+        self.times = []
+
+    async def __call__(self, message):
+        self.payloads.append(json.loads(message))
+        self.times.append(asyncio.get_running_loop().time())
+
+
+async def _speak(manager, engine, send, text, actions=None):
+    await manager.speak(
+        tts_text=text,
+        display_text=DisplayText(text=text),
+        actions=actions,
+        live2d_model=None,
+        tts_engine=engine,
+        websocket_send=send,
+    )
+
+
+async def _drain(manager):
+    await asyncio.gather(*manager.task_list)
+    await manager._payload_queue.join()
+    manager.clear()
+
+
+def _duration_ms(payload):
+    with wave.open(io.BytesIO(base64.b64decode(payload["audio"]))) as f:
+        return f.getnframes() * 1000 // f.getframerate()
+
+
+@pytest.mark.asyncio
+async def test_frames_are_forwarded_in_sentence_order(tmp_path):
+    # The first sentence streams slowly, the second finishes immediately
+    engine = StreamingTTS(tmp_path, {"first one": 20, "second": 3}, delay=0.01)
+    send = Recorder()
+    manager = TTSTaskManager()
+    await _speak(manager, engine, send, "first one", Actions(expressions=["happy"]))
+    await _speak(manager, engine, send, "second")
+    await _drain(manager)
+
+    # The subtitle comes with each sentence's first frame only
+    texts = [(p["display_text"] or {}).get("text") for p in send.payloads]
+    assert texts == ["first one", None, None, "second"]
+    # 2 s in 100 ms chunks: a short first frame (>= 250 ms), then 1 s frames
+    assert [_duration_ms(p) for p in send.payloads[:3]] == [300, 1000, 700]
+    assert send.payloads[0]["actions"] == {"expressions": ["happy"]}
+    assert all(p["actions"] is None for p in send.payloads[1:3])
+    assert all(max(p["volumes"]) <= 1.0 for p in send.payloads)
+    assert engine.generated_files == []
+
+
+@pytest.mark.asyncio
+async def test_first_frame_is_sent_before_synthesis_finishes(tmp_path):
+    engine = StreamingTTS(tmp_path, {"long sentence": 20}, delay=0.01)
+    send = Recorder()
+    manager = TTSTaskManager()
+    loop = asyncio.get_running_loop()
+    await _speak(manager, engine, send, "long sentence")
+    await asyncio.gather(*manager.task_list)
+    finished = loop.time()
+    await _drain(manager)
+
+    assert send.times[0] < finished - 0.1
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_file_when_streaming_fails(tmp_path):
+    engine = StreamingTTS(tmp_path, {"hello": 1}, fail=True)
+    send = Recorder()
+    manager = TTSTaskManager()
+    await _speak(manager, engine, send, "hello")
+    await _drain(manager)
+
+    [payload] = send.payloads
+    assert _duration_ms(payload) == 200
+    assert payload["display_text"]["text"] == "hello"
+    assert len(engine.generated_files) == 1
+    assert not os.path.exists(engine.generated_files[0])
+
+
+@pytest.mark.asyncio
+async def test_file_based_engine_sends_one_frame_per_sentence(tmp_path):
+    engine = StreamingTTS(tmp_path, {})
+    engine.supports_streaming = False
+    send = Recorder()
+    manager = TTSTaskManager()
+    await _speak(manager, engine, send, "first", Actions(expressions=["happy"]))
+    await _speak(manager, engine, send, "second")
+    await _drain(manager)
+
+    assert [p["display_text"]["text"] for p in send.payloads] == ["first", "second"]
+    assert [_duration_ms(p) for p in send.payloads] == [200, 200]
+    assert send.payloads[0]["actions"] == {"expressions": ["happy"]}
+    assert max(send.payloads[0]["volumes"]) == pytest.approx(1.0)
+    assert not any(os.path.exists(path) for path in engine.generated_files)
+
+
+@pytest.mark.asyncio
+async def test_missing_audio_sends_silent_payload(tmp_path):
+    engine = StreamingTTS(tmp_path, {})
+    engine.supports_streaming = False
+    engine.generate_audio = lambda text, file_name_no_ext=None: None
+    send = Recorder()
+    manager = TTSTaskManager()
+    await _speak(manager, engine, send, "hello")
+    await _drain(manager)
+
+    [payload] = send.payloads
+    assert payload["audio"] is None
+    assert payload["display_text"]["text"] == "hello"
@@ -0,0 +1,65 @@
+"""Tests for VADBatchScheduler batching of concurrent VAD sessions."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from open_llm_vtuber.vad.batch_scheduler import VADBatchScheduler
+
+
+class CountingModel:
+    """Stand-in batched model: probability = window mean, state = call count."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def infer(self, windows, states):
+        self.batch_sizes.append(len(states))
+        for state in states:
+            state["calls"] += 1
+        return windows.mean(axis=1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_share_batches():
+    model = CountingModel()
+    scheduler = VADBatchScheduler(model.infer, max_batch_size=8)
+    sessions = [{"calls": 0} for _ in range(4)]
+
+    async def stream(i, session):
+        probs = []
+        for step in range(5):
+            window = np.full(512, i + step / 10, dtype=np.float32)
+            probs.append(await scheduler.submit(session, window))
+        return probs
+
+    results = await asyncio.gather(*(stream(i, s) for i, s in enumerate(sessions)))
+
+    for i, probs in enumerate(results):
+        assert probs == pytest.approx([i + step / 10 for step in range(5)])
+    assert all(session["calls"] == 5 for session in sessions)
+    # One model call per step for all four sessions, not one per window
+    assert model.batch_sizes == [4] * 5
+    assert scheduler.average_batch_size == 4
+
+
+@pytest.mark.asyncio
+async def test_batches_respect_max_size():
+    model = CountingModel()
+    scheduler = VADBatchScheduler(model.infer, max_batch_size=3)
+    window = np.zeros(512, dtype=np.float32)
+
+    await asyncio.gather(*(scheduler.submit({"calls": 0}, window) for _ in range(7)))
+
+    assert model.batch_sizes == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_inference_error_reaches_submitters():
+    def failing(windows, states):
+        raise RuntimeError("model failed")
+
+    scheduler = VADBatchScheduler(failing)
+    with pytest.raises(RuntimeError, match="model failed"):
+        await scheduler.submit({}, np.zeros(512, dtype=np.float32))
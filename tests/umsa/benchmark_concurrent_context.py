@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+UMSA concurrent build_context benchmark
+
+Runs many simulated clients calling MemoryService.build_context() against one
+SQLite store while a background writer commits consolidation-sized
+transactions, and reports throughput and latency percentiles for each read
+pool size. A deterministic hashing embedder replaces the sentence-transformers
+model so the numbers reflect storage and retrieval, not model inference.
+
+Usage:
+    python tests/umsa/benchmark_concurrent_context.py --clients 32 --pools 0 4
+"""
+
+import argparse
+import asyncio
+import hashlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.open_llm_vtuber.umsa.config import MemoryConfig  # noqa: E402
+from src.open_llm_vtuber.umsa.embedding import EmbeddingService  # noqa: E402
+from src.open_llm_vtuber.umsa.memory_service import MemoryService  # noqa: E402
+
+WORDS = (
+    "cats dogs music games anime coffee rain travel coding stream chat "
+    "pizza guitar movies books night morning football painting ramen"
+).split()
+
+
+class HashEmbeddingService(EmbeddingService):
+    """Bag-of-words hashing embedder with the EmbeddingService interface."""
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        out = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in text.lower().split():
+                h = int(hashlib.md5(word.encode()).hexdigest(), 16)
+                out[i, h % self.dimension] += 1.0 if h & 1 else -1.0
+        out /= np.maximum(np.linalg.norm(out, axis=1, keepdims=True), 1e-6)
+        return out.tolist()
+
+
+def make_text(rng: np.random.Generator) -> str:
+    return " ".join(rng.choice(WORDS, size=6))
+
+
+async def seed(service: MemoryService, nodes: int, entities: int) -> None:
+    """Insert ``nodes`` embedded facts spread over ``entities`` viewers."""
+    store = await service._ensure_store()
+    rng = np.random.default_rng(0)
+    for e in range(entities):
+        await store.touch_entity(f"viewer{e}", "direct")
+    batch = []
+    for i in range(nodes):
+        content = make_text(rng)
+        batch.append(
+            {
+                "node_id": f"n{i}",
+                "entity_id": f"viewer{i % entities}",
+                "node_type": "atomic_fact",
+                "content": content,
+                "importance": float(rng.uniform(0.2, 0.9)),
+                "embedding": EmbeddingService.serialize_embedding(
+                    service._embedding_service.encode_single(content)
+                ),
+            }
+        )
+        if len(batch) == 1000:
+            await store.insert_knowledge_nodes(batch)
+            batch = []
+    await store.insert_knowledge_nodes(batch)
+
+
+async def writer(service: MemoryService, stop: asyncio.Event, interval: float):
+    """Commit a consolidation-sized transaction every ``interval`` seconds."""
+    store = await service._ensure_store()
+    rng = np.random.default_rng(1)
+    i = 0
+    while not stop.is_set():
+        async with store.transaction():
+            for _ in range(20):
+                await store.insert_knowledge_node(
+                    {
+                        "node_id": f"w{i}",
+                        "entity_id": None,
+                        "node_type": "episode",
+                        "content": make_text(rng),
+                    }
+                )
+                i += 1
+            await store.insert_knowledge_edges(
+                [
+                    {
+                        "edge_id": f"we{j}",
+                        "source_node_id": f"w{j}",
+                        "target_node_id": f"w{j - 1}",
+                    }
+                    for j in range(i - 19, i)
+                ]
+            )
+        await asyncio.sleep(interval)
+    return i
+
+
+async def client(
+    service: MemoryService, client_id: int, calls: int, entities: int
+) -> list[float]:
+    rng = np.random.default_rng(100 + client_id)
+    latencies = []
+    for _ in range(calls):
+        messages = [{"role": "user", "content": make_text(rng)}]
+        start = time.perf_counter()
+        await service.build_context(
+            messages, entity_id=f"viewer{client_id % entities}", max_tokens=2048
+        )
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run(args: argparse.Namespace, pool_size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = MemoryConfig(
+            enabled=True,
+            storage={
+                "sqlite_db_path": str(Path(tmpdir) / "bench.db"),
+                "read_pool_size": pool_size,
+            },
+            embedding={"dimension": args.dim},
+            # Measure full retrievals rather than deadline-truncated ones
+            retrieval={"max_latency_ms": 60_000},
+        )
+        service = MemoryService(config=config)
+        service._embedding_service = HashEmbeddingService(config.embedding)
+        await seed(service, args.nodes, args.entities)
+
+        # Warm the vector index so the first clients don't pay the load
+        retriever = await service._ensure_retriever()
+        await retriever.retrieve("warmup", entity_id=None)
+
+        stop = asyncio.Event()
+        writer_task = asyncio.create_task(writer(service, stop, args.write_interval))
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                client(service, c, args.calls, args.entities)
+                for c in range(args.clients)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        stop.set()
+        written = await writer_task
+        await service.close()
+
+    latencies = np.array([lat for r in results for lat in r]) * 1000
+    print(
+        f"{pool_size:>6} {len(latencies) / elapsed:>12.1f} "
+        f"{np.percentile(latencies, 50):>10.1f} "
+        f"{np.percentile(latencies, 95):>10.1f} "
+        f"{np.percentile(latencies, 99):>10.1f} {written:>10}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="UMSA concurrent context benchmark")
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--entities", type=int, default=50)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--write-interval", type=float, default=0.01)
+    parser.add_argument("--pools", type=int, nargs="+", default=[0, 4])
+    args = parser.parse_args()
+
+    # Per-call INFO/DEBUG logging would dominate the measurement
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(
+        f"{args.clients} clients x {args.calls} build_context calls, "
+        f"{args.nodes} nodes, concurrent writer every {args.write_interval}s"
+    )
+    print("=" * 64)
+    print(
+        f"{'pool':>6} {'calls/s':>12} {'p50 (ms)':>10} {'p95 (ms)':>10} "
+        f"{'p99 (ms)':>10} {'written':>10}"
+    )
+    print("-" * 64)
+    for pool_size in args.pools:
+        await run(args, pool_size)
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+UMSA regex extraction throughput benchmark
+
+Runs a multilingual live-chat corpus through RegexExtractor and reports
+messages per second for the previous path (every pattern, unbounded leading
+groups) and the trigger-prefiltered one, plus the slowest single message.
+
+By default a synthetic corpus is generated: mostly short Korean/English/
+Japanese chatter and emotes, some memory-bearing lines, and the occasional
+long copy-paste line. Pass --corpus to use a recorded chat log instead (one
+message per line, UTF-8).
+
+Usage:
+    python tests/umsa/benchmark_regex_extractor.py --messages 5000
+    python tests/umsa/benchmark_regex_extractor.py --corpus chat_log.txt
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.open_llm_vtuber.umsa.regex_extractor import (  # noqa: E402
+    _MAX_LEADING_CAPTURE,
+    _PATTERNS,
+    RegexExtractor,
+)
+
+CHATTER = [
+    "ㅋㅋㅋㅋㅋㅋ",
+    "오늘 방송 재밌다",
+    "안녕하세요~",
+    "와 대박",
+    "lol",
+    "gg",
+    "hi chat",
+    "that was so clutch",
+    "KEKW",
+    "草",
+    "こんにちは！",
+    "今日も配信ありがとう",
+    "888888",
+    "❤️❤️❤️",
+    "first time here, love the vibe",
+]
+MEMORY_LINES = [
+    "나는 파이썬 좋아해",
+    "요즘 기타 배우고 있어",
+    "서울에 살아요",
+    "제 이름은 민수야",
+    "I really like cats!",
+    "I'm a nurse.",
+    "My name is Alex",
+    "I just started running",
+    "I have a dog named Max.",
+]
+COPY_PASTA = (
+    "이 방송 보는 사람들 다 복받을거야 오늘도 즐거운 하루 보내고 내일도 또 오자 "
+    "this is the best stream on the whole platform and everyone here is awesome "
+)
+
+
+def make_corpus(count: int) -> list[str]:
+    rng = random.Random(0)
+    corpus = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.01:
+            corpus.append(COPY_PASTA * rng.randint(2, 4))
+        elif roll < 0.11:
+            corpus.append(rng.choice(MEMORY_LINES))
+        else:
+            corpus.append(" ".join(rng.choices(CHATTER, k=rng.randint(1, 3))))
+    return corpus
+
+
+def legacy_extractor() -> RegexExtractor:
+    """Every pattern, with the original unbounded leading groups."""
+    bounded = f"(.{{1,{_MAX_LEADING_CAPTURE}}}?)"
+    entries = tuple(
+        replace(
+            entry,
+            pattern=re.compile(
+                entry.pattern.pattern.replace(bounded, "(.+?)", 1), re.IGNORECASE
+            ),
+            triggers=(),
+        )
+        for entry in _PATTERNS
+    )
+    return RegexExtractor(_patterns=entries)
+
+
+def run(extractor: RegexExtractor, corpus: list[str]) -> tuple[float, float, int]:
+    """Return (messages/s, slowest message ms, extractions)."""
+    extracted = 0
+    slowest = 0.0
+    start = time.perf_counter()
+    for message in corpus:
+        t = time.perf_counter()
+        extracted += len(extractor.extract(message))
+        slowest = max(slowest, time.perf_counter() - t)
+    elapsed = time.perf_counter() - start
+    return len(corpus) / elapsed, slowest * 1000, extracted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="RegexExtractor throughput")
+    parser.add_argument("--messages", type=int, default=5_000)
+    parser.add_argument("--corpus", type=Path, default=None)
+    args = parser.parse_args()
+
+    if args.corpus:
+        lines = args.corpus.read_text(encoding="utf-8").splitlines()
+        corpus = [line for line in lines if line.strip()]
+    else:
+        corpus = make_corpus(args.messages)
+
+    print(f"{len(corpus)} messages, {sum(map(len, corpus))} chars")
+    print("=" * 64)
+    print(f"{'extractor':<22} {'msg/s':>12} {'slowest ms':>12} {'results':>10}")
+    print("-" * 64)
+    rates = {}
+    for name, extractor in [
+        ("all patterns (old)", legacy_extractor()),
+        ("trigger prefilter", RegexExtractor()),
+    ]:
+        rate, slowest, extracted = run(extractor, corpus)
+        rates[name] = rate
+        print(f"{name:<22} {rate:>12,.0f} {slowest:>12.2f} {extracted:>10}")
+    print("-" * 64)
+    speedup = rates["trigger prefilter"] / rates["all patterns (old)"]
+    print(f"throughput speedup: {speedup:.1f}x")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+UMSA token counting benchmark
+
+Builds a mixed Korean/English context of roughly 32k tokens and times the
+token-budget hot path: the CJK estimator (per-character loop vs regex), text
+truncation (the old 10%-trim loop vs TokenCounter.truncate) and a full
+ContextAssembler.assemble_split() call with a cold and a warm count cache.
+
+Usage:
+    python tests/umsa/benchmark_token_counter.py --tokens 32000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.open_llm_vtuber.umsa.context_assembler import ContextAssembler  # noqa: E402
+from src.open_llm_vtuber.umsa.token_counter import TokenCounter  # noqa: E402
+
+LINES = [
+    "오늘 방송 정말 재밌었어요! 다음에도 꼭 올게요.",
+    "What game are we playing next week? I vote for the horror one.",
+    "고양이 사진 보여주세요 ㅋㅋㅋ 너무 귀여워요",
+    "The new song cover was amazing, the harmonies at the end were great.",
+]
+
+
+def legacy_estimate(text: str) -> int:
+    """The per-character estimator that regex counting replaced."""
+    cjk_count = 0
+    for char in text:
+        cp = ord(char)
+        if (
+            0x4E00 <= cp <= 0x9FFF
+            or 0xAC00 <= cp <= 0xD7AF
+            or 0x3040 <= cp <= 0x309F
+            or 0x30A0 <= cp <= 0x30FF
+        ):
+            cjk_count += 1
+    non_cjk = len(text) - cjk_count
+    return max(1, (non_cjk // 4) + (cjk_count // 2))
+
+
+def legacy_fit_text(text: str, max_tokens: int) -> str:
+    """The 90%-estimate-then-trim-10% loop that truncate() replaced."""
+    current = legacy_estimate(text)
+    if current <= max_tokens:
+        return text
+    fitted = text[: int(max_tokens * len(text) / max(current, 1) * 0.9)]
+    while legacy_estimate(fitted) > max_tokens and fitted:
+        fitted = fitted[: int(len(fitted) * 0.9)]
+    return fitted
+
+
+def make_messages(tokens: int) -> list[dict]:
+    messages = []
+    total = 0
+    i = 0
+    while total < tokens:
+        content = " ".join(LINES[(i + k) % len(LINES)] for k in range(3))
+        messages.append(
+            {"role": "user" if i % 2 == 0 else "assistant", "content": content}
+        )
+        total += legacy_estimate(content)
+        i += 1
+    return messages
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="UMSA token counting benchmark")
+    parser.add_argument("--tokens", type=int, default=32_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    messages = make_messages(args.tokens)
+    text = "\n".join(m["content"] for m in messages)
+    budget = args.tokens // 3
+    counter = TokenCounter()
+    backend = "tiktoken" if counter._encoder else "estimator"
+
+    print(
+        f"{len(messages)} messages, {len(text)} chars, "
+        f"~{legacy_estimate(text)} tokens ({backend})"
+    )
+    print("=" * 60)
+    print(f"{'operation':<36} {'ms/call':>10} {'speedup':>10}")
+    print("-" * 60)
+
+    def row(name: str, old_ms: float, new_ms: float) -> None:
+        print(f"{name + ' (old)':<36} {old_ms:>10.2f}")
+        print(f"{name + ' (new)':<36} {new_ms:>10.2f} {old_ms / new_ms:>9.1f}x")
+
+    row(
+        "estimate full text",
+        timed(lambda: legacy_estimate(text), args.repeat),
+        timed(lambda: TokenCounter._estimate_tokens(text), args.repeat),
+    )
+
+    def uncached(fn):
+        def run():
+            counter._cache.clear()
+            fn()
+
+        return run
+
+    assembler = ContextAssembler(total_tokens=args.tokens, token_counter=counter)
+    row(
+        "fit text to 1/3 budget",
+        timed(lambda: legacy_fit_text(text, budget), args.repeat),
+        timed(uncached(lambda: assembler._fit_text(text, budget)), args.repeat),
+    )
+    print(
+        f"{'  tokens kept (old / new)':<36} "
+        f"{legacy_estimate(legacy_fit_text(text, budget)):>10} "
+        f"{counter.count(counter.truncate(text, budget)):>10}"
+    )
+
+    def assemble():
+        assembler.assemble_split(
+            system_prompt="You are a friendly VTuber. " * 50,
+            recent_messages=messages,
+            episodic_summary=text[:2000],
+        )
+
+    row(
+        "assemble_split (cold vs warm cache)",
+        timed(uncached(assemble), args.repeat),
+        timed(assemble, args.repeat),
+    )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+UMSA vector index benchmark
+
+Compares the exact VectorIndex against IVFVectorIndex on synthetic clustered
+embeddings: build time, per-query latency and recall@k of the approximate
+backend measured against the exact results.
+
+Usage:
+    python tests/umsa/benchmark_vector_index.py --nodes 100000 --dim 768
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.open_llm_vtuber.umsa.storage.vector_index import (  # noqa: E402
+    IVFVectorIndex,
+    VectorIndex,
+)
+
+
+def make_embeddings(n: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    """Generate normalized embeddings grouped around random topic centers."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    data = centers[rng.integers(0, clusters, n)]
+    data += 0.5 * rng.normal(size=(n, dim)).astype(np.float32)
+    data /= np.linalg.norm(data, axis=1, keepdims=True)
+    return data
+
+
+def build(index: VectorIndex, data: np.ndarray) -> float:
+    """Bulk-load the index and return the elapsed seconds."""
+    rows = [(f"n{i}", "bench", row.tobytes()) for i, row in enumerate(data)]
+    start = time.perf_counter()
+    index.load(rows, entity_id="bench")
+    return time.perf_counter() - start
+
+
+def run_queries(
+    index: VectorIndex, queries: np.ndarray, k: int
+) -> tuple[list[set[str]], float]:
+    """Run all queries and return (result id sets, mean latency in ms)."""
+    results = []
+    start = time.perf_counter()
+    for q in queries:
+        results.append({nid for nid, _ in index.search(q, "bench", k=k)})
+    elapsed = time.perf_counter() - start
+    return results, elapsed / len(queries) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="UMSA vector index benchmark")
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--clusters", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    args = parser.parse_args()
+
+    print(f"Generating {args.nodes} x {args.dim} embeddings...")
+    data = make_embeddings(args.nodes, args.dim, args.clusters, seed=0)
+    queries = make_embeddings(args.queries, args.dim, args.clusters, seed=1)
+
+    exact = VectorIndex()
+    build_s = build(exact, data)
+    truth, exact_ms = run_queries(exact, queries, args.k)
+
+    print("=" * 60)
+    print(f"{'backend':<20} {'build (s)':>10} {'query (ms)':>12} {'recall@k':>10}")
+    print("-" * 60)
+    print(f"{'exact':<20} {build_s:>10.2f} {exact_ms:>12.3f} {1.0:>10.3f}")
+
+    for nprobe in args.nprobe:
+        ivf = IVFVectorIndex(nprobe=nprobe)
+        build_s = build(ivf, data)
+        approx, ivf_ms = run_queries(ivf, queries, args.k)
+        recall = np.mean([len(t & a) / args.k for t, a in zip(truth, approx)])
+        label = f"ivf nprobe={nprobe}"
+        print(f"{label:<20} {build_s:>10.2f} {ivf_ms:>12.3f} {recall:>10.3f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
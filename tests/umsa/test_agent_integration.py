@@ -7,13 +7,22 @@ service is not configured.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
-
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from open_llm_vtuber.config_manager.tts_preprocessor import (
+    TranslatorConfig,
+    TTSPreprocessorConfig,
+)
+from open_llm_vtuber.conversations.conversation_utils import (
+    create_batch_input,
+    process_user_input,
+)
 from open_llm_vtuber.umsa.config import MemoryConfig
 
 
-def _make_agent(memory_config: MemoryConfig | None = None):
+def _make_agent(memory_config: MemoryConfig | None = None, **kwargs):
     """Create a BasicMemoryAgent with mocked LLM and Live2D dependencies.
 
     We patch the heavy constructor side-effects (LLM binding, tool formatting)
@@ -33,6 +42,7 @@ def _make_agent(memory_config: MemoryConfig | None = None):
         system="You are a test assistant.",
         live2d_model=mock_live2d,
         memory_config=memory_config,
+        **kwargs,
     )
     return agent
 
@@ -171,3 +181,71 @@ class TestUpdateStreamContext:
 
         assert "viewer_a" in sc.active_viewers
         assert "viewer_b" in sc.active_viewers
+
+
+class TestPrefetchContext:
+    """Tests for prefetching memory retrieval between ASR and chat()."""
+
+    async def test_chat_reuses_prefetched_retrieval(self, tmp_path):
+        """The retrieval started after ASR is the one chat() awaits.
+
+        The transcript carries stray whitespace and the turn has an image, so
+        the raw text differs from the prompt chat() builds.
+        """
+        config = MemoryConfig(
+            enabled=True,
+            storage={"sqlite_db_path": str(tmp_path / "memory.db")},
+            extraction={"enabled": False},
+        )
+        agent = _make_agent(
+            memory_config=config,
+            tts_preprocessor_config=TTSPreprocessorConfig(
+                remove_special_char=True,
+                translator_config=TranslatorConfig(
+                    translate_audio=False, translate_provider="deeplx"
+                ),
+            ),
+        )
+
+        async def reply(messages, system):
+            yield "Cats are great."
+
+        agent._llm.chat_completion = reply
+
+        service = agent._memory_service
+        queries = []
+        original_retrieve = service._retrieve
+
+        async def spy_retrieve(query, entity_id):
+            queries.append(query)
+            return await original_retrieve(query, entity_id)
+
+        service._retrieve = spy_retrieve
+
+        asr = MagicMock()
+        asr.async_transcribe_np = AsyncMock(return_value="  tell me about cats \n")
+        images = [
+            {
+                "source": "upload",
+                "data": "data:image/png;base64,AAAA",
+                "mime_type": "image/png",
+            }
+        ]
+        try:
+            input_text = await process_user_input(
+                np.zeros(160, dtype=np.float32),
+                asr,
+                AsyncMock(),
+                agent_engine=agent,
+                images=images,
+            )
+            batch_input = create_batch_input(input_text, images, from_name="Human")
+            async for _ in agent.chat(batch_input):
+                pass
+        finally:
+            await service.close()
+
+        # One retrieval, for the prompt chat() builds (stripped, image note)
+        assert queries == [agent._to_text_prompt(batch_input)]
+        assert queries[0].endswith("[User has also provided images]")
+        assert service._prefetched == {}
@@ -0,0 +1,118 @@
+"""Tests for deferred session consolidation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from open_llm_vtuber.umsa.config import MemoryConfig, StorageConfig
+from open_llm_vtuber.umsa.memory_service import MemoryService
+from open_llm_vtuber.umsa.models import Message
+
+# ---------------------------------------------------------------------------
+# MemoryService.end_session(defer=True)
+# ---------------------------------------------------------------------------
+
+
+def _service(tmp_path, idle_seconds=10.0) -> MemoryService:
+    return MemoryService(
+        MemoryConfig(
+            storage=StorageConfig(sqlite_db_path=str(tmp_path / "memory.db")),
+            consolidation={"idle_seconds": idle_seconds},
+        )
+    )
+
+
+async def _run_session(svc: MemoryService) -> str:
+    session_id = await svc.start_session()
+    svc.stream_context.update(author="viewer", content="hello there", msg_type="chat")
+    svc.increment_session_message_count(session_id)
+    await svc.end_session(session_id, defer=True)
+    return session_id
+
+
+@pytest.mark.asyncio
+async def test_deferred_end_session_records_pending_job(tmp_path):
+    svc = _service(tmp_path)
+    session_id = await _run_session(svc)
+    store = await svc._ensure_store()
+
+    pending = await store.get_pending_consolidations()
+    assert [job["session_id"] for job in pending] == [session_id]
+    assert await store.get_stream_episodes() == []
+    assert svc.stream_context.message_count == 0
+
+    await svc._consolidation.flush()
+    assert await store.get_pending_consolidations() == []
+    [episode] = await store.get_stream_episodes()
+    assert episode["session_id"] == session_id
+    assert episode["summary"]
+    await svc.close()
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_consolidated_in_one_batch(tmp_path):
+    svc = _service(tmp_path, idle_seconds=0.05)
+    sessions = [await _run_session(svc) for _ in range(3)]
+    await asyncio.sleep(0.3)
+
+    assert svc._consolidation.batches == 1
+    assert svc._consolidation.consolidated == 3
+    store = await svc._ensure_store()
+    episodes = await store.get_stream_episodes()
+    assert sorted(ep["session_id"] for ep in episodes) == sorted(sessions)
+    await svc.close()
+
+
+@pytest.mark.asyncio
+async def test_pending_jobs_survive_restart(tmp_path):
+    svc = _service(tmp_path)
+    session_id = await _run_session(svc)
+    # Simulate a crash: drop the scheduler without running its jobs
+    svc._consolidation._task.cancel()
+    svc._consolidation = None
+    await svc.close()
+
+    restarted = _service(tmp_path)
+    await restarted.start_session()
+    assert restarted._consolidation.pending == 1
+
+    await restarted._consolidation.flush()
+    store = await restarted._ensure_store()
+    assert await store.get_pending_consolidations() == []
+    assert [ep["session_id"] for ep in await store.get_stream_episodes()] == [
+        session_id
+    ]
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_buffered_turns_with_their_entity(tmp_path):
+    svc = MemoryService(
+        MemoryConfig(
+            storage=StorageConfig(sqlite_db_path=str(tmp_path / "memory.db")),
+            consolidation={"idle_seconds": 10},
+            extraction={"batch_size": 10, "confidence_threshold": 0.5},
+        )
+    )
+    # Regex-only extraction buffers turns inline until the batch runs
+    svc.set_llm(None)
+    store = await svc._ensure_store()
+    for entity_id, text in [("alice", "My name is Alice"), ("bob", "I like pizza")]:
+        await store.touch_entity(entity_id, "direct")
+        session_id = await svc.start_session(entity_id=entity_id)
+        await svc.process_turn(
+            Message(role="user", content=text),
+            Message(role="assistant", content="ok"),
+            entity_id=entity_id,
+        )
+        await svc.end_session(session_id, defer=True)
+
+    await svc._consolidation.flush()
+    alice = [n["content"] for n in await store.get_knowledge_nodes("alice")]
+    bob = [n["content"] for n in await store.get_knowledge_nodes("bob")]
+    assert any("Alice" in content for content in alice)
+    assert any("pizza" in content for content in bob)
+    assert not any("pizza" in content for content in alice)
+    await svc.close()
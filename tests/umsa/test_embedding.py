@@ -0,0 +1,209 @@
+"""Tests for the embedding cache, cached encoding and the background worker."""
+
+import asyncio
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from open_llm_vtuber.umsa.config import EmbeddingConfig, MemoryConfig, StorageConfig
+from open_llm_vtuber.umsa.embedding import EmbeddingService
+from open_llm_vtuber.umsa.embedding_cache import EmbeddingCache
+from open_llm_vtuber.umsa.embedding_worker import EmbeddingWorker
+from open_llm_vtuber.umsa.memory_service import MemoryService
+from open_llm_vtuber.umsa.models import MemoryType, SemanticMemory
+from open_llm_vtuber.umsa.storage.sqlite_store import SQLiteStore
+
+
+class FakeModel:
+    """Stands in for a SentenceTransformer; records every encode batch."""
+
+    def __init__(self, dim: int = 4):
+        self.dim = dim
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            out[i, len(text) % self.dim] = 1.0
+        return out
+
+
+def _service(**config) -> tuple[EmbeddingService, FakeModel]:
+    service = EmbeddingService(EmbeddingConfig(**config))
+    model = FakeModel()
+    service._model = model
+    return service, model
+
+
+@pytest.fixture
+async def store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        s = SQLiteStore(db_path=os.path.join(tmpdir, "test.db"))
+        await s.initialize()
+        yield s
+        await s.close()
+
+
+# ---------------------------------------------------------------------------
+# EmbeddingCache
+# ---------------------------------------------------------------------------
+
+
+def test_cache_lru_eviction():
+    cache = EmbeddingCache(model="m", max_entries=2)
+    cache.put_many(["a", "b"], [b"A", b"B"])
+    assert cache.get_many(["a"]) == [b"A"]  # "a" is now most recent
+    cache.put_many(["c"], [b"C"])
+    assert cache.get_many(["a", "b", "c"]) == [b"A", None, b"C"]
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_cache_keys_include_model():
+    assert EmbeddingCache(model="m1").key("x") != EmbeddingCache(model="m2").key("x")
+
+
+def test_cache_persists_across_instances():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "cache.db")
+        first = EmbeddingCache(model="m", db_path=path)
+        first.put_many(["hello"], [b"\x00\x00\x80\x3f"])
+        first.close()
+
+        second = EmbeddingCache(model="m", db_path=path)
+        assert second.get_many(["hello", "other"]) == [b"\x00\x00\x80\x3f", None]
+        assert len(second) == 1
+        second.close()
+
+
+# ---------------------------------------------------------------------------
+# EmbeddingService
+# ---------------------------------------------------------------------------
+
+
+def test_encode_uses_cache_and_dedupes():
+    service, model = _service()
+    first = service.encode(["hi", "hey", "hi"])
+    assert model.calls == [["hi", "hey"]]
+    assert first[0] == first[2]
+
+    assert service.encode_single("hey") == first[1]
+    assert service.encode(["hey", "new"])[0] == first[1]
+    assert model.calls == [["hi", "hey"], ["new"]]
+
+
+def test_encode_without_cache():
+    service, model = _service(cache_size=0)
+    service.encode(["hi"])
+    service.encode(["hi"])
+    assert service.cache is None
+    assert len(model.calls) == 2
+
+
+# ---------------------------------------------------------------------------
+# EmbeddingWorker
+# ---------------------------------------------------------------------------
+
+
+async def _insert(store, node_id):
+    await store.insert_knowledge_node(
+        {"node_id": node_id, "node_type": "atomic_fact", "content": node_id * 2}
+    )
+
+
+@pytest.mark.asyncio
+async def test_worker_batches_and_writes_once(store):
+    for i in range(5):
+        await _insert(store, f"n{i}")
+    service, model = _service()
+    worker = EmbeddingWorker(store, service, is_busy=lambda: False, batch_size=8)
+
+    commits = 0
+    original_commit = store._db.commit
+
+    async def counting_commit():
+        nonlocal commits
+        commits += 1
+        await original_commit()
+
+    store._db.commit = counting_commit
+    for i in range(5):
+        worker.submit({"node_id": f"n{i}", "content": f"n{i}" * 2})
+    assert worker.pending == 5
+    await worker.flush()
+
+    assert model.calls == [[f"n{i}" * 2 for i in range(5)]]
+    assert commits == 1
+    assert worker.pending == 0
+    assert worker.embedded == 5
+    assert len(await store.get_all_embeddings()) == 5
+
+
+@pytest.mark.asyncio
+async def test_worker_splits_at_batch_size(store):
+    for i in range(5):
+        await _insert(store, f"n{i}")
+    service, model = _service()
+    worker = EmbeddingWorker(store, service, is_busy=lambda: False, batch_size=2)
+    for i in range(5):
+        worker.submit({"node_id": f"n{i}", "content": f"text {i}"})
+    await worker.flush()
+    assert [len(c) for c in model.calls] == [2, 2, 1]
+    assert len(await store.get_all_embeddings()) == 5
+
+
+@pytest.mark.asyncio
+async def test_worker_waits_for_live_turn(store):
+    await _insert(store, "n0")
+    service, model = _service()
+    busy = True
+    worker = EmbeddingWorker(
+        store, service, is_busy=lambda: busy, idle_seconds=0.01, busy_poll=0.01
+    )
+    worker.submit({"node_id": "n0", "content": "text"})
+
+    await asyncio.sleep(0.1)
+    assert model.calls == []
+    busy = False
+    await asyncio.sleep(0.05)
+    assert model.calls == [["text"]]
+    assert worker.embedded == 1
+
+
+def _memory_service(tmp_path) -> MemoryService:
+    svc = MemoryService(
+        MemoryConfig(
+            storage=StorageConfig(sqlite_db_path=str(tmp_path / "memory.db")),
+            embedding={"idle_seconds": 10},
+        )
+    )
+    svc._ensure_embedding_service()._model = FakeModel()
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_pending_embeddings_survive_restart(tmp_path):
+    svc = _memory_service(tmp_path)
+    memory = SemanticMemory(memory_type=MemoryType.ATOMIC_FACT, content="likes tea")
+    await svc.add_memory(memory)
+    assert svc._embedding_worker.pending == 1
+    store = await svc._ensure_store()
+    assert await store.get_pending_embeddings() == [
+        {"node_id": memory.id, "content": "likes tea"}
+    ]
+    # Simulate a crash: drop the worker without running its batch
+    svc._embedding_worker._task.cancel()
+    svc._embedding_worker = None
+    await svc.close()
+
+    restarted = _memory_service(tmp_path)
+    await restarted.start_session()
+    assert restarted._embedding_worker.pending == 1
+
+    await restarted._embedding_worker.flush()
+    store = await restarted._ensure_store()
+    assert [node["node_id"] for node in await store.get_all_embeddings()] == [memory.id]
+    assert await store.get_pending_embeddings() == []
+    await restarted.close()
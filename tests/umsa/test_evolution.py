@@ -0,0 +1,122 @@
+"""Tests for MemoryEvolver merge planning and batched writes."""
+
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from open_llm_vtuber.umsa.config import ConsolidationConfig
+from open_llm_vtuber.umsa.embedding import EmbeddingService
+from open_llm_vtuber.umsa.evolution import MemoryEvolver
+from open_llm_vtuber.umsa.storage.sqlite_store import SQLiteStore
+from open_llm_vtuber.umsa.storage.vector_index import find_similar_pairs
+
+
+def _duplicated(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    """Random unit vectors where every 10th row nearly copies its predecessor."""
+    rng = np.random.default_rng(seed)
+    data = rng.normal(size=(n, dim)).astype(np.float32)
+    for k in range(1, n, 10):
+        data[k] = data[k - 1] + 0.1 * rng.normal(size=dim)
+    data /= np.linalg.norm(data, axis=1, keepdims=True)
+    return data
+
+
+def _brute_force(data: np.ndarray, threshold: float) -> set[tuple[int, int]]:
+    scores = data @ data.T
+    i, j = np.triu_indices(len(data), k=1)
+    hit = scores[i, j] >= threshold
+    return set(zip(i[hit].tolist(), j[hit].tolist()))
+
+
+@pytest.fixture
+async def store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        s = SQLiteStore(db_path=os.path.join(tmpdir, "test.db"))
+        await s.initialize()
+        await s.touch_entity("alice", "direct")
+        yield s
+        await s.close()
+
+
+# ---------------------------------------------------------------------------
+# find_similar_pairs
+# ---------------------------------------------------------------------------
+
+
+def test_exact_pairs_match_brute_force():
+    data = _duplicated(500, 32)
+    i, j, s = find_similar_pairs(data, 0.85, max_block=5000)
+    assert set(zip(i.tolist(), j.tolist())) == _brute_force(data, 0.85)
+    assert list(zip(i.tolist(), j.tolist())) == sorted(zip(i.tolist(), j.tolist()))
+    assert np.all(s >= 0.85)
+
+
+def test_clustered_pairs_cover_duplicates():
+    data = _duplicated(4000, 32)
+    truth = _brute_force(data, 0.85)
+    i, j, _ = find_similar_pairs(data, 0.85, exact_limit=100)
+    found = set(zip(i.tolist(), j.tolist()))
+    assert found <= truth
+    assert len(found) >= 0.95 * len(truth)
+    # No pair is reported twice even though rows sit in several lists
+    assert len(found) == len(i)
+
+
+# ---------------------------------------------------------------------------
+# MemoryEvolver
+# ---------------------------------------------------------------------------
+
+
+async def _insert(store, node_id, vector, importance):
+    await store.insert_knowledge_node(
+        {
+            "node_id": node_id,
+            "entity_id": "alice",
+            "node_type": "atomic_fact",
+            "content": f"content of {node_id}",
+            "importance": importance,
+            "embedding": EmbeddingService.serialize_embedding(list(vector)),
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_merge_keeps_higher_importance_in_one_commit(store):
+    await _insert(store, "a", [1.0, 0.0, 0.0], 0.4)
+    await _insert(store, "a_dup", [0.99, 0.05, 0.0], 0.8)
+    await _insert(store, "b", [0.0, 1.0, 0.0], 0.5)
+    await _insert(store, "c", [0.0, 0.0, 1.0], 0.5)
+
+    commits = 0
+    original_commit = store._db.commit
+
+    async def counting_commit():
+        nonlocal commits
+        commits += 1
+        await original_commit()
+
+    store._db.commit = counting_commit
+    evolver = MemoryEvolver(store, embedding_service=None)
+    assert await evolver._merge_similar("alice") == 1
+    assert commits == 1
+
+    remaining = {n["node_id"] for n in await store.get_knowledge_nodes("alice")}
+    assert remaining == {"a_dup", "b", "c"}
+
+
+@pytest.mark.asyncio
+async def test_merge_is_not_truncated(store):
+    # Above merge_exact_limit: the clustered search still merges every duplicate
+    data = _duplicated(60, 16)
+    for k, row in enumerate(data):
+        await _insert(store, f"n{k}", row, 0.5)
+
+    evolver = MemoryEvolver(
+        store, embedding_service=None, config=ConsolidationConfig(merge_exact_limit=10)
+    )
+    expected = len({j for _, j in _brute_force(data, 0.85)})
+    assert await evolver._merge_similar("alice") == expected
+    nodes = await store.get_knowledge_nodes("alice", limit=100)
+    assert len(nodes) == 60 - expected
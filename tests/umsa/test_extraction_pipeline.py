@@ -455,6 +455,45 @@ class TestEdgeCases:
         for m in result.memories:
             assert m.category is not None
 
+    @pytest.mark.asyncio
+    async def test_unattributed_llm_items_dropped_across_entities(
+        self, llm_only_config: ExtractionConfig
+    ) -> None:
+        llm_response = (
+            '[{"content": "Alice likes tea", "turn": 1},'
+            ' {"content": "Bob likes coffee", "turn": 2},'
+            ' {"content": "Someone likes cake"},'
+            ' {"content": "Someone likes pie", "turn": 7}]'
+        )
+        ext = MemoryExtractor(llm=_make_llm_mock(llm_response), config=llm_only_config)
+        result = await ext.extract_turns(
+            [
+                {"user": "I like tea", "assistant": "ok", "entity_id": "alice"},
+                {"user": "I like coffee", "assistant": "ok", "entity_id": "bob"},
+            ]
+        )
+
+        assert [(m.content, m.entity_id) for m in result.memories] == [
+            ("Alice likes tea", "alice"),
+            ("Bob likes coffee", "bob"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unattributed_llm_items_kept_for_single_entity(
+        self, llm_only_config: ExtractionConfig
+    ) -> None:
+        ext = MemoryExtractor(
+            llm=_make_llm_mock('[{"content": "Alice likes cake"}]'),
+            config=llm_only_config,
+        )
+        result = await ext.extract_turns(
+            [{"user": "I like cake", "assistant": "ok", "entity_id": "alice"}]
+        )
+
+        assert [(m.content, m.entity_id) for m in result.memories] == [
+            ("Alice likes cake", "alice")
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Backward compatibility
@@ -0,0 +1,122 @@
+"""Tests for background batched memory extraction."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from open_llm_vtuber.umsa.config import MemoryConfig, StorageConfig
+from open_llm_vtuber.umsa.memory_service import MemoryService
+from open_llm_vtuber.umsa.models import Message
+
+# ---------------------------------------------------------------------------
+# MemoryService background extraction
+# ---------------------------------------------------------------------------
+
+
+class ExtractionLLM:
+    """Stateless LLM stub answering one fact per transcript turn."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls: list[str] = []
+
+    async def chat_completion(self, messages, system=None):
+        transcript = messages[-1]["content"]
+        self.calls.append(transcript)
+        if self.fail:
+            raise ConnectionError("LLM is down")
+        turns = transcript.count("[Turn ")
+        yield json.dumps(
+            [
+                {
+                    "content": f"Fact from turn {turn}",
+                    "type": "atomic_fact",
+                    "importance": 0.9,
+                    "turn": turn,
+                }
+                for turn in range(1, turns + 1)
+            ]
+        )
+
+
+def _service(tmp_path, llm) -> MemoryService:
+    svc = MemoryService(
+        MemoryConfig(
+            storage=StorageConfig(sqlite_db_path=str(tmp_path / "memory.db")),
+            extraction={"regex_enabled": False, "batch_size": 2, "idle_seconds": 10},
+        )
+    )
+    svc.set_llm(llm)
+    return svc
+
+
+async def _turn(svc: MemoryService, entity_id: str, text: str) -> None:
+    store = await svc._ensure_store()
+    await store.touch_entity(entity_id, "direct")
+    await svc.process_turn(
+        Message(role="user", content=text),
+        Message(role="assistant", content="ok"),
+        entity_id=entity_id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_turn_does_not_wait_for_llm(tmp_path):
+    llm = ExtractionLLM()
+    svc = _service(tmp_path, llm)
+    for i in range(3):
+        await _turn(svc, f"viewer{i}", f"message {i}")
+    store = await svc._ensure_store()
+
+    assert llm.calls == []
+    assert len(await store.get_pending_extractions()) == 3
+    assert svc.extraction_metrics()["pending"] == 3
+
+    await svc.flush_extraction()
+    # All three viewers in one LLM call, each fact stored under its viewer
+    assert len(llm.calls) == 1
+    for i in range(3):
+        [node] = await store.get_knowledge_nodes(f"viewer{i}")
+        assert node["content"] == f"Fact from turn {i + 1}"
+    assert await store.get_pending_extractions() == []
+    assert svc.extraction_metrics()["extracted"] == 3
+    await svc.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_llm_call_keeps_turns_for_retry(tmp_path):
+    svc = _service(tmp_path, ExtractionLLM(fail=True))
+    await _turn(svc, "viewer", "message")
+    await svc.flush_extraction()
+    store = await svc._ensure_store()
+
+    assert svc.extraction_metrics()["failed"] == 1
+    assert len(await store.get_pending_extractions()) == 1
+    assert await store.get_knowledge_nodes("viewer") == []
+    await svc.close()
+
+
+@pytest.mark.asyncio
+async def test_pending_turns_survive_restart(tmp_path):
+    svc = _service(tmp_path, ExtractionLLM())
+    await _turn(svc, "viewer", "message")
+    # Simulate a crash: drop the worker without running its batch
+    svc._extraction_worker._task.cancel()
+    svc._extraction_worker = None
+    await svc.close()
+
+    llm = ExtractionLLM()
+    restarted = _service(tmp_path, llm)
+    await restarted.start_session()
+    assert restarted.extraction_metrics()["pending"] == 1
+
+    await restarted.flush_extraction()
+    store = await restarted._ensure_store()
+    assert len(llm.calls) == 1
+    assert [node["content"] for node in await store.get_knowledge_nodes("viewer")] == [
+        "Fact from turn 1"
+    ]
+    assert await store.get_pending_extractions() == []
+    await restarted.close()
@@ -0,0 +1,146 @@
+"""Tests for the idle-time batching shared by UMSA's background workers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from open_llm_vtuber.umsa.idle_batch_scheduler import IdleBatchScheduler
+
+
+class Recorder:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def __call__(self, items: list[dict]) -> None:
+        self.batches.append([item["id"] for item in items])
+
+
+def _submit(scheduler: IdleBatchScheduler, *ids: str) -> None:
+    for item_id in ids:
+        scheduler.submit({"id": item_id})
+
+
+@pytest.mark.asyncio
+async def test_items_are_batched_after_idle_gap():
+    recorder = Recorder()
+    scheduler = IdleBatchScheduler(
+        recorder, is_busy=lambda: False, batch_size=3, idle_seconds=0.05
+    )
+    for i in range(3):
+        _submit(scheduler, f"i{i}")
+        await asyncio.sleep(0.01)
+
+    assert recorder.batches == []
+    assert scheduler.metrics()["pending"] == 3
+    assert scheduler.metrics()["oldest_pending_seconds"] > 0
+    await asyncio.sleep(0.15)
+    assert recorder.batches == [["i0", "i1", "i2"]]
+    metrics = scheduler.metrics()
+    assert (metrics["pending"], metrics["batches"], metrics["processed"]) == (0, 1, 3)
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped_at_max_batch():
+    recorder = Recorder()
+    scheduler = IdleBatchScheduler(recorder, is_busy=lambda: False, max_batch=2)
+    _submit(scheduler, "i0", "i1", "i2", "i3", "i4")
+    await asyncio.wait_for(scheduler.flush(), timeout=1)
+
+    assert recorder.batches == [["i0", "i1"], ["i2", "i3"], ["i4"]]
+
+
+@pytest.mark.asyncio
+async def test_small_backlog_waits_for_max_delay():
+    recorder = Recorder()
+    scheduler = IdleBatchScheduler(
+        recorder,
+        is_busy=lambda: False,
+        batch_size=5,
+        idle_seconds=0.01,
+        max_delay_seconds=0.1,
+    )
+    _submit(scheduler, "i0")
+
+    await asyncio.sleep(0.05)
+    assert recorder.batches == []
+    await asyncio.sleep(0.1)
+    assert recorder.batches == [["i0"]]
+
+
+@pytest.mark.asyncio
+async def test_max_delay_bounds_postponement():
+    recorder = Recorder()
+    scheduler = IdleBatchScheduler(
+        recorder, is_busy=lambda: False, idle_seconds=10, max_delay_seconds=0.05
+    )
+    _submit(scheduler, "i0")
+    for _ in range(10):
+        scheduler.touch()
+        await asyncio.sleep(0.02)
+
+    assert recorder.batches == [["i0"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_waits_for_live_turn():
+    recorder = Recorder()
+    busy = True
+    scheduler = IdleBatchScheduler(
+        recorder, is_busy=lambda: busy, idle_seconds=0.01, busy_poll=0.01
+    )
+    _submit(scheduler, "i0")
+
+    await asyncio.sleep(0.1)
+    assert recorder.batches == []
+    busy = False
+    await asyncio.sleep(0.05)
+    assert recorder.batches == [["i0"]]
+
+
+@pytest.mark.asyncio
+async def test_max_delay_bounds_busy_wait():
+    waited = []
+
+    async def run_batch(items):
+        # Overdue batches no longer yield to live turns between steps
+        await asyncio.wait_for(scheduler.wait_until_idle(), timeout=1)
+        waited.append([item["id"] for item in items])
+
+    scheduler = IdleBatchScheduler(
+        run_batch,
+        is_busy=lambda: True,
+        idle_seconds=0.01,
+        max_delay_seconds=0.1,
+        busy_poll=0.01,
+    )
+    _submit(scheduler, "i0")
+
+    await asyncio.sleep(0.05)
+    assert waited == []
+    await asyncio.sleep(0.15)
+    assert waited == [["i0"]]
+
+
+@pytest.mark.asyncio
+async def test_flush_runs_immediately_even_when_busy():
+    recorder = Recorder()
+    scheduler = IdleBatchScheduler(recorder, is_busy=lambda: True, idle_seconds=10)
+    _submit(scheduler, "i0")
+    await asyncio.wait_for(scheduler.flush(), timeout=1)
+
+    assert recorder.batches == [["i0"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_counted():
+    async def fail(items):
+        raise RuntimeError("boom")
+
+    scheduler = IdleBatchScheduler(fail, is_busy=lambda: False)
+    _submit(scheduler, "i0")
+    await scheduler.flush()
+
+    assert scheduler.failed == 1
+    assert scheduler.batches == 0
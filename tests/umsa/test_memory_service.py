@@ -11,6 +11,8 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import nullcontext
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -320,6 +322,85 @@ class TestBuildContextPhase2:
         assert call_kwargs["episodic_summary"] == ""
 
 
+# ---------------------------------------------------------------------------
+# prefetch_context() and build_context() caching
+# ---------------------------------------------------------------------------
+
+
+class TestPrefetchContext:
+    """Tests for prefetched retrieval and the episodic summary cache."""
+
+    @pytest.fixture
+    def retrieve(self, service):
+        retrieve = AsyncMock(return_value=[])
+        service._ensure_retriever = AsyncMock(return_value=MagicMock(retrieve=retrieve))
+        service._ensure_components()
+        return retrieve
+
+    @pytest.mark.asyncio
+    async def test_build_context_reuses_prefetch(
+        self, service, retrieve, sample_messages
+    ):
+        """A prefetch for the same messages replaces the retrieval in build_context."""
+        service.prefetch_context(sample_messages)
+        ctx = await service.build_context(messages=sample_messages)
+
+        assert retrieve.await_count == 1
+        assert retrieve.call_args[1]["query"] == "Hello there! Tell me about cats."
+        assert set(ctx.timings) == {"retrieval", "episodic", "assembly", "total"}
+        assert service._prefetched == {}
+
+    @pytest.mark.asyncio
+    async def test_prefetch_for_other_query_is_not_used(
+        self, service, retrieve, sample_messages
+    ):
+        """build_context() retrieves again when the prefetched query differs."""
+        service.prefetch_context([{"role": "user", "content": "something else"}])
+        await service.build_context(messages=sample_messages)
+        await asyncio.sleep(0)  # let the prefetch task run
+
+        assert retrieve.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_prefetch_is_dropped(
+        self, service, retrieve, sample_messages
+    ):
+        """Prefetched results older than prefetch_ttl_seconds are not used."""
+        service.prefetch_context(sample_messages)
+        [(_, task)] = service._prefetched.values()
+        service.config.retrieval.prefetch_ttl_seconds = -1.0
+        await service.build_context(messages=sample_messages)
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert retrieve.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_multimodal_user_text_is_queried(self, service, retrieve):
+        """Text parts of list-style user content are part of the query."""
+        messages = [{"role": "user", "content": [{"type": "text", "text": "cats?"}]}]
+        await service.build_context(messages=messages)
+
+        assert retrieve.call_args[1]["query"] == "cats?"
+
+    @pytest.mark.asyncio
+    async def test_episodic_summary_is_cached(self, service, retrieve, sample_messages):
+        """Stream episodes are loaded once until a new episode is saved."""
+        mock_store = AsyncMock()
+        mock_store.get_stream_episodes.return_value = [{"summary": "Talked about cats"}]
+        service._store = mock_store
+        service._store_initialized = True
+
+        await service.build_context(messages=sample_messages)
+        ctx = await service.build_context(messages=sample_messages)
+        assert mock_store.get_stream_episodes.await_count == 1
+        assert "Talked about cats" in ctx.system_content
+
+        await service._record_session_end(mock_store, "s1", "t", 0, None, "direct")
+        await service.build_context(messages=sample_messages)
+        assert mock_store.get_stream_episodes.await_count == 2
+
+
 # ---------------------------------------------------------------------------
 # start_session() Phase 2 updates
 # ---------------------------------------------------------------------------
@@ -427,6 +508,7 @@ class TestEndSessionPhase2:
         service._stream_context.message_count = 5
 
         mock_store = AsyncMock()
+        mock_store.transaction = MagicMock(return_value=nullcontext())
         mock_store.end_session = AsyncMock()
         mock_store.insert_knowledge_node = AsyncMock()
         mock_store.insert_stream_episode = AsyncMock(return_value="ep_123")
@@ -457,6 +539,7 @@ class TestEndSessionPhase2:
 
         # Return enough nodes for reflection (>= min_group_size)
         mock_store = AsyncMock()
+        mock_store.transaction = MagicMock(return_value=nullcontext())
         mock_store.end_session = AsyncMock()
         mock_store.insert_knowledge_node = AsyncMock()
         mock_store.insert_stream_episode = AsyncMock(return_value="ep_1")
@@ -519,6 +602,7 @@ class TestEndSessionPhase2:
         }
 
         mock_store = AsyncMock()
+        mock_store.transaction = MagicMock(return_value=nullcontext())
         mock_store.end_session = AsyncMock()
         mock_store.insert_knowledge_node = AsyncMock()
         mock_store.insert_stream_episode = AsyncMock(return_value="ep_1")
@@ -592,6 +676,7 @@ class TestEndSessionPhase2:
         assert service._stream_context.message_count > 0
 
         mock_store = AsyncMock()
+        mock_store.transaction = MagicMock(return_value=nullcontext())
         mock_store.end_session = AsyncMock()
         mock_store.insert_knowledge_node = AsyncMock()
         mock_store.insert_stream_episode = AsyncMock(return_value="ep_1")
@@ -617,6 +702,7 @@ class TestEndSessionPhase2:
         }
 
         mock_store = AsyncMock()
+        mock_store.transaction = MagicMock(return_value=nullcontext())
         mock_store.end_session = AsyncMock()
         mock_store.insert_knowledge_node = AsyncMock()
         mock_store.insert_stream_episode = AsyncMock(
@@ -794,6 +880,7 @@ class TestEdgeCases:
         }
 
         mock_store = AsyncMock()
+        mock_store.transaction = MagicMock(return_value=nullcontext())
         mock_store.end_session = AsyncMock()
         mock_store.insert_knowledge_node = AsyncMock()
         mock_store.insert_stream_episode = AsyncMock(return_value="ep_1")
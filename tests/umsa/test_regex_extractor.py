@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import time
+from dataclasses import replace
+
 import pytest
 
-from open_llm_vtuber.umsa.regex_extractor import RegexExtractor
+from open_llm_vtuber.umsa.regex_extractor import _PATTERNS, RegexExtractor
 
 
 # ---------------------------------------------------------------------------
@@ -263,3 +266,56 @@ def test_result_dict_keys(ext: RegexExtractor) -> None:
     expected_keys = {"content", "memory_type", "importance", "confidence", "category"}
     for r in results:
         assert set(r.keys()) == expected_keys
+
+
+# ---------------------------------------------------------------------------
+# Trigger prefilter
+# ---------------------------------------------------------------------------
+
+MIXED_MESSAGES = [
+    "나는 파이썬 좋아해",
+    "피자를 제일 좋아",
+    "수학은 별로",
+    "지금 롤 하고 있어",
+    "리액트로 개발하고 있어",
+    "제 이름은 민수야",
+    "서울에 살아요",
+    "ㅋㅋㅋㅋ 오늘 방송 재밌다",
+    "I REALLY LIKE cats!",
+    "I'm not a fan of horror. I love ramen",
+    "I have a dog named Max.",
+    "I'm 25 years old and I work at a bakery",
+    "I prefer tea over coffee",
+    "because we use it",
+    "こんにちは！今日も配信ありがとう",
+    "lol gg",
+]
+
+
+def test_prefilter_matches_running_every_pattern(ext: RegexExtractor) -> None:
+    unfiltered = RegexExtractor(
+        _patterns=tuple(replace(entry, triggers=()) for entry in _PATTERNS)
+    )
+    for message in MIXED_MESSAGES:
+        assert ext.extract(message) == unfiltered.extract(message), message
+
+
+def test_every_pattern_has_triggers() -> None:
+    assert all(entry.triggers for entry in _PATTERNS)
+
+
+def test_messages_without_triggers_run_no_patterns(ext: RegexExtractor) -> None:
+    assert ext._candidate_patterns("ㅋㅋㅋㅋ 오늘 방송 재밌다") == []
+
+
+def test_trigger_enables_patterns_of_triggers_inside_it(ext: RegexExtractor) -> None:
+    candidates = ext._candidate_patterns("파이썬 좋아해")
+    selected = {_PATTERNS[i].triggers for i in candidates}
+    assert ("좋아해",) in selected and ("좋아",) in selected
+
+
+def test_long_message_does_not_backtrack_quadratically(ext: RegexExtractor) -> None:
+    start = time.perf_counter()
+    ext.extract("ㅋ" * 5000 + "별로")
+    ext.extract("가나다 " * 1500 + "좋아")
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,115 @@
+"""Tests for HybridRetriever concurrent fan-out and per-source deadlines."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from open_llm_vtuber.umsa.config import RetrievalConfig
+from open_llm_vtuber.umsa.retrieval import HybridRetriever
+
+
+def _node(node_id: str, **extra) -> dict:
+    return {
+        "node_id": node_id,
+        "content": f"content of {node_id}",
+        "importance": 0.5,
+        "last_accessed_at": None,
+        **extra,
+    }
+
+
+def _make_retriever(
+    config: RetrievalConfig,
+    vector_delay: float = 0.0,
+    fts_delay: float = 0.0,
+    graph_delay: float = 0.0,
+) -> HybridRetriever:
+    store = MagicMock()
+
+    async def search_embeddings(*args, **kwargs):
+        await asyncio.sleep(vector_delay)
+        return [_node("v1", similarity=0.9)]
+
+    async def search_fts(*args, **kwargs):
+        await asyncio.sleep(fts_delay)
+        return [_node("f1", fts_rank=-5.0)]
+
+    async def get_knowledge_nodes(*args, **kwargs):
+        await asyncio.sleep(graph_delay)
+        return [_node("seed")]
+
+    store.search_embeddings = search_embeddings
+    store.search_fts = search_fts
+    store.get_knowledge_nodes = get_knowledge_nodes
+    store.get_connected_nodes = AsyncMock(
+        return_value=[_node("g1", edge_type="related", edge_strength=0.8)]
+    )
+    store.touch_node = AsyncMock()
+
+    embedding = MagicMock()
+    embedding.encode_single = MagicMock(return_value=[1.0, 0.0])
+    return HybridRetriever(store=store, embedding_service=embedding, config=config)
+
+
+@pytest.mark.asyncio
+async def test_sources_run_concurrently():
+    retriever = _make_retriever(
+        RetrievalConfig(max_latency_ms=1000),
+        vector_delay=0.2,
+        fts_delay=0.2,
+        graph_delay=0.2,
+    )
+    start = time.perf_counter()
+    results = await retriever.retrieve("hello", entity_id="alice")
+    elapsed = time.perf_counter() - start
+
+    assert {r.id for r in results} == {"v1", "f1", "g1"}
+    # Sequential execution would take at least 0.6s
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_slow_source_degrades_to_partial_results():
+    retriever = _make_retriever(
+        RetrievalConfig(max_latency_ms=1000, source_deadlines_ms={"graph": 50}),
+        graph_delay=1.0,
+    )
+    start = time.perf_counter()
+    results = await retriever.retrieve("hello", entity_id="alice")
+    elapsed = time.perf_counter() - start
+
+    assert {r.id for r in results} == {"v1", "f1"}
+    assert elapsed < 0.5
+    assert results[0].metadata["timed_out_sources"] == ["graph"]
+
+
+@pytest.mark.asyncio
+async def test_timings_exposed_in_metadata():
+    retriever = _make_retriever(RetrievalConfig())
+    results = await retriever.retrieve("hello", entity_id="alice")
+
+    assert results
+    timings = results[0].metadata["source_timings_ms"]
+    assert set(timings) == {"vector", "fts", "graph"}
+    assert all(ms >= 0.0 for ms in timings.values())
+    assert "timed_out_sources" not in results[0].metadata
+
+
+@pytest.mark.asyncio
+async def test_query_encoded_off_event_loop():
+    retriever = _make_retriever(RetrievalConfig())
+    encode_threads: list[int] = []
+
+    def encode_single(text):
+        encode_threads.append(threading.get_ident())
+        return [1.0, 0.0]
+
+    retriever._embedding.encode_single = encode_single
+    await retriever.retrieve("hello")
+    assert encode_threads
+    assert encode_threads[0] != threading.get_ident()
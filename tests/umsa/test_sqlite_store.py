@@ -1,6 +1,8 @@
 """Tests for UMSA Phase 2 schema migration and new methods in SQLiteStore."""
 
+import asyncio
 import os
+import sqlite3
 import tempfile
 
 import pytest
@@ -244,3 +246,174 @@ async def test_insert_supersedes_edge(store):
     connected = await store.get_connected_nodes("new-node", limit=10)
     assert any(n["node_id"] == "old-node" for n in connected)
     assert any(n["edge_type"] == "supersedes" for n in connected)
+
+
+def _node(node_id: str, **extra) -> dict:
+    return {
+        "node_id": node_id,
+        "entity_id": None,
+        "node_type": "atomic_fact",
+        "content": f"content of {node_id}",
+        **extra,
+    }
+
+
+@pytest.mark.asyncio
+async def test_transaction_commits_once(store):
+    commits = 0
+    original_commit = store._db.commit
+
+    async def counting_commit():
+        nonlocal commits
+        commits += 1
+        await original_commit()
+
+    store._db.commit = counting_commit
+    async with store.transaction():
+        await store.insert_knowledge_node(_node("n1"))
+        await store.insert_knowledge_node(_node("n2"))
+        async with store.transaction():
+            await store.insert_knowledge_node(_node("n3"))
+        assert commits == 0
+    assert commits == 1
+    assert len(await store.get_knowledge_nodes()) == 3
+
+
+@pytest.mark.asyncio
+async def test_transaction_rolls_back_on_error(store):
+    await store.insert_knowledge_node(_node("kept"))
+    with pytest.raises(ValueError):
+        async with store.transaction():
+            await store.insert_knowledge_node(_node("dropped"))
+            raise ValueError("boom")
+    nodes = await store.get_knowledge_nodes()
+    assert [n["node_id"] for n in nodes] == ["kept"]
+
+
+@pytest.mark.asyncio
+async def test_insert_knowledge_nodes_and_edges_batch(store):
+    ids = await store.insert_knowledge_nodes([_node("a"), _node("b"), _node("c")])
+    assert ids == ["a", "b", "c"]
+    edge_ids = await store.insert_knowledge_edges(
+        [
+            {"edge_id": "e1", "source_node_id": "a", "target_node_id": "b"},
+            {"edge_id": "e2", "source_node_id": "a", "target_node_id": "c"},
+        ]
+    )
+    assert edge_ids == ["e1", "e2"]
+    connected = await store.get_connected_nodes("a", limit=10)
+    assert {n["node_id"] for n in connected} == {"b", "c"}
+    assert await store.insert_knowledge_nodes([]) == []
+
+
+@pytest.mark.asyncio
+async def test_touch_nodes_buffers_until_flush(store):
+    await store.insert_knowledge_nodes([_node("a"), _node("b")])
+    await store.touch_nodes(["a", "b"])
+    await store.touch_nodes(["a"])
+
+    nodes = {n["node_id"]: n for n in await store.get_knowledge_nodes()}
+    assert nodes["a"]["access_count"] == 0
+
+    assert await store.flush_pending_writes() == 2
+    nodes = {n["node_id"]: n for n in await store.get_knowledge_nodes()}
+    assert nodes["a"]["access_count"] == 2
+    assert nodes["b"]["access_count"] == 1
+    assert await store.flush_pending_writes() == 0
+
+
+@pytest.mark.asyncio
+async def test_touch_nodes_flushes_after_interval():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        s = SQLiteStore(db_path=os.path.join(tmpdir, "test.db"), flush_interval=0.01)
+        await s.initialize()
+        try:
+            await s.insert_knowledge_node(_node("a"))
+            await s.touch_nodes(["a"])
+            await asyncio.sleep(0.1)
+            nodes = await s.get_knowledge_nodes()
+            assert nodes[0]["access_count"] == 1
+        finally:
+            await s.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_use_pool_and_pragmas(store):
+    assert len(store._readers) == 4
+    async with store._reader() as db:
+        assert db is not store._db
+        async with db.execute("PRAGMA synchronous") as cursor:
+            assert (await cursor.fetchone())[0] == 1  # NORMAL
+        async with db.execute("PRAGMA temp_store") as cursor:
+            assert (await cursor.fetchone())[0] == 2  # MEMORY
+        with pytest.raises(sqlite3.OperationalError):
+            await db.execute("DELETE FROM knowledge_nodes")
+
+
+@pytest.mark.asyncio
+async def test_transaction_reads_own_writes_others_see_committed(store):
+    await store.insert_knowledge_node(_node("committed"))
+    inside = asyncio.Event()
+    release = asyncio.Event()
+
+    async def writer():
+        async with store.transaction():
+            await store.insert_knowledge_node(_node("pending"))
+            own = {n["node_id"] for n in await store.get_knowledge_nodes()}
+            assert own == {"committed", "pending"}
+            inside.set()
+            await release.wait()
+
+    task = asyncio.create_task(writer())
+    await inside.wait()
+    others = {n["node_id"] for n in await store.get_knowledge_nodes()}
+    assert others == {"committed"}
+    release.set()
+    await task
+    assert len(await store.get_knowledge_nodes()) == 2
+
+
+@pytest.mark.asyncio
+async def test_other_task_write_waits_and_survives_rollback(store):
+    inside = asyncio.Event()
+    release = asyncio.Event()
+
+    async def failing_transaction():
+        async with store.transaction():
+            await store.insert_knowledge_node(_node("dropped"))
+            inside.set()
+            await release.wait()
+            raise ValueError("boom")
+
+    task = asyncio.create_task(failing_transaction())
+    await inside.wait()
+    write = asyncio.create_task(store.insert_knowledge_node(_node("kept")))
+    await asyncio.sleep(0.05)
+    assert not write.done()
+
+    release.set()
+    with pytest.raises(ValueError):
+        await task
+    await write
+    nodes = await store.get_knowledge_nodes()
+    assert [n["node_id"] for n in nodes] == ["kept"]
+
+
+@pytest.mark.asyncio
+async def test_read_pool_disabled_uses_writer():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        s = SQLiteStore(db_path=os.path.join(tmpdir, "test.db"), read_pool_size=0)
+        await s.initialize()
+        try:
+            await s.insert_knowledge_node(_node("a"))
+            async with s._reader() as db:
+                assert db is s._db
+            assert len(await s.get_knowledge_nodes()) == 1
+        finally:
+            await s.close()
+
+
+def test_invalid_pragma_rejected():
+    s = SQLiteStore(db_path="unused.db", pragmas={"synchronous": "OFF; DROP"})
+    with pytest.raises(ValueError):
+        asyncio.run(s._apply_pragmas(None))
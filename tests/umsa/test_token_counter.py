@@ -0,0 +1,89 @@
+"""Tests for TokenCounter caching, truncation and cached message counts."""
+
+from open_llm_vtuber.umsa.models import Message
+from open_llm_vtuber.umsa.token_counter import TokenCounter, cjk_char_count
+
+
+def _legacy_estimate(text: str) -> int:
+    """The original per-character estimator, kept as the reference."""
+    cjk_count = 0
+    for char in text:
+        cp = ord(char)
+        if (
+            0x4E00 <= cp <= 0x9FFF
+            or 0xAC00 <= cp <= 0xD7AF
+            or 0x3040 <= cp <= 0x309F
+            or 0x30A0 <= cp <= 0x30FF
+        ):
+            cjk_count += 1
+    non_cjk = len(text) - cjk_count
+    return max(1, (non_cjk // 4) + (cjk_count // 2))
+
+
+SAMPLES = [
+    "",
+    "hello world",
+    "안녕하세요 오늘 방송 재밌다!",
+    "こんにちは、カタカナとひらがな",
+    "中文字符 mixed with English 한국어",
+    "emoji 🎉 and symbols ㄱㄴ ＡＢＣ",
+]
+
+
+def test_regex_estimator_matches_legacy():
+    for text in SAMPLES:
+        assert TokenCounter._estimate_tokens(text) == _legacy_estimate(text)
+    assert cjk_char_count("가나a中") == 3
+
+
+def test_count_is_cached():
+    counter = TokenCounter()
+    counter._encoder = None
+    calls = 0
+    original = counter._estimate_tokens
+
+    def counting(text):
+        nonlocal calls
+        calls += 1
+        return original(text)
+
+    counter._estimate_tokens = counting
+    assert counter.count("same text") == counter.count("same text")
+    assert calls == 1
+
+
+def test_count_cache_is_bounded():
+    counter = TokenCounter()
+    counter.CACHE_SIZE = 3
+    for i in range(10):
+        counter.count(f"text {i}")
+    assert list(counter._cache) == ["text 7", "text 8", "text 9"]
+
+
+def test_truncate_keeps_longest_prefix_within_budget():
+    counter = TokenCounter()
+    counter._encoder = None
+    text = "word " * 200 + "한국어 문장 " * 100
+    for budget in (1, 7, 50, 300):
+        fitted = counter.truncate(text, budget)
+        assert text.startswith(fitted)
+        assert counter.count(fitted) <= budget
+        # One more character would exceed the budget
+        assert counter.count(text[: len(fitted) + 1]) > budget
+
+    assert counter.truncate(text, 10_000) == text
+    assert counter.truncate(text, 0) == ""
+
+
+def test_message_token_count_cached_until_content_changes():
+    counter = TokenCounter()
+    message = Message(role="user", content="hello there")
+    first = message.token_count(counter)
+    assert first == counter.count("hello there")
+
+    counter._cache.clear()
+    assert message.token_count(counter) == first
+    assert not counter._cache  # served from the message, not the counter
+
+    message.content = "hello there, this message is now much longer"
+    assert message.token_count(counter) == counter.count(message.content)
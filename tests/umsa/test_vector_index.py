@@ -0,0 +1,305 @@
+"""Tests for the in-memory vector indexes and their SQLiteStore synchronisation."""
+
+import asyncio
+import os
+import tempfile
+import threading
+from contextlib import asynccontextmanager
+
+import numpy as np
+import pytest
+
+from open_llm_vtuber.umsa.embedding import EmbeddingService
+from open_llm_vtuber.umsa.storage.sqlite_store import SQLiteStore
+from open_llm_vtuber.umsa.storage.vector_index import (
+    IVFVectorIndex,
+    VectorIndex,
+    _IVFPartition,
+)
+
+
+def _unit(*values: float) -> list[float]:
+    vec = np.asarray(values, dtype=np.float32)
+    return (vec / np.linalg.norm(vec)).tolist()
+
+
+def _blob(*values: float) -> bytes:
+    return EmbeddingService.serialize_embedding(_unit(*values))
+
+
+@pytest.fixture
+async def store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        s = SQLiteStore(db_path=os.path.join(tmpdir, "test.db"))
+        await s.initialize()
+        await s.touch_entity("alice", "direct")
+        await s.touch_entity("bob", "direct")
+        yield s
+        await s.close()
+
+
+async def _insert(store, node_id, entity_id, *vec):
+    await store.insert_knowledge_node(
+        {
+            "node_id": node_id,
+            "entity_id": entity_id,
+            "node_type": "atomic_fact",
+            "content": f"content of {node_id}",
+            "embedding": _blob(*vec) if vec else None,
+        }
+    )
+
+
+# ---------------------------------------------------------------------------
+# VectorIndex
+# ---------------------------------------------------------------------------
+
+
+def test_search_returns_top_k_sorted():
+    index = VectorIndex()
+    index.load(
+        [
+            ("a", "e1", _blob(1, 0, 0)),
+            ("b", "e1", _blob(0.9, 0.1, 0)),
+            ("c", "e1", _blob(0, 1, 0)),
+            ("d", "e1", _blob(0, 0, 1)),
+        ],
+        entity_id="e1",
+    )
+    hits = index.search(_unit(1, 0, 0), "e1", k=2)
+    assert [h[0] for h in hits] == ["a", "b"]
+    assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_unloaded_entity_ignores_writes():
+    index = VectorIndex()
+    index.add("a", "e1", _blob(1, 0))
+    assert index.size == 0
+    assert not index.is_loaded("e1")
+
+
+def test_remove_swaps_last_row():
+    index = VectorIndex()
+    index.load(
+        [
+            ("a", "e1", _blob(1, 0)),
+            ("b", "e1", _blob(0, 1)),
+            ("c", "e1", _blob(1, 1)),
+        ],
+        entity_id="e1",
+    )
+    assert index.remove("a")
+    assert not index.remove("a")
+    hits = dict(index.search(_unit(0, 1), "e1", k=10))
+    assert set(hits) == {"b", "c"}
+    assert hits["b"] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_global_search_spans_partitions():
+    index = VectorIndex()
+    index.load(
+        [
+            ("a", "e1", _blob(1, 0)),
+            ("b", "e2", _blob(0, 1)),
+            ("c", None, _blob(1, 1)),
+        ]
+    )
+    hits = index.search(_unit(0, 1), None, k=2)
+    assert [h[0] for h in hits] == ["b", "c"]
+    assert index.search(_unit(0, 1), "e1", k=2)[0][0] == "a"
+
+
+def test_growth_beyond_initial_capacity():
+    index = VectorIndex()
+    index.load([], entity_id="e1")
+    rng = np.random.default_rng(0)
+    for i in range(200):
+        index.add(f"n{i}", "e1", _blob(*rng.normal(size=8)))
+    index.add("target", "e1", _blob(*([1.0] + [0.0] * 7)))
+    assert index.size == 201
+    assert index.search(_unit(*([1.0] + [0.0] * 7)), "e1", k=1)[0][0] == "target"
+
+
+def test_dimension_mismatch_is_skipped():
+    index = VectorIndex()
+    index.load([("a", "e1", _blob(1, 0))], entity_id="e1")
+    index.add("b", "e1", _blob(1, 0, 0))
+    assert index.size == 1
+    assert index.search(_unit(1, 0, 0), "e1", k=5) == []
+
+
+# ---------------------------------------------------------------------------
+# SQLiteStore integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_search_embeddings_lazy_loads(store):
+    await _insert(store, "n1", "alice", 1, 0)
+    await _insert(store, "n2", "alice", 0, 1)
+    await _insert(store, "n3", "bob", 1, 0)
+
+    results = await store.search_embeddings(_unit(1, 0), "alice", limit=5)
+    assert [r["node_id"] for r in results] == ["n1", "n2"]
+    assert results[0]["similarity"] == pytest.approx(1.0, abs=1e-5)
+    assert results[0]["content"] == "content of n1"
+
+
+@pytest.mark.asyncio
+async def test_index_tracks_inserts_updates_and_deletes(store):
+    await _insert(store, "n1", "alice", 1, 0)
+    await store.search_embeddings(_unit(1, 0), "alice")
+
+    # Insert with embedding after load
+    await _insert(store, "n2", "alice", 0, 1)
+    # Insert without embedding, embedded later
+    await _insert(store, "n3", "alice")
+    await store.update_node_embedding("n3", _blob(1, 1))
+
+    results = await store.search_embeddings(_unit(1, 1), "alice", limit=3)
+    assert results[0]["node_id"] == "n3"
+    assert {r["node_id"] for r in results} == {"n1", "n2", "n3"}
+
+    await store.delete_knowledge_node("n3")
+    results = await store.search_embeddings(_unit(1, 1), "alice", limit=3)
+    assert {r["node_id"] for r in results} == {"n1", "n2"}
+
+    await store.delete_knowledge_nodes("alice")
+    assert await store.search_embeddings(_unit(1, 0), "alice") == []
+
+
+@pytest.mark.asyncio
+async def test_writes_during_lazy_load_are_kept(store, monkeypatch):
+    await _insert(store, "n1", "alice", 1, 0)
+    await _insert(store, "n2", "alice")
+    selected = asyncio.Event()
+    release = asyncio.Event()
+    reader = store._reader
+
+    @asynccontextmanager
+    async def paused_reader():
+        async with reader() as db:
+            yield db
+        if not selected.is_set():
+            # Hold the load between its SELECT and VectorIndex.load()
+            selected.set()
+            await release.wait()
+
+    monkeypatch.setattr(store, "_reader", paused_reader)
+    search = asyncio.create_task(store.search_embeddings(_unit(0, 1), "alice"))
+    await selected.wait()
+    await _insert(store, "n3", "alice", 0, 1)
+    await store.update_node_embedding("n2", _blob(1, 1))
+    await store.delete_knowledge_node("n1")
+    release.set()
+
+    assert [r["node_id"] for r in await search] == ["n3", "n2"]
+    assert store.vector_index.size == 2
+
+
+# ---------------------------------------------------------------------------
+# IVFVectorIndex
+# ---------------------------------------------------------------------------
+
+
+def _clustered(n: int, dim: int, clusters: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    data = centers[rng.integers(0, clusters, n)] + 0.3 * rng.normal(size=(n, dim))
+    data /= np.linalg.norm(data, axis=1, keepdims=True)
+    return data.astype(np.float32)
+
+
+def _load(index, data, entity_id="e1"):
+    index.load(
+        [(f"n{i}", entity_id, row.tobytes()) for i, row in enumerate(data)],
+        entity_id=entity_id,
+    )
+
+
+def test_ivf_recall_against_exact():
+    data = _clustered(3000, 32, clusters=20)
+    queries = _clustered(50, 32, clusters=20, seed=1)
+    exact = VectorIndex()
+    ivf = IVFVectorIndex(nprobe=8, min_train_size=500)
+    _load(exact, data)
+    _load(ivf, data)
+
+    recall = []
+    for q in queries:
+        truth = {nid for nid, _ in exact.search(q, "e1", k=10)}
+        approx = {nid for nid, _ in ivf.search(q, "e1", k=10)}
+        recall.append(len(truth & approx) / 10)
+    assert np.mean(recall) >= 0.9
+
+
+def test_ivf_small_partition_is_exact():
+    index = IVFVectorIndex(min_train_size=100)
+    index.load([("a", "e1", _blob(1, 0)), ("b", "e1", _blob(0, 1))], "e1")
+    assert [h[0] for h in index.search(_unit(0, 1), "e1", k=1)] == ["b"]
+
+
+def test_ivf_incremental_insert_delete_and_retrain():
+    data = _clustered(400, 16, clusters=8)
+    index = IVFVectorIndex(nprobe=4, min_train_size=200)
+    index.load([], entity_id="e1")
+    for i, row in enumerate(data):
+        index.add(f"n{i}", "e1", row.tobytes())
+    assert index.size == 400
+
+    # The partition trained in the background once it crossed min_train_size
+    index._partitions["e1"]._retrain_thread.join(timeout=10)
+    assert index._partitions["e1"].trained
+
+    target = data[123]
+    assert index.search(target, "e1", k=1)[0][0] == "n123"
+    assert index.remove("n123")
+    assert all(nid != "n123" for nid, _ in index.search(target, "e1", k=20))
+
+
+def test_ivf_retrain_keeps_writes_made_while_training(monkeypatch):
+    data = _clustered(300, 16, clusters=8)
+    index = IVFVectorIndex(nprobe=8, min_train_size=200)
+    index.load([], entity_id="e1")
+    started = threading.Event()
+    release = threading.Event()
+    fit = _IVFPartition._fit
+
+    def slow_fit(self, node_ids, matrix):
+        started.set()
+        release.wait(timeout=10)
+        return fit(self, node_ids, matrix)
+
+    monkeypatch.setattr(_IVFPartition, "_fit", slow_fit)
+    for i, row in enumerate(data[:200]):
+        index.add(f"n{i}", "e1", row.tobytes())
+    partition = index._partitions["e1"]
+    assert started.wait(timeout=10)
+
+    # Training is in progress: writes and searches do not wait for it
+    assert not partition.trained
+    for i, row in enumerate(data[200:], start=200):
+        index.add(f"n{i}", "e1", row.tobytes())
+    index.remove("n0")
+    assert index.search(data[250], "e1", k=1)[0][0] == "n250"
+
+    release.set()
+    partition._retrain_thread.join(timeout=10)
+    assert partition.trained
+    assert index.size == partition.size == 299
+    assert index.search(data[250], "e1", k=1)[0][0] == "n250"
+    assert all(nid != "n0" for nid, _ in index.search(data[0], "e1", k=20))
+
+
+@pytest.mark.asyncio
+async def test_rebuild_vector_index_from_store(store):
+    await _insert(store, "n1", "alice", 1, 0)
+    await _insert(store, "n2", "bob", 0, 1)
+    await store.search_embeddings(_unit(1, 0), None)
+
+    # Simulate drift: the index loses a vector the database still has
+    store.vector_index.remove("n2")
+    assert await store.rebuild_vector_index() == 2
+    assert await store.rebuild_vector_index("bob") == 1
+    results = await store.search_embeddings(_unit(0, 1), "bob")
+    assert [r["node_id"] for r in results] == ["n2"]
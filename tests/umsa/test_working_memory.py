@@ -0,0 +1,111 @@
+"""Tests for WorkingMemory eviction order, token accounting and scale."""
+
+import time
+
+from loguru import logger
+
+from open_llm_vtuber.umsa.token_counter import TokenCounter
+from open_llm_vtuber.umsa.working_memory import WorkingMemory
+
+
+def _memory(max_tokens: int) -> WorkingMemory:
+    counter = TokenCounter()
+    counter._encoder = None  # deterministic estimator: 4 chars per token
+    return WorkingMemory(max_tokens=max_tokens, token_counter=counter)
+
+
+def _recount(memory: WorkingMemory) -> int:
+    return sum(memory.token_counter.count(m.content) for m in memory.get_messages())
+
+
+def test_evicts_unimportant_before_important():
+    memory = _memory(max_tokens=6)
+    memory.add_message("user", "pinned a", important=True)  # 2 tokens
+    memory.add_message("user", "first xx")
+    memory.add_message("user", "second x")
+    evicted = memory.add_message("user", "third xx")
+
+    assert [m.content for m in evicted] == ["first xx"]
+    assert [m.content for m in memory.get_messages()] == [
+        "pinned a",
+        "second x",
+        "third xx",
+    ]
+
+    assert [
+        m.content for m in memory.add_message("user", "pinned b", important=True)
+    ] == ["second x"]
+    assert [m.content for m in memory.add_message("user", "fourth x")] == ["third xx"]
+
+    # Once no unimportant message is left, the oldest important one goes
+    evicted = memory.add_message("user", "pinned c xxx", important=True)
+    assert [m.content for m in evicted] == ["fourth x", "pinned a"]
+    assert memory.current_tokens == _recount(memory) <= 6
+
+
+def test_never_evicts_last_message():
+    memory = _memory(max_tokens=2)
+    memory.add_message("user", "x" * 40)
+    assert memory.message_count == 1
+    assert memory.current_tokens == 10
+
+
+def test_interrupt_and_update_adjust_tokens():
+    memory = _memory(max_tokens=1000)
+    memory.add_message("user", "hello there")
+    memory.add_message("assistant", "a long answer " * 10)
+
+    memory.handle_interrupt("a long")
+    assert memory.last_message.content == "a long\n[INTERRUPTED by user]"
+    assert memory.current_tokens == _recount(memory)
+
+    memory.update_last_content("short")
+    assert memory.current_tokens == _recount(memory)
+
+    # Eviction subtracts what was charged, not a stale count
+    memory.max_tokens = 2
+    memory.add_message("user", "next")
+    assert memory.current_tokens == _recount(memory)
+
+
+def test_set_from_history_evicts_oldest():
+    memory = _memory(max_tokens=4)
+    evicted = memory.set_from_history(
+        [{"role": "user", "content": f"msg{i}"} for i in range(6)]
+    )
+    assert [m.content for m in evicted] == ["msg0", "msg1"]
+    assert [m["content"] for m in memory.to_chat_messages()] == [
+        "msg2",
+        "msg3",
+        "msg4",
+        "msg5",
+    ]
+
+    memory.clear()
+    assert memory.message_count == 0
+    assert memory.current_tokens == 0
+    assert memory.last_message is None
+
+
+def test_stress_100k_messages():
+    memory = _memory(max_tokens=2000)
+    logger.disable("open_llm_vtuber")
+    try:
+        start = time.perf_counter()
+        evicted = 0
+        for i in range(100_000):
+            # Every 7th message is pinned, so unimportant ones keep being
+            # evicted from behind a growing run of important messages
+            evicted += len(
+                memory.add_message("user", f"chat message {i}", important=i % 7 == 0)
+            )
+        elapsed = time.perf_counter() - start
+    finally:
+        logger.enable("open_llm_vtuber")
+
+    assert evicted + memory.message_count == 100_000
+    assert memory.current_tokens == _recount(memory) <= 2000
+    # Pinned messages outlive unimportant ones, so the newest pinned survives
+    assert "chat message 99995" in [m.content for m in memory.get_messages()]
+    # Loose bound; eviction no longer rescans the run of pinned messages
+    assert elapsed < 30